@@ -0,0 +1,283 @@
+"""Token- and concurrency-aware admission control for Claude requests.
+
+Workers used to learn about rate limits only after the fact, when a run
+failed with a usage limit error. The AdmissionController sits in front of
+task dispatch and keeps each model inside a configured budget:
+
+- ``tokens_per_minute``: tokens consumed in a sliding 60 s window, plus
+  the estimated tokens of requests still in flight
+- ``max_concurrent``: number of requests in flight at once
+
+Requests that would exceed a budget are delayed until enough of the
+window has expired or a slot is released. Token estimates come from an
+exponential moving average of observed usage, scaled by the size of the
+request, so smaller tasks can be admitted ahead of a large one that does
+not fit yet.
+
+Typical usage example:
+    controller = AdmissionController({"sonnet": ModelBudget(tokens_per_minute=80000)})
+    ticket = controller.acquire("sonnet", controller.estimate("sonnet"))
+    try:
+        tokens = run_task()
+    finally:
+        controller.release(ticket, tokens)
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Estimate used for a model before any usage has been observed
+DEFAULT_TOKEN_ESTIMATE = 20000
+
+# Weight of the newest observation in the moving averages
+EMA_ALPHA = 0.3
+
+# Longest single wait between budget re-checks
+MAX_WAIT_SLICE = 1.0
+
+
+@dataclass
+class ModelBudget:
+    """Limits for one model; None means unlimited."""
+    tokens_per_minute: Optional[int] = None
+    max_concurrent: Optional[int] = None
+
+
+@dataclass
+class AdmissionTicket:
+    """An admitted request, returned to the controller on release."""
+    model: str
+    estimated_tokens: int
+    size: Optional[int]
+    admitted_at: float
+
+
+class AdmissionController:
+    """Delays requests so each model stays within its token and concurrency budget."""
+
+    def __init__(self, budgets: Optional[Dict[str, ModelBudget]] = None,
+                 window: float = 60.0,
+                 default_estimate: int = DEFAULT_TOKEN_ESTIMATE,
+                 clock: Callable[[], float] = time.monotonic):
+        """Initialize the controller.
+
+        Args:
+            budgets: Budget per model name; models without one are unlimited
+            window: Length of the token accounting window in seconds
+            default_estimate: Tokens assumed per request before any is observed
+            clock: Monotonic time source
+        """
+        self.budgets = dict(budgets or {})
+        self.window = window
+        self.default_estimate = default_estimate
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._usage: Dict[str, Deque[Tuple[float, int]]] = {}
+        self._window_tokens: Dict[str, int] = {}
+        self._reserved: Dict[str, int] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._avg_tokens: Dict[str, float] = {}
+        self._avg_size: Dict[str, float] = {}
+        self.stats = {
+            "admitted": 0,
+            "delayed": 0,
+            "reordered": 0,
+            "wait_time": 0.0
+        }
+
+    @classmethod
+    def from_config(cls, config) -> "AdmissionController":
+        """Build a controller from the worker and manager model budgets."""
+        budgets = {
+            config.manager_model: ModelBudget(
+                tokens_per_minute=config.manager_tokens_per_minute,
+                max_concurrent=config.manager_max_concurrent
+            ),
+            # A model used for both roles shares the worker budget
+            config.worker_model: ModelBudget(
+                tokens_per_minute=config.worker_tokens_per_minute,
+                max_concurrent=config.worker_max_concurrent
+            )
+        }
+        return cls(budgets)
+
+    def estimate(self, model: str, size: Optional[int] = None) -> int:
+        """Estimate the tokens a request will consume.
+
+        Args:
+            model: Model the request runs on
+            size: Size of the request (e.g. prompt length); requests larger
+                than average are estimated proportionally higher
+
+        Returns:
+            Estimated token count
+        """
+        with self._cond:
+            average = self._avg_tokens.get(model)
+            if average is None:
+                return self.default_estimate
+            avg_size = self._avg_size.get(model)
+            if size and avg_size:
+                average *= min(4.0, max(0.25, size / avg_size))
+            return int(average)
+
+    def try_acquire(self, model: str, tokens: int, size: Optional[int] = None) -> Optional[AdmissionTicket]:
+        """Admit a request if it fits the budget right now."""
+        with self._cond:
+            if self._wait_time(model, tokens) > 0:
+                return None
+            return self._admit(model, tokens, size)
+
+    def acquire(self, model: str, tokens: int, size: Optional[int] = None,
+                timeout: Optional[float] = None,
+                should_stop: Optional[Callable[[], bool]] = None) -> Optional[AdmissionTicket]:
+        """Wait until a request fits the budget and admit it.
+
+        Args:
+            model: Model the request runs on
+            tokens: Estimated tokens of the request
+            size: Size of the request, used to refine later estimates
+            timeout: Maximum seconds to wait; None waits indefinitely
+            should_stop: Polled while waiting; returning True abandons the wait
+
+        Returns:
+            AdmissionTicket, or None if the wait timed out or was abandoned
+        """
+        start = self._clock()
+        delayed = False
+        with self._cond:
+            while True:
+                wait = self._wait_time(model, tokens)
+                if wait <= 0:
+                    if delayed:
+                        self.stats["delayed"] += 1
+                        self.stats["wait_time"] += self._clock() - start
+                    return self._admit(model, tokens, size)
+
+                if should_stop and should_stop():
+                    return None
+                remaining = None if timeout is None else timeout - (self._clock() - start)
+                if remaining is not None and remaining <= 0:
+                    return None
+
+                if not delayed:
+                    delayed = True
+                    logger.debug(f"Delaying {model} request of ~{tokens} tokens by up to {wait:.1f}s")
+                slice_ = min(wait, MAX_WAIT_SLICE)
+                if remaining is not None:
+                    slice_ = min(slice_, remaining)
+                self._cond.wait(slice_)
+
+    def release(self, ticket: AdmissionTicket, actual_tokens: Optional[int] = None):
+        """Return a ticket, recording the tokens the request actually used.
+
+        Args:
+            ticket: Ticket returned by acquire/try_acquire
+            actual_tokens: Observed usage; the estimate is kept if unknown
+        """
+        tokens = actual_tokens if actual_tokens else ticket.estimated_tokens
+        with self._cond:
+            model = ticket.model
+            self._in_flight[model] = max(0, self._in_flight.get(model, 0) - 1)
+            self._reserved[model] = max(0, self._reserved.get(model, 0) - ticket.estimated_tokens)
+            self._record(model, tokens)
+            if actual_tokens:
+                self._update_averages(model, actual_tokens, ticket.size)
+            self._cond.notify_all()
+
+    def record_usage(self, model: str, tokens: int):
+        """Record usage that did not go through acquire/release."""
+        with self._cond:
+            self._record(model, tokens)
+
+    def note_reordered(self):
+        """Count a request admitted ahead of an earlier one."""
+        with self._cond:
+            self.stats["reordered"] += 1
+
+    def get_status(self) -> Dict[str, Dict[str, Optional[int]]]:
+        """Current usage against the budget for every known model."""
+        with self._cond:
+            models = set(self.budgets) | set(self._usage) | set(self._in_flight)
+            status = {}
+            for model in sorted(models):
+                self._expire(model)
+                budget = self.budgets.get(model, ModelBudget())
+                status[model] = {
+                    "tokens_in_window": self._window_tokens.get(model, 0),
+                    "reserved_tokens": self._reserved.get(model, 0),
+                    "in_flight": self._in_flight.get(model, 0),
+                    "tokens_per_minute": budget.tokens_per_minute,
+                    "max_concurrent": budget.max_concurrent
+                }
+            return status
+
+    def _admit(self, model: str, tokens: int, size: Optional[int]) -> AdmissionTicket:
+        self._in_flight[model] = self._in_flight.get(model, 0) + 1
+        self._reserved[model] = self._reserved.get(model, 0) + tokens
+        self.stats["admitted"] += 1
+        return AdmissionTicket(model=model, estimated_tokens=tokens, size=size, admitted_at=self._clock())
+
+    def _record(self, model: str, tokens: int):
+        self._usage.setdefault(model, deque()).append((self._clock(), tokens))
+        self._window_tokens[model] = self._window_tokens.get(model, 0) + tokens
+
+    def _expire(self, model: str):
+        usage = self._usage.get(model)
+        if not usage:
+            return
+        cutoff = self._clock() - self.window
+        while usage and usage[0][0] <= cutoff:
+            _, tokens = usage.popleft()
+            self._window_tokens[model] -= tokens
+
+    def _update_averages(self, model: str, tokens: int, size: Optional[int]):
+        previous = self._avg_tokens.get(model)
+        self._avg_tokens[model] = tokens if previous is None else (
+            EMA_ALPHA * tokens + (1 - EMA_ALPHA) * previous
+        )
+        if size:
+            previous = self._avg_size.get(model)
+            self._avg_size[model] = size if previous is None else (
+                EMA_ALPHA * size + (1 - EMA_ALPHA) * previous
+            )
+
+    def _wait_time(self, model: str, tokens: int) -> float:
+        """Seconds until a request of ``tokens`` fits; 0 if it fits now."""
+        budget = self.budgets.get(model)
+        if budget is None:
+            return 0.0
+
+        in_flight = self._in_flight.get(model, 0)
+        if budget.max_concurrent and in_flight >= budget.max_concurrent:
+            # Woken by release(); the slice bounds the wait
+            return MAX_WAIT_SLICE
+
+        limit = budget.tokens_per_minute
+        if not limit:
+            return 0.0
+
+        self._expire(model)
+        # A request larger than the whole budget is admitted once the
+        # window is otherwise empty, so it is slowed down but never starved
+        needed = min(tokens, limit)
+        excess = self._window_tokens.get(model, 0) + self._reserved.get(model, 0) + needed - limit
+        if excess <= 0:
+            return 0.0
+        if self._reserved.get(model, 0) and excess > self._window_tokens.get(model, 0):
+            # Only in-flight requests can free the remaining budget
+            return MAX_WAIT_SLICE
+
+        # Wait until enough of the oldest usage leaves the window
+        freed = 0
+        for timestamp, used in self._usage.get(model, ()):
+            freed += used
+            if freed >= excess:
+                return max(0.0, timestamp + self.window - self._clock())
+        return MAX_WAIT_SLICE
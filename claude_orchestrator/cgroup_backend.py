@@ -0,0 +1,281 @@
+"""Linux cgroup v2 resource enforcement and accounting for sandboxed commands.
+
+With a CgroupBackend, SecureSandbox runs each command in its own
+transient cgroup below a delegated parent. The kernel enforces the
+limits there:
+
+- ``memory.max`` (and ``memory.swap.max`` = 0) instead of RLIMIT_AS
+  plus RSS polling
+- ``pids.max`` instead of the per-user RLIMIT_NPROC
+- ``cpu.max`` to cap CPU bandwidth at a number of cores
+
+When the command exits, its exact CPU time, peak memory and IO byte
+counts are read from ``cpu.stat``, ``memory.peak`` and ``io.stat``, and
+OOM kills and refused forks from ``memory.events`` and ``pids.events``.
+
+The parent cgroup must be on the unified (v2) hierarchy, writable, and
+able to delegate the memory and pids controllers to its children. By
+default it is the cgroup this process runs in, which only works when that
+cgroup has no other processes (for example, the root of a container's
+cgroup namespace). Otherwise point ``parent`` (or the
+CLAUDE_SANDBOX_CGROUP environment variable) at a delegated cgroup. When
+no usable parent exists, ``available`` is False and the sandbox keeps
+using rlimits, with wait4 rusage for accounting.
+
+Typical usage example:
+    backend = CgroupBackend()
+    if backend.available:
+        cgroup = backend.create("job-1", memory_max=256 << 20, pids_max=10)
+        proc = subprocess.Popen(cmd, preexec_fn=cgroup.attach)
+        proc.wait()
+        usage = cgroup.read_usage()
+        cgroup.destroy()
+"""
+
+import os
+import time
+import errno
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+# Controllers without which the backend is not used
+REQUIRED_CONTROLLERS = ("memory", "pids")
+
+# Controllers enabled when the parent offers them
+OPTIONAL_CONTROLLERS = ("cpu", "io")
+
+# cpu.max period in microseconds
+CPU_PERIOD = 100000
+
+
+class SandboxCgroup:
+    """A transient cgroup holding one sandboxed command"""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def attach(self):
+        """Move the calling process into this cgroup.
+
+        Meant for ``preexec_fn``: the command is inside the cgroup before
+        it execs, so every process it forks is accounted for.
+        """
+        fd = os.open(str(self.path / "cgroup.procs"), os.O_WRONLY)
+        try:
+            os.write(fd, b"0")
+        finally:
+            os.close(fd)
+
+    def read_usage(self) -> Dict[str, Any]:
+        """Exact resource usage of everything that ran in the cgroup"""
+        usage: Dict[str, Any] = {"accounting": "cgroup"}
+
+        cpu = self._read_keyed("cpu.stat")
+        if "usage_usec" in cpu:
+            usage["cpu_time"] = cpu["usage_usec"] / 1e6
+            usage["user_time"] = cpu.get("user_usec", 0) / 1e6
+            usage["system_time"] = cpu.get("system_usec", 0) / 1e6
+
+        peak = self._read_int("memory.peak")
+        if peak is not None:
+            usage["peak_memory_mb"] = peak / 1024 / 1024
+
+        io_stat = self._read("io.stat")
+        if io_stat is not None:
+            read_bytes = write_bytes = 0
+            for line in io_stat.splitlines():
+                for field in line.split()[1:]:
+                    key, _, value = field.partition("=")
+                    if key == "rbytes":
+                        read_bytes += int(value)
+                    elif key == "wbytes":
+                        write_bytes += int(value)
+            usage["io_read_bytes"] = read_bytes
+            usage["io_write_bytes"] = write_bytes
+
+        return usage
+
+    def events(self) -> Dict[str, int]:
+        """Limit events: OOM kills and forks refused by pids.max"""
+        return {
+            "oom_kill": self._read_keyed("memory.events").get("oom_kill", 0),
+            "pids_max": self._read_keyed("pids.events").get("max", 0)
+        }
+
+    def destroy(self, timeout: float = 1.0):
+        """Kill anything left in the cgroup and remove it"""
+        try:
+            (self.path / "cgroup.kill").write_text("1")
+        except OSError:
+            pass
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                self.path.rmdir()
+                return
+            except FileNotFoundError:
+                return
+            except OSError as e:
+                # EBUSY until the killed processes have left
+                if e.errno != errno.EBUSY or time.monotonic() >= deadline:
+                    logger.debug(f"Could not remove cgroup {self.path}: {e}")
+                    return
+                time.sleep(0.01)
+
+    def _read(self, name: str) -> Optional[str]:
+        try:
+            return (self.path / name).read_text()
+        except OSError:
+            return None
+
+    def _read_int(self, name: str) -> Optional[int]:
+        text = self._read(name)
+        if text is None or not text.strip().isdigit():
+            return None
+        return int(text)
+
+    def _read_keyed(self, name: str) -> Dict[str, int]:
+        values = {}
+        for line in (self._read(name) or "").splitlines():
+            parts = line.split()
+            if len(parts) == 2 and parts[1].isdigit():
+                values[parts[0]] = int(parts[1])
+        return values
+
+
+class CgroupBackend:
+    """Creates per-command cgroups below a delegated parent cgroup"""
+
+    def __init__(self, parent: Optional[str] = None, root: Path = CGROUP_ROOT):
+        self.root = Path(root)
+        parent = parent or os.getenv("CLAUDE_SANDBOX_CGROUP")
+        self.parent = Path(parent) if parent else self._own_cgroup()
+        if self.parent is not None and not self.parent.is_absolute():
+            self.parent = self.root / self.parent
+        self.controllers: set = set()
+        self.unavailable_reason: Optional[str] = None
+        self._available: Optional[bool] = None
+
+    @property
+    def available(self) -> bool:
+        """Whether commands can be placed in their own cgroups (checked once)"""
+        if self._available is None:
+            self.unavailable_reason = self._check()
+            self._available = self.unavailable_reason is None
+            if self._available:
+                logger.info(f"Using cgroup v2 sandboxing under {self.parent} "
+                            f"({', '.join(sorted(self.controllers))})")
+            else:
+                logger.info(f"cgroup v2 sandboxing unavailable: {self.unavailable_reason}")
+        return self._available
+
+    def create(self, name: str,
+               memory_max: Optional[int] = None,
+               cpu_cores: Optional[float] = None,
+               pids_max: Optional[int] = None) -> Optional[SandboxCgroup]:
+        """Create a cgroup with the given limits.
+
+        Args:
+            name: Unique name for the cgroup
+            memory_max: Memory limit in bytes (None for no limit)
+            cpu_cores: CPU bandwidth in cores (None for no limit)
+            pids_max: Maximum number of tasks (None for no limit)
+
+        Returns:
+            The cgroup, or None if it could not be set up
+        """
+        if not self.available:
+            return None
+        path = self.parent / f"sandbox-{name}"
+        try:
+            path.mkdir()
+        except OSError as e:
+            logger.warning(f"Could not create cgroup {path}: {e}")
+            return None
+
+        cgroup = SandboxCgroup(path)
+        try:
+            (path / "memory.max").write_text(str(memory_max) if memory_max else "max")
+            (path / "pids.max").write_text(str(pids_max) if pids_max else "max")
+            if "cpu" in self.controllers:
+                quota = "max" if not cpu_cores else str(max(1000, int(cpu_cores * CPU_PERIOD)))
+                (path / "cpu.max").write_text(f"{quota} {CPU_PERIOD}")
+        except OSError as e:
+            logger.warning(f"Could not set cgroup limits on {path}: {e}")
+            cgroup.destroy()
+            return None
+
+        try:
+            # Without this, memory.max only pushes the command into swap
+            (path / "memory.swap.max").write_text("0")
+        except OSError:
+            pass
+        return cgroup
+
+    def _own_cgroup(self) -> Optional[Path]:
+        try:
+            with open("/proc/self/cgroup") as f:
+                for line in f:
+                    if line.startswith("0::"):
+                        return self.root / line[3:].strip().lstrip("/")
+        except OSError:
+            pass
+        return None
+
+    def _check(self) -> Optional[str]:
+        """Return why cgroups cannot be used, or None if they can"""
+        if not (self.root / "cgroup.controllers").exists():
+            return f"no cgroup v2 hierarchy at {self.root}"
+        if self.parent is None or not self.parent.is_dir():
+            return f"parent cgroup {self.parent} not found"
+        if not os.access(self.parent, os.W_OK):
+            return f"parent cgroup {self.parent} is not writable"
+
+        try:
+            offered = set((self.parent / "cgroup.controllers").read_text().split())
+        except OSError as e:
+            return f"cannot read controllers of {self.parent}: {e}"
+        missing = [c for c in REQUIRED_CONTROLLERS if c not in offered]
+        if missing:
+            return f"controllers not delegated to {self.parent}: {', '.join(missing)}"
+
+        subtree = self.parent / "cgroup.subtree_control"
+        for controller in REQUIRED_CONTROLLERS + OPTIONAL_CONTROLLERS:
+            if controller not in offered:
+                continue
+            try:
+                enabled = set(subtree.read_text().split())
+                if controller not in enabled:
+                    subtree.write_text(f"+{controller}")
+            except OSError as e:
+                if controller in REQUIRED_CONTROLLERS:
+                    # EBUSY: the parent itself has processes in it
+                    return f"cannot enable {controller} in {subtree}: {e}"
+                continue
+        try:
+            enabled = set(subtree.read_text().split())
+        except OSError as e:
+            return f"cannot read {subtree}: {e}"
+        self.controllers = enabled & set(REQUIRED_CONTROLLERS + OPTIONAL_CONTROLLERS)
+        return None
+
+
+def rusage_usage(ru) -> Dict[str, Any]:
+    """Resource usage from a wait4 rusage, the fallback without cgroups"""
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    maxrss = ru.ru_maxrss if os.uname().sysname == "Darwin" else ru.ru_maxrss * 1024
+    return {
+        "accounting": "rusage",
+        "cpu_time": ru.ru_utime + ru.ru_stime,
+        "user_time": ru.ru_utime,
+        "system_time": ru.ru_stime,
+        "peak_memory_mb": maxrss / 1024 / 1024,
+        # Block counts are in 512-byte units
+        "io_read_bytes": ru.ru_inblock * 512,
+        "io_write_bytes": ru.ru_oublock * 512
+    }
@@ -0,0 +1,300 @@
+"""Streaming execution of the Claude CLI.
+
+Runs a Claude CLI command and reads its stdout line by line instead of
+buffering the whole transcript until exit. With ``--output-format
+stream-json`` every line is a JSON event; the collector tracks turns,
+tool calls and token usage as they arrive and reports them through a
+progress callback. Plain text output is handled as well.
+
+The raw transcript is kept in memory only up to ``spool_threshold``
+bytes and spooled to disk beyond that. On timeout the process group is
+killed, and whatever was produced so far (text, session id, transcript)
+is returned so the task can be retried or resumed.
+
+Typical usage example:
+    result = run_streaming(cmd, cwd=working_dir, timeout=600,
+                           on_progress=lambda p: print(p.turns, p.tokens_used))
+    if result.timed_out:
+        resume_id = result.session_id
+"""
+
+import io
+import os
+import json
+import signal
+import logging
+import tempfile
+import threading
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Keep up to 1 MiB of raw transcript in memory before spooling to disk
+DEFAULT_SPOOL_THRESHOLD = 1024 * 1024
+
+
+@dataclass
+class StreamProgress:
+    """Live progress of a streaming Claude run."""
+    turns: int = 0
+    tool_uses: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    last_text: str = ""
+
+    @property
+    def tokens_used(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+@dataclass
+class StreamResult:
+    """Outcome of a streaming Claude run."""
+    returncode: Optional[int]
+    output: str
+    stderr: str = ""
+    timed_out: bool = False
+    is_error: bool = False
+    session_id: Optional[str] = None
+    num_turns: int = 0
+    usage: Dict[str, int] = field(default_factory=dict)
+    cost_usd: Optional[float] = None
+    transcript_path: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.returncode == 0 and not self.timed_out and not self.is_error
+
+
+class StreamCollector:
+    """Incrementally parses Claude CLI output lines."""
+
+    def __init__(self):
+        self.progress = StreamProgress()
+        self.session_id: Optional[str] = None
+        self.final_text: Optional[str] = None
+        self.final_usage: Optional[Dict[str, Any]] = None
+        self.num_turns: Optional[int] = None
+        self.is_error = False
+        self.cost_usd: Optional[float] = None
+        self._texts: List[str] = []
+        self._plain_lines: List[str] = []
+        # Events for one assistant message repeat its usage, so keep the
+        # latest usage per message id
+        self._message_usage: Dict[str, Dict[str, int]] = {}
+
+    def feed(self, line: str) -> bool:
+        """Consume one output line; returns True if progress changed."""
+        stripped = line.strip()
+        if not stripped:
+            return False
+        try:
+            event = json.loads(stripped)
+        except ValueError:
+            event = None
+        if not isinstance(event, dict) or "type" not in event:
+            self._plain_lines.append(line)
+            return False
+
+        event_type = event["type"]
+        if event.get("session_id"):
+            self.session_id = event["session_id"]
+
+        if event_type == "assistant":
+            return self._on_assistant(event.get("message") or {})
+        if event_type == "result":
+            self.final_text = event.get("result")
+            self.final_usage = event.get("usage") or None
+            self.num_turns = event.get("num_turns")
+            self.is_error = bool(event.get("is_error")) or event.get("subtype", "success") != "success"
+            self.cost_usd = event.get("total_cost_usd", event.get("cost_usd"))
+            if self.final_usage:
+                self.progress.input_tokens = self.final_usage.get("input_tokens", 0)
+                self.progress.output_tokens = self.final_usage.get("output_tokens", 0)
+            return True
+        return False
+
+    def _on_assistant(self, message: Dict[str, Any]) -> bool:
+        for block in message.get("content") or []:
+            if block.get("type") == "text" and block.get("text"):
+                self._texts.append(block["text"])
+                self.progress.last_text = block["text"]
+            elif block.get("type") == "tool_use":
+                self.progress.tool_uses += 1
+
+        message_id = message.get("id") or f"_{len(self._message_usage)}"
+        usage = message.get("usage")
+        if usage:
+            self._message_usage[message_id] = usage
+        elif message_id not in self._message_usage:
+            self._message_usage[message_id] = {}
+
+        self.progress.turns = len(self._message_usage)
+        self.progress.input_tokens = sum(u.get("input_tokens", 0) for u in self._message_usage.values())
+        self.progress.output_tokens = sum(u.get("output_tokens", 0) for u in self._message_usage.values())
+        return True
+
+    @property
+    def output(self) -> str:
+        """Final result text, or everything produced so far."""
+        if self.final_text is not None:
+            return self.final_text
+        if self._texts:
+            return "\n".join(self._texts)
+        return "".join(self._plain_lines)
+
+    def usage(self) -> Dict[str, int]:
+        usage = {
+            "input_tokens": self.progress.input_tokens,
+            "output_tokens": self.progress.output_tokens,
+            "tokens_used": self.progress.tokens_used
+        }
+        if self.final_usage:
+            for key in ("cache_creation_input_tokens", "cache_read_input_tokens"):
+                if key in self.final_usage:
+                    usage[key] = self.final_usage[key]
+        return usage
+
+
+class _Spool:
+    """Raw transcript buffer that moves to a file past a size threshold."""
+
+    def __init__(self, threshold: int, directory: Optional[str], name: Optional[str]):
+        self.threshold = threshold
+        self.directory = directory
+        self.name = name
+        self.path: Optional[str] = None
+        self._buffer: Optional[io.BytesIO] = io.BytesIO()
+        self._file = None
+
+    def write(self, data: bytes):
+        if self._file is not None:
+            self._file.write(data)
+            return
+        self._buffer.write(data)
+        if self._buffer.tell() > self.threshold:
+            self._move_to_disk()
+
+    def _move_to_disk(self):
+        directory = Path(self.directory or tempfile.gettempdir())
+        directory.mkdir(parents=True, exist_ok=True)
+        if self.name:
+            self.path = str(directory / self.name)
+            self._file = open(self.path, "wb")
+        else:
+            fd, self.path = tempfile.mkstemp(prefix="claude-transcript-", suffix=".log", dir=str(directory))
+            self._file = os.fdopen(fd, "wb")
+        self._file.write(self._buffer.getvalue())
+        self._buffer = None
+
+    def persist(self) -> Optional[str]:
+        """Make sure the transcript is on disk and return its path."""
+        if self._file is None and self._buffer is not None and self._buffer.tell():
+            self._move_to_disk()
+        return self.path
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+def _kill_process_group(process: subprocess.Popen):
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError, AttributeError):
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+
+
+def run_streaming(cmd: List[str],
+                  cwd: Optional[str] = None,
+                  env: Optional[Dict[str, str]] = None,
+                  timeout: Optional[float] = None,
+                  on_progress: Optional[Callable[[StreamProgress], None]] = None,
+                  spool_dir: Optional[str] = None,
+                  spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+                  transcript_name: Optional[str] = None) -> StreamResult:
+    """Run a Claude CLI command, consuming its output as it is produced.
+
+    Args:
+        cmd: Command line to execute
+        cwd: Working directory
+        env: Environment for the child process
+        timeout: Seconds before the process group is killed
+        on_progress: Called from the reading thread whenever progress changes
+        spool_dir: Directory for transcripts that outgrow memory
+        spool_threshold: Bytes of raw transcript kept in memory
+        transcript_name: File name used when the transcript is spooled
+
+    Returns:
+        StreamResult with the output so far, usage and session id
+    """
+    collector = StreamCollector()
+    spool = _Spool(spool_threshold, spool_dir, transcript_name)
+
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            stdin=subprocess.DEVNULL,
+            cwd=cwd,
+            env=env,
+            start_new_session=True
+        )
+
+        timed_out = threading.Event()
+
+        def on_timeout():
+            timed_out.set()
+            _kill_process_group(process)
+
+        watchdog = threading.Timer(timeout, on_timeout) if timeout else None
+        if watchdog:
+            watchdog.daemon = True
+            watchdog.start()
+
+        try:
+            for raw in iter(process.stdout.readline, b""):
+                spool.write(raw)
+                if collector.feed(raw.decode("utf-8", errors="replace")) and on_progress:
+                    try:
+                        on_progress(collector.progress)
+                    except Exception as e:
+                        logger.debug(f"Progress callback failed: {e}")
+            returncode = process.wait()
+        except BaseException:
+            _kill_process_group(process)
+            process.wait()
+            raise
+        finally:
+            if watchdog:
+                watchdog.cancel()
+            process.stdout.close()
+            spool.close()
+
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode("utf-8", errors="replace")
+
+    transcript_path = spool.persist() if timed_out.is_set() else spool.path
+    if timed_out.is_set():
+        spool.close()
+        logger.warning(f"Claude run timed out after {timeout}s; partial transcript at {transcript_path}")
+
+    return StreamResult(
+        returncode=None if timed_out.is_set() else returncode,
+        output=collector.output,
+        stderr=stderr,
+        timed_out=timed_out.is_set(),
+        is_error=collector.is_error,
+        session_id=collector.session_id,
+        num_turns=collector.num_turns or collector.progress.turns,
+        usage=collector.usage(),
+        cost_usd=collector.cost_usd,
+        transcript_path=transcript_path
+    )
@@ -0,0 +1,193 @@
+"""
+Command line entry point for Claude Orchestrator
+
+Only argument parsing lives here. Each command is loaded on demand from
+the module that implements it, so read-only task commands never import
+the orchestrator, UI, configuration or feedback/rollback subsystems.
+"""
+
+import sys
+import argparse
+import importlib
+from typing import Callable, Dict
+
+
+# Commands that only read tasks.json and must start fast
+READ_ONLY_COMMANDS = ('list', 'show', 'next')
+
+# command -> "module:function" relative to this package
+COMMAND_HANDLERS: Dict[str, str] = {
+    'list': 'task_commands:run_task_command',
+    'show': 'task_commands:run_task_command',
+    'next': 'task_commands:run_task_command',
+}
+
+# Everything else is handled by the full orchestrator entry point
+DEFAULT_HANDLER = 'main:main'
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all commands"""
+    parser = argparse.ArgumentParser(
+        description="Claude Orchestrator - Opus Manager with Sonnet Workers",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Task Management
+  co list                               # List all tasks
+  co list --filter-status pending       # List only pending tasks
+  co list --show-subtasks              # List tasks with subtasks
+  co show 1                            # Show details of task 1
+  co next                              # Get next available task
+  co update 1 --status in-progress     # Update task status
+  co expand 1 --research               # Expand task into subtasks with AI research
+  co expand --all --workers 8          # Expand all complex tasks, 8 at a time
+  co delete 1                          # Delete a task
+  
+  # Task Creation
+  co add "Create a REST API with authentication"    # Add a new task
+  co parse requirements.txt                         # Parse PRD file
+  
+  # Orchestration
+  co run                               # Run the orchestrator
+  co run --workers 5                   # Run with 5 parallel workers
+  co run --id 123                      # Run only task with ID 123
+  co run --resume                      # Continue an interrupted run
+  
+  # Setup & Status
+  co init                              # Initialize project
+  co check                             # Check setup
+  co status                            # Check session status
+  
+  # Feedback Analysis
+  co analyze-feedback 123              # Analyze feedback for task 123
+  co worker-performance worker1        # Show performance metrics for worker
+  co feedback-report                   # Generate comprehensive feedback report
+  co export-metrics report.json        # Export metrics to file
+  
+  # Rollback Management
+  co checkpoint "Before deployment"    # Create manual checkpoint
+  co list-checkpoints                  # List available checkpoints
+  co rollback cp_20250104_120000       # Rollback to specific checkpoint
+  
+  # Test Monitoring
+  co test-status                       # Show test monitoring status
+  co test-report                       # Generate test report
+  co run-tests                         # Manually run all tests
+  co run-tests pytest                  # Run specific test suite
+  co coverage                          # Run tests with coverage report
+  
+  # Security
+  co security-audit                    # Run security audit for API keys
+        """
+    )
+    
+    parser.add_argument('command', nargs='?', default='run', 
+                       choices=['run', 'add', 'parse', 'check', 'status', 'init', 'list', 'show', 'next', 'update', 'expand', 'delete',
+                               'analyze-feedback', 'worker-performance', 'feedback-report', 'export-metrics',
+                               'checkpoint', 'rollback', 'list-checkpoints',
+                               'test-status', 'test-report', 'run-tests', 'coverage',
+                               'feedback-shell', 'security-audit'],
+                       help='Command to execute (default: run)')
+    
+    parser.add_argument('--config', '-c', 
+                       help='Path to configuration file')
+    
+    parser.add_argument('--workers', '-w', type=int,
+                       help='Override number of workers')
+    
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Enable verbose logging')
+    
+    parser.add_argument('--no-progress', action='store_true',
+                       help='Disable progress bar')
+    
+    parser.add_argument('--working-dir', '-d',
+                       help='Set working directory for task execution')
+    
+    parser.add_argument('--id', type=str,
+                       help='Run only a specific task by ID (e.g., --id 123)')
+    
+    parser.add_argument('--resume', action='store_true',
+                       help='Continue the last interrupted run from its journal (for run command)')
+    
+    # Add command specific arguments (using arg2 as a generic second argument)
+    parser.add_argument('arg2', nargs='?',
+                       help='Command argument (task description, file path, or task ID)')
+    
+    parser.add_argument('--status', '-s',
+                       choices=['pending', 'in-progress', 'done', 'review', 'deferred', 'cancelled'],
+                       help='Task status (for update command)')
+    
+    parser.add_argument('--priority', '-p',
+                       choices=['high', 'medium', 'low'],
+                       help='Task priority (for update command)')
+    
+    parser.add_argument('--filter-status',
+                       choices=['pending', 'in-progress', 'done', 'review', 'deferred', 'cancelled'],
+                       help='Filter tasks by status (for list command)')
+    
+    parser.add_argument('--show-subtasks', action='store_true',
+                       help='Show subtasks in list (for list command)')
+    
+    parser.add_argument('--research', action='store_true',
+                       help='Use AI research when expanding task (for expand command)')
+    
+    parser.add_argument('--all', action='store_true',
+                       help='Expand every task without subtasks, --workers at a time (for expand command)')
+    
+    parser.add_argument('--threshold', type=int, default=5,
+                       help='Minimum complexity score to expand (for expand --all, default: 5)')
+    
+    return parser
+
+
+def _load_handler(spec: str) -> Callable:
+    """Import ``module:function`` from this package"""
+    module_name, func_name = spec.split(':')
+    module = importlib.import_module(f"{__package__}.{module_name}")
+    return getattr(module, func_name)
+
+
+def _check_and_enable_enhanced_ui() -> bool:
+    """Check config and enable Enhanced UI if configured"""
+    import json
+    from pathlib import Path
+    try:
+        # Check for orchestrator_config.json in current directory or parent
+        for config_path in [Path("orchestrator_config.json"), Path("../orchestrator_config.json")]:
+            if config_path.exists():
+                with open(config_path) as f:
+                    config = json.load(f)
+                
+                # Check if enhanced UI is enabled
+                ui_mode = config.get("monitoring", {}).get("ui_mode", "")
+                if ui_mode == "enhanced":
+                    # Importing the optional UI patch module patches the
+                    # display classes as a side effect
+                    try:
+                        from . import ui_patch  # noqa: F401
+                        return True
+                    except ImportError:
+                        pass
+                break
+    except Exception:
+        pass
+    return False
+
+
+def main(argv=None):
+    """Parse arguments and dispatch to the command's module"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    
+    spec = COMMAND_HANDLERS.get(args.command)
+    if spec is not None:
+        sys.exit(_load_handler(spec)(args))
+    
+    _check_and_enable_enhanced_ui()
+    return _load_handler(DEFAULT_HANDLER)(args, parser)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,11 @@ Provides centralized configuration loading, validation, and management
 
 import json
 import os
+import copy
+import time
 import logging
-from typing import Dict, Any, Optional, Union, List
+import threading
+from typing import Dict, Any, Optional, Union, List, Callable, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 from jsonschema import validate, ValidationError
@@ -49,7 +52,9 @@ class ConfigurationManager:
                         "type": "object",
                         "properties": {
                             "model": {"type": "string"},
-                            "description": {"type": "string"}
+                            "description": {"type": "string"},
+                            "tokens_per_minute": {"type": ["integer", "null"], "minimum": 1},
+                            "max_concurrent": {"type": ["integer", "null"], "minimum": 1}
                         },
                         "required": ["model"]
                     },
@@ -57,7 +62,9 @@ class ConfigurationManager:
                         "type": "object",
                         "properties": {
                             "model": {"type": "string"},
-                            "description": {"type": "string"}
+                            "description": {"type": "string"},
+                            "tokens_per_minute": {"type": ["integer", "null"], "minimum": 1},
+                            "max_concurrent": {"type": ["integer", "null"], "minimum": 1}
                         },
                         "required": ["model"]
                     }
@@ -78,7 +85,19 @@ class ConfigurationManager:
                     "default_working_dir": {"type": ["string", "null"]},
                     "max_retries": {"type": "integer", "minimum": 0},
                     "retry_base_delay": {"type": "number", "minimum": 0},
-                    "retry_max_delay": {"type": "number", "minimum": 0}
+                    "retry_max_delay": {"type": "number", "minimum": 0},
+                    "stream_output": {"type": "boolean"},
+                    "transcript_dir": {"type": "string"},
+                    "autoscale": {"type": "boolean"},
+                    "min_workers": {"type": "integer", "minimum": 1, "maximum": 20},
+                    "autoscale_interval": {"type": "number", "minimum": 1},
+                    "target_queue_wait": {"type": "number", "minimum": 0},
+                    "scale_up_cooldown": {"type": "number", "minimum": 0},
+                    "scale_down_cooldown": {"type": "number", "minimum": 0},
+                    "scaling_policy": {"type": "string", "enum": ["conservative", "balanced", "aggressive"]},
+                    "speculative_execution": {"type": "boolean"},
+                    "isolate_workers": {"type": "boolean"},
+                    "task_ordering": {"type": "string", "enum": ["critical_path", "fifo"]}
                 },
                 "required": ["max_workers", "worker_timeout", "manager_timeout"]
             },
@@ -99,7 +118,10 @@ class ConfigurationManager:
                     "slack_webhook_url": {"type": ["string", "null"]},
                     "notify_on_task_complete": {"type": "boolean"},
                     "notify_on_task_failed": {"type": "boolean"},
-                    "notify_on_all_complete": {"type": "boolean"}
+                    "notify_on_all_complete": {"type": "boolean"},
+                    "slack_coalesce_window": {"type": "number", "minimum": 0},
+                    "slack_queue_size": {"type": "integer", "minimum": 1},
+                    "slack_timeout": {"type": "number", "minimum": 0}
                 }
             },
             "claude_cli": {
@@ -153,6 +175,10 @@ class ConfigurationManager:
         
     def load_configuration(self) -> Dict[str, Any]:
         """Load configuration from multiple sources in order of precedence"""
+        # Reset state from any previous load
+        self.loaded_files = []
+        self.validation_result = ConfigValidationResult(is_valid=True)
+        
         # Start with default configuration
         self.config = self._get_default_config()
         
@@ -185,11 +211,15 @@ class ConfigurationManager:
             "models": {
                 "manager": {
                     "model": "opus",
-                    "description": "Opus model for planning and task management"
+                    "description": "Opus model for planning and task management",
+                    "tokens_per_minute": None,
+                    "max_concurrent": None
                 },
                 "worker": {
                     "model": "sonnet",
-                    "description": "Sonnet model for code implementation"
+                    "description": "Sonnet model for code implementation",
+                    "tokens_per_minute": None,
+                    "max_concurrent": None
                 }
             },
             "execution": {
@@ -201,7 +231,19 @@ class ConfigurationManager:
                 "bash_default_timeout_ms": 3600000,
                 "bash_max_timeout_ms": 3600000,
                 "bash_max_output_length": 30000,
-                "default_working_dir": None
+                "default_working_dir": None,
+                "stream_output": True,
+                "transcript_dir": ".taskmaster/transcripts",
+                "autoscale": True,
+                "min_workers": 1,
+                "autoscale_interval": 5.0,
+                "target_queue_wait": 60.0,
+                "scale_up_cooldown": 30.0,
+                "scale_down_cooldown": 120.0,
+                "scaling_policy": "balanced",
+                "speculative_execution": False,
+                "isolate_workers": False,
+                "task_ordering": "critical_path"
             },
             "monitoring": {
                 "progress_interval": 10,
@@ -215,7 +257,10 @@ class ConfigurationManager:
                 "slack_webhook_url": "",
                 "notify_on_task_complete": True,
                 "notify_on_task_failed": True,
-                "notify_on_all_complete": True
+                "notify_on_all_complete": True,
+                "slack_coalesce_window": 30.0,
+                "slack_queue_size": 1000,
+                "slack_timeout": 10.0
             },
             "claude_cli": {
                 "command": "claude",
@@ -494,48 +539,109 @@ class ConfigurationManager:
 
 
 class ConfigProperty:
-    """Property descriptor for configuration values with validation"""
+    """Property descriptor for configuration values with validation
+    
+    Values are resolved and validated once, when the owning
+    ``EnhancedConfig`` compiles its snapshot; reads only load the
+    pre-validated attribute from the current snapshot.
+    """
     
     def __init__(self, config_path: str, default_value: Any = None, 
                  validator: Optional[callable] = None):
         self.config_path = config_path
+        self.keys = tuple(config_path.split('.'))
         self.default_value = default_value
         self.validator = validator
+        self.name = None
     
-    def __get__(self, instance, owner):
-        if instance is None:
-            return self
-        
-        keys = self.config_path.split('.')
-        value = instance.config
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def resolve(self, config: Dict[str, Any]) -> Any:
+        """Walk the config dict and validate the value"""
+        value = config
         
-        for key in keys:
+        for key in self.keys:
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
-                return self.default_value
+                return copy.deepcopy(self.default_value)
         
+        return self.validate(value)
+    
+    def validate(self, value: Any) -> Any:
+        """Run the validator, falling back to the default on bad input"""
         if self.validator:
             try:
                 value = self.validator(value)
             except (ValueError, TypeError) as e:
                 logger.warning(f"Invalid value for {self.config_path}: {e}")
-                return self.default_value
+                return copy.deepcopy(self.default_value)
         
-        return value
+        # Snapshots must not alias the mutable raw config
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return getattr(instance._snapshot, self.name)
+    
+    def __set__(self, instance, value):
+        instance.set_override(self.name, value)
+
+
+class ConfigSnapshot:
+    """Immutable, slotted view of a compiled configuration
+    
+    Concrete subclasses with one slot per ``ConfigProperty`` are created by
+    ``EnhancedConfig``. Hot loops can hold on to a snapshot and read its
+    fields as plain attribute loads; a refresh swaps in a new snapshot
+    instead of mutating this one.
+    """
+    
+    __slots__ = ("version", "created_at")
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Get all compiled fields as a dictionary"""
+        return {name: getattr(self, name) for name in type(self).__slots__}
+    
+    def __repr__(self):
+        return f"<{type(self).__name__} version={self.version}>"
 
 
 class EnhancedConfig:
     """Enhanced configuration class with property-based access"""
     
+    _snapshot_class = None
+    _properties: Tuple[ConfigProperty, ...] = ()
+    
     def __init__(self, config_manager: ConfigurationManager):
         self.config_manager = config_manager
         self.config = config_manager.get_config()
+        self._overrides: Dict[str, Any] = {}
+        self._version = 0
+        self._compile_lock = threading.Lock()
+        self._reload_callbacks: List[Callable[[ConfigSnapshot], None]] = []
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        self._snapshot = self._compile()
     
     # Model configurations
     manager_model = ConfigProperty("models.manager.model", "claude-3-opus-20240229")
     worker_model = ConfigProperty("models.worker.model", "claude-3-5-sonnet-20241022")
     
+    # Admission budgets (None = unlimited)
+    manager_tokens_per_minute = ConfigProperty("models.manager.tokens_per_minute", None)
+    manager_max_concurrent = ConfigProperty("models.manager.max_concurrent", None)
+    worker_tokens_per_minute = ConfigProperty("models.worker.tokens_per_minute", None)
+    worker_max_concurrent = ConfigProperty("models.worker.max_concurrent", None)
+    
     # Execution configurations
     max_workers = ConfigProperty("execution.max_workers", 3, lambda x: max(1, min(20, int(x))))
     worker_timeout = ConfigProperty("execution.worker_timeout", 300, lambda x: max(10, int(x)))
@@ -546,6 +652,26 @@ class EnhancedConfig:
     bash_max_timeout_ms = ConfigProperty("execution.bash_max_timeout_ms", 600000)
     bash_max_output_length = ConfigProperty("execution.bash_max_output_length", 30000)
     default_working_dir = ConfigProperty("execution.default_working_dir", None)
+    stream_output = ConfigProperty("execution.stream_output", True)
+    transcript_dir = ConfigProperty("execution.transcript_dir", ".taskmaster/transcripts")
+    
+    # Autoscaling configurations
+    autoscale = ConfigProperty("execution.autoscale", True)
+    min_workers = ConfigProperty("execution.min_workers", 1, lambda x: max(1, min(20, int(x))))
+    autoscale_interval = ConfigProperty("execution.autoscale_interval", 5.0, lambda x: max(1.0, float(x)))
+    target_queue_wait = ConfigProperty("execution.target_queue_wait", 60.0, lambda x: max(0.0, float(x)))
+    scale_up_cooldown = ConfigProperty("execution.scale_up_cooldown", 30.0, lambda x: max(0.0, float(x)))
+    scale_down_cooldown = ConfigProperty("execution.scale_down_cooldown", 120.0, lambda x: max(0.0, float(x)))
+    scaling_policy = ConfigProperty("execution.scaling_policy", "balanced")
+    
+    # Run dependents of unreviewed tasks in git worktrees
+    speculative_execution = ConfigProperty("execution.speculative_execution", False)
+    
+    # Run every task in its worker's own git worktree
+    isolate_workers = ConfigProperty("execution.isolate_workers", False)
+    
+    # Order in which ready tasks are handed to workers
+    task_ordering = ConfigProperty("execution.task_ordering", "critical_path")
     
     # Retry configurations
     max_retries = ConfigProperty("execution.max_retries", 3, lambda x: max(0, int(x)))
@@ -566,6 +692,9 @@ class EnhancedConfig:
     notify_on_task_complete = ConfigProperty("notifications.notify_on_task_complete", True)
     notify_on_task_failed = ConfigProperty("notifications.notify_on_task_failed", True)
     notify_on_all_complete = ConfigProperty("notifications.notify_on_all_complete", True)
+    slack_coalesce_window = ConfigProperty("notifications.slack_coalesce_window", 30.0, lambda x: max(0.0, float(x)))
+    slack_queue_size = ConfigProperty("notifications.slack_queue_size", 1000, lambda x: max(1, int(x)))
+    slack_timeout = ConfigProperty("notifications.slack_timeout", 10.0, lambda x: max(1.0, float(x)))
     
     # Claude CLI configurations
     claude_command = ConfigProperty("claude_cli.command", "claude")
@@ -580,9 +709,127 @@ class EnhancedConfig:
     # Locale configurations
     locale_language = ConfigProperty("locale.language", "en")
     
+    @classmethod
+    def _get_snapshot_class(cls):
+        """Build the slotted snapshot class for this config class once"""
+        if cls.__dict__.get("_snapshot_class") is None:
+            properties = {}
+            for klass in reversed(cls.__mro__):
+                for name, value in vars(klass).items():
+                    if isinstance(value, ConfigProperty):
+                        properties[name] = value
+            cls._properties = tuple(properties.values())
+            cls._snapshot_class = type(
+                f"{cls.__name__}Snapshot",
+                (ConfigSnapshot,),
+                {"__slots__": tuple(properties)}
+            )
+        return cls._snapshot_class
+    
+    def _compile(self) -> ConfigSnapshot:
+        """Compile the raw config and overrides into a new snapshot"""
+        snapshot_class = self._get_snapshot_class()
+        snapshot = object.__new__(snapshot_class)
+        
+        for prop in self._properties:
+            if prop.name in self._overrides:
+                value = prop.validate(self._overrides[prop.name])
+            else:
+                value = prop.resolve(self.config)
+            object.__setattr__(snapshot, prop.name, value)
+        
+        self._version += 1
+        object.__setattr__(snapshot, "version", self._version)
+        object.__setattr__(snapshot, "created_at", time.time())
+        return snapshot
+    
+    def _recompile(self):
+        """Atomically swap in a freshly compiled snapshot"""
+        with self._compile_lock:
+            snapshot = self._compile()
+            self._snapshot = snapshot
+        
+        for callback in list(self._reload_callbacks):
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.error(f"Error in config reload callback: {e}")
+    
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """The current immutable configuration snapshot"""
+        return self._snapshot
+    
+    @property
+    def version(self) -> int:
+        """Version of the current snapshot, bumped on every recompile"""
+        return self._snapshot.version
+    
+    def set_override(self, name: str, value: Any):
+        """Override a compiled field, e.g. from command line arguments
+        
+        Overrides survive ``refresh()``.
+        """
+        self._overrides[name] = value
+        self._recompile()
+    
+    def set_value(self, config_path: str, value: Any):
+        """Set a raw configuration value and recompile the snapshot"""
+        self.config_manager._set_nested_value(self.config, config_path, value)
+        self._recompile()
+    
     def refresh(self):
         """Refresh configuration from sources"""
         self.config = self.config_manager.load_configuration()
+        self._recompile()
+    
+    def add_reload_callback(self, callback: Callable[[ConfigSnapshot], None]):
+        """Register a callback invoked with each new snapshot"""
+        self._reload_callbacks.append(callback)
+    
+    def _watched_files(self) -> Dict[str, Optional[int]]:
+        """Current mtimes of every candidate config file"""
+        mtimes = {}
+        for path in self.config_manager.config_paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[path] = None
+        return mtimes
+    
+    def enable_hot_reload(self, interval: float = 2.0):
+        """Reload configuration when a config file changes on disk
+        
+        Args:
+            interval: Seconds between mtime checks
+        """
+        if self._watch_thread and self._watch_thread.is_alive():
+            return
+        
+        self._watch_stop.clear()
+        last_mtimes = self._watched_files()
+        
+        def watch_loop():
+            nonlocal last_mtimes
+            while not self._watch_stop.wait(interval):
+                current = self._watched_files()
+                if current != last_mtimes:
+                    last_mtimes = current
+                    try:
+                        self.refresh()
+                        logger.info(f"Configuration reloaded (version {self.version})")
+                    except Exception as e:
+                        logger.error(f"Failed to reload configuration: {e}")
+        
+        self._watch_thread = threading.Thread(target=watch_loop, daemon=True, name="ConfigWatcher")
+        self._watch_thread.start()
+    
+    def disable_hot_reload(self):
+        """Stop watching config files"""
+        self._watch_stop.set()
+        if self._watch_thread:
+            self._watch_thread.join(timeout=5)
+            self._watch_thread = None
     
     def get_raw_config(self) -> Dict[str, Any]:
         """Get the raw configuration dictionary"""
@@ -3,7 +3,6 @@
 import os
 import sys
 import time
-import json
 import subprocess
 import logging
 from pathlib import Path
@@ -12,6 +11,11 @@ from typing import Dict, List, Any, Optional, Set, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import threading
+import tempfile
+
+from .test_result_store import TestHistoryStore, build_junit_command, parse_junit_xml
+from .test_impact_analyzer import TestImpactAnalyzer
+from . import pytest_worker_pool
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +41,8 @@ class TestResult:
     stdout: Optional[str] = None
     stderr: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.now)
+    node_id: Optional[str] = None
+    traceback: Optional[str] = None
 
 
 @dataclass
@@ -104,10 +110,41 @@ class ContinuousTestMonitor:
         # Track file modifications
         self._file_mtimes: Dict[str, float] = {}
         
+        # Indexed result history
+        self.history = TestHistoryStore(str(self.result_dir / "test_history.db"))
+        
+        # Warm pytest workers for fast re-runs (0 disables)
+        self.warm_pool: Optional[pytest_worker_pool.PytestWorkerPool] = None
+        pool_size = self.config.get('warm_pool_size', 2)
+        if pool_size and pytest_worker_pool.is_supported():
+            project_root = self.config.get('project_root', os.getcwd())
+            preload = self.config.get('warm_pool_preload')
+            if preload is None:
+                preload = self._default_preload(project_root)
+            self.warm_pool = pytest_worker_pool.PytestWorkerPool(
+                size=pool_size,
+                preload_modules=preload,
+                project_root=project_root,
+                max_runs=self.config.get('warm_pool_max_runs', 50)
+            )
+        
         # Callbacks
         self.on_test_complete: Optional[Callable[[TestResult], None]] = None
         self.on_suite_complete: Optional[Callable[[TestSuite], None]] = None
         
+    def _default_preload(self, project_root: str) -> List[str]:
+        """pytest plus the project modules the tests import most"""
+        try:
+            analyzer = TestImpactAnalyzer(
+                root_dir=project_root,
+                test_dir=os.path.abspath(self.test_dir)
+            )
+            analyzer.refresh()
+            return ['pytest'] + analyzer.get_most_imported_modules()
+        except Exception as e:
+            logger.debug(f"Failed to pick warm pool preload modules: {e}")
+            return ['pytest']
+        
     def start(self):
         """Start continuous test monitoring"""
         if self.running:
@@ -117,6 +154,9 @@ class ContinuousTestMonitor:
         self.running = True
         self._stop_event.clear()
         
+        if self.warm_pool:
+            self.warm_pool.start()
+        
         # Start periodic test runner
         self._monitor_thread = threading.Thread(target=self._monitor_loop)
         self._monitor_thread.daemon = True
@@ -136,6 +176,9 @@ class ContinuousTestMonitor:
         if self._monitor_thread:
             self._monitor_thread.join(timeout=5)
             
+        if self.warm_pool:
+            self.warm_pool.shutdown()
+            
         logger.info("Continuous test monitoring stopped")
         
     def _monitor_loop(self):
@@ -231,27 +274,31 @@ class ContinuousTestMonitor:
         return results
         
     def _run_pytest(self, test_path: str) -> List[TestResult]:
-        """Run pytest on a file and parse results"""
+        """Run pytest on a file and ingest its JUnit XML report"""
         results = []
         
+        fd, xml_path = tempfile.mkstemp(prefix="junit_", suffix=".xml", dir=str(self.result_dir))
+        os.close(fd)
+        
         try:
-            # Run pytest with simple output
-            cmd = [
-                sys.executable, "-m", "pytest",
-                test_path,
-                "--tb=short",
-                "-v"
-            ]
+            cmd = build_junit_command(sys.executable, test_path, xml_path)
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            output = self._run_on_warm_worker(cmd[3:])
+            if output is None:
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    text=True,
+                    timeout=300  # 5 minute timeout
+                )
+                output = result.stdout + result.stderr
+            
+            if os.path.getsize(xml_path) > 0:
+                results = self._results_from_junit(xml_path, test_path)
             
-            # Parse output
-            results = self._parse_pytest_output(result.stdout + result.stderr, test_path)
+            if not results:
+                # pytest died before writing a report (e.g. usage error)
+                results = self._parse_pytest_output(output, test_path)
                 
         except subprocess.TimeoutExpired:
             logger.error(f"Test timeout: {test_path}")
@@ -271,9 +318,46 @@ class ContinuousTestMonitor:
                 duration=0.0,
                 error_message=str(e)
             ))
+        finally:
+            try:
+                os.remove(xml_path)
+            except OSError:
+                pass
             
         return results
         
+    def _run_on_warm_worker(self, pytest_args: List[str]) -> Optional[str]:
+        """Run pytest on a warm worker
+        
+        Returns:
+            Captured output, or None if the caller should spawn a fresh interpreter
+        """
+        if not self.warm_pool:
+            return None
+        
+        run = self.warm_pool.run(pytest_args, timeout=300)
+        if run is None:
+            return None
+        if run.timed_out:
+            raise subprocess.TimeoutExpired(pytest_args, 300)
+        return run.output
+        
+    def _results_from_junit(self, xml_path: str, test_path: str) -> List[TestResult]:
+        """Convert a JUnit XML report into test results"""
+        return [
+            TestResult(
+                test_name=case["test_name"],
+                test_file=test_path,
+                status=TestStatus(case["status"]),
+                duration=case["duration"],
+                error_message=case["error_message"],
+                stdout=case["stdout"],
+                node_id=case["node_id"],
+                traceback=case["traceback"]
+            )
+            for case in parse_junit_xml(xml_path, test_path)
+        ]
+        
     def _parse_pytest_output(self, output: str, test_path: str) -> List[TestResult]:
         """Parse pytest text output"""
         results = []
@@ -343,133 +427,49 @@ class ContinuousTestMonitor:
         return results
         
     def _save_suite_results(self, suite: TestSuite):
-        """Save test suite results to file"""
-        file_path = self.result_dir / f"{suite.suite_name}.json"
-        
-        data = {
-            'suite_name': suite.suite_name,
-            'start_time': suite.start_time.isoformat(),
-            'end_time': suite.end_time.isoformat() if suite.end_time else None,
-            'duration': suite.duration,
-            'passed_count': suite.passed_count,
-            'failed_count': suite.failed_count,
-            'error_count': suite.error_count,
-            'success_rate': suite.success_rate,
-            'test_results': [
-                {
-                    'test_name': r.test_name,
-                    'test_file': r.test_file,
-                    'status': r.status.value,
-                    'duration': r.duration,
-                    'error_message': r.error_message,
-                    'timestamp': r.timestamp.isoformat()
-                }
-                for r in suite.test_results
-            ]
-        }
-        
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Save test suite results to the history database"""
+        self.history.record_run(
+            suite.test_results,
+            run_type="suite",
+            suite_name=suite.suite_name,
+            started_at=suite.start_time,
+            ended_at=suite.end_time
+        )
             
     def _save_test_results(self, results: List[TestResult]):
         """Save individual test results"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        file_path = self.result_dir / f"test_run_{timestamp}.json"
-        
-        data = {
-            'timestamp': datetime.now().isoformat(),
-            'results': [
-                {
-                    'test_name': r.test_name,
-                    'test_file': r.test_file,
-                    'status': r.status.value,
-                    'duration': r.duration,
-                    'error_message': r.error_message
-                }
-                for r in results
-            ]
-        }
-        
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        self.history.record_run(results, run_type="file")
             
     def get_test_history(self, test_name: str, limit: int = 10) -> List[TestResult]:
         """Get history of test results"""
-        history = []
-        
-        # Search through saved results
-        result_files = sorted(self.result_dir.glob("*.json"), reverse=True)
-        
-        for file_path in result_files[:limit * 10]:  # Check more files
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    
-                # Check suite results
-                if 'test_results' in data:
-                    for result_data in data['test_results']:
-                        if result_data['test_name'] == test_name:
-                            result = TestResult(
-                                test_name=result_data['test_name'],
-                                test_file=result_data['test_file'],
-                                status=TestStatus(result_data['status']),
-                                duration=result_data['duration'],
-                                error_message=result_data.get('error_message'),
-                                timestamp=datetime.fromisoformat(result_data['timestamp'])
-                            )
-                            history.append(result)
-                            
-                # Check individual results
-                elif 'results' in data:
-                    for result_data in data['results']:
-                        if result_data['test_name'] == test_name:
-                            result = TestResult(
-                                test_name=result_data['test_name'],
-                                test_file=result_data['test_file'],
-                                status=TestStatus(result_data['status']),
-                                duration=result_data['duration'],
-                                error_message=result_data.get('error_message'),
-                                timestamp=datetime.fromisoformat(data['timestamp'])
-                            )
-                            history.append(result)
-                            
-                if len(history) >= limit:
-                    break
-                    
-            except Exception as e:
-                logger.debug(f"Failed to read result file {file_path}: {e}")
-                
-        return history[:limit]
+        return [
+            TestResult(
+                test_name=row['test_name'],
+                test_file=row['test_file'],
+                status=TestStatus(row['status']),
+                duration=row['duration'],
+                error_message=row['error_message'],
+                timestamp=datetime.fromisoformat(row['timestamp']),
+                node_id=row['node_id'],
+                traceback=row['traceback']
+            )
+            for row in self.history.get_history(test_name, limit)
+        ]
         
     def get_test_statistics(self) -> Dict[str, Any]:
         """Get overall test statistics"""
-        stats = {
+        stats = self.history.get_statistics(run_type="suite")
+        
+        return {
             'total_suites': len(self.test_suites),
-            'total_tests_run': 0,
-            'total_passed': 0,
-            'total_failed': 0,
-            'total_errors': 0,
-            'average_success_rate': 0.0,
-            'last_run': None
+            'total_runs': stats['total_runs'],
+            'total_tests_run': stats['total_tests_run'],
+            'total_passed': stats['total_passed'],
+            'total_failed': stats['total_failed'],
+            'total_errors': stats['total_errors'],
+            'average_success_rate': stats['average_success_rate'],
+            'last_run': stats['last_run']
         }
-        
-        if self.test_suites:
-            for suite in self.test_suites.values():
-                stats['total_tests_run'] += len(suite.test_results)
-                stats['total_passed'] += suite.passed_count
-                stats['total_failed'] += suite.failed_count
-                stats['total_errors'] += suite.error_count
-                
-            stats['average_success_rate'] = (
-                (stats['total_passed'] / stats['total_tests_run'] * 100)
-                if stats['total_tests_run'] > 0 else 0.0
-            )
-            
-            # Find most recent suite
-            latest_suite = max(self.test_suites.values(), key=lambda s: s.start_time)
-            stats['last_run'] = latest_suite.start_time.isoformat()
-            
-        return stats
 
 
 # Singleton instance
@@ -0,0 +1,198 @@
+"""Critical-path ordering of ready tasks.
+
+The task queue used to hand out ready tasks in the order they became
+ready, so workers often picked up leaf tasks while the longest chain of
+dependent work waited behind them. ``CriticalPathScheduler`` ranks each
+task by the longest duration-weighted path from the task to the end of
+the plan (the task itself plus its longest chain of dependents). Ties
+are broken by fan-out, the number of tasks that depend on it directly.
+
+Durations come from, in order of preference:
+
+- the task's own measured duration, recorded when it completed or loaded
+  from earlier runs' success feedback
+- the ``TaskComplexityAnalyzer`` estimate, scaled by the median ratio of
+  measured to estimated duration over the tasks that have both
+
+``simulate_makespan`` replays a plan on a fixed number of workers, which
+is how the ordering is compared against first-come-first-served.
+
+Typical usage example:
+    scheduler = CriticalPathScheduler()
+    scheduler.plan(pending_tasks)
+    ready.sort(key=scheduler.rank, reverse=True)
+    scheduler.record_duration(task.task_id, execution_time)
+"""
+
+import heapq
+import logging
+import statistics
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .models import WorkerTask
+from .dynamic_worker_allocation import TaskComplexityAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# Floor for durations, so a dependency always outranks its dependents
+MIN_DURATION = 1.0
+
+Rank = Tuple[float, int]
+
+
+class CriticalPathScheduler:
+    """Ranks tasks by the longest chain of work they unblock"""
+
+    def __init__(self, analyzer: Optional[TaskComplexityAnalyzer] = None):
+        self.analyzer = analyzer or TaskComplexityAnalyzer()
+        self.history: Dict[str, float] = {}  # task_id -> measured seconds
+        self.ranks: Dict[str, Rank] = {}
+        self._estimates: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def estimate(self, task: WorkerTask) -> float:
+        """Estimated duration of a task in seconds, before calibration"""
+        task_id = str(task.task_id)
+        if task_id not in self._estimates:
+            description = f"{task.description or ''} {task.details or ''}"
+            minutes = self.analyzer.analyze_task(description, task.title).estimated_duration
+            self._estimates[task_id] = max(MIN_DURATION, minutes * 60.0)
+        return self._estimates[task_id]
+
+    def record_duration(self, task_id: str, seconds: float):
+        with self._lock:
+            self.history[str(task_id)] = max(MIN_DURATION, seconds)
+
+    def load_history(self, storage) -> int:
+        """Seed measured durations from task success feedback.
+
+        Returns:
+            Number of tasks with a measured duration
+        """
+        from .feedback_model import FeedbackType
+
+        # Newest first: the latest run of a task wins
+        for feedback in storage.query(feedback_type=FeedbackType.TASK_SUCCESS):
+            seconds = feedback.metrics.execution_time
+            task_id = feedback.context.task_id
+            with self._lock:
+                if seconds and task_id and task_id not in self.history:
+                    self.history[task_id] = max(MIN_DURATION, seconds)
+        return len(self.history)
+
+    def plan(self, tasks: List[WorkerTask]) -> Dict[str, Rank]:
+        """Rank the tasks still to run by their remaining critical path.
+
+        Args:
+            tasks: Pending and in-progress tasks; dependencies outside
+                this list count as done.
+
+        Returns:
+            Dict of task_id -> (remaining path in seconds, fan-out)
+        """
+        task_map = {task.task_id: task for task in tasks}
+        for task in tasks:
+            self.estimate(task)
+        with self._lock:
+            scale = self._calibration()
+            durations = {
+                task_id: self.history.get(str(task_id)) or self.estimate(task) * scale
+                for task_id, task in task_map.items()
+            }
+
+        dependencies = {
+            task_id: {dep for dep in task.dependencies if dep in task_map and dep != task_id}
+            for task_id, task in task_map.items()
+        }
+        dependents: Dict[str, List[str]] = {task_id: [] for task_id in task_map}
+        for task_id, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(task_id)
+
+        # Walk from the last tasks of the plan back to the first
+        remaining: Dict[str, float] = {}
+        waiting = {task_id: len(children) for task_id, children in dependents.items()}
+        ready = [task_id for task_id, count in waiting.items() if count == 0]
+        while ready:
+            task_id = ready.pop()
+            remaining[task_id] = durations[task_id] + max(
+                (remaining[child] for child in dependents[task_id]), default=0.0)
+            for dep in dependencies[task_id]:
+                waiting[dep] -= 1
+                if waiting[dep] == 0:
+                    ready.append(dep)
+
+        # Tasks on a dependency cycle never become ready; rank them by their own duration
+        ranks = {
+            task_id: (remaining.get(task_id, durations[task_id]), len(dependents[task_id]))
+            for task_id in task_map
+        }
+        self.ranks = ranks
+        return ranks
+
+    def rank(self, task: WorkerTask) -> Rank:
+        """Sort key of a task; higher runs first, unplanned tasks last"""
+        return self.ranks.get(task.task_id, (0.0, 0))
+
+    def _calibration(self) -> float:
+        """Median measured/estimated duration ratio (1.0 without data)"""
+        ratios = [
+            self.history[task_id] / estimate
+            for task_id, estimate in self._estimates.items()
+            if task_id in self.history
+        ]
+        return statistics.median(ratios) if ratios else 1.0
+
+
+def simulate_makespan(tasks: Iterable[WorkerTask], durations: Dict[str, float], workers: int,
+                      rank: Optional[Callable[[WorkerTask], Any]] = None) -> float:
+    """Time to finish ``tasks`` on ``workers`` workers.
+
+    A task is queued once its dependencies finish, and an idle worker
+    takes the queued task with the highest ``rank``, or the one queued
+    first when ``rank`` is None (the orchestrator's FIFO queue). Tasks
+    that become ready at the same time are queued in the given order.
+
+    Args:
+        tasks: Tasks in plan order
+        durations: task_id -> seconds
+        workers: Number of parallel workers
+        rank: Sort key of a task, higher first
+
+    Returns:
+        Makespan in seconds (tasks on a dependency cycle are never run)
+    """
+    tasks = list(tasks)
+    task_ids = {task.task_id for task in tasks}
+    waiting = {
+        task.task_id: {dep for dep in task.dependencies if dep in task_ids}
+        for task in tasks
+    }
+    queued: List[WorkerTask] = []
+    running: List[Tuple[float, int, str]] = []
+    now = 0.0
+
+    def enqueue_ready():
+        for task in tasks:
+            if task.task_id in waiting and not waiting[task.task_id]:
+                del waiting[task.task_id]
+                queued.append(task)
+
+    enqueue_ready()
+    while queued or running:
+        while queued and len(running) < workers:
+            index = 0
+            if rank is not None:
+                index = max(range(len(queued)), key=lambda i: (rank(queued[i]), -i))
+            task = queued.pop(index)
+            heapq.heappush(running, (now + durations[task.task_id], len(running), task.task_id))
+
+        now, _, finished = heapq.heappop(running)
+        done = [finished]
+        while running and running[0][0] == now:
+            done.append(heapq.heappop(running)[2])
+        for deps in waiting.values():
+            deps.difference_update(done)
+        enqueue_ready()
+    return now
@@ -8,6 +8,8 @@ import logging
 import asyncio
 import threading
 import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -50,6 +52,7 @@ from .rollback_strategies import (
 # Import existing components
 from .task_master import TaskManager, Task as TMTask, TaskStatus as TMTaskStatus
 from .config_manager import ConfigurationManager, EnhancedConfig
+from .event_loop_monitor import EventLoopLagMonitor
 
 logger = logging.getLogger(__name__)
 
@@ -116,7 +119,7 @@ class EnhancedClaudeOrchestrator:
         self.circuit_breaker_manager = circuit_breaker_manager
         
         # Rollback components
-        rollback_storage_dir = self.config_manager.get("rollback_storage_dir", ".taskmaster/rollbacks")
+        rollback_storage_dir = self.config.get_raw_config().get("rollback_storage_dir", ".taskmaster/rollbacks")
         self.rollback_manager = create_rollback_manager(
             checkpoint_manager=self.checkpoint_manager,
             storage_dir=rollback_storage_dir
@@ -145,6 +148,15 @@ class EnhancedClaudeOrchestrator:
         # Thread safety
         self._lock = threading.Lock()
         
+        # Blocking work (task execution, checkpoint/rollback/report/trace writes)
+        # runs on bounded executors so one slow call can't stall the event loop
+        io_workers = self.config.get_raw_config().get("io_executor_workers", 4)
+        self._io_executor = ThreadPoolExecutor(max_workers=io_workers,
+                                               thread_name_prefix="enhanced-io")
+        self._execution_executor = ThreadPoolExecutor(max_workers=self.config.max_workers,
+                                                      thread_name_prefix="enhanced-exec")
+        self.loop_monitor = EventLoopLagMonitor()
+        
         # Initialize worker profiles
         self._initialize_workers()
         
@@ -222,6 +234,11 @@ class EnhancedClaudeOrchestrator:
                 )
             )
     
+    async def _offload(self, executor: ThreadPoolExecutor, func, *args, **kwargs):
+        """Run a blocking call on an executor and await its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+    
     async def process_task_enhanced(self, task_id: str, 
                                   auto_decompose: bool = True,
                                   auto_optimize: bool = True,
@@ -260,38 +277,40 @@ class EnhancedClaudeOrchestrator:
                 original_task.title
             )
             
+            timed = self.loop_monitor.timed
+            
             # Step 1: Analyze task complexity
-            await self._analyze_task_complexity(context)
-            await self._create_task_checkpoint(context, "Task complexity analyzed", 
-                                             {"complexity": context.metadata.get("task_requirements")})
+            await timed("analyze", self._analyze_task_complexity(context))
+            await timed("checkpoint", self._create_task_checkpoint(context, "Task complexity analyzed", 
+                                             {"complexity": context.metadata.get("task_requirements")}))
             
             # Step 2: Decompose if needed
             if auto_decompose:
-                await self._handle_task_decomposition(context)
+                await timed("decompose", self._handle_task_decomposition(context))
                 if context.metadata.get("decomposed"):
-                    await self._create_task_checkpoint(context, "Task decomposition completed",
-                                                     {"decomposition_plan": context.decomposition_plan})
+                    await timed("checkpoint", self._create_task_checkpoint(context, "Task decomposition completed",
+                                                     {"decomposition_plan": context.decomposition_plan}))
             
             # Step 3: Allocate worker
-            await self._allocate_worker_enhanced(context)
-            await self._create_task_checkpoint(context, "Worker allocated",
-                                             {"worker_id": context.worker_id})
+            await timed("allocate", self._allocate_worker_enhanced(context))
+            await timed("checkpoint", self._create_task_checkpoint(context, "Worker allocated",
+                                             {"worker_id": context.worker_id}))
             
             # Step 4: Execute with monitoring
-            await self._execute_task_enhanced(context)
-            await self._create_task_checkpoint(context, "Task execution completed",
-                                             {"execution_result": context.metadata.get("execution_result")})
+            await timed("execute", self._execute_task_enhanced(context))
+            await timed("checkpoint", self._create_task_checkpoint(context, "Task execution completed",
+                                             {"execution_result": context.metadata.get("execution_result")}))
             
             # Step 5: Validate results
-            await self._validate_task_results(context, validation_level)
-            await self._create_task_checkpoint(context, "Validation completed",
-                                             {"validation_result": context.metadata.get("validation_result")})
+            await timed("validate", self._validate_task_results(context, validation_level))
+            await timed("checkpoint", self._create_task_checkpoint(context, "Validation completed",
+                                             {"validation_result": context.metadata.get("validation_result")}))
             
             # Step 6: Optimize if needed
             if auto_optimize and not context.evaluation_cycles:
-                await self._optimize_task_results(context)
-                await self._create_task_checkpoint(context, "Optimization completed",
-                                                 {"optimization_cycles": len(context.evaluation_cycles)})
+                await timed("optimize", self._optimize_task_results(context))
+                await timed("checkpoint", self._create_task_checkpoint(context, "Optimization completed",
+                                                 {"optimization_cycles": len(context.evaluation_cycles)}))
             
             # Mark as completed
             context.status = EnhancedTaskStatus.COMPLETED
@@ -310,7 +329,9 @@ class EnhancedClaudeOrchestrator:
             if context.rollback_on_failure and context.last_stable_checkpoint:
                 try:
                     rollback_reason = self._determine_rollback_reason(e)
-                    await self._perform_task_rollback(context, rollback_reason)
+                    await self.loop_monitor.timed(
+                        "rollback", self._perform_task_rollback(context, rollback_reason)
+                    )
                 except Exception as rollback_error:
                     logger.error(f"Rollback failed for task {task_id}: {rollback_error}")
                     context.metadata["rollback_error"] = str(rollback_error)
@@ -322,8 +343,10 @@ class EnhancedClaudeOrchestrator:
             raise
         
         finally:
-            # Complete trace
-            self.execution_tracer.complete_trace(
+            # Complete trace (writes the trace file)
+            await self._offload(
+                self._io_executor,
+                self.execution_tracer.complete_trace,
                 context.trace_id,
                 success=(context.status == EnhancedTaskStatus.COMPLETED)
             )
@@ -495,11 +518,14 @@ class EnhancedClaudeOrchestrator:
             }
         
         # Use circuit breaker to execute
-        result = context.circuit_breaker.call(execute_task)
+        result = await self._offload(self._execution_executor,
+                                     context.circuit_breaker.call, execute_task)
         
         # Create checkpoints during execution
         if context.checkpoint_wrapper:
-            context.checkpoint_wrapper.checkpoint(
+            await self._offload(
+                self._io_executor,
+                context.checkpoint_wrapper.checkpoint,
                 "Task execution completed",
                 {"result": result}
             )
@@ -531,7 +557,9 @@ class EnhancedClaudeOrchestrator:
         )
         
         # Save validation report
-        report_path = self.validation_report_manager.save_report(validation_report)
+        report_path = await self._offload(self._io_executor,
+                                          self.validation_report_manager.save_report,
+                                          validation_report)
         
         context.metadata["validation_report"] = {
             "overall_result": validation_report.overall_result.value,
@@ -566,7 +594,9 @@ class EnhancedClaudeOrchestrator:
         
         # Run evaluation-optimization cycle
         execution_result = context.metadata.get("execution_result", {})
-        iteration_cycle = self.evaluator_optimizer.run_evaluation_cycle(
+        iteration_cycle = await self._offload(
+            self._execution_executor,
+            self.evaluator_optimizer.run_evaluation_cycle,
             context.task_id,
             context.original_task.description,
             execution_result,
@@ -682,6 +712,7 @@ class EnhancedClaudeOrchestrator:
                 "rollback_system": rollback_metrics,
                 "execution_traces": trace_analytics,
                 "evaluation_system": evaluation_analytics,
+                "event_loop": self.loop_monitor.get_report(),
                 "configuration": {
                     "max_workers": self.config.max_workers,
                     "worker_timeout": self.config.worker_timeout,
@@ -692,6 +723,15 @@ class EnhancedClaudeOrchestrator:
                 }
             }
     
+    def get_loop_lag_report(self) -> Dict[str, Any]:
+        """Get blocked event loop time per pipeline stage"""
+        return self.loop_monitor.get_report()
+    
+    def shutdown(self, wait: bool = True):
+        """Shut down the blocking-work executors"""
+        self._io_executor.shutdown(wait=wait)
+        self._execution_executor.shutdown(wait=wait)
+    
     def get_task_analytics(self, time_window_hours: int = 24) -> Dict[str, Any]:
         """Get analytics for tasks within time window"""
         cutoff_time = datetime.now() - timedelta(hours=time_window_hours)
@@ -745,8 +785,12 @@ class EnhancedClaudeOrchestrator:
                 return await self.process_task_enhanced(task_id)
         
         # Process tasks concurrently
-        tasks = [process_single_task(task_id) for task_id in task_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self.loop_monitor.start()
+        try:
+            tasks = [process_single_task(task_id) for task_id in task_ids]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await self.loop_monitor.stop()
         
         # Separate successful results from exceptions
         successful_results = []
@@ -766,7 +810,9 @@ class EnhancedClaudeOrchestrator:
             return None
         
         try:
-            checkpoint_id = self.rollback_manager.create_checkpoint(
+            checkpoint_id = await self._offload(
+                self._io_executor,
+                self.rollback_manager.create_checkpoint,
                 task_id=context.task_id,
                 task_title=context.original_task.title,
                 step_number=len(context.rollback_checkpoints) + 1,
@@ -813,10 +859,12 @@ class EnhancedClaudeOrchestrator:
             scope = self._determine_rollback_scope(context, reason)
             
             # Create rollback plan
-            plan = self.rollback_strategy_manager.create_rollback_plan(scope)
+            plan = await self._offload(self._io_executor,
+                                       self.rollback_strategy_manager.create_rollback_plan, scope)
             
             # Execute rollback
-            success, results = self.rollback_strategy_manager.execute_rollback(plan)
+            success, results = await self._offload(self._io_executor,
+                                                   self.rollback_strategy_manager.execute_rollback, plan)
             
             if success:
                 logger.info(f"Successfully rolled back task {context.task_id} to checkpoint "
@@ -893,7 +941,9 @@ class EnhancedClaudeOrchestrator:
             return False
         
         try:
-            success, data = self.rollback_manager.restore_checkpoint(
+            success, data = await self._offload(
+                self._io_executor,
+                self.rollback_manager.restore_checkpoint,
                 checkpoint_id=target_checkpoint,
                 reason=RollbackReason.MANUAL
             )
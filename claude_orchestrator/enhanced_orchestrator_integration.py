@@ -3,149 +3,84 @@ Enhanced Orchestrator Integration - Connects all communication components
 """
 import asyncio
 import logging
-from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
-import subprocess
-import json
-import tempfile
 
-from .worker_result_manager import WorkerResultManager, WorkerResult
+from .worker_result_manager import WorkerResultManager, WorkerResult, ResultStatus
 from .enhanced_review_system import EnhancedReviewSystem
 from .task_master import TaskManager, TaskStatus
-from .communication_protocol import CommunicationProtocol, MessageType
+from .session_worker_pool import SessionWorkerPool
 
 logger = logging.getLogger(__name__)
 
 
 class WorkerProcessManager:
-    """Manages worker process lifecycle and communication"""
+    """Manages worker process lifecycle and communication
     
-    def __init__(self, orchestrator_id: str):
+    Tasks run on a pool of persistent session workers that keep their
+    imports loaded; assignments, progress and results travel over pipes.
+    """
+    
+    def __init__(self, orchestrator_id: str, pool_size: int = 3,
+                 max_tasks_per_worker: int = 20, max_memory_growth_mb: int = 512):
         self.orchestrator_id = orchestrator_id
-        self.active_workers: Dict[str, subprocess.Popen] = {}
+        self.active_workers: Dict[str, int] = {}  # worker_id -> process id
         self.result_manager = WorkerResultManager()
-        self.comm_protocol = CommunicationProtocol()
-        
-    async def start_worker(self, task_id: str, worker_id: str) -> subprocess.Popen:
-        """Start a worker process with enhanced communication"""
-        # Create task file
-        task_file = Path(f".taskmaster/tasks/task_{task_id}.json")
-        
-        # Prepare worker command with enhanced session
-        cmd = [
-            sys.executable, "-m", "claude_orchestrator.enhanced_worker_session",
-            "--task-file", str(task_file),
-            "--worker-id", worker_id,
-            "--orchestrator-id", self.orchestrator_id
-        ]
-        
-        # Start worker process
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+        self.pool = SessionWorkerPool(
+            size=pool_size,
+            max_tasks=max_tasks_per_worker,
+            max_memory_growth_mb=max_memory_growth_mb
         )
         
-        self.active_workers[worker_id] = process
+    async def start(self):
+        """Start the worker pool"""
+        await self.pool.start()
         
-        # Send initial handshake
-        await self.comm_protocol.send_message(
-            sender_id=self.orchestrator_id,
-            recipient_id=worker_id,
-            message_type=MessageType.TASK_ASSIGNMENT,
-            payload={
-                'task_id': task_id,
-                'task_file': str(task_file),
-                'started_at': datetime.now().isoformat()
-            }
-        )
+    async def run_task(self, task: Dict[str, Any], worker_id: str,
+                       timeout: Optional[float] = None,
+                       on_progress: Optional[Callable[[str], None]] = None) -> WorkerResult:
+        """Run a task on a pooled worker and store its result"""
+        task_id = str(task.get('id', 'unknown'))
+        logger.info(f"Assigning task {task_id} to {worker_id}")
         
-        logger.info(f"Started worker {worker_id} for task {task_id}")
-        return process
+        def progress(message: str):
+            logger.debug(f"[{worker_id}] {message}")
+            if on_progress:
+                on_progress(message)
         
-    async def monitor_worker(self, worker_id: str, process: subprocess.Popen) -> WorkerResult:
-        """Monitor worker process and capture results"""
-        # Poll process completion
-        while process.poll() is None:
-            await asyncio.sleep(0.5)
-            
-            # Check for heartbeat
-            heartbeat_msg = await self.comm_protocol.receive_message(
-                recipient_id=self.orchestrator_id,
-                sender_id=worker_id,
-                timeout=1.0
-            )
-            
-            if heartbeat_msg and heartbeat_msg.header.message_type == MessageType.WORKER_HEARTBEAT:
-                logger.debug(f"Received heartbeat from {worker_id}")
-                
-        # Process completed - get return code
-        return_code = process.returncode
-        
-        # Capture output
-        stdout, stderr = process.communicate()
-        
-        # Get task result from database
-        task_id = self._extract_task_id(worker_id)
-        result = self.result_manager.get_latest_result(task_id)
+        self.active_workers[worker_id] = None
+        started = datetime.now()
+        try:
+            outcome = await self.pool.run_task(task, worker_id, timeout=timeout, on_progress=progress)
+        finally:
+            self.active_workers.pop(worker_id, None)
         
-        if not result:
-            # Create error result
+        if outcome.result is not None:
+            result = WorkerResult.from_dict(outcome.result)
+        else:
             result = WorkerResult(
                 task_id=task_id,
                 worker_id=worker_id,
                 status=ResultStatus.FAILED,
-                output=stdout or "",
+                output="",
                 created_files=[],
                 modified_files=[],
-                execution_time=0,
+                execution_time=(datetime.now() - started).total_seconds(),
                 tokens_used=0,
                 timestamp=datetime.now().isoformat(),
-                error_message=stderr or f"Process exited with code {return_code}"
+                error_message=outcome.error or "Worker returned no result",
+                metadata={'timed_out': outcome.timed_out, 'worker_pid': outcome.worker_pid}
             )
-            self.result_manager.store_result(result)
-            
-        # Clean up
-        del self.active_workers[worker_id]
         
+        self.result_manager.store_result(result)
         return result
         
-    def _extract_task_id(self, worker_id: str) -> str:
-        """Extract task ID from worker ID"""
-        # Worker ID format: worker_<task_id>_<timestamp>
-        parts = worker_id.split('_')
-        if len(parts) >= 2:
-            return parts[1]
-        return "unknown"
-        
     async def shutdown_all_workers(self):
-        """Gracefully shutdown all active workers"""
-        for worker_id, process in self.active_workers.items():
-            try:
-                # Send shutdown message
-                await self.comm_protocol.send_message(
-                    sender_id=self.orchestrator_id,
-                    recipient_id=worker_id,
-                    message_type=MessageType.SHUTDOWN,
-                    payload={}
-                )
-                
-                # Give worker time to cleanup
-                await asyncio.sleep(1.0)
-                
-                # Terminate if still running
-                if process.poll() is None:
-                    process.terminate()
-                    await asyncio.sleep(0.5)
-                    
-                    # Force kill if needed
-                    if process.poll() is None:
-                        process.kill()
-                        
-            except Exception as e:
-                logger.error(f"Error shutting down worker {worker_id}: {e}")
+        """Gracefully shutdown all pooled workers"""
+        try:
+            await self.pool.shutdown()
+        except Exception as e:
+            logger.error(f"Error shutting down workers: {e}")
 
 
 class EnhancedOrchestratorIntegration:
@@ -159,15 +94,22 @@ class EnhancedOrchestratorIntegration:
         self.task_manager = TaskManager()
         self.result_manager = WorkerResultManager()
         self.review_system = EnhancedReviewSystem(self.result_manager)
-        self.worker_manager = WorkerProcessManager(self.orchestrator_id)
         
         # Configuration
         self.max_parallel_workers = config.get('max_parallel_workers', 3)
         self.worker_timeout = config.get('worker_timeout', 600)  # 10 minutes
         
+        self.worker_manager = WorkerProcessManager(
+            self.orchestrator_id,
+            pool_size=self.max_parallel_workers,
+            max_tasks_per_worker=config.get('worker_max_tasks', 20),
+            max_memory_growth_mb=config.get('worker_max_memory_growth_mb', 512)
+        )
+        
     async def process_tasks(self, task_ids: List[str]):
         """Process a list of tasks with enhanced communication"""
         logger.info(f"Processing {len(task_ids)} tasks")
+        await self.worker_manager.start()
         
         # Create task queue
         task_queue = asyncio.Queue()
@@ -202,18 +144,23 @@ class EnhancedOrchestratorIntegration:
         worker_id = f"worker_{task_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         try:
-            # Update task status
-            self.task_manager.update_task_status(task_id, TaskStatus.IN_PROGRESS)
+            task = self.task_manager.get_task(task_id)
+            if task is None:
+                logger.error(f"Task {task_id} not found")
+                return
             
-            # Start worker
-            process = await self.worker_manager.start_worker(task_id, worker_id)
+            # Update task status
+            self.task_manager.update_task_status(task_id, TaskStatus.IN_PROGRESS.value)
             
-            # Monitor with timeout
-            result = await asyncio.wait_for(
-                self.worker_manager.monitor_worker(worker_id, process),
-                timeout=self.worker_timeout
+            # Run on a pooled worker; the pool kills and replaces it on timeout
+            result = await self.worker_manager.run_task(
+                task.to_dict(), worker_id, timeout=self.worker_timeout
             )
             
+            if result.metadata and result.metadata.get('timed_out'):
+                logger.error(f"Task {task_id} timed out")
+                return
+            
             # Validate result
             is_valid, message = self.result_manager.validate_result(task_id)
             
@@ -222,12 +169,6 @@ class EnhancedOrchestratorIntegration:
             else:
                 logger.warning(f"Task {task_id} validation failed: {message}")
                 
-        except asyncio.TimeoutError:
-            logger.error(f"Task {task_id} timed out")
-            # Kill the worker process
-            if worker_id in self.worker_manager.active_workers:
-                self.worker_manager.active_workers[worker_id].kill()
-                
         except Exception as e:
             logger.error(f"Error processing task {task_id}: {e}")
             
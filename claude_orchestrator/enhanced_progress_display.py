@@ -5,17 +5,26 @@ A clean, organized terminal UI that clearly shows:
 - Worker status in a table format
 - Task queue status
 - Real-time updates without visual clutter
+
+Workers only post state; they never touch the terminal. A render thread
+started with ``start()`` owns the terminal, draws at a fixed frame rate
+and rewrites only the lines that changed since the previous frame. When
+stdout is not a TTY it logs a periodic one-line summary instead.
 """
 
 import sys
 import time
+import logging
 import threading
+from collections import deque
 from typing import Dict, Optional, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 import shutil
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 
 class WorkerState(Enum):
     """Worker states with emojis"""
@@ -40,7 +49,7 @@ class WorkerInfo:
 class EnhancedProgressDisplay:
     """Enhanced progress display with clean, organized layout"""
     
-    def __init__(self, total_tasks: int = 0):
+    def __init__(self, total_tasks: int = 0, fps: float = 10.0, summary_interval: float = 30.0):
         self.total_tasks = total_tasks
         self.completed_tasks = 0
         self.failed_tasks = 0
@@ -59,17 +68,27 @@ class EnhancedProgressDisplay:
         self.terminal_width = shutil.get_terminal_size().columns
         self.last_display_lines = 0
         self.start_time = time.time()
+        self.fps = fps
+        self.summary_interval = summary_interval
+        self._previous_lines: List[str] = []
+        self._last_summary: Optional[str] = None
+        self._last_summary_time = 0.0
+        
+        # Render thread (the only writer to the terminal)
+        self._render_lock = threading.Lock()
+        self._render_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
         
         # Animation
         self.spinner_frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
         self.spinner_index = 0
         
-        # Thread safety
+        # Guards counter increments only; rendering never takes it
         self.lock = threading.Lock()
         
         # Messages log (kept separate from progress display)
-        self.messages: List[Tuple[str, str, float]] = []  # (message, level, timestamp)
         self.max_messages = 5
+        self.messages = deque(maxlen=self.max_messages)  # (message, level, timestamp)
         
     def register_worker(self, worker_id: str):
         """Register a new worker"""
@@ -80,23 +99,38 @@ class EnhancedProgressDisplay:
             )
             self.max_workers = max(self.max_workers, len(self.workers))
     
+    def unregister_worker(self, worker_id: str):
+        """Remove a worker that has stopped"""
+        with self.lock:
+            self.workers.pop(worker_id, None)
+            self.max_workers = len(self.workers)
+    
     def update_worker(self, worker_id: str, state: WorkerState, 
                      task_id: Optional[str] = None,
                      task_title: Optional[str] = None,
                      progress: Optional[Tuple[int, int]] = None):
-        """Update worker status"""
-        with self.lock:
-            if worker_id in self.workers:
-                worker = self.workers[worker_id]
-                worker.state = state
-                worker.current_task = task_id
-                worker.task_title = task_title
-                worker.progress = progress
-                
-                if state == WorkerState.WORKING and worker.start_time is None:
-                    worker.start_time = time.time()
-                elif state != WorkerState.WORKING:
-                    worker.start_time = None
+        """Update worker status
+        
+        Publishes a new WorkerInfo rather than mutating the current one,
+        so the renderer always sees a consistent row without locking.
+        """
+        worker = self.workers.get(worker_id)
+        if worker is None:
+            return
+        
+        if state == WorkerState.WORKING:
+            start_time = worker.start_time or time.time()
+        else:
+            start_time = None
+        
+        self.workers[worker_id] = replace(
+            worker,
+            state=state,
+            current_task=task_id,
+            task_title=task_title,
+            progress=progress,
+            start_time=start_time
+        )
     
     def task_completed(self, success: bool = True):
         """Mark a task as completed"""
@@ -114,72 +148,155 @@ class EnhancedProgressDisplay:
     
     def update_queue_status(self, queued: int, pending_reviews: int):
         """Update queue information"""
-        with self.lock:
-            self.queued_tasks = queued
-            self.pending_reviews = pending_reviews
+        self.queued_tasks = queued
+        self.pending_reviews = pending_reviews
     
     def add_message(self, message: str, level: str = "INFO"):
         """Add a message to the log"""
-        with self.lock:
-            self.messages.append((message, level, time.time()))
-            if len(self.messages) > self.max_messages:
-                self.messages.pop(0)
+        self.messages.append((message, level, time.time()))
     
-    def render(self):
-        """Render the complete display"""
-        if not self.is_tty:
+    def start(self):
+        """Start the render thread"""
+        if self._render_thread is not None:
+            return
+        self._stop_event.clear()
+        self._render_thread = threading.Thread(
+            target=self._render_loop, name="progress-render", daemon=True
+        )
+        self._render_thread.start()
+    
+    def stop(self, timeout: float = 1.0):
+        """Stop the render thread after drawing a final frame"""
+        thread, self._render_thread = self._render_thread, None
+        if thread is None:
             return
+        self._stop_event.set()
+        thread.join(timeout)
+        self.render()
+    
+    @property
+    def running(self) -> bool:
+        return self._render_thread is not None
+    
+    def _render_loop(self):
+        frame_interval = 1.0 / self.fps if self.fps > 0 else 0.1
+        while not self._stop_event.wait(frame_interval):
+            try:
+                self.render()
+            except Exception as e:
+                logger.debug(f"Progress render failed: {e}")
+    
+    def render(self):
+        """Render one frame
         
-        with self.lock:
-            # Clear previous display
-            self._clear_display()
-            
-            # Build display sections
-            lines = []
-            
-            # Header (single line)
-            lines.append(self._render_header())
-            lines.append("")
-            
-            # Overall progress
-            progress_lines = self._render_progress_section()
-            lines.append(progress_lines)
-            lines.append("")
+        On a TTY only the lines that differ from the previous frame are
+        rewritten. Otherwise a summary line is logged when it has changed
+        and ``summary_interval`` seconds have passed.
+        """
+        with self._render_lock:
+            if not self.is_tty:
+                self._log_summary()
+                return
             
-            # Worker status table
-            worker_lines = self._render_workers_section()
-            lines.extend(worker_lines)
-            lines.append("")
-            
-            # Queue status (only if there's something to show)
-            queue_line = self._render_queue_section()
-            if queue_line and "Empty" not in queue_line:
-                lines.append(queue_line)
-                lines.append("")
-            
-            # Recent messages (limit to avoid screen overflow)
-            message_lines = self._render_messages_section()
-            if message_lines:
-                lines.extend(message_lines[:6])  # Limit messages
-            
-            # Filter out empty lines at the end
-            while lines and lines[-1] == "":
-                lines.pop()
+            lines = self.build_lines()
+            output = self._diff_output(self._previous_lines, lines)
+            if output:
+                sys.stdout.write(output)
+                sys.stdout.flush()
             
-            # Output all lines
-            output = "\n".join(lines) + "\n"
-            sys.stdout.write(output)
-            sys.stdout.flush()
-            
-            self.last_display_lines = len(lines) + 1  # +1 for final newline
+            self._previous_lines = lines
+            self.last_display_lines = len(lines)
             self.spinner_index = (self.spinner_index + 1) % len(self.spinner_frames)
     
+    def build_lines(self) -> List[str]:
+        """Build the panel lines from a snapshot of the current state"""
+        workers = dict(self.workers)
+        messages = list(self.messages)
+        
+        lines = []
+        
+        # Header (single line)
+        lines.append(self._render_header())
+        lines.append("")
+        
+        # Overall progress
+        lines.extend(self._render_progress_section().split("\n"))
+        lines.append("")
+        
+        # Worker status table
+        lines.extend(self._render_workers_section(workers))
+        lines.append("")
+        
+        # Queue status (only if there's something to show)
+        queue_line = self._render_queue_section()
+        if queue_line:
+            lines.append(queue_line)
+            lines.append("")
+        
+        # Recent messages (limit to avoid screen overflow)
+        lines.extend(self._render_messages_section(messages))
+        
+        # Filter out empty lines at the end
+        while lines and lines[-1] == "":
+            lines.pop()
+        
+        return lines
+    
+    @staticmethod
+    def _diff_output(previous: List[str], lines: List[str]) -> str:
+        """Escape sequences that turn the previous frame into ``lines``
+        
+        The cursor is expected on the line just below the previous frame
+        and is left just below the new one.
+        """
+        if previous == lines:
+            return ""
+        
+        out = []
+        if previous:
+            out.append(f"\033[{len(previous)}A")
+        for i, line in enumerate(lines):
+            if i < len(previous) and previous[i] == line:
+                out.append("\r\n")
+            else:
+                out.append(f"\r\033[2K{line}\n")
+        
+        # Blank rows left over from a taller previous frame
+        extra = len(previous) - len(lines)
+        if extra > 0:
+            out.append("\r\033[2K\n" * extra)
+            out.append(f"\033[{extra}A")
+        
+        return "".join(out)
+    
+    def get_summary(self) -> str:
+        """One-line progress summary"""
+        busy = sum(1 for w in list(self.workers.values()) if w.state == WorkerState.WORKING)
+        parts = [
+            f"{self.completed_tasks}/{self.total_tasks} completed",
+            f"{self.active_tasks} active",
+            f"{self.failed_tasks} failed",
+            f"{busy}/{len(self.workers)} workers busy"
+        ]
+        if self.queued_tasks:
+            parts.append(f"{self.queued_tasks} queued")
+        return "Progress: " + ", ".join(parts)
+    
+    def _log_summary(self):
+        now = time.time()
+        if now - self._last_summary_time < self.summary_interval:
+            return
+        summary = self.get_summary()
+        if summary != self._last_summary:
+            logger.info(summary)
+            self._last_summary = summary
+        self._last_summary_time = now
+    
     def _clear_display(self):
         """Clear the previous display"""
         if self.last_display_lines > 0:
-            # Move cursor up and clear lines
-            for _ in range(self.last_display_lines):
-                sys.stdout.write("\033[A\033[K")
+            sys.stdout.write(self._diff_output(self._previous_lines, []))
+            sys.stdout.flush()
     
     def _render_header(self) -> str:
         """Render the header section"""
@@ -216,11 +333,11 @@ class EnhancedProgressDisplay:
         
         return "\n".join(lines)
     
-    def _render_workers_section(self) -> List[str]:
+    def _render_workers_section(self, workers: Dict[str, WorkerInfo]) -> List[str]:
         """Render the workers status table"""
         lines = ["👷 Workers:"]
         
-        if not self.workers:
+        if not workers:
             lines.append("   No workers registered")
             return lines
         
@@ -230,7 +347,7 @@ class EnhancedProgressDisplay:
         lines.append("   ├─────────┼──────────┼─────────────────────────────────────┼──────────┤")
         
         # Worker rows
-        for worker_id, worker in sorted(self.workers.items()):
+        for worker_id, worker in sorted(workers.items()):
             emoji, status = worker.state.value
             
             # Format task title
@@ -276,9 +393,9 @@ class EnhancedProgressDisplay:
         
         return "📦 Queue: " + " | ".join(items)
     
-    def _render_messages_section(self) -> List[str]:
+    def _render_messages_section(self, messages: List[Tuple[str, str, float]]) -> List[str]:
         """Render recent messages section"""
-        if not self.messages:
+        if not messages:
             return []
         
         lines = ["💬 Recent Activity:"]
@@ -292,7 +409,7 @@ class EnhancedProgressDisplay:
             "DEBUG": "🔍"
         }
         
-        for message, level, timestamp in self.messages[-self.max_messages:]:
+        for message, level, timestamp in messages[-self.max_messages:]:
             emoji = level_emojis.get(level, "•")
             # Truncate message if too long
             max_msg_len = self.terminal_width - 10
@@ -317,9 +434,11 @@ class EnhancedProgressDisplay:
     
     def clear(self):
         """Clear the entire display"""
-        if self.is_tty and self.last_display_lines > 0:
-            self._clear_display()
-            self.last_display_lines = 0
+        with self._render_lock:
+            if self.is_tty and self.last_display_lines > 0:
+                self._clear_display()
+                self._previous_lines = []
+                self.last_display_lines = 0
 
 
 # Example usage wrapper for easy integration
@@ -332,10 +451,12 @@ class ProgressDisplayAdapter:
         self.completed = 0
         self.active = 0
         self.failed = 0
+        self.display.start()
         
     def update(self, status: str = "", force: bool = False):
-        """Update the display"""
-        self.display.render()
+        """Update the display (the render thread draws the next frame)"""
+        if force:
+            self.display.render()
     
     def set_worker_task(self, worker_id: str, task_id: str, task_title: str, progress: str = ""):
         """Set worker task"""
@@ -355,26 +476,25 @@ class ProgressDisplayAdapter:
             task_title,
             progress_tuple
         )
-        self.display.render()
     
     def clear_worker_task(self, worker_id: str):
         """Clear worker task"""
         self.display.update_worker(worker_id, WorkerState.IDLE)
-        self.display.render()
     
     def log_message(self, message: str, level: str = "INFO"):
         """Log a message"""
         self.display.add_message(message, level)
-        self.display.render()
     
     def increment_completed(self):
         """Increment completed count"""
         self.completed += 1
         self.display.task_completed(True)
-        self.display.render()
     
     def increment_failed(self):
         """Increment failed count"""
         self.failed += 1
         self.display.task_completed(False)
-        self.display.render()
\ No newline at end of file
+    
+    def stop(self):
+        """Stop the render thread"""
+        self.display.stop()
@@ -10,10 +10,14 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
 import hashlib
+import logging
+from typing import Callable
 
 from .claude_session_worker import ClaudeSessionWorker
 from .worker_result_manager import WorkerResult, ResultStatus, WorkerResultManager
 
+logger = logging.getLogger(__name__)
+
 
 class FileTracker:
     """Tracks file operations during task execution"""
@@ -76,56 +80,108 @@ class FileTracker:
 class EnhancedClaudeSessionWorker(ClaudeSessionWorker):
     """Enhanced worker with better result reporting and validation"""
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init__(self, task_file: Optional[str] = None, worker_id: str = "worker",
+                 progress_callback: Optional[Callable[[str], None]] = None,
+                 result_manager: Optional[WorkerResultManager] = None):
+        if task_file is not None:
+            super().__init__(task_file)
+        else:
+            # Pooled workers receive tasks over a pipe instead of a file
+            self.task_file = None
+            self.result_file = None
+        self.worker_id = worker_id
+        self.progress_callback = progress_callback
         self.file_tracker = FileTracker()
-        self.result_manager = WorkerResultManager()
+        self._result_manager = result_manager
         self.execution_log: List[str] = []
-        
-    def run(self):
-        """Enhanced run method with comprehensive result tracking"""
+    
+    @property
+    def result_manager(self) -> WorkerResultManager:
+        # Pooled workers hand results to the orchestrator, which stores them
+        if self._result_manager is None:
+            self._result_manager = WorkerResultManager()
+        return self._result_manager
+    
+    def _load_task(self) -> Optional[Dict[str, Any]]:
+        """Load the task definition from the task file"""
+        try:
+            with open(self.task_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            self.log(f"ERROR: Could not load task file {self.task_file}: {e}")
+            return None
+    
+    def execute(self, task: Dict[str, Any]) -> WorkerResult:
+        """Execute a task and build its result without storing it"""
         start_time = time.time()
         base_path = Path.cwd()
+        task_id = str(task.get('id', 'unknown'))
         
         # Start file tracking
+        self.file_tracker = FileTracker()
         self.file_tracker.start_tracking(base_path)
-        
-        # Load and validate task
-        task = self._load_task()
-        if not task:
-            self._report_error("Failed to load task", start_time)
-            return
-            
-        task_id = task.get('id', 'unknown')
+        self.execution_log = []
         self.log(f"Starting task {task_id}: {task.get('title', 'No title')}")
         
         try:
             # Execute task with enhanced prompting
             result = self._execute_task_with_validation(task)
-            
-            # Detect file changes
-            file_changes = self.file_tracker.detect_changes(base_path)
-            
-            # Prepare detailed result
-            execution_time = time.time() - start_time
-            worker_result = WorkerResult(
+        except Exception as e:
+            self.log(f"ERROR: Task execution failed: {e}")
+            return WorkerResult(
                 task_id=task_id,
                 worker_id=self.worker_id,
-                status=ResultStatus.SUCCESS if result['success'] else ResultStatus.FAILED,
-                output=result['output'],
-                created_files=file_changes['created'],
-                modified_files=file_changes['modified'],
-                execution_time=execution_time,
-                tokens_used=result.get('usage', {}).get('tokens_used', 0),
+                status=ResultStatus.FAILED,
+                output="",
+                created_files=[],
+                modified_files=[],
+                execution_time=time.time() - start_time,
+                tokens_used=0,
                 timestamp=datetime.now().isoformat(),
-                error_message=result.get('error'),
+                error_message=f"Task execution failed: {e}",
                 metadata={
-                    'deleted_files': file_changes['deleted'],
                     'execution_log': self.execution_log,
-                    'task_type': task.get('type', 'unknown'),
-                    'task_tags': task.get('tags', [])
+                    'traceback': traceback.format_exc()
                 }
             )
+        
+        # Detect file changes
+        file_changes = self.file_tracker.detect_changes(base_path)
+        
+        # Prepare detailed result
+        return WorkerResult(
+            task_id=task_id,
+            worker_id=self.worker_id,
+            status=ResultStatus.SUCCESS if result['success'] else ResultStatus.FAILED,
+            output=result['output'],
+            created_files=file_changes['created'],
+            modified_files=file_changes['modified'],
+            execution_time=time.time() - start_time,
+            tokens_used=result.get('usage', {}).get('tokens_used', 0),
+            timestamp=datetime.now().isoformat(),
+            error_message=result.get('error'),
+            metadata={
+                'deleted_files': file_changes['deleted'],
+                'execution_log': self.execution_log,
+                'task_type': task.get('type', 'unknown'),
+                'task_tags': task.get('tags', [])
+            }
+        )
+        
+    def run(self):
+        """Enhanced run method with comprehensive result tracking"""
+        start_time = time.time()
+        
+        # Load and validate task
+        task = self._load_task()
+        if not task:
+            self._report_error("Failed to load task", start_time)
+            return
+            
+        task_id = task.get('id', 'unknown')
+        
+        try:
+            worker_result = self.execute(task)
             
             # Store result in database
             result_id = self.result_manager.store_result(worker_result)
@@ -246,4 +302,13 @@ class EnhancedClaudeSessionWorker(ClaudeSessionWorker):
     def log(self, message: str):
         """Enhanced logging that captures to execution log"""
         self.execution_log.append(f"[{datetime.now().isoformat()}] {message}")
-        super().log(message)
\ No newline at end of file
+        logger.info(message)
+        if self.progress_callback:
+            self.progress_callback(message)
+
+
+def run_session_task(task: Dict[str, Any], worker_id: str,
+                     progress: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """Session worker pool handler: execute one task and return its result"""
+    worker = EnhancedClaudeSessionWorker(worker_id=worker_id, progress_callback=progress)
+    return worker.execute(task).to_dict()
\ No newline at end of file
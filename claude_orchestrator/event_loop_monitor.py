@@ -0,0 +1,155 @@
+"""
+Event loop lag monitoring
+
+Measures how long coroutines keep the event loop busy without yielding.
+``timed(stage, coro)`` records the synchronous run time of every step of
+a coroutine under a stage name, so blocking work shows up against the
+stage that did it. A heartbeat task additionally samples overall loop
+lag (how late a periodic wake-up fires).
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, Any, Optional, Awaitable
+
+logger = logging.getLogger(__name__)
+
+
+class _StageStats:
+    """Blocked-loop time for one stage"""
+
+    __slots__ = ("calls", "steps", "blocked_total", "blocked_max")
+
+    def __init__(self):
+        self.calls = 0
+        self.steps = 0
+        self.blocked_total = 0.0
+        self.blocked_max = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "steps": self.steps,
+            "blocked_ms_total": round(self.blocked_total * 1000, 3),
+            "blocked_ms_max": round(self.blocked_max * 1000, 3)
+        }
+
+
+class _TimedCoroutine:
+    """Awaitable that drives a coroutine and times each step on the loop"""
+
+    def __init__(self, coro, stats: _StageStats, lock: threading.Lock, warn_after: float, stage: str):
+        self._coro = coro
+        self._stats = stats
+        self._lock = lock
+        self._warn_after = warn_after
+        self._stage = stage
+
+    def _record(self, elapsed: float):
+        with self._lock:
+            self._stats.steps += 1
+            self._stats.blocked_total += elapsed
+            if elapsed > self._stats.blocked_max:
+                self._stats.blocked_max = elapsed
+        if self._warn_after and elapsed > self._warn_after:
+            logger.warning(f"Stage '{self._stage}' blocked the event loop for {elapsed * 1000:.1f}ms")
+
+    def __await__(self):
+        coro = self._coro
+        value, error = None, None
+        while True:
+            start = time.perf_counter()
+            try:
+                if error is not None:
+                    yielded = coro.throw(error)
+                else:
+                    yielded = coro.send(value)
+            except StopIteration as stop:
+                self._record(time.perf_counter() - start)
+                return stop.value
+            except BaseException:
+                self._record(time.perf_counter() - start)
+                raise
+            self._record(time.perf_counter() - start)
+
+            try:
+                value, error = (yield yielded), None
+            except BaseException as e:
+                value, error = None, e
+
+
+class EventLoopLagMonitor:
+    """Per-stage blocked-loop accounting plus a loop lag heartbeat"""
+
+    def __init__(self, interval: float = 0.05, warn_after: float = 0.1):
+        """
+        Args:
+            interval: Heartbeat period in seconds
+            warn_after: Log a warning when one step blocks longer than this
+        """
+        self.interval = interval
+        self.warn_after = warn_after
+        self._stages: Dict[str, _StageStats] = {}
+        self._lock = threading.Lock()
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._lag_samples = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+
+    def timed(self, stage: str, coro) -> Awaitable:
+        """Wrap a coroutine so its time on the loop is charged to ``stage``"""
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = self._stages[stage] = _StageStats()
+            stats.calls += 1
+        return _TimedCoroutine(coro, stats, self._lock, self.warn_after, stage)
+
+    def start(self):
+        """Start the heartbeat on the running loop (idempotent)"""
+        if self._heartbeat is None or self._heartbeat.done():
+            self._heartbeat = asyncio.get_running_loop().create_task(self._run_heartbeat())
+
+    async def stop(self):
+        """Stop the heartbeat"""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat = None
+
+    async def _run_heartbeat(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            with self._lock:
+                self._lag_samples += 1
+                self._lag_total += lag
+                if lag > self._lag_max:
+                    self._lag_max = lag
+
+    def reset(self):
+        """Clear all collected statistics"""
+        with self._lock:
+            self._stages.clear()
+            self._lag_samples = 0
+            self._lag_total = 0.0
+            self._lag_max = 0.0
+
+    def get_report(self) -> Dict[str, Any]:
+        """Blocked time per stage and overall loop lag"""
+        with self._lock:
+            return {
+                "stages": {name: stats.to_dict() for name, stats in self._stages.items()},
+                "loop_lag": {
+                    "samples": self._lag_samples,
+                    "mean_ms": round(self._lag_total / self._lag_samples * 1000, 3) if self._lag_samples else 0.0,
+                    "max_ms": round(self._lag_max * 1000, 3)
+                }
+            }
@@ -3,11 +3,15 @@ Feature Flag System - Simple and Lightweight
 Following Simplicity First principle with minimal complexity
 """
 
+import os
 import json
+import time
+import hashlib
 import logging
+import threading
 from typing import Dict, Any, Optional, Union
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -29,16 +33,20 @@ class FeatureFlag:
     value: Any = None
     description: str = ""
     flag_type: FlagType = FlagType.BOOLEAN
+    rollout_percentage: Optional[float] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage"""
-        return {
+        data = {
             "name": self.name,
             "enabled": self.enabled,
             "value": self.value,
             "description": self.description,
             "flag_type": self.flag_type.value
         }
+        if self.rollout_percentage is not None:
+            data["rollout_percentage"] = self.rollout_percentage
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'FeatureFlag':
@@ -48,44 +56,103 @@ class FeatureFlag:
             enabled=data["enabled"],
             value=data.get("value"),
             description=data.get("description", ""),
-            flag_type=FlagType(data.get("flag_type", "boolean"))
+            flag_type=FlagType(data.get("flag_type", "boolean")),
+            rollout_percentage=data.get("rollout_percentage")
         )
 
 
+def rollout_bucket(flag_name: str, key: str) -> float:
+    """Deterministic bucket in [0, 100) for a flag and a task/worker id"""
+    digest = hashlib.sha1(f"{flag_name}:{key}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:4], "big") % 10000 / 100.0
+
+
 class FeatureFlagStorage:
-    """Simple file-based storage for feature flags"""
+    """Simple file-based storage for feature flags
+    
+    The in-memory table is copy-on-write: every load or change builds a
+    new dict and swaps it in with a bumped ``version``, so readers never
+    take a lock. ``maybe_reload`` re-reads the file only when its
+    mtime/size changes, and at most once per ``check_interval`` seconds.
+    """
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, check_interval: float = 1.0):
         """Initialize storage with optional config path"""
         self.config_path = Path(config_path or "feature_flags.json")
+        self.check_interval = check_interval
         self._flags: Dict[str, FeatureFlag] = {}
+        self.version = 0
+        self._file_signature = None
+        self._next_check = 0.0
+        self._write_lock = threading.Lock()
         self._load_flags()
     
+    def _stat_signature(self):
+        """Get (mtime_ns, size) of the flags file, or None if missing"""
+        try:
+            stat = os.stat(self.config_path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
+    def _swap(self, flags: Dict[str, FeatureFlag]):
+        """Publish a new flag table"""
+        self._flags = flags
+        self.version += 1
+    
     def _load_flags(self):
         """Load flags from storage"""
-        try:
-            if self.config_path.exists():
-                with open(self.config_path, 'r') as f:
-                    data = json.load(f)
-                    for flag_data in data.get("flags", []):
-                        flag = FeatureFlag.from_dict(flag_data)
-                        self._flags[flag.name] = flag
-                logger.info(f"Loaded {len(self._flags)} feature flags")
-            else:
-                logger.info("No feature flags file found, starting with empty flags")
-        except Exception as e:
-            logger.error(f"Error loading feature flags: {e}")
-            self._flags = {}
+        with self._write_lock:
+            signature = self._stat_signature()
+            flags: Dict[str, FeatureFlag] = {}
+            try:
+                if signature is not None:
+                    with open(self.config_path, 'r') as f:
+                        data = json.load(f)
+                        for flag_data in data.get("flags", []):
+                            flag = FeatureFlag.from_dict(flag_data)
+                            flags[flag.name] = flag
+                    logger.info(f"Loaded {len(flags)} feature flags")
+                else:
+                    logger.info("No feature flags file found, starting with empty flags")
+            except Exception as e:
+                logger.error(f"Error loading feature flags: {e}")
+                flags = {}
+            self._file_signature = signature
+            self._next_check = time.monotonic() + self.check_interval
+            self._swap(flags)
+    
+    def maybe_reload(self) -> bool:
+        """Reload flags if the file changed on disk
+        
+        Returns:
+            True if the table was reloaded
+        """
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+        self._next_check = now + self.check_interval
+        
+        if self._stat_signature() == self._file_signature:
+            return False
+        
+        logger.info(f"Feature flags file changed, reloading {self.config_path}")
+        self._load_flags()
+        return True
     
-    def _save_flags(self):
+    def _save_flags(self, flags: Dict[str, FeatureFlag]):
         """Save flags to storage"""
         try:
             data = {
-                "flags": [flag.to_dict() for flag in self._flags.values()]
+                "flags": [flag.to_dict() for flag in flags.values()]
             }
-            with open(self.config_path, 'w') as f:
+            tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+            with open(tmp_path, 'w') as f:
                 json.dump(data, f, indent=2)
-            logger.info(f"Saved {len(self._flags)} feature flags")
+            os.replace(tmp_path, self.config_path)
+            # Our own write must not look like an external change
+            self._file_signature = self._stat_signature()
+            logger.info(f"Saved {len(flags)} feature flags")
         except Exception as e:
             logger.error(f"Error saving feature flags: {e}")
     
@@ -95,16 +162,22 @@ class FeatureFlagStorage:
     
     def set_flag(self, flag: FeatureFlag):
         """Set a flag and save to storage"""
-        self._flags[flag.name] = flag
-        self._save_flags()
+        with self._write_lock:
+            flags = dict(self._flags)
+            flags[flag.name] = flag
+            self._swap(flags)
+            self._save_flags(flags)
     
     def delete_flag(self, name: str) -> bool:
         """Delete a flag"""
-        if name in self._flags:
-            del self._flags[name]
-            self._save_flags()
+        with self._write_lock:
+            if name not in self._flags:
+                return False
+            flags = dict(self._flags)
+            del flags[name]
+            self._swap(flags)
+            self._save_flags(flags)
             return True
-        return False
     
     def list_flags(self) -> Dict[str, FeatureFlag]:
         """List all flags"""
@@ -117,22 +190,41 @@ class FeatureFlagEvaluator:
     def __init__(self, storage: FeatureFlagStorage):
         self.storage = storage
     
-    def is_enabled(self, flag_name: str, default: bool = False) -> bool:
-        """Check if a flag is enabled"""
+    def _flag_enabled(self, flag: FeatureFlag, key: Optional[str]) -> bool:
+        """Apply the enabled switch and any percentage rollout"""
+        if not flag.enabled:
+            return False
+        if flag.rollout_percentage is None:
+            return True
+        if key is None:
+            # Without a task or worker id only a full rollout is on
+            return flag.rollout_percentage >= 100
+        return rollout_bucket(flag.name, key) < flag.rollout_percentage
+    
+    def is_enabled(self, flag_name: str, default: bool = False, key: Optional[str] = None) -> bool:
+        """Check if a flag is enabled
+        
+        Args:
+            flag_name: Flag to check
+            default: Returned when the flag does not exist
+            key: Task or worker id used for percentage rollouts
+        """
+        self.storage.maybe_reload()
         flag = self.storage.get_flag(flag_name)
         if flag is None:
             logger.debug(f"Flag '{flag_name}' not found, returning default: {default}")
             return default
-        return flag.enabled
+        return self._flag_enabled(flag, key)
     
-    def get_value(self, flag_name: str, default: Any = None) -> Any:
+    def get_value(self, flag_name: str, default: Any = None, key: Optional[str] = None) -> Any:
         """Get flag value"""
+        self.storage.maybe_reload()
         flag = self.storage.get_flag(flag_name)
         if flag is None:
             logger.debug(f"Flag '{flag_name}' not found, returning default: {default}")
             return default
         
-        if not flag.enabled:
+        if not self._flag_enabled(flag, key):
             logger.debug(f"Flag '{flag_name}' is disabled, returning default: {default}")
             return default
         
@@ -166,21 +258,77 @@ class FeatureFlagEvaluator:
         return default
 
 
+class CachedFlag:
+    """Call-site handle that re-evaluates a flag only when the table changes
+    
+    Usage::
+    
+        PARALLEL = cached_flag("enable_parallel_processing", default=True)
+        ...
+        if PARALLEL:
+            ...
+    """
+    
+    __slots__ = ("_evaluator", "name", "default", "_version", "_enabled", "_value")
+    
+    def __init__(self, evaluator: 'FeatureFlagEvaluator', name: str, default: Any = False):
+        self._evaluator = evaluator
+        self.name = name
+        self.default = default
+        self._version = -1
+        self._enabled = False
+        self._value = default
+    
+    def _refresh(self):
+        storage = self._evaluator.storage
+        storage.maybe_reload()
+        if storage.version != self._version:
+            self._version = storage.version
+            self._enabled = self._evaluator.is_enabled(self.name, bool(self.default))
+            self._value = self._evaluator.get_value(self.name, self.default)
+    
+    @property
+    def enabled(self) -> bool:
+        self._refresh()
+        return self._enabled
+    
+    @property
+    def value(self) -> Any:
+        self._refresh()
+        return self._value
+    
+    def enabled_for(self, key: str) -> bool:
+        """Evaluate a percentage rollout for a task or worker id"""
+        return self._evaluator.is_enabled(self.name, bool(self.default), key=key)
+    
+    def __bool__(self) -> bool:
+        return self.enabled
+
+
 class FeatureFlagManager:
     """Main feature flag manager - Simple facade"""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, check_interval: float = 1.0):
         """Initialize the feature flag manager"""
-        self.storage = FeatureFlagStorage(config_path)
+        self.storage = FeatureFlagStorage(config_path, check_interval=check_interval)
         self.evaluator = FeatureFlagEvaluator(self.storage)
     
-    def is_enabled(self, flag_name: str, default: bool = False) -> bool:
+    @property
+    def version(self) -> int:
+        """Version of the flag table, bumped on every change or reload"""
+        return self.storage.version
+    
+    def is_enabled(self, flag_name: str, default: bool = False, key: Optional[str] = None) -> bool:
         """Check if a feature flag is enabled"""
-        return self.evaluator.is_enabled(flag_name, default)
+        return self.evaluator.is_enabled(flag_name, default, key)
     
-    def get_value(self, flag_name: str, default: Any = None) -> Any:
+    def get_value(self, flag_name: str, default: Any = None, key: Optional[str] = None) -> Any:
         """Get feature flag value"""
-        return self.evaluator.get_value(flag_name, default)
+        return self.evaluator.get_value(flag_name, default, key)
+    
+    def cached(self, flag_name: str, default: Any = False) -> CachedFlag:
+        """Get a call-site handle for a flag"""
+        return CachedFlag(self.evaluator, flag_name, default)
     
     def get_string(self, flag_name: str, default: str = "") -> str:
         """Get string flag value"""
@@ -195,34 +343,41 @@ class FeatureFlagManager:
         return self.evaluator.get_json(flag_name, default)
     
     def create_flag(self, name: str, enabled: bool = False, value: Any = None, 
-                   description: str = "", flag_type: FlagType = FlagType.BOOLEAN):
+                   description: str = "", flag_type: FlagType = FlagType.BOOLEAN,
+                   rollout_percentage: Optional[float] = None):
         """Create a new feature flag"""
         flag = FeatureFlag(
             name=name,
             enabled=enabled,
             value=value,
             description=description,
-            flag_type=flag_type
+            flag_type=flag_type,
+            rollout_percentage=rollout_percentage
         )
         self.storage.set_flag(flag)
         logger.info(f"Created flag '{name}' (enabled: {enabled})")
     
     def update_flag(self, name: str, enabled: Optional[bool] = None, 
-                   value: Optional[Any] = None, description: Optional[str] = None):
+                   value: Optional[Any] = None, description: Optional[str] = None,
+                   rollout_percentage: Optional[float] = None):
         """Update an existing feature flag"""
         flag = self.storage.get_flag(name)
         if flag is None:
             logger.warning(f"Flag '{name}' not found for update")
             return False
         
+        # Published flags are shared by readers; never mutate them in place
+        changes = {}
         if enabled is not None:
-            flag.enabled = enabled
+            changes["enabled"] = enabled
         if value is not None:
-            flag.value = value
+            changes["value"] = value
         if description is not None:
-            flag.description = description
+            changes["description"] = description
+        if rollout_percentage is not None:
+            changes["rollout_percentage"] = rollout_percentage
         
-        self.storage.set_flag(flag)
+        self.storage.set_flag(replace(flag, **changes))
         logger.info(f"Updated flag '{name}'")
         return True
     
@@ -241,7 +396,7 @@ class FeatureFlagManager:
         return {name: flag.to_dict() for name, flag in flags.items()}
     
     def reload(self):
-        """Reload flags from storage"""
+        """Force a reload of flags from storage"""
         self.storage._load_flags()
         logger.info("Reloaded feature flags from storage")
 
@@ -258,14 +413,19 @@ def get_flag_manager(config_path: Optional[str] = None) -> FeatureFlagManager:
     return _global_flag_manager
 
 
-def is_enabled(flag_name: str, default: bool = False) -> bool:
+def is_enabled(flag_name: str, default: bool = False, key: Optional[str] = None) -> bool:
     """Convenience function to check if a flag is enabled"""
-    return get_flag_manager().is_enabled(flag_name, default)
+    return get_flag_manager().is_enabled(flag_name, default, key)
 
 
-def get_value(flag_name: str, default: Any = None) -> Any:
+def get_value(flag_name: str, default: Any = None, key: Optional[str] = None) -> Any:
     """Convenience function to get flag value"""
-    return get_flag_manager().get_value(flag_name, default)
+    return get_flag_manager().get_value(flag_name, default, key)
+
+
+def cached_flag(flag_name: str, default: Any = False) -> CachedFlag:
+    """Convenience function to get a call-site flag handle"""
+    return get_flag_manager().cached(flag_name, default)
 
 
 def get_string(flag_name: str, default: str = "") -> str:
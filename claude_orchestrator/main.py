@@ -22,6 +22,7 @@ import shlex
 from pathlib import Path
 import re
 import time
+import weakref
 # Enhanced UI imports
 from .enhanced_progress_display import EnhancedProgressDisplay, WorkerState
 from .progress_display_integration import ProgressDisplay as EnhancedProgressWrapper
@@ -284,10 +285,23 @@ from .orchestrator import ClaudeOrchestrator
 class TaskMasterInterface:
     """Interface to interact with native Task Master"""
     
-    def __init__(self):
-        self.task_manager = TaskManager()
+    def __init__(self, task_manager: Optional[TaskManager] = None):
+        self.task_manager = task_manager or TaskManager()
         self.task_ai = TaskMasterAI(self.task_manager)
-        self._subtask_cache = {}  # Cache subtask info to reduce performance impact
+        # Cache subtask info until the shared task store changes
+        self._subtask_cache = {}
+        
+        # The store lives for the whole process; hold only a weak reference
+        interface_ref = weakref.ref(self)
+        
+        def clear_cache(store):
+            interface = interface_ref()
+            if interface is None:
+                unsubscribe()
+            else:
+                interface._subtask_cache.clear()
+        
+        unsubscribe = self.task_manager.store.subscribe(clear_cache)
     
     def _format_task_output(self, task: TMTask) -> str:
         """Format task for output similar to CLI"""
@@ -371,15 +385,15 @@ class TaskMasterInterface:
     def get_task_subtask_progress(self, task_id: str) -> tuple[int, int]:
         """Get subtask progress for a task (completed, total)"""
         # Check cache first
-        if task_id in self._subtask_cache:
-            cache_time, data = self._subtask_cache[task_id]
-            if time.time() - cache_time < 5:  # Cache for 5 seconds
-                return data
+        version = self.task_manager.store.version
+        cached = self._subtask_cache.get(task_id)
+        if cached and cached[0] == version:
+            return cached[1]
         
         result = self.task_manager.get_task_subtask_progress(task_id)
         
         # Cache the result
-        self._subtask_cache[task_id] = (time.time(), result)
+        self._subtask_cache[task_id] = (version, result)
         return result
     
     def parse_prd(self, prd_content: str, auto_add: bool = True) -> List[Dict[str, Any]]:
@@ -402,6 +416,21 @@ class TaskMasterInterface:
     def complete_task(self, task_id: str) -> bool:
         """Mark a task as completed"""
         return self.task_manager.update_task_status(task_id, 'done')
+    
+    def expand_task(self, task_id: str, use_research: bool = False) -> List[Dict[str, Any]]:
+        """Expand a task into subtasks using AI"""
+        subtasks = self.task_ai.expand_task(task_id, use_research=use_research)
+        return [{'id': f"{task_id}.{st.id}", 'title': st.title} for st in subtasks]
+    
+    def expand_all(self, threshold: int = 5, use_research: bool = False,
+                   max_workers: int = 4, on_result=None) -> Dict[str, Any]:
+        """Expand every eligible task concurrently, saving once"""
+        return self.task_ai.expand_all(
+            threshold=threshold,
+            use_research=use_research,
+            max_workers=max_workers,
+            on_result=on_result
+        )
 
 
 def opus_add_task(description: str, config, task_interface: Optional[TaskMasterInterface] = None) -> bool:
@@ -608,7 +637,10 @@ def init_project():
             "slack_webhook_url": None,
             "notify_on_task_complete": True,
             "notify_on_task_failed": True,
-            "notify_on_all_complete": True
+            "notify_on_all_complete": True,
+            "slack_coalesce_window": 30.0,
+            "slack_queue_size": 1000,
+            "slack_timeout": 10.0
         },
         "git": {
             "auto_commit": False,
@@ -690,111 +722,18 @@ venv/
     return True
 
 
-def main():
-    """Main entry point for the orchestrator"""
-    import argparse
-    
-    parser = argparse.ArgumentParser(
-        description="Claude Orchestrator - Opus Manager with Sonnet Workers",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Task Management
-  co list                               # List all tasks
-  co list --filter-status pending       # List only pending tasks
-  co list --show-subtasks              # List tasks with subtasks
-  co show 1                            # Show details of task 1
-  co next                              # Get next available task
-  co update 1 --status in-progress     # Update task status
-  co expand 1 --research               # Expand task into subtasks with AI research
-  co delete 1                          # Delete a task
-  
-  # Task Creation
-  co add "Create a REST API with authentication"    # Add a new task
-  co parse requirements.txt                         # Parse PRD file
-  
-  # Orchestration
-  co run                               # Run the orchestrator
-  co run --workers 5                   # Run with 5 parallel workers
-  co run --id 123                      # Run only task with ID 123
-  
-  # Setup & Status
-  co init                              # Initialize project
-  co check                             # Check setup
-  co status                            # Check session status
-  
-  # Feedback Analysis
-  co analyze-feedback 123              # Analyze feedback for task 123
-  co worker-performance worker1        # Show performance metrics for worker
-  co feedback-report                   # Generate comprehensive feedback report
-  co export-metrics report.json        # Export metrics to file
-  
-  # Rollback Management
-  co checkpoint "Before deployment"    # Create manual checkpoint
-  co list-checkpoints                  # List available checkpoints
-  co rollback cp_20250104_120000       # Rollback to specific checkpoint
-  
-  # Test Monitoring
-  co test-status                       # Show test monitoring status
-  co test-report                       # Generate test report
-  co run-tests                         # Manually run all tests
-  co run-tests pytest                  # Run specific test suite
-  co coverage                          # Run tests with coverage report
-  
-  # Security
-  co security-audit                    # Run security audit for API keys
-        """
-    )
-    
-    parser.add_argument('command', nargs='?', default='run', 
-                       choices=['run', 'add', 'parse', 'check', 'status', 'init', 'list', 'show', 'next', 'update', 'expand', 'delete',
-                               'analyze-feedback', 'worker-performance', 'feedback-report', 'export-metrics',
-                               'checkpoint', 'rollback', 'list-checkpoints',
-                               'test-status', 'test-report', 'run-tests', 'coverage',
-                               'feedback-shell', 'security-audit'],
-                       help='Command to execute (default: run)')
-    
-    parser.add_argument('--config', '-c', 
-                       help='Path to configuration file')
-    
-    parser.add_argument('--workers', '-w', type=int,
-                       help='Override number of workers')
-    
-    parser.add_argument('--verbose', '-v', action='store_true',
-                       help='Enable verbose logging')
-    
-    parser.add_argument('--no-progress', action='store_true',
-                       help='Disable progress bar')
-    
-    parser.add_argument('--working-dir', '-d',
-                       help='Set working directory for task execution')
-    
-    parser.add_argument('--id', type=str,
-                       help='Run only a specific task by ID (e.g., --id 123)')
-    
-    # Add command specific arguments (using arg2 as a generic second argument)
-    parser.add_argument('arg2', nargs='?',
-                       help='Command argument (task description, file path, or task ID)')
-    
-    parser.add_argument('--status', '-s',
-                       choices=['pending', 'in-progress', 'done', 'review', 'deferred', 'cancelled'],
-                       help='Task status (for update command)')
-    
-    parser.add_argument('--priority', '-p',
-                       choices=['high', 'medium', 'low'],
-                       help='Task priority (for update command)')
-    
-    parser.add_argument('--filter-status',
-                       choices=['pending', 'in-progress', 'done', 'review', 'deferred', 'cancelled'],
-                       help='Filter tasks by status (for list command)')
-    
-    parser.add_argument('--show-subtasks', action='store_true',
-                       help='Show subtasks in list (for list command)')
-    
-    parser.add_argument('--research', action='store_true',
-                       help='Use AI research when expanding task (for expand command)')
-    
-    args = parser.parse_args()
+def main(args=None, parser=None):
+    """Main entry point for the orchestrator
+    
+    Args:
+        args: Already parsed arguments (from ``cli.main``); parsed from
+            ``sys.argv`` when omitted
+        parser: Parser that produced ``args``, used for usage errors
+    """
+    if args is None:
+        from .cli import build_parser
+        parser = build_parser()
+        args = parser.parse_args()
     
     # Set up logging based on verbose flag
     if args.verbose:
@@ -919,147 +858,9 @@ Examples:
             if working_dir:
                 os.chdir(original_dir)
     
-    elif args.command == 'list':
-        # List all tasks with optional filtering
-        task_interface = TaskMasterInterface()
-        tasks = task_interface.list_tasks(status=args.filter_status)
-        
-        if not tasks:
-            print("No tasks found.")
-            sys.exit(0)
-        
-        # Group tasks by status
-        status_groups = {}
-        for task in tasks:
-            status = task['status']
-            if status not in status_groups:
-                status_groups[status] = []
-            status_groups[status].append(task)
-        
-        # Display tasks
-        print("\n📋 Task List")
-        print("=" * 80)
-        
-        status_emojis = {
-            'pending': '○',
-            'in-progress': '►',
-            'done': '✓',
-            'review': '👁',
-            'deferred': '⏱',
-            'cancelled': '✗'
-        }
-        
-        priority_colors = {
-            'high': '🔴',
-            'medium': '🟡',
-            'low': '🟢'
-        }
-        
-        for status in ['in-progress', 'pending', 'review', 'done', 'deferred', 'cancelled']:
-            if status in status_groups:
-                print(f"\n{status_emojis.get(status, '?')} {status.upper()} ({len(status_groups[status])})")
-                print("-" * 40)
-                
-                for task in status_groups[status]:
-                    priority_emoji = priority_colors.get(task.get('priority', 'medium'), '⚪')
-                    print(f"{priority_emoji} [{task['id']}] {task['title'][:60]}")
-                    
-                    if args.show_subtasks and 'subtasks' in task and task['subtasks']:
-                        for subtask in task['subtasks']:
-                            subtask_emoji = status_emojis.get(subtask.get('status', 'pending'), '?')
-                            print(f"    {subtask_emoji} {subtask['id']}: {subtask['title'][:50]}")
-        
-        # Show summary
-        total = len(tasks)
-        completed = len([t for t in tasks if t['status'] == 'done'])
-        in_progress = len([t for t in tasks if t['status'] == 'in-progress'])
-        pending = len([t for t in tasks if t['status'] == 'pending'])
-        
-        print(f"\n📊 Summary: Total: {total} | ✓ Done: {completed} | ► In Progress: {in_progress} | ○ Pending: {pending}")
-        sys.exit(0)
-    
-    elif args.command == 'show':
-        # Show detailed information about a specific task
-        if not args.arg2:
-            print("Error: Task ID required for show command")
-            print("Usage: co show <task_id>")
-            sys.exit(1)
-        
-        task_interface = TaskMasterInterface()
-        task = task_interface.get_task(args.arg2)
-        
-        if not task:
-            print(f"Error: Task {args.arg2} not found")
-            sys.exit(1)
-        
-        # Display task details
-        status_emoji = {
-            'pending': '○',
-            'in-progress': '►',
-            'done': '✓',
-            'review': '👁',
-            'deferred': '⏱',
-            'cancelled': '✗'
-        }.get(task['status'], '?')
-        
-        priority_color = {
-            'high': '🔴',
-            'medium': '🟡',
-            'low': '🟢'
-        }.get(task.get('priority', 'medium'), '⚪')
-        
-        print(f"\n📋 Task Details")
-        print("=" * 80)
-        print(f"ID:          {task['id']}")
-        print(f"Title:       {task['title']}")
-        print(f"Status:      {status_emoji} {task['status']}")
-        print(f"Priority:    {priority_color} {task.get('priority', 'medium')}")
-        print(f"\nDescription:")
-        print(f"  {task.get('description', 'No description')}")
-        
-        if task.get('details'):
-            print(f"\nDetails:")
-            print(f"  {task['details']}")
-        
-        if task.get('dependencies'):
-            print(f"\nDependencies: {', '.join(map(str, task['dependencies']))}")
-        
-        if task.get('subtasks'):
-            print(f"\nSubtasks ({len(task['subtasks'])}):")
-            for st in task['subtasks']:
-                st_emoji = {
-                    'pending': '○',
-                    'in-progress': '►',
-                    'done': '✓'
-                }.get(st.get('status', 'pending'), '?')
-                print(f"  {st_emoji} {st['id']}: {st['title']}")
-        
-        sys.exit(0)
-    
-    elif args.command == 'next':
-        # Get the next available task
-        task_interface = TaskMasterInterface()
-        next_task = task_interface.get_next_task()
-        
-        if not next_task:
-            print("No available tasks. All tasks are either completed or have unmet dependencies.")
-            sys.exit(0)
-        
-        print(f"\n📋 Next Task")
-        print("=" * 80)
-        print(f"ID:       {next_task['id']}")
-        print(f"Title:    {next_task['title']}")
-        print(f"Priority: {next_task.get('priority', 'medium')}")
-        print(f"\nDescription:")
-        print(f"  {next_task.get('description', 'No description')}")
-        
-        if next_task.get('details'):
-            print(f"\nDetails:")
-            print(f"  {next_task['details']}")
-        
-        print(f"\nTo start working on this task, run:")
-        print(f"  co update {next_task['id']} --status in-progress")
-        sys.exit(0)
+    elif args.command in ('list', 'show', 'next'):
+        from .task_commands import run_task_command
+        sys.exit(run_task_command(args))
     
     elif args.command == 'update':
         # Update task status or priority
@@ -1092,9 +893,37 @@ Examples:
     
     elif args.command == 'expand':
         # Expand a task into subtasks using AI
+        if args.all:
+            task_interface = TaskMasterInterface()
+            concurrency = args.workers or 4
+            
+            def on_result(task_id, error):
+                if error:
+                    print(f"  ❌ Task {task_id}: {error[:100]}")
+                else:
+                    print(f"  ✓ Task {task_id} expanded")
+            
+            print(f"🤖 Expanding tasks with complexity >= {args.threshold} "
+                  f"({concurrency} at a time)...")
+            report = task_interface.expand_all(
+                threshold=args.threshold,
+                use_research=args.research,
+                max_workers=concurrency,
+                on_result=on_result
+            )
+            
+            created = sum(len(subtasks) for subtasks in report['expanded'].values())
+            print(f"\n✅ Created {created} subtasks across {len(report['expanded'])} tasks")
+            if report['skipped']:
+                print(f"⏭  Skipped {len(report['skipped'])} tasks below the complexity threshold")
+            if report['failed']:
+                print(f"❌ {len(report['failed'])} tasks failed to expand")
+                sys.exit(1)
+            sys.exit(0)
+        
         if not args.arg2:
             print("Error: Task ID required for expand command")
-            print("Usage: co expand <task_id> [--research]")
+            print("Usage: co expand <task_id> [--research] | co expand --all [--threshold N] [--workers N]")
             sys.exit(1)
         
         task_interface = TaskMasterInterface()
@@ -1692,8 +1521,8 @@ Examples:
         # Override config with command line args if provided
         if hasattr(args, 'workers') and args.workers:
             if hasattr(config, 'config_manager'):
-                # Enhanced config system
-                config.config_manager.config["execution"]["max_workers"] = args.workers
+                # Enhanced config system; overrides survive hot reloads
+                config.set_override("max_workers", args.workers)
             else:
                 # Legacy config system
                 config.config["execution"]["max_workers"] = args.workers
@@ -1717,7 +1546,8 @@ Examples:
             logger.info(f"Changed to working directory: {working_dir}")
         
         try:
-            orchestrator = ClaudeOrchestrator(config, working_dir)
+            orchestrator = ClaudeOrchestrator(config, working_dir,
+                                              resume=getattr(args, 'resume', False))
             orchestrator.run()
         finally:
             # Restore original directory if changed
@@ -8,9 +8,10 @@ the parallel execution of independent tasks.
 
 The OpusManager handles:
 - Task analysis and dependency resolution
-- Task prioritization and delegation
+- Task prioritization (longest remaining critical path first) and delegation
 - Progress monitoring
 - Task queue management
+- Admission control against the worker model's token budget
 
 Typical usage example:
     manager = OpusManager(config)
@@ -22,15 +23,43 @@ Typical usage example:
 import sys
 import queue
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from .models import TaskStatus, WorkerTask
+from .admission_control import AdmissionController, AdmissionTicket
+from .critical_path import CriticalPathScheduler
 # TaskMasterInterface will be injected by orchestrator
 
 logger = logging.getLogger(__name__)
 
 
+class RankedTaskQueue(queue.Queue):
+    """Task queue kept in descending ``rank`` order, FIFO among equal ranks"""
+    
+    def __init__(self, rank: Optional[Callable[[WorkerTask], Any]] = None):
+        self.rank = rank
+        super().__init__()
+    
+    def _put(self, task: WorkerTask):
+        if self.rank is not None:
+            key = self.rank(task)
+            for index, queued in enumerate(self.queue):
+                if self.rank(queued) < key:
+                    self.queue.insert(index, task)
+                    return
+        self.queue.append(task)
+    
+    def reorder(self):
+        """Re-sort the queued tasks after their ranks changed"""
+        if self.rank is None:
+            return
+        with self.mutex:
+            ordered = sorted(self.queue, key=self.rank, reverse=True)
+            self.queue.clear()
+            self.queue.extend(ordered)
+
+
 class OpusManager:
     """Opus model acting as the manager/orchestrator"""
     
@@ -47,10 +76,16 @@ class OpusManager:
             self.config.validate_execution = True
         self.max_workers = config.max_workers
         self.task_master = None  # Will be set by orchestrator
-        self.task_queue: queue.Queue[WorkerTask] = queue.Queue()
+        # Ready tasks on the longest remaining chain of work are handed out first
+        self.scheduler: Optional[CriticalPathScheduler] = None
+        if getattr(config, 'task_ordering', 'critical_path') == 'critical_path':
+            self.scheduler = CriticalPathScheduler()
+        self.task_queue = RankedTaskQueue(self.scheduler.rank if self.scheduler else None)
         self.completed_tasks: Dict[str, WorkerTask] = {}
         self.failed_tasks: Dict[str, WorkerTask] = {}
         self.active_tasks: Dict[str, WorkerTask] = {}
+        # Token/concurrency budgets (set by orchestrator)
+        self.admission: Optional[AdmissionController] = None
         
     def analyze_and_plan(self) -> List[WorkerTask]:
         """Use Opus to analyze tasks and create execution plan.
@@ -100,6 +135,11 @@ class OpusManager:
         
         # Sort tasks by dependencies and priority
         sorted_tasks = self._sort_tasks_by_dependencies(worker_tasks)
+        if self.scheduler:
+            # With positive durations this keeps dependencies ahead of dependents
+            self.scheduler.plan(worker_tasks)
+            sorted_tasks.sort(key=self.scheduler.rank, reverse=True)
+            self.task_queue.reorder()
         
         # Collect feedback for task planning decision
         if hasattr(self, 'feedback_collector') and self.feedback_collector:
@@ -167,6 +207,21 @@ class OpusManager:
         
         return sorted_tasks
     
+    def record_duration(self, task_id: str, seconds: float):
+        """Feed a measured task duration into critical-path ranking"""
+        if self.scheduler:
+            self.scheduler.record_duration(task_id, seconds)
+    
+    def load_duration_history(self, storage):
+        """Seed critical-path ranking with durations from earlier runs' feedback"""
+        if not self.scheduler:
+            return
+        try:
+            count = self.scheduler.load_history(storage)
+            logger.debug(f"Loaded measured durations of {count} tasks")
+        except Exception as e:
+            logger.debug(f"Could not load task durations from feedback: {e}")
+    
     def delegate_task(self, task: WorkerTask):
         """Add task to the queue for workers to process"""
         logger.debug(f"Delegating task {task.task_id} to worker queue")
@@ -195,6 +250,67 @@ class OpusManager:
         
         self.task_queue.put(task)
     
+    def next_task(self, timeout: float) -> Tuple[WorkerTask, Optional[AdmissionTicket]]:
+        """Take the next queued task that the worker model's budget admits.
+        
+        If the task at the head of the queue does not fit the remaining
+        token budget, a smaller queued task that does fit is taken instead;
+        otherwise the call waits up to ``timeout`` for budget to free up.
+        
+        Args:
+            timeout: Seconds to wait for a task and for admission.
+            
+        Returns:
+            Tuple of the task and its admission ticket (None without an
+            admission controller). The ticket must be released after the
+            task has run.
+            
+        Raises:
+            queue.Empty: If no task was available or admitted within timeout.
+        """
+        task = self.task_queue.get(timeout=timeout)
+        if self.admission is None:
+            return task, None
+        
+        model = self.config.worker_model
+        size = self._task_size(task)
+        estimate = self.admission.estimate(model, size)
+        ticket = self.admission.try_acquire(model, estimate, size)
+        if ticket:
+            return task, ticket
+        
+        with self.task_queue.mutex:
+            for candidate in list(self.task_queue.queue):
+                candidate_size = self._task_size(candidate)
+                candidate_estimate = self.admission.estimate(model, candidate_size)
+                if candidate_estimate >= estimate:
+                    continue
+                ticket = self.admission.try_acquire(model, candidate_estimate, candidate_size)
+                if ticket:
+                    # Swap: the smaller task runs now, the head keeps its place
+                    self.task_queue.queue.remove(candidate)
+                    self.task_queue.queue.appendleft(task)
+                    self.task_queue.not_empty.notify()
+                    self.admission.note_reordered()
+                    logger.debug(f"Admitted task {candidate.task_id} ahead of {task.task_id} "
+                                 f"(~{candidate_estimate} vs ~{estimate} tokens)")
+                    return candidate, ticket
+        
+        ticket = self.admission.acquire(model, estimate, size, timeout=timeout)
+        if ticket:
+            return task, ticket
+        
+        # Still over budget: put the task back at the front and let the caller retry
+        with self.task_queue.mutex:
+            self.task_queue.queue.appendleft(task)
+            self.task_queue.not_empty.notify()
+        raise queue.Empty
+    
+    @staticmethod
+    def _task_size(task: WorkerTask) -> int:
+        """Prompt size of a task, used to scale its token estimate"""
+        return len(task.title) + len(task.description or "") + len(task.details or "")
+    
     def monitor_progress(self):
         """Monitor and report on worker progress"""
         active_count = len(self.active_tasks)
@@ -33,6 +33,9 @@ class WorkerTask:
         result: Result output from task execution
         error: Error message if task failed
         status_message: Additional status information
+        partial_result: Output produced before a timeout, kept for retries
+        resume_session_id: Claude session to resume after a timeout
+        transcript_path: Spooled transcript of the last streaming run
     """
     task_id: str
     title: str
@@ -44,6 +47,9 @@ class WorkerTask:
     result: Optional[str] = None
     error: Optional[str] = None
     status_message: Optional[str] = None
+    partial_result: Optional[str] = None
+    resume_session_id: Optional[str] = None
+    transcript_path: Optional[str] = None
     
     def __post_init__(self):
         if self.dependencies is None:
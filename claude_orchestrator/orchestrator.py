@@ -16,7 +16,7 @@ import asyncio
 import json
 import os
 import sys
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import asdict
 import logging
 from datetime import datetime
@@ -34,6 +34,12 @@ from .models import TaskStatus, WorkerTask
 from .progress_display_integration import ProgressDisplay as EnhancedProgressWrapper
 from .task_master import TaskManager, Task as TMTask, TaskStatus as TMTaskStatus
 from .config_manager import EnhancedConfig
+from .admission_control import AdmissionController
+from .worker_autoscaler import WorkerAutoscaler, AutoscaleConfig
+from .worker_pool_manager import PoolScalingPolicy
+from .run_journal import RunJournal, JournalState, RUN_JOURNAL_FILE
+from .speculation import SpeculationTracker, Speculation
+from .worktree import GitWorktree, WorkspacePool, WorktreeError, is_git_repo
 
 # Import at module level to avoid circular imports and type annotation issues
 from typing import TYPE_CHECKING
@@ -49,9 +55,10 @@ logger = logging.getLogger(__name__)
 class TaskMasterInterface:
     """Interface for Task Master integration"""
     
-    def __init__(self):
-        self.task_manager = None
-        self._initialize_task_manager()
+    def __init__(self, task_manager: Optional[TaskManager] = None):
+        self.task_manager = task_manager
+        if self.task_manager is None:
+            self._initialize_task_manager()
     
     def _initialize_task_manager(self):
         """Initialize the Task Master if available"""
@@ -68,22 +75,20 @@ class TaskMasterInterface:
             return
         
         try:
-            # Find the task in Task Master
-            tasks = self.task_manager.list_tasks(filter_func=lambda t: str(t.id) == task_id)
-            if tasks:
-                task = tasks[0]
-                # Update task metadata with progress
-                if not task.metadata:
-                    task.metadata = {}
-                task.metadata['subtask_progress'] = {
-                    'current': current,
-                    'total': total,
-                    'updated_at': datetime.now().isoformat()
-                }
-                if status:
-                    task.metadata['subtask_status'] = status
-                # Save the update
-                self.task_manager._save_tasks()
+            # Progress is runtime state: keep it on the shared in-memory
+            # task instead of rewriting tasks.json on every tick
+            with self.task_manager.store.lock:
+                task = self.task_manager.get_task(task_id)
+                if task:
+                    metadata = getattr(task, 'metadata', None) or {}
+                    metadata['subtask_progress'] = {
+                        'current': current,
+                        'total': total,
+                        'updated_at': datetime.now().isoformat()
+                    }
+                    if status:
+                        metadata['subtask_status'] = status
+                    task.metadata = metadata
         except Exception as e:
             logger.debug(f"Failed to update subtask progress: {e}")
     
@@ -93,9 +98,10 @@ class TaskMasterInterface:
             return None
         
         try:
-            tasks = self.task_manager.list_tasks(filter_func=lambda t: str(t.id) == task_id)
-            if tasks and tasks[0].metadata:
-                return tasks[0].metadata.get('subtask_progress')
+            task = self.task_manager.get_task(task_id)
+            metadata = getattr(task, 'metadata', None)
+            if metadata:
+                return metadata.get('subtask_progress')
         except Exception as e:
             logger.debug(f"Failed to get subtask progress: {e}")
         return None
@@ -117,13 +123,15 @@ class ClaudeOrchestrator:
         progress: Progress display instance for UI updates
     """
     
-    def __init__(self, config: EnhancedConfig, working_dir: Optional[str] = None):
+    def __init__(self, config: EnhancedConfig, working_dir: Optional[str] = None,
+                 resume: bool = False):
         """Initialize the orchestrator with configuration and working directory.
         
         Args:
             config: EnhancedConfig instance with all orchestrator settings
             working_dir: Optional directory path for task execution. If not provided,
                         uses current working directory
+            resume: Continue the last run from its journal if it was interrupted
         
         Raises:
             ValueError: If working directory does not exist
@@ -145,6 +153,9 @@ class ClaudeOrchestrator:
         self.manager = OpusManager(config)
         # Share the task master interface
         self.manager.task_master = self.main_task_master
+        # Token and concurrency budgets for worker and manager models
+        self.admission = AdmissionController.from_config(config)
+        self.manager.admission = self.admission
         self.workers: List[SonnetWorker] = []
         self.max_workers = config.max_workers
         self.executor = ThreadPoolExecutor(max_workers=config.max_workers)
@@ -158,16 +169,48 @@ class ClaudeOrchestrator:
         self.usage_warnings = []
         self.workers_at_limit = set()
         
+        # Live resizing of the worker pool between min_workers and max_workers
+        self.autoscaler = None
+        if config.autoscale:
+            self.autoscaler = WorkerAutoscaler(AutoscaleConfig(
+                min_workers=min(config.min_workers, config.max_workers),
+                max_workers=config.max_workers,
+                target_queue_wait=config.target_queue_wait,
+                scale_up_cooldown=config.scale_up_cooldown,
+                scale_down_cooldown=config.scale_down_cooldown,
+                policy=PoolScalingPolicy(config.scaling_policy)
+            ))
+        self.retiring_workers = set()
+        self._admission_delays = 0
+        
+        # Journal of assignments, completions and reviews for --resume
+        self.resume = resume
+        self.journal = RunJournal(os.path.join(self.working_dir, RUN_JOURNAL_FILE))
+        
+        # Per-worker git worktrees, merged back into the working directory
+        self.isolate_workers = getattr(config, 'isolate_workers', False)
+        self.workspaces = WorkspacePool(self.working_dir)
+        self._merge_conflicts: Dict[str, int] = {}
+        
+        # Dependents of tasks awaiting review may run ahead in git worktrees
+        self.speculative = getattr(config, 'speculative_execution', False)
+        self.speculation = SpeculationTracker()
+        
         # Initialize Opus review system
         self.review_executor = ThreadPoolExecutor(max_workers=max(2, config.max_workers // 2))
         self.review_queue = queue.Queue()
         self.pending_reviews = {}  # task_id -> Future
         
         # Initialize Slack notification manager
-        self.slack_notifier = SlackNotificationManager(config.slack_webhook_url)
+        self.slack_notifier = SlackNotificationManager(
+            config.slack_webhook_url,
+            coalesce_window=config.slack_coalesce_window,
+            queue_size=config.slack_queue_size,
+            timeout=config.slack_timeout
+        )
         
-        # Task Master interface for subtask progress
-        self.task_master = TaskMasterInterface()
+        # Task Master interface for subtask progress, sharing the same TaskManager
+        self.task_master = TaskMasterInterface(self.main_task_master.task_manager)
         
         # Initialize agent router (will be set later if needed)
         self.agent_router = None
@@ -185,6 +228,7 @@ class ClaudeOrchestrator:
             self.feedback_storage = create_feedback_storage(config.feedback)
             self.feedback_analyzer = FeedbackAnalyzer(self.feedback_storage)
             self.feedback_collector = FeedbackCollector(storage=self.feedback_storage)
+            self.manager.load_duration_history(self.feedback_storage)
             logger.info("Feedback system initialized")
         
         if hasattr(config, 'rollback') and config.rollback.get('enabled', True):
@@ -254,22 +298,67 @@ class ClaudeOrchestrator:
             worker_count = max(1, optimal_workers)
         else:
             worker_count = self.max_workers
+        if self.autoscaler:
+            worker_count = max(worker_count, self.autoscaler.config.min_workers)
         
-        # Update thread pool size
-        self.executor = ThreadPoolExecutor(max_workers=worker_count)
+        # Room for every worker the autoscaler may start, plus the checkpoint thread
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers + 1)
         
         # Create workers
         for i in range(worker_count):
-            worker = self.SonnetWorker(i, self.working_dir, self.config)
-            worker.orchestrator = self  # Set reference to orchestrator
-            worker.task_master = self.main_task_master  # Share task master
-            self.workers.append(worker)
+            self._create_worker()
         
         logger.info(f"Created {worker_count} Sonnet workers for {task_count or 'unknown'} tasks")
         
         # Initialize specialized agents and dynamic routing after workers are created
         # NOTE: Specialized agents initialization removed - not implemented yet
     
+    def _create_worker(self) -> 'SonnetWorker':
+        """Create a worker with the next free id"""
+        worker = self.SonnetWorker(len(self.workers), self.working_dir, self.config)
+        worker.orchestrator = self  # Set reference to orchestrator
+        worker.task_master = self.main_task_master  # Share task master
+        self.workers.append(worker)
+        return worker
+    
+    def _live_workers(self) -> List['SonnetWorker']:
+        """Workers that are running and not retiring or stopped at a usage limit"""
+        return [
+            w for w in self.workers
+            if w.worker_id not in self.retiring_workers and w.worker_id not in self.workers_at_limit
+        ]
+    
+    def _autoscale(self):
+        """Grow or shrink the live worker pool to the autoscaler's target"""
+        # Tasks held back by admission control count as a rate-limit signal
+        delayed = self.admission.stats["delayed"]
+        if delayed > self._admission_delays:
+            self.autoscaler.record_rate_limit()
+        self._admission_delays = delayed
+        
+        live = self._live_workers()
+        target = self.autoscaler.evaluate(
+            current_workers=len(live),
+            queue_depth=self.manager.task_queue.qsize(),
+            busy_workers=len(self.manager.active_tasks)
+        )
+        # New workers would fail their tasks on the same exhausted quota
+        if self.workers_at_limit:
+            target = min(target, len(live))
+        
+        if target > len(live):
+            for _ in range(target - len(live)):
+                worker = self._create_worker()
+                if self.progress:
+                    self.progress.add_worker(worker.worker_id)
+                self.executor.submit(self.worker_loop, worker)
+        elif target < len(live):
+            # Retire idle workers, newest first; they exit before taking another task
+            busy = {t.assigned_worker for t in list(self.manager.active_tasks.values())}
+            idle = [w for w in reversed(live) if w.worker_id not in busy]
+            for worker in idle[:len(live) - target]:
+                self.retiring_workers.add(worker.worker_id)
+    
     def _check_and_delegate_new_tasks(self):
         """Check for newly available tasks and delegate them"""
         try:
@@ -281,7 +370,8 @@ class ClaudeOrchestrator:
                 set(self.manager.completed_tasks.keys()) |
                 set(self.manager.failed_tasks.keys()) |
                 set(self.manager.active_tasks.keys()) |
-                {t.task_id for t in list(self.manager.task_queue.queue)}
+                {t.task_id for t in list(self.manager.task_queue.queue)} |
+                self.speculation.task_ids()
             )
             
             # Check each task
@@ -315,8 +405,21 @@ class ClaudeOrchestrator:
                 # Get task from review queue with timeout
                 task = self.review_queue.get(timeout=1.0)
                 
+                # Wait for room in the manager model's budget
+                model = self.config.manager_model
+                ticket = self.admission.acquire(
+                    model, self.admission.estimate(model),
+                    should_stop=lambda: not self.running
+                )
+                if ticket is None:
+                    continue
+                
                 # Perform Opus review
                 review_result = self._opus_review_task(task)
+                self.admission.release(ticket, review_result.get('tokens_used'))
+                if review_result['success']:
+                    self.journal.review_done(task.task_id)
+                self._review_finished(task, review_result)
                 
                 # Collect feedback for review decision
                 if hasattr(self.manager, 'feedback_collector') and self.manager.feedback_collector:
@@ -424,128 +527,95 @@ class ClaudeOrchestrator:
             logger.info(f"Worker {worker.worker_id} started")
             
         while self.running:
+            if worker.worker_id in self.retiring_workers:
+                break
             try:
-                # Get task from queue with timeout
-                task = self.manager.task_queue.get(timeout=self.config.task_queue_timeout)
+                # One immutable config snapshot per task; a reload applies to the next task
+                cfg = self.config.snapshot
+                
+                # Get the next task the token budget admits
+                task, ticket = self.manager.next_task(cfg.task_queue_timeout)
                 
-                # Mark task as active
-                task.assigned_worker = worker.worker_id
-                self.manager.active_tasks[task.task_id] = task
+                used_tokens = None
+                try:
+                    # Mark task as active
+                    task.assigned_worker = worker.worker_id
+                    self.manager.active_tasks[task.task_id] = task
+                    self.journal.task_assigned(task, worker.worker_id)
                 
+                    # Run in the worker's worktree when isolated or ahead of unreviewed dependencies
+                    workspace, speculation = self._enter_workspace(task, worker)
 
-                # Update progress display
-                if self.use_progress_display and self.progress:
-                    # Update task counts first
-                    self.progress.active = len(self.manager.active_tasks)
-                    self.progress.update_totals(
-                        completed=len(self.manager.completed_tasks),
-                        active=len(self.manager.active_tasks),
-                        failed=len(self.manager.failed_tasks)
-                    )
+                    # Update progress display
+                    if self.use_progress_display and self.progress:
+                        # Update task counts first
+                        self.progress.active = len(self.manager.active_tasks)
+                        self.progress.update_totals(
+                            completed=len(self.manager.completed_tasks),
+                            active=len(self.manager.active_tasks),
+                            failed=len(self.manager.failed_tasks)
+                        )
                     
-                    # Set worker task with proper formatting
-                    task_display = task.title[:50] if len(task.title) > 50 else task.title
-                    self.progress.set_worker_task(worker.worker_id, task.task_id, task_display)
+                        # Set worker task with proper formatting
+                        task_display = task.title[:50] if len(task.title) > 50 else task.title
+                        self.progress.set_worker_task(worker.worker_id, task.task_id, task_display)
                     
-                    # Log task start
-                    self.progress.log_message(f"Worker {worker.worker_id} started: {task_display}", "INFO")
+                        # Log task start
+                        self.progress.log_message(f"Worker {worker.worker_id} started: {task_display}", "INFO")
                     
-                    self.progress.update()
+                        self.progress.update()
                 
-                # Track start time for performance feedback
-                start_time = time.time()
+                    # Track start time for performance feedback
+                    start_time = time.time()
                 
-                # Process task
-                completed_task = worker.process_task(task)
+                    # Process task
+                    try:
+                        completed_task = worker.process_task(task)
+                    finally:
+                        if workspace is not None:
+                            worker.working_dir = self.working_dir
+                    used_tokens = worker.current_task_tokens
+                except Exception as e:
+                    # Fail the task rather than leave it active forever
+                    self.manager.active_tasks.pop(task.task_id, None)
+                    self.speculation.drop(task.task_id)
+                    task.status = TaskStatus.FAILED
+                    task.error = f"Worker error: {e}"
+                    self.manager.failed_tasks[task.task_id] = task
+                    self.journal.task_failed(task)
+                    self.manager.task_queue.task_done()
+                    raise
+                finally:
+                    # Always return the admission slot, whatever happened above
+                    if ticket:
+                        self.admission.release(ticket, used_tokens)
                 
                 # Calculate execution time
                 execution_time = time.time() - start_time
+                
+                if self.autoscaler:
+                    error = (completed_task.error or "").lower()
+                    self.autoscaler.record_task(
+                        execution_time,
+                        completed_task.status == TaskStatus.COMPLETED,
+                        rate_limited=("usage_limit" in error or "usage limit" in error or
+                                      "rate limit" in error or "429" in error)
+                    )
 
                 # Move task to appropriate collection
                 del self.manager.active_tasks[task.task_id]
                 
-                if completed_task.status == TaskStatus.COMPLETED:
-                    # First mark as completed
-                    self.manager.completed_tasks[task.task_id] = completed_task
-                    
-                    # Update TaskMaster state
-                    try:
-                        self.manager.task_master.complete_task(str(task.task_id))
-                    except Exception as e:
-                        logger.debug(f"Could not update TaskMaster: {e}")
-                    
-                    # Collect feedback if enabled
-                    if hasattr(self.manager, 'feedback_collector') and self.manager.feedback_collector:
-                        try:
-                            # Collect success feedback with performance metrics
-                            feedback_id = self.manager.feedback_collector.collect_task_feedback(
-                                task_id=str(task.task_id),
-                                success=True,
-                                message=f"Task completed successfully by {worker.worker_id}",
-                                worker_id=worker.worker_id,
-                                execution_time=execution_time
-                            )
-                            logger.debug(f"Collected feedback {feedback_id} for completed task {task.task_id}")
-                        except Exception as e:
-                            logger.debug(f"Failed to collect feedback for task {task.task_id}: {e}")
-                    
+                if workspace is not None and self._leave_workspace(workspace, speculation, completed_task, cfg):
                     if self.use_progress_display and self.progress:
-                        # Update counts
-                        self.progress.completed += 1
-                        self.progress.active = len(self.manager.active_tasks)
-                        
-                        # Clear worker task
                         self.progress.clear_worker_task(worker.worker_id)
-                        
-                        # Log completion
-                        task_display = task.title[:40] if len(task.title) > 40 else task.title
-                        self.progress.log_message(f"✅ Task {task.task_id} completed: {task_display}", "SUCCESS")
-                    
-                    # Submit task for Opus review
-                    self.review_queue.put(completed_task)
-                    if self.use_progress_display and self.progress:
-                        self.progress.log_message(f"📋 Task {task.task_id} submitted for Opus review", "INFO")
-                    
-                    # Collect feedback for successful task
-                    if self.feedback_storage:
-                        try:
-                            from .feedback_model import create_success_feedback, FeedbackMetrics
-                            
-                            # Calculate execution time if available
-                            exec_time = getattr(completed_task, 'execution_time', None)
-                            metrics = FeedbackMetrics(
-                                execution_time=exec_time,
-                                tokens_used=getattr(completed_task, 'tokens_used', None)
-                            )
-                            
-                            feedback = create_success_feedback(
-                                task_id=str(task.task_id),
-                                message=f"Task completed successfully: {task.title}",
-                                metrics=metrics,
-                                worker_id=f"worker_{worker.worker_id}",
-                                session_id=str(id(self))
-                            )
-                            self.feedback_storage.save(feedback)
-                        except Exception as e:
-                            logger.debug(f"Failed to save task success feedback: {e}")
-                    
-                    # Create checkpoint after task completion if enabled
-                    if self.rollback_manager and self.rollback_manager.auto_checkpoint:
-                        try:
-                            from .rollback_manager import CheckpointType
-                            self.rollback_manager.update_task_state(
-                                str(task.task_id), 
-                                {"status": "completed", "title": task.title}
-                            )
-                            # This will auto-create checkpoint due to task completion
-                        except Exception as e:
-                            logger.debug(f"Failed to update rollback state: {e}")
-                    
-                    # Send Slack notification for completed task
-                    if self.config.notify_on_task_complete:
-                        self.slack_notifier.send_task_complete(task.task_id, task.title)
+                    self.manager.task_queue.task_done()
+                    continue
+                
+                if completed_task.status == TaskStatus.COMPLETED:
+                    self._record_completed_task(completed_task, worker.worker_id, execution_time, cfg)
                 else:
                     self.manager.failed_tasks[task.task_id] = completed_task
+                    self.journal.task_failed(completed_task)
                     if self.use_progress_display and self.progress:
                         # Update counts
                         self.progress.failed += 1
@@ -595,7 +665,7 @@ class ClaudeOrchestrator:
                             logger.debug(f"Failed to save task error feedback: {e}")
                     
                     # Send Slack notification for failed task
-                    if self.config.notify_on_task_failed:
+                    if cfg.notify_on_task_failed:
                         error_msg = completed_task.error or "Unknown error"
                         self.slack_notifier.send_task_failed(task.task_id, task.title, error_msg)
                     
@@ -619,14 +689,105 @@ class ClaudeOrchestrator:
                 logger.error(f"Worker {worker.worker_id} error: {e}")
                 # Continue working despite errors
         
+        if worker.worker_id in self.retiring_workers:
+            self.workspaces.discard(worker.worker_id)
+        
         if self.use_progress_display and self.progress:
             if worker.worker_id in self.workers_at_limit:
                 self.progress.log_message(f"Worker {worker.worker_id} stopped - Usage limit reached", "WARNING")
+            elif worker.worker_id in self.retiring_workers:
+                self.progress.remove_worker(worker.worker_id)
+                self.progress.log_message(f"Worker {worker.worker_id} retired by autoscaler", "INFO")
             else:
                 self.progress.log_message(f"Worker {worker.worker_id} stopped", "INFO")
         else:
             logger.info(f"Worker {worker.worker_id} stopped")
     
+    def _record_completed_task(self, completed_task: WorkerTask, worker_id: Any,
+                               execution_time: float, cfg):
+        """Book a successfully completed task and submit it for Opus review"""
+        task = completed_task
+        
+        # First mark as completed
+        self.manager.completed_tasks[task.task_id] = completed_task
+        self.manager.record_duration(task.task_id, execution_time)
+        self.journal.task_completed(completed_task)
+        
+        # Update TaskMaster state
+        try:
+            self.manager.task_master.complete_task(str(task.task_id))
+        except Exception as e:
+            logger.debug(f"Could not update TaskMaster: {e}")
+        
+        # Collect feedback if enabled
+        if hasattr(self.manager, 'feedback_collector') and self.manager.feedback_collector:
+            try:
+                # Collect success feedback with performance metrics
+                feedback_id = self.manager.feedback_collector.collect_task_feedback(
+                    task_id=str(task.task_id),
+                    success=True,
+                    message=f"Task completed successfully by {worker_id}",
+                    worker_id=worker_id,
+                    execution_time=execution_time
+                )
+                logger.debug(f"Collected feedback {feedback_id} for completed task {task.task_id}")
+            except Exception as e:
+                logger.debug(f"Failed to collect feedback for task {task.task_id}: {e}")
+        
+        if self.use_progress_display and self.progress:
+            # Update counts
+            self.progress.completed += 1
+            self.progress.active = len(self.manager.active_tasks)
+            
+            # Clear worker task
+            self.progress.clear_worker_task(worker_id)
+            
+            # Log completion
+            task_display = task.title[:40] if len(task.title) > 40 else task.title
+            self.progress.log_message(f"✅ Task {task.task_id} completed: {task_display}", "SUCCESS")
+        
+        # Submit task for Opus review
+        self._queue_review(completed_task)
+        if self.use_progress_display and self.progress:
+            self.progress.log_message(f"📋 Task {task.task_id} submitted for Opus review", "INFO")
+        
+        # Collect feedback for successful task
+        if self.feedback_storage:
+            try:
+                from .feedback_model import create_success_feedback, FeedbackMetrics
+                
+                metrics = FeedbackMetrics(
+                    execution_time=execution_time,
+                    tokens_used=getattr(completed_task, 'tokens_used', None)
+                )
+                
+                feedback = create_success_feedback(
+                    task_id=str(task.task_id),
+                    message=f"Task completed successfully: {task.title}",
+                    metrics=metrics,
+                    worker_id=f"worker_{worker_id}",
+                    session_id=str(id(self))
+                )
+                self.feedback_storage.save(feedback)
+            except Exception as e:
+                logger.debug(f"Failed to save task success feedback: {e}")
+        
+        # Create checkpoint after task completion if enabled
+        if self.rollback_manager and self.rollback_manager.auto_checkpoint:
+            try:
+                from .rollback_manager import CheckpointType
+                self.rollback_manager.update_task_state(
+                    str(task.task_id), 
+                    {"status": "completed", "title": task.title}
+                )
+                # This will auto-create checkpoint due to task completion
+            except Exception as e:
+                logger.debug(f"Failed to update rollback state: {e}")
+        
+        # Send Slack notification for completed task
+        if cfg.notify_on_task_complete:
+            self.slack_notifier.send_task_complete(task.task_id, task.title)
+    
     def run(self):
         """Run the orchestrator"""
         self.start_time = time.time()
@@ -637,10 +798,20 @@ class ClaudeOrchestrator:
         # Step 1: Analyze and plan with Opus
         tasks = self.manager.analyze_and_plan()
         
-        if not tasks:
+        # Skip whatever an interrupted run already finished
+        tasks = self._start_journal(tasks)
+        
+        if not tasks and self.review_queue.empty():
             logger.warning("No tasks to process!")
+            self.journal.close(finished=True)
             return
         
+        if (self.speculative or self.isolate_workers) and not is_git_repo(self.working_dir):
+            logger.warning("Worker isolation and speculative execution need a git repository "
+                           "with at least one commit; disabled")
+            self.speculative = False
+            self.isolate_workers = False
+        
         # Initialize workers based on task count
         self._initialize_workers(len(tasks))
         
@@ -652,6 +823,7 @@ class ClaudeOrchestrator:
         
         # Set running flag
         self.running = True
+        finished = False
         
         try:
             # Log task execution plan
@@ -705,6 +877,7 @@ class ClaudeOrchestrator:
             monitor_interval = min(5, self.config.progress_interval)  # Check at least every 5 seconds
             last_monitor = datetime.now()
             last_progress_update = time.time()
+            last_autoscale = time.time()
             
             while True:
                 # Update progress display
@@ -755,6 +928,7 @@ class ClaudeOrchestrator:
                 all_done = (
                     self.manager.task_queue.empty() and
                     len(self.manager.active_tasks) == 0 and
+                    len(self.speculation) == 0 and
                     not has_pending_tasks
                 )
                 
@@ -762,6 +936,7 @@ class ClaudeOrchestrator:
                     # Wait a bit more to ensure all reviews complete
                     logger.info("All tasks processed, waiting for reviews to complete...")
                     time.sleep(2)
+                    finished = True
                     break
                 
                 # Periodic monitoring
@@ -795,6 +970,7 @@ class ClaudeOrchestrator:
                         if (task.task_id not in self.manager.completed_tasks and
                             task.task_id not in self.manager.failed_tasks and
                             task.task_id not in self.manager.active_tasks and
+                            task.task_id not in self.speculation and
                             task.task_id not in [t.task_id for t in list(self.manager.task_queue.queue)]):
                             
                             deps_completed = all(
@@ -806,6 +982,11 @@ class ClaudeOrchestrator:
                                 logger.info(f"Dependencies satisfied for task {task.task_id}, delegating...")
                                 self.manager.delegate_task(task)
                 
+                # Resize the worker pool to the current load
+                if self.autoscaler and time.time() - last_autoscale >= self.config.autoscale_interval:
+                    self._autoscale()
+                    last_autoscale = time.time()
+                
                 # Small sleep to prevent busy waiting
                 time.sleep(0.1)
             
@@ -825,8 +1006,204 @@ class ClaudeOrchestrator:
             self.executor.shutdown(wait=True)
             self.review_executor.shutdown(wait=True)
             
+            # Reviews still queued keep the run resumable
+            self.journal.close(finished=finished and self.review_queue.empty())
+            
+            # Results still waiting for reviews are dropped; the tasks stay in progress
+            for task_id in self.speculation.task_ids():
+                self.speculation.drop(task_id)
+            self.workspaces.close()
+            
+            # Stop the render thread so the report isn't drawn over
+            if self.progress:
+                self.progress.stop()
+            
             # Final report
             self._generate_final_report()
+            
+            # Deliver queued Slack notifications and stop the dispatcher
+            self.slack_notifier.close()
+    
+    def _queue_review(self, task: WorkerTask):
+        """Submit a completed task for Opus review"""
+        self.speculation.review_queued(task.task_id)
+        self.review_queue.put(task)
+    
+    def _review_finished(self, task: WorkerTask, review_result: Dict[str, Any]):
+        """Settle speculative results that were waiting on this review"""
+        passed = review_result['success'] and not review_result.get('follow_up_count', 0)
+        self.speculation.review_finished(task.task_id, passed)
+        if self.speculative:
+            self._settle_speculations()
+    
+    def _enter_workspace(self, task: WorkerTask, worker: 'SonnetWorker'
+                         ) -> Tuple[Optional[GitWorktree], Optional[Speculation]]:
+        """Move a task into its worker's worktree if it runs isolated or speculatively
+        
+        Returns:
+            Tuple of (worktree or None, speculation or None)
+        """
+        depends_on = self.speculation.unconfirmed(task) if self.speculative else set()
+        if not depends_on and not self.isolate_workers:
+            return None, None
+        try:
+            workspace = self.workspaces.acquire(worker.worker_id)
+        except WorktreeError as e:
+            logger.warning(f"Running task {task.task_id} in the working directory: {e}")
+            return None, None
+        worker.working_dir = workspace.path
+        if not depends_on:
+            return workspace, None
+        
+        logger.info(f"Task {task.task_id} runs speculatively in {workspace.path} "
+                    f"(awaiting review: {', '.join(sorted(depends_on))})")
+        return workspace, self.speculation.start(task, depends_on, worker.worker_id)
+    
+    def _leave_workspace(self, workspace: GitWorktree, speculation: Optional[Speculation],
+                         completed_task: WorkerTask, cfg) -> bool:
+        """Merge a task's changes back, or hold them if it ran speculatively
+        
+        A task starts only once its dependencies are merged, so merging at
+        completion applies patches in dependency order. A patch that
+        conflicts with a task merged meanwhile is dropped and the task runs
+        again on top of it, up to ``max_retries`` times.
+        
+        Returns:
+            True if the task was held or queued again; otherwise it is
+            handled like any completed or failed task
+        """
+        task_id = completed_task.task_id
+        if completed_task.status != TaskStatus.COMPLETED:
+            if speculation is not None:
+                self.speculation.drop(task_id)
+            return False
+        
+        try:
+            patch = workspace.diff()
+        except WorktreeError as e:
+            logger.warning(f"Could not collect the changes of task {task_id}, running it again: {e}")
+            if speculation is not None:
+                self.speculation.drop(task_id)
+            self._rerun_task(completed_task)
+            return True
+        
+        if speculation is not None:
+            self._hold_speculation(completed_task, patch)
+            return True
+        
+        error = self.workspaces.merge(patch)
+        if not error:
+            self._merge_conflicts.pop(task_id, None)
+            return False
+        
+        attempts = self._merge_conflicts.get(task_id, 0) + 1
+        self._merge_conflicts[task_id] = attempts
+        if attempts > cfg.max_retries:
+            completed_task.status = TaskStatus.FAILED
+            completed_task.error = f"Changes conflict with the working directory: {error}"
+            return False
+        logger.warning(f"Changes of task {task_id} conflict with the working directory, "
+                       f"running it again: {error}")
+        self._rerun_task(completed_task)
+        return True
+    
+    def _hold_speculation(self, completed_task: WorkerTask, patch: str):
+        """Hold a speculative result until its dependencies' reviews settle it"""
+        task_id = completed_task.task_id
+        self.speculation.finish(task_id, patch)
+        
+        # The worker marked it done, but it is not done until committed
+        try:
+            self.main_task_master.set_task_status(task_id, "in-progress")
+        except Exception as e:
+            logger.debug(f"Could not update TaskMaster: {e}")
+        if self.use_progress_display and self.progress:
+            self.progress.log_message(f"⏸ Task {task_id} finished speculatively, waiting for reviews", "INFO")
+        
+        self._settle_speculations()
+    
+    def _settle_speculations(self):
+        """Commit or discard held results whose dependencies' reviews are done"""
+        to_commit, to_discard = self.speculation.settle()
+        for speculation in to_discard:
+            rejected = ', '.join(sorted(speculation.depends_on & self.speculation.rejected))
+            logger.info(f"Discarding speculative result of task {speculation.task.task_id}: "
+                        f"review of {rejected} asked for changes")
+            self._rerun_task(speculation.task)
+        
+        for speculation in to_commit:
+            task = speculation.task
+            error = self.workspaces.merge(speculation.patch)
+            if error:
+                self.speculation.conflict()
+                logger.warning(f"Speculative result of task {task.task_id} conflicts with the "
+                               f"working directory, running it again: {error}")
+                self._rerun_task(task)
+                continue
+            saved = self.speculation.committed(speculation)
+            logger.info(f"Committed speculative result of task {task.task_id} ({saved:.0f}s saved)")
+            self._record_completed_task(task, speculation.worker_id,
+                                        speculation.finished_at - speculation.started_at,
+                                        self.config.snapshot)
+        
+        if to_commit or to_discard:
+            self._check_and_delegate_new_tasks()
+    
+    def _rerun_task(self, task: WorkerTask):
+        """Queue a task again after its result was dropped"""
+        task.status = TaskStatus.PENDING
+        task.result = None
+        task.error = None
+        task.status_message = None
+        try:
+            self.main_task_master.set_task_status(task.task_id, "pending")
+        except Exception as e:
+            logger.debug(f"Could not update TaskMaster: {e}")
+        self.manager.delegate_task(task)
+    
+    def _start_journal(self, tasks: List[WorkerTask]) -> List[WorkerTask]:
+        """Start the run journal, restoring the interrupted run when resuming.
+        
+        Tasks the journal records as completed are put back into
+        ``completed_tasks`` (so their dependents can run) and their reviews,
+        if still outstanding, back into the review queue. Interrupted and
+        failed tasks are simply run again.
+        
+        Args:
+            tasks: Tasks from analyze_and_plan
+        
+        Returns:
+            The tasks that still need to run
+        """
+        state: Optional[JournalState] = None
+        if self.resume:
+            state = RunJournal.replay(self.journal.path)
+            if not state.resumable:
+                logger.info("No interrupted run to resume, starting a new run")
+                state = None
+        self.journal.start(state)
+        if state is None:
+            return tasks
+        
+        planned = {t.task_id for t in tasks}
+        for task_id, task in state.completed.items():
+            self.manager.completed_tasks[task_id] = task
+            if task_id in planned:
+                # Killed between journaling the completion and saving tasks.json
+                try:
+                    self.manager.task_master.complete_task(str(task_id))
+                except Exception as e:
+                    logger.debug(f"Could not update TaskMaster: {e}")
+        for task in state.pending_reviews.values():
+            self._queue_review(task)
+        
+        remaining = [t for t in tasks if t.task_id not in state.completed]
+        logger.info(
+            f"Resuming run {state.run_id}: {len(state.completed)} tasks already completed, "
+            f"{len(state.pending_reviews)} reviews restored, {len(remaining)} tasks to run "
+            f"({len(state.in_progress)} interrupted, {len(state.failed)} failed)"
+        )
+        return remaining
     
     def _generate_final_report(self):
         """Generate final execution report"""
@@ -874,7 +1251,25 @@ class ClaudeOrchestrator:
                     
             if total_tokens > 0:
                 logger.info(f"\nTotal tokens used across all workers: {total_tokens:,}")
-        
+
+            stats = self.admission.stats
+            if stats["delayed"] or stats["reordered"]:
+                logger.info(f"Admission control: {stats['delayed']} tasks delayed "
+                           f"({stats['wait_time']:.0f}s total), {stats['reordered']} reordered")
+
+            stats = self.speculation.stats
+            if stats["started"]:
+                logger.info(f"Speculative execution: {stats['started']} tasks started before their "
+                           f"dependencies' reviews, {stats['committed']} committed, "
+                           f"{stats['discarded']} discarded, {stats['conflicts']} re-run after conflicts")
+                logger.info(f"  Critical-path time saved: "
+                           f"{self._format_elapsed_time(self.speculation.critical_path_saved())}")
+
+            stats = self.workspaces.stats
+            if stats["created"]:
+                logger.info(f"Worker worktrees: {stats['created']} created, {stats['reused']} reused, "
+                           f"{stats['merged']} patches merged, {stats['conflicts']} conflicts")
+
         if self.manager.completed_tasks:
             logger.info("\nCompleted tasks:")
             for task_id, task in self.manager.completed_tasks.items():
@@ -1250,7 +1645,9 @@ Provide your review summary."""
                 return {
                     'success': True,
                     'review': opus_output,
-                    'follow_up_count': follow_up_count
+                    'follow_up_count': follow_up_count,
+                    # Text output carries no usage; approximate at ~4 characters per token
+                    'tokens_used': (len(prompt) + len(opus_output)) // 4
                 }
             else:
                 return {
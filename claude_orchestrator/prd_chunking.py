@@ -0,0 +1,248 @@
+"""Splitting, parsing and reconciling large PRDs.
+
+A large PRD does not fit comfortably in one prompt, and a single model
+call over it is slow and tends to time out. TaskMasterAI.parse_prd uses
+this module to:
+
+- split the PRD into sections at its markdown headings, packing small
+  sections together and cutting oversized ones at paragraph breaks
+- pull the JSON task array out of each model response without a greedy
+  regex over the whole reply
+- merge the per-section task lists, folding together tasks with the
+  same normalized title and resolving dependencies that refer to tasks
+  in other sections by title
+
+Typical usage example:
+    preamble, sections = split_prd(prd_text, max_chars=12000)
+    parsed = [extract_json_array(call_model(s.text)) for s in sections]
+    tasks = merge_section_tasks(parsed)
+"""
+
+import re
+import json
+import difflib
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# PRDs up to this size are parsed in a single request
+PRD_CHUNK_CHARS = 12000
+
+# Characters of the text before the first heading repeated in every section prompt
+PREAMBLE_CHARS = 2000
+
+# Title similarity needed to resolve a dependency given by title
+DEPENDENCY_TITLE_RATIO = 0.8
+
+_HEADING = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+
+_PRIORITY_RANK = {'high': 3, 'medium': 2, 'low': 1}
+
+_ARTICLES = {'a', 'an', 'the'}
+
+
+@dataclass
+class PrdSection:
+    """A chunk of a PRD sent to the model on its own"""
+    index: int
+    headings: List[str]
+    text: str
+
+
+def split_prd(content: str, max_chars: int = PRD_CHUNK_CHARS) -> Tuple[str, List[PrdSection]]:
+    """Split a PRD into sections of at most ``max_chars`` characters.
+
+    The document is cut at its shallowest heading level that occurs more
+    than once; adjacent sections are packed together while they fit.
+
+    Returns:
+        Tuple of (text before the first heading, sections)
+    """
+    lines = content.splitlines(keepends=True)
+    # Lines inside code fences (e.g. shell comments) are never headings
+    matches = []
+    in_code = False
+    for line in lines:
+        if line.lstrip().startswith("```"):
+            in_code = not in_code
+        matches.append(None if in_code else _HEADING.match(line))
+    levels = [len(match.group(1)) for match in matches if match]
+    split_level = next((lvl for lvl in sorted(set(levels)) if levels.count(lvl) > 1), None)
+
+    preamble_lines: List[str] = []
+    blocks: List[Tuple[str, List[str]]] = []
+    for line, match in zip(lines, matches, strict=True):
+        if match and split_level is not None and len(match.group(1)) <= split_level:
+            blocks.append((match.group(2), [line]))
+        elif blocks:
+            blocks[-1][1].append(line)
+        else:
+            preamble_lines.append(line)
+
+    preamble = "".join(preamble_lines).strip()
+    if not blocks:
+        blocks = [("", preamble_lines)]
+        preamble = ""
+
+    sections: List[PrdSection] = []
+    headings: List[str] = []
+    text = ""
+    for heading, block_lines in blocks:
+        for piece in _cut(("".join(block_lines)), max_chars):
+            if text and len(text) + len(piece) > max_chars:
+                sections.append(PrdSection(len(sections), headings, text))
+                headings, text = [], ""
+            if heading and heading not in headings:
+                headings.append(heading)
+            text += piece
+    if text.strip():
+        sections.append(PrdSection(len(sections), headings, text))
+    return preamble[:PREAMBLE_CHARS], sections
+
+
+def _cut(text: str, max_chars: int) -> List[str]:
+    """Cut an oversized block at paragraph breaks"""
+    if len(text) <= max_chars:
+        return [text]
+    pieces, current = [], ""
+    for paragraph in re.split(r'(?<=\n\n)', text):
+        if current and len(current) + len(paragraph) > max_chars:
+            pieces.append(current)
+            current = ""
+        current += paragraph
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def extract_json_array(text: Any) -> Optional[List[Any]]:
+    """Return the first JSON array in a model response, or None.
+
+    Each ``[`` is tried with a JSON decoder, so prose or a second array
+    after the task list does not break parsing.
+    """
+    if isinstance(text, list):
+        return text
+    if isinstance(text, dict):
+        text = text.get('response', '')
+    if not isinstance(text, str):
+        return None
+    decoder = json.JSONDecoder()
+    fallback = None
+    for match in re.finditer(r'\[', text):
+        try:
+            value, _ = decoder.raw_decode(text, match.start())
+        except json.JSONDecodeError:
+            continue
+        if isinstance(value, list):
+            if value and all(isinstance(item, dict) for item in value):
+                return value
+            if fallback is None:
+                fallback = value
+    return fallback
+
+
+def normalize_title(title: str) -> str:
+    """Lower-case title without punctuation, articles or extra whitespace"""
+    words = re.sub(r'[^a-z0-9]+', ' ', title.lower()).split()
+    return " ".join(w for w in words if w not in _ARTICLES)
+
+
+def merge_section_tasks(section_tasks: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Merge per-section task lists into one deduplicated list.
+
+    Within a section, numeric dependencies refer to that section's tasks
+    (1-based). String dependencies name a task by title and may point
+    into any section. In the result, ``dependencies`` holds 1-based
+    positions in the merged list; references that cannot be resolved or
+    that would create a cycle are dropped.
+    """
+    merged: List[Dict[str, Any]] = []
+    titles: List[str] = []
+    # (section, local position) -> merged position
+    positions: Dict[Tuple[int, int], int] = {}
+    raw_deps: List[List[Tuple[int, Any]]] = []
+
+    for section_idx, tasks in enumerate(section_tasks):
+        for local_idx, data in enumerate(tasks, 1):
+            if not isinstance(data, dict):
+                logger.warning(f"Skipping malformed task in PRD section {section_idx + 1}: {data!r}")
+                continue
+            data = dict(data)
+            data['title'] = str(data.get('title') or f'Task {len(merged) + 1}')
+            key = normalize_title(data['title'])
+            # Only matching titles are merged: "Build feature 1" and
+            # "Build feature 2" are close but different tasks
+            duplicate = titles.index(key) if key in titles else None
+            deps = data.get('dependencies') or []
+            if not isinstance(deps, list):
+                deps = [deps]
+            deps = [(section_idx, dep) for dep in deps]
+            if duplicate is not None:
+                _absorb(merged[duplicate], data)
+                raw_deps[duplicate].extend(deps)
+                positions[(section_idx, local_idx)] = duplicate
+                continue
+            positions[(section_idx, local_idx)] = len(merged)
+            merged.append(data)
+            titles.append(key)
+            raw_deps.append(deps)
+
+    edges: Dict[int, List[int]] = {i: [] for i in range(len(merged))}
+    for idx, deps in enumerate(raw_deps):
+        for section_idx, dep in deps:
+            target = _resolve(dep, section_idx, positions, titles)
+            if target is None or target == idx or target in edges[idx]:
+                continue
+            if _reaches(edges, target, idx):
+                logger.debug(f"Dropping cyclic dependency {merged[idx]['title']!r} -> {merged[target]['title']!r}")
+                continue
+            edges[idx].append(target)
+
+    for idx, data in enumerate(merged):
+        data['dependencies'] = [target + 1 for target in edges[idx]]
+    return merged
+
+
+def _find_title(key: str, titles: List[str], cutoff: float) -> Optional[int]:
+    if key in titles:
+        return titles.index(key)
+    close = difflib.get_close_matches(key, titles, n=1, cutoff=cutoff)
+    return titles.index(close[0]) if close else None
+
+
+def _absorb(kept: Dict[str, Any], duplicate: Dict[str, Any]):
+    """Fold a duplicate task into the one already kept"""
+    if _PRIORITY_RANK.get(duplicate.get('priority'), 0) > _PRIORITY_RANK.get(kept.get('priority'), 0):
+        kept['priority'] = duplicate['priority']
+    for field in ('description', 'details', 'testStrategy'):
+        if not kept.get(field) and duplicate.get(field):
+            kept[field] = duplicate[field]
+
+
+def _resolve(dep: Any, section_idx: int, positions: Dict[Tuple[int, int], int],
+             titles: List[str]) -> Optional[int]:
+    if isinstance(dep, bool):
+        return None
+    if isinstance(dep, str) and dep.strip().isdigit():
+        dep = int(dep.strip())
+    if isinstance(dep, int):
+        return positions.get((section_idx, dep))
+    if isinstance(dep, str):
+        # Cross-section references are by title; allow some paraphrasing
+        return _find_title(normalize_title(dep), titles, DEPENDENCY_TITLE_RATIO)
+    return None
+
+
+def _reaches(edges: Dict[int, List[int]], start: int, goal: int) -> bool:
+    stack, seen = [start], set()
+    while stack:
+        node = stack.pop()
+        if node == goal:
+            return True
+        if node not in seen:
+            seen.add(node)
+            stack.extend(edges[node])
+    return False
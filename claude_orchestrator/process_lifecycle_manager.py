@@ -15,6 +15,7 @@ from .enhanced_review_system import EnhancedReviewSystem
 from .task_master import TaskManager, TaskStatus
 from .enhanced_prompts import EnhancedPromptSystem
 from .communication_protocol import CommunicationProtocol, MessageType
+from .state_store import StateStore, LIFECYCLE_STATES, get_state_store
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +62,7 @@ class ProcessContext:
 class ProcessLifecycleManager:
     """Manages the complete lifecycle of task processing"""
     
-    def __init__(self, orchestrator_id: str):
+    def __init__(self, orchestrator_id: str, state_store: Optional[StateStore] = None):
         self.orchestrator_id = orchestrator_id
         self.contexts: Dict[str, ProcessContext] = {}
         self.state_transitions: Dict[ProcessState, List[ProcessState]] = {
@@ -85,49 +86,53 @@ class ProcessLifecycleManager:
         self.prompt_system = EnhancedPromptSystem()
         self.comm_protocol = CommunicationProtocol()
         
-        # State persistence
+        # State persistence: one row per task in the shared state store
+        self.states = (state_store or get_state_store()).table(LIFECYCLE_STATES)
+        # Pre-state-store location, imported once
         self.state_file = Path(".taskmaster/lifecycle_states.json")
         self._load_states()
         
     def _load_states(self):
         """Load persisted states"""
-        if self.state_file.exists():
-            try:
+        try:
+            records = self.states.all()
+            if not records and self.state_file.exists():
                 with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                    for task_id, context_data in data.items():
-                        self.contexts[task_id] = ProcessContext(
-                            task_id=task_id,
-                            task_data=context_data['task_data'],
-                            state=ProcessState(context_data['state']),
-                            worker_id=context_data.get('worker_id'),
-                            retry_count=context_data.get('retry_count', 0),
-                            created_at=datetime.fromisoformat(context_data['created_at']),
-                            updated_at=datetime.fromisoformat(context_data['updated_at']),
-                            error_messages=context_data.get('error_messages', [])
-                        )
-            except Exception as e:
-                logger.error(f"Failed to load states: {e}")
+                    records = [dict(context_data, task_id=task_id)
+                               for task_id, context_data in json.load(f).items()]
+                for record in records:
+                    self.states.upsert(record)
+                logger.info(f"Imported {len(records)} lifecycle states from {self.state_file}")
+            for context_data in records:
+                task_id = context_data['task_id']
+                self.contexts[task_id] = ProcessContext(
+                    task_id=task_id,
+                    task_data=context_data['task_data'],
+                    state=ProcessState(context_data['state']),
+                    worker_id=context_data.get('worker_id'),
+                    retry_count=context_data.get('retry_count', 0),
+                    created_at=datetime.fromisoformat(context_data['created_at']),
+                    updated_at=datetime.fromisoformat(context_data['updated_at']),
+                    error_messages=context_data.get('error_messages', [])
+                )
+        except Exception as e:
+            logger.error(f"Failed to load states: {e}")
                 
-    def _save_states(self):
-        """Persist current states"""
+    def _save_state(self, context: ProcessContext):
+        """Persist one task's state"""
         try:
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            data = {}
-            for task_id, context in self.contexts.items():
-                data[task_id] = {
-                    'task_data': context.task_data,
-                    'state': context.state.value,
-                    'worker_id': context.worker_id,
-                    'retry_count': context.retry_count,
-                    'created_at': context.created_at.isoformat(),
-                    'updated_at': context.updated_at.isoformat(),
-                    'error_messages': context.error_messages
-                }
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self.states.upsert({
+                'task_id': context.task_id,
+                'task_data': context.task_data,
+                'state': context.state.value,
+                'worker_id': context.worker_id,
+                'retry_count': context.retry_count,
+                'created_at': context.created_at.isoformat(),
+                'updated_at': context.updated_at.isoformat(),
+                'error_messages': context.error_messages
+            })
         except Exception as e:
-            logger.error(f"Failed to save states: {e}")
+            logger.error(f"Failed to save state for task {context.task_id}: {e}")
             
     async def initialize_task(self, task_id: str, task_data: Dict[str, Any]) -> ProcessContext:
         """Initialize a new task in the lifecycle"""
@@ -138,7 +143,7 @@ class ProcessLifecycleManager:
         )
         
         self.contexts[task_id] = context
-        self._save_states()
+        self._save_state(context)
         
         logger.info(f"Initialized lifecycle for task {task_id}")
         return context
@@ -160,7 +165,7 @@ class ProcessLifecycleManager:
         # Update state
         context.state = new_state
         context.updated_at = datetime.now()
-        self._save_states()
+        self._save_state(context)
         
         # Send state change notification
         await self.comm_protocol.send_message(
@@ -343,6 +348,8 @@ class ProcessLifecycleManager:
             else:
                 # Reset to pending
                 context.state = ProcessState.PENDING
+                context.updated_at = datetime.now()
+                self._save_state(context)
                 
     def get_statistics(self) -> Dict[str, int]:
         """Get lifecycle statistics"""
@@ -0,0 +1,350 @@
+"""Shared resource monitor for sandboxed processes.
+
+SecureSandbox used to start one polling thread per command, and each
+thread read memory, CPU, open files and sockets every 500 ms. With many
+concurrent commands that meant one thread and a steady stream of /proc
+walks per process. The ProcessMonitor watches every sandboxed PID from a
+single thread:
+
+- exit events come from pidfds registered with the platform selector
+  (epoll on Linux), so finished processes are dropped without polling;
+  where pidfds are unavailable, exits are detected while sampling
+- cheap checks (RSS, CPU) run often, starting every ``min_interval`` and
+  backing off to ``max_interval`` while memory stays well under the limit
+- expensive checks (file descriptor and socket enumeration) run on a
+  separate, slower schedule
+- a violating process gets SIGTERM, then SIGKILL after ``kill_grace``
+  seconds, without blocking the monitor thread
+
+Typical usage example:
+    monitor = get_process_monitor()
+    watch = monitor.watch(proc.pid, max_memory=256 * 1024 * 1024,
+                          network_allowed=False, on_violation=violations.append)
+    proc.wait()
+    monitor.unwatch(proc.pid)
+    print(watch.peak_rss)
+"""
+
+import os
+import time
+import errno
+import logging
+import platform
+import selectors
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+# Memory above this fraction of the limit keeps RSS sampling at min_interval
+MEMORY_WATCH_RATIO = 0.5
+
+# CPU usage logged as high
+HIGH_CPU_PERCENT = 90
+
+
+@dataclass
+class WatchedProcess:
+    """Limits, schedule and latest readings for one watched process"""
+    pid: int
+    max_memory: Optional[int] = None
+    max_open_files: Optional[int] = None
+    network_allowed: bool = True
+    on_violation: Optional[Callable[[str], None]] = None
+    on_exit: Optional[Callable[[int], None]] = None
+    process: Optional[psutil.Process] = None
+    pidfd: Optional[int] = None
+    interval: float = 0.0
+    next_cheap: float = 0.0
+    next_expensive: float = 0.0
+    kill_at: Optional[float] = None
+    exited: bool = False
+    rss: int = 0
+    peak_rss: int = 0
+    cpu_percent: float = 0.0
+    num_threads: int = 0
+    num_fds: int = 0
+    samples: Dict[str, int] = field(default_factory=lambda: {"cheap": 0, "expensive": 0})
+
+    def resources_used(self) -> Dict[str, float]:
+        return {
+            "cpu_percent": self.cpu_percent,
+            "memory_mb": self.rss / 1024 / 1024,
+            "peak_memory_mb": self.peak_rss / 1024 / 1024,
+            "num_threads": self.num_threads
+        }
+
+
+class ProcessMonitor:
+    """Monitors many processes from one thread"""
+
+    def __init__(self,
+                 min_interval: float = 0.1,
+                 max_interval: float = 1.0,
+                 expensive_interval: float = 2.0,
+                 kill_grace: float = 0.5):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.expensive_interval = expensive_interval
+        self.kill_grace = kill_grace
+        self._watched: Dict[int, WatchedProcess] = {}
+        self._lock = threading.Lock()
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._check_fds = platform.system() != "Windows"
+        self.stats = {"watched": 0, "exits": 0, "cheap_samples": 0,
+                      "expensive_samples": 0, "violations": 0}
+
+    def watch(self, pid: int,
+              max_memory: Optional[int] = None,
+              max_open_files: Optional[int] = None,
+              network_allowed: bool = True,
+              on_violation: Optional[Callable[[str], None]] = None,
+              on_exit: Optional[Callable[[int], None]] = None) -> Optional[WatchedProcess]:
+        """Start watching a process.
+
+        Args:
+            pid: Process to watch
+            max_memory: RSS limit in bytes; exceeding it terminates the process
+            max_open_files: File descriptor limit; exceeding it is reported
+            network_allowed: If False, any socket terminates the process
+            on_violation: Called with a message for each violation
+            on_exit: Called with the pid once the process has exited
+
+        Returns:
+            The WatchedProcess record, or None if the process does not exist
+        """
+        try:
+            process = psutil.Process(pid)
+        except psutil.NoSuchProcess:
+            logger.error(f"Process {pid} not found")
+            return None
+
+        now = time.monotonic()
+        watched = WatchedProcess(
+            pid=pid,
+            max_memory=max_memory,
+            max_open_files=max_open_files,
+            network_allowed=network_allowed,
+            on_violation=on_violation,
+            on_exit=on_exit,
+            process=process,
+            interval=self.min_interval,
+            next_cheap=now,
+            # The first socket check comes early: short-lived commands
+            # would otherwise finish before it
+            next_expensive=now + self.min_interval
+        )
+        watched.pidfd = self._open_pidfd(pid)
+
+        with self._lock:
+            previous = self._watched.get(pid)
+            if previous is not None:
+                self._close_pidfd(previous)
+            self._watched[pid] = watched
+            self.stats["watched"] += 1
+            if watched.pidfd is not None:
+                self._selector.register(watched.pidfd, selectors.EVENT_READ, pid)
+            self._ensure_thread()
+        self._wake()
+        return watched
+
+    def unwatch(self, pid: int) -> Optional[WatchedProcess]:
+        """Stop watching a process; returns its final record"""
+        with self._lock:
+            watched = self._watched.pop(pid, None)
+            if watched is not None:
+                self._close_pidfd(watched)
+        return watched
+
+    def get(self, pid: int) -> Optional[WatchedProcess]:
+        with self._lock:
+            return self._watched.get(pid)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._watched)
+
+    def stop(self):
+        """Stop the monitor thread and forget all processes"""
+        with self._lock:
+            self._running = False
+            for watched in self._watched.values():
+                self._close_pidfd(watched)
+            self._watched.clear()
+            thread = self._thread
+            self._thread = None
+        self._wake()
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=2)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="process-monitor", daemon=True)
+            self._thread.start()
+
+    def _wake(self):
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
+    def _open_pidfd(self, pid: int) -> Optional[int]:
+        if not hasattr(os, "pidfd_open"):
+            return None
+        try:
+            return os.pidfd_open(pid)
+        except OSError as e:
+            # ESRCH: already gone (sampling notices); others: no pidfd support
+            if e.errno != errno.ESRCH:
+                logger.debug(f"pidfd_open unavailable for {pid}: {e}")
+            return None
+
+    def _close_pidfd(self, watched: WatchedProcess):
+        if watched.pidfd is None:
+            return
+        try:
+            self._selector.unregister(watched.pidfd)
+        except (KeyError, ValueError):
+            pass
+        os.close(watched.pidfd)
+        watched.pidfd = None
+
+    def _run(self):
+        """Monitor loop: wait for exits or the next due sample"""
+        while True:
+            with self._lock:
+                if not self._running:
+                    return
+                due = [w.next_cheap for w in self._watched.values()]
+                due += [w.kill_at for w in self._watched.values() if w.kill_at is not None]
+            timeout = None if not due else max(0.0, min(due) - time.monotonic())
+
+            exited = []
+            for key, _ in self._selector.select(timeout):
+                if key.fd == self._wake_r:
+                    try:
+                        while os.read(self._wake_r, 4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                else:
+                    exited.append(key.data)
+            for pid in exited:
+                self._handle_exit(pid)
+
+            now = time.monotonic()
+            with self._lock:
+                watched_list = list(self._watched.values())
+            for watched in watched_list:
+                if watched.kill_at is not None and now >= watched.kill_at:
+                    self._kill(watched)
+                if now >= watched.next_cheap:
+                    self._sample(watched, now)
+
+    def _sample(self, watched: WatchedProcess, now: float):
+        process = watched.process
+        try:
+            with process.oneshot():
+                rss = process.memory_info().rss
+                watched.cpu_percent = process.cpu_percent(interval=None)
+                watched.num_threads = process.num_threads()
+            watched.rss = rss
+            watched.peak_rss = max(watched.peak_rss, rss)
+            watched.samples["cheap"] += 1
+            self.stats["cheap_samples"] += 1
+
+            if watched.max_memory and rss > watched.max_memory:
+                self._violation(watched, f"Memory limit exceeded: {rss} bytes", terminate=True)
+            if watched.cpu_percent > HIGH_CPU_PERCENT:
+                logger.warning(f"High CPU usage: {watched.cpu_percent}%")
+
+            if now >= watched.next_expensive:
+                self._sample_expensive(watched)
+                watched.next_expensive = now + self.expensive_interval
+        except psutil.NoSuchProcess:
+            self._handle_exit(watched.pid)
+            return
+        except Exception as e:
+            logger.debug(f"Monitoring error for {watched.pid}: {e}")
+
+        # Back off while memory is comfortably under the limit
+        if watched.max_memory and watched.rss > watched.max_memory * MEMORY_WATCH_RATIO:
+            watched.interval = self.min_interval
+        else:
+            watched.interval = min(self.max_interval, watched.interval * 1.5)
+        watched.next_cheap = now + watched.interval
+
+    def _sample_expensive(self, watched: WatchedProcess):
+        process = watched.process
+        watched.samples["expensive"] += 1
+        self.stats["expensive_samples"] += 1
+
+        if self._check_fds and watched.max_open_files:
+            # Counting fds is a directory listing; open_files() resolves each one
+            watched.num_fds = process.num_fds()
+            if watched.num_fds > watched.max_open_files:
+                self._violation(watched, f"Too many open files: {watched.num_fds}")
+
+        if not watched.network_allowed:
+            net_connections = getattr(process, "net_connections", None) or process.connections
+            connections = net_connections(kind="inet")
+            if connections:
+                self._violation(watched, "Unauthorized network connection attempted", terminate=True)
+
+    def _violation(self, watched: WatchedProcess, message: str, terminate: bool = False):
+        self.stats["violations"] += 1
+        if watched.on_violation:
+            try:
+                watched.on_violation(message)
+            except Exception as e:
+                logger.debug(f"Violation callback failed: {e}")
+        if terminate and watched.kill_at is None:
+            logger.warning(f"Terminating process {watched.pid}: {message}")
+            try:
+                watched.process.terminate()
+            except psutil.NoSuchProcess:
+                return
+            watched.kill_at = time.monotonic() + self.kill_grace
+
+    def _kill(self, watched: WatchedProcess):
+        watched.kill_at = None
+        try:
+            if watched.process.is_running() and watched.process.status() != psutil.STATUS_ZOMBIE:
+                watched.process.kill()
+        except psutil.NoSuchProcess:
+            pass
+
+    def _handle_exit(self, pid: int):
+        watched = self.unwatch(pid)
+        if watched is None:
+            return
+        watched.exited = True
+        self.stats["exits"] += 1
+        if watched.on_exit:
+            try:
+                watched.on_exit(pid)
+            except Exception as e:
+                logger.debug(f"Exit callback failed: {e}")
+
+
+# Global instance shared by all sandboxes
+_process_monitor = None
+_process_monitor_lock = threading.Lock()
+
+
+def get_process_monitor() -> ProcessMonitor:
+    """Get or create the global process monitor"""
+    global _process_monitor
+    with _process_monitor_lock:
+        if _process_monitor is None:
+            _process_monitor = ProcessMonitor()
+        return _process_monitor
@@ -5,8 +5,6 @@ that offers a cleaner, more organized terminal UI.
 """
 
 import sys
-import time
-import threading
 from typing import Optional, Dict, Any
 from .enhanced_progress_display import EnhancedProgressDisplay, WorkerState
 
@@ -25,30 +23,28 @@ class ProgressDisplay:
         self.active_tasks: Dict[str, Any] = {}
         self.task_subtasks: Dict[str, tuple] = {}
         self.is_tty = sys.stdout.isatty()
-        self.display_thread = None
-        self.running = False
         
-        # Start auto-refresh thread for smooth animations
-        if self.is_tty:
-            self._start_refresh_thread()
+        # The display's render thread owns the terminal; on a non-TTY it
+        # logs periodic summaries instead
+        self.display.start()
     
-    def _start_refresh_thread(self):
-        """Start background thread for smooth UI updates"""
-        self.running = True
-        self.display_thread = threading.Thread(target=self._refresh_loop, daemon=True)
-        self.display_thread.start()
-    
-    def _refresh_loop(self):
-        """Background refresh loop for smooth animations"""
-        while self.running:
-            self.display.render()
-            time.sleep(0.1)  # 10 FPS refresh rate
+    @property
+    def running(self) -> bool:
+        return self.display.running
     
 
     def register_workers(self, num_workers: int):
         """Register all workers at initialization"""
         for i in range(num_workers):
             self.display.register_worker(str(i))
+    
+    def add_worker(self, worker_id):
+        """Register a worker started after initialization"""
+        self.display.register_worker(str(worker_id))
+    
+    def remove_worker(self, worker_id):
+        """Drop a worker that has stopped"""
+        self.display.unregister_worker(str(worker_id))
 
     def update(self, status: str = "", force: bool = False):
         """Update the display (compatibility method)"""
@@ -66,7 +62,7 @@ class ProgressDisplay:
         self.display.failed_tasks = self.failed
         
         # Manual render if not using auto-refresh
-        if not self.running:
+        if force or not self.running:
             self.display.render()
     
     def set_worker_task(self, worker_id, task_id: str, task_title: str, progress: str = ""):
@@ -132,20 +128,14 @@ class ProgressDisplay:
         self.active = active
         self.failed = failed
         
-        # Update display counters
+        # Update display counters (picked up by the next frame)
         self.display.completed_tasks = completed
         self.display.active_tasks = active
         self.display.failed_tasks = failed
-        
-        # Force render to show updated counts
-        if self.is_tty:
-            self.display.render()
     
     def stop(self):
         """Stop the display and cleanup"""
-        self.running = False
-        if self.display_thread:
-            self.display_thread.join(timeout=1)
+        self.display.stop()
         self.display.clear()
     
     def __del__(self):
@@ -0,0 +1,438 @@
+"""Pool of pre-warmed pytest worker processes for fast test re-runs
+
+Each worker is a long-lived interpreter that imports pytest and the
+configured heavy modules once, then serves run requests over a JSON-lines
+pipe. Every request is executed in a forked child so test modules and
+global state never leak between runs, while the child inherits the warm
+imports for free. Workers are recycled after ``max_runs`` requests or as
+soon as one of the project files they preloaded changes on disk.
+
+Only the modules named in ``preload_modules`` are warmed; with the
+default of just ``pytest`` no project code is imported up front.
+``ContinuousTestMonitor`` preloads the project modules most imported by
+the tests unless ``warm_pool_preload`` is configured.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import signal
+import logging
+import tempfile
+import importlib
+import threading
+import subprocess
+from typing import Dict, List, Any, Optional, Set
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+def is_supported() -> bool:
+    """Warm workers rely on fork() to isolate runs"""
+    return hasattr(os, "fork") and sys.platform != "win32"
+
+
+@dataclass
+class PytestRunResult:
+    """Result of one pytest invocation on a warm worker"""
+    returncode: int
+    duration: float
+    output: str = ""
+    worker_id: Optional[str] = None
+    timed_out: bool = False
+
+
+class PytestWorker:
+    """Handle on one warm worker process"""
+
+    def __init__(self,
+                 worker_id: str,
+                 preload_modules: List[str],
+                 project_root: str,
+                 python: str = sys.executable,
+                 startup_timeout: float = 60.0):
+        self.worker_id = worker_id
+        self.project_root = os.path.abspath(project_root)
+        self.runs = 0
+        self.started_at = time.time()
+        # project file -> mtime_ns at load time
+        self.loaded_files: Dict[str, int] = {}
+
+        # The worker must be able to import both the project and this package
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in [self.project_root, package_root, env.get("PYTHONPATH", "")] if p
+        )
+
+        self.process = subprocess.Popen(
+            [python, "-m", "claude_orchestrator.pytest_worker_pool",
+             "--preload", ",".join(preload_modules),
+             "--project-root", self.project_root],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.project_root,
+            env=env,
+            text=True,
+            bufsize=1,
+            start_new_session=True
+        )
+
+        self._messages: "queue.Queue[Optional[str]]" = queue.Queue()
+        threading.Thread(
+            target=self._reader, daemon=True, name=f"{worker_id}-reader"
+        ).start()
+
+        ready = self._read_message(startup_timeout)
+        if not ready or not ready.get("ready"):
+            self.kill()
+            raise RuntimeError(f"Pytest worker {worker_id} failed to start")
+
+        for path in ready.get("project_files", []):
+            try:
+                self.loaded_files[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+
+        logger.debug(f"Pytest worker {worker_id} ready with {len(self.loaded_files)} project modules preloaded")
+
+    def _reader(self):
+        """Forward protocol lines from the worker to the message queue"""
+        try:
+            for line in self.process.stdout:
+                # Skip anything printed at import time before the channel was isolated
+                if line.startswith("{"):
+                    self._messages.put(line)
+        except (OSError, ValueError):
+            pass
+        self._messages.put(None)
+
+    def _read_message(self, timeout: Optional[float]) -> Optional[Dict[str, Any]]:
+        """Read one JSON message from the worker, or None on timeout/EOF"""
+        try:
+            line = self._messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if line is None:
+            return None
+        return json.loads(line)
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def is_stale(self) -> bool:
+        """Check whether a preloaded project module changed since warm-up"""
+        for path, mtime_ns in self.loaded_files.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def run(self, args: List[str], timeout: float) -> PytestRunResult:
+        """Run pytest with the given arguments in a forked child"""
+        fd, output_path = tempfile.mkstemp(prefix="pytest_worker_", suffix=".log")
+        os.close(fd)
+
+        try:
+            request = {"args": args, "output": output_path, "timeout": timeout}
+            self.process.stdin.write(json.dumps(request) + "\n")
+            self.process.stdin.flush()
+
+            # The worker enforces the timeout itself; allow a little slack
+            reply = self._read_message(timeout + 10)
+            if reply is None:
+                self.kill()
+                raise TimeoutError(f"Pytest worker {self.worker_id} did not answer in {timeout}s")
+
+            self.runs += 1
+            with open(output_path, "r", errors="replace") as f:
+                output = f.read()
+
+            return PytestRunResult(
+                returncode=reply["returncode"],
+                duration=reply["duration"],
+                output=output,
+                worker_id=self.worker_id,
+                timed_out=reply.get("timeout", False)
+            )
+        finally:
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
+
+    def stop(self):
+        """Ask the worker to exit, killing it if it doesn't"""
+        if not self.is_alive():
+            return
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=5)
+        except Exception:
+            self.kill()
+
+    def kill(self):
+        """Kill the worker and any child it forked"""
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError, OSError):
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except Exception:
+            pass
+
+
+class PytestWorkerPool:
+    """Pool of warm pytest workers with recycling"""
+
+    def __init__(self,
+                 size: int = 2,
+                 preload_modules: Optional[List[str]] = None,
+                 project_root: str = ".",
+                 max_runs: int = 50,
+                 run_timeout: float = 300.0):
+        self.size = max(1, size)
+        self.preload_modules = preload_modules or ["pytest"]
+        self.project_root = os.path.abspath(project_root)
+        self.max_runs = max_runs
+        self.run_timeout = run_timeout
+
+        self._idle: "queue.Queue[PytestWorker]" = queue.Queue()
+        self._all: Set[PytestWorker] = set()
+        self._lock = threading.Lock()
+        self._counter = 0
+        self._started = False
+        self._closed = False
+
+        self.stats = {
+            "runs": 0,
+            "workers_started": 0,
+            "workers_recycled": 0,
+            "failures": 0
+        }
+
+    def start(self, wait: bool = False):
+        """Pre-warm the pool in the background"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+
+        def warm():
+            for _ in range(self.size):
+                worker = self._spawn()
+                if worker:
+                    self._idle.put(worker)
+
+        if wait:
+            warm()
+        else:
+            threading.Thread(target=warm, daemon=True, name="PytestPoolWarmup").start()
+
+    def _spawn(self) -> Optional[PytestWorker]:
+        """Start a new worker"""
+        if self._closed:
+            return None
+        with self._lock:
+            self._counter += 1
+            worker_id = f"pytest-worker-{self._counter}"
+        try:
+            worker = PytestWorker(worker_id, self.preload_modules, self.project_root)
+        except Exception as e:
+            logger.warning(f"Failed to start pytest worker: {e}")
+            self.stats["failures"] += 1
+            return None
+        with self._lock:
+            self._all.add(worker)
+        self.stats["workers_started"] += 1
+        return worker
+
+    def _retire(self, worker: PytestWorker):
+        """Stop a worker and replace it in the background"""
+        with self._lock:
+            self._all.discard(worker)
+        worker.stop()
+        self.stats["workers_recycled"] += 1
+
+        def replace():
+            replacement = self._spawn()
+            if replacement:
+                self._idle.put(replacement)
+
+        if not self._closed:
+            threading.Thread(target=replace, daemon=True, name="PytestPoolRecycle").start()
+
+    def _checkout(self, timeout: float) -> Optional[PytestWorker]:
+        """Get a healthy, up-to-date worker"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                worker = self._idle.get(timeout=max(0.0, deadline - time.time()))
+            except queue.Empty:
+                return None
+            if not worker.is_alive() or worker.is_stale() or worker.runs >= self.max_runs:
+                self._retire(worker)
+                continue
+            return worker
+        return None
+
+    def run(self, args: List[str], timeout: Optional[float] = None,
+            checkout_timeout: float = 30.0) -> Optional[PytestRunResult]:
+        """Run pytest arguments on a warm worker
+
+        Returns:
+            The run result, or None if no worker could be used and the
+            caller should fall back to a fresh interpreter
+        """
+        if self._closed:
+            return None
+        if not self._started:
+            self.start()
+
+        worker = self._checkout(checkout_timeout)
+        if worker is None:
+            return None
+
+        try:
+            result = worker.run(args, timeout or self.run_timeout)
+        except Exception as e:
+            logger.warning(f"Pytest worker {worker.worker_id} failed: {e}")
+            self.stats["failures"] += 1
+            self._retire(worker)
+            return None
+
+        self.stats["runs"] += 1
+        if worker.runs >= self.max_runs:
+            self._retire(worker)
+        else:
+            self._idle.put(worker)
+        return result
+
+    def shutdown(self):
+        """Stop all workers"""
+        self._closed = True
+        with self._lock:
+            workers = list(self._all)
+            self._all.clear()
+        for worker in workers:
+            worker.stop()
+
+
+# ----------------------------------------------------------------------
+# Worker process side
+# ----------------------------------------------------------------------
+
+def _project_files(project_root: str) -> List[str]:
+    """Files of already-imported modules that live under the project root"""
+    prefix = os.path.abspath(project_root) + os.sep
+    files = []
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.abspath(path).startswith(prefix):
+            files.append(os.path.abspath(path))
+    return sorted(set(files))
+
+
+def _run_in_child(request: Dict[str, Any], proto_fd: int) -> Dict[str, Any]:
+    """Fork, run pytest in the child and wait for it"""
+    start = time.time()
+    pid = os.fork()
+
+    if pid == 0:
+        code = 4
+        try:
+            os.close(proto_fd)
+            devnull = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull, 0)
+            os.close(devnull)
+            out = os.open(request["output"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.dup2(out, 1)
+            os.dup2(out, 2)
+            os.close(out)
+            import pytest
+            code = int(pytest.main(request["args"]))
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        except BaseException:
+            code = 3
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            except Exception:
+                pass
+            os._exit(code)
+
+    timeout = request.get("timeout") or 300
+    deadline = start + timeout
+    status = None
+    while time.time() < deadline:
+        waited, status = os.waitpid(pid, os.WNOHANG)
+        if waited:
+            break
+        time.sleep(0.01)
+    else:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        return {"returncode": -signal.SIGKILL, "duration": time.time() - start, "timeout": True}
+
+    if os.WIFEXITED(status):
+        returncode = os.WEXITSTATUS(status)
+    else:
+        returncode = -os.WTERMSIG(status)
+    return {"returncode": returncode, "duration": time.time() - start}
+
+
+def _serve(preload: List[str], project_root: str):
+    """Worker main loop: preload, then serve JSON-lines requests from stdin"""
+    # Keep the protocol channel private so stray prints can't corrupt it
+    proto_fd = os.dup(1)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    proto = os.fdopen(proto_fd, "w", buffering=1)
+
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+    for name in preload:
+        if not name:
+            continue
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"preload of {name} failed: {e}", file=sys.stderr)
+
+    proto.write(json.dumps({"ready": True, "project_files": _project_files(project_root)}) + "\n")
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            reply = _run_in_child(json.loads(line), proto_fd)
+        except Exception as e:
+            reply = {"returncode": 3, "duration": 0.0, "error": str(e)}
+        proto.write(json.dumps(reply) + "\n")
+
+
+def main(argv: Optional[List[str]] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Warm pytest worker")
+    parser.add_argument("--preload", default="pytest")
+    parser.add_argument("--project-root", default=".")
+    args = parser.parse_args(argv)
+
+    _serve(args.preload.split(","), os.path.abspath(args.project_root))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Disk-backed cache for TaskMasterAI research results.
+
+Research prompts are expensive and often repeated: every ``co expand
+--research`` run asks again for the same tasks and files. Entries are
+keyed by a hash of the normalized query, the content of the related
+tasks, the content fingerprints of the referenced files and any extra
+context, so a cached answer is only reused while all of its inputs are
+unchanged.
+
+Entries expire after ``ttl`` seconds, and the least recently used ones
+are evicted beyond ``max_entries``. When a referenced file changes, every
+entry built from an older version of that file is dropped.
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# One week
+DEFAULT_TTL = 7 * 24 * 3600
+
+DEFAULT_MAX_ENTRIES = 500
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a research query"""
+    return " ".join(query.lower().split())
+
+
+def fingerprint(content: bytes) -> str:
+    """Content fingerprint of a referenced file"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def make_key(query: str, task_context: str = "",
+             files: Iterable[Tuple[str, str]] = (),
+             additional_context: Optional[str] = None,
+             model: str = "") -> str:
+    """Cache key for a research request.
+
+    Args:
+        query: Research query (normalized before hashing)
+        task_context: Text of the related tasks
+        files: (path, fingerprint) pairs of the referenced files
+        additional_context: Extra context passed with the query
+        model: Model that answers the query
+    """
+    payload = json.dumps({
+        "query": normalize_query(query),
+        "tasks": task_context,
+        "files": sorted(files),
+        "extra": additional_context or "",
+        "model": model
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResearchCache:
+    """SQLite cache of research responses with TTL and LRU eviction"""
+
+    def __init__(self, db_path: str,
+                 ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "invalidated": 0, "evicted": 0}
+        self._init_database()
+
+    def _init_database(self):
+        """Initialize database schema"""
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS research_cache (
+                    key TEXT PRIMARY KEY,
+                    query TEXT NOT NULL,
+                    research TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS research_files (
+                    key TEXT NOT NULL REFERENCES research_cache(key) ON DELETE CASCADE,
+                    path TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    PRIMARY KEY (key, path)
+                )
+            """)
+
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_research_last_used ON research_cache(last_used)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_research_files_path ON research_files(path)")
+
+            conn.commit()
+
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection with context manager"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA foreign_keys=ON")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached research for ``key``, or None if absent or expired"""
+        now = time.time()
+        with self._lock, self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT research, created_at FROM research_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            if now - row[1] > self.ttl:
+                conn.execute("DELETE FROM research_cache WHERE key = ?", (key,))
+                conn.commit()
+                self.stats["misses"] += 1
+                return None
+            conn.execute("UPDATE research_cache SET last_used = ? WHERE key = ?", (now, key))
+            conn.commit()
+        self.stats["hits"] += 1
+        return row[0]
+
+    def put(self, key: str, query: str, research: str, files: Iterable[Tuple[str, str]] = ()):
+        """Store a research response and the file versions it was built from"""
+        now = time.time()
+        files = list(files)
+        with self._lock, self._get_connection() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO research_cache (key, query, research, created_at, last_used)
+                VALUES (?, ?, ?, ?, ?)
+            """, (key, normalize_query(query), research, now, now))
+            conn.executemany(
+                "INSERT OR REPLACE INTO research_files (key, path, fingerprint) VALUES (?, ?, ?)",
+                [(key, path, fp) for path, fp in files]
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def invalidate_changed(self, files: Iterable[Tuple[str, str]]) -> int:
+        """Drop entries built from a different version of any of ``files``
+
+        Args:
+            files: Current (path, fingerprint) pairs
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock, self._get_connection() as conn:
+            for path, fp in files:
+                cursor = conn.execute("""
+                    DELETE FROM research_cache WHERE key IN (
+                        SELECT key FROM research_files WHERE path = ? AND fingerprint != ?
+                    )
+                """, (path, fp))
+                removed += cursor.rowcount
+            conn.commit()
+        if removed:
+            self.stats["invalidated"] += removed
+            logger.debug(f"Invalidated {removed} research cache entries for changed files")
+        return removed
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock, self._get_connection() as conn:
+            conn.execute("DELETE FROM research_cache")
+            conn.commit()
+
+    def __len__(self) -> int:
+        with self._get_connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM research_cache").fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Expire old entries and trim to max_entries, least recently used first"""
+        cursor = conn.execute("DELETE FROM research_cache WHERE created_at < ?", (time.time() - self.ttl,))
+        evicted = cursor.rowcount
+        cursor = conn.execute("""
+            DELETE FROM research_cache WHERE key IN (
+                SELECT key FROM research_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_entries,))
+        evicted += cursor.rowcount
+        if evicted:
+            self.stats["evicted"] += evicted
@@ -11,6 +11,8 @@ from pathlib import Path
 import threading
 import time
 
+from .state_store import StateStore, StateTable, TRACKED_RESOURCES, DEFAULT_STATE_DB, get_state_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -102,11 +104,22 @@ class Resource:
 class OrphanedResourceDetector:
     """Detects and tracks orphaned resources."""
     
+    DEFAULT_TRACKING_FILE = ".resource_tracking.json"
+    
     def __init__(self, 
-                 tracking_file: str = ".resource_tracking.json",
+                 tracking_file: str = DEFAULT_TRACKING_FILE,
                  idle_threshold_minutes: int = 30,
-                 scan_interval_seconds: int = 300):
+                 scan_interval_seconds: int = 300,
+                 state_store: Optional[StateStore] = None):
+        # Pre-state-store location, imported once
         self.tracking_file = tracking_file
+        # Resources share the orchestrator state store unless tracked elsewhere
+        if tracking_file == self.DEFAULT_TRACKING_FILE:
+            self.state_db = Path(DEFAULT_STATE_DB)
+        else:
+            self.state_db = Path(tracking_file).with_suffix(".db")
+        self._state_store = state_store
+        self._table: Optional[StateTable] = None
         self.idle_threshold_minutes = idle_threshold_minutes
         self.scan_interval_seconds = scan_interval_seconds
         self.resources: Dict[str, Resource] = {}
@@ -119,35 +132,39 @@ class OrphanedResourceDetector:
         
         logger.info(f"Orphaned resource detector initialized with idle threshold: {idle_threshold_minutes} minutes")
     
+    @property
+    def tracked(self) -> StateTable:
+        """Resource table, opened on first use"""
+        if self._table is None:
+            store = self._state_store or get_state_store(self.state_db)
+            self._table = store.table(TRACKED_RESOURCES)
+        return self._table
+    
     def _load_tracking_data(self):
-        """Load tracking data from file."""
-        if os.path.exists(self.tracking_file):
-            try:
+        """Load tracking data from the state store."""
+        legacy = os.path.exists(self.tracking_file)
+        if self._state_store is None and not self.state_db.exists() and not legacy:
+            # Nothing tracked yet; don't create the database just to read it
+            return
+        try:
+            records = self.tracked.all()
+            if not records and legacy:
                 with open(self.tracking_file, 'r') as f:
-                    data = json.load(f)
-                    for resource_data in data.get("resources", []):
-                        resource = Resource.from_dict(resource_data)
-                        self.resources[resource.resource_id] = resource
-                logger.info(f"Loaded {len(self.resources)} tracked resources")
-            except Exception as e:
-                logger.error(f"Failed to load tracking data: {e}")
+                    records = json.load(f).get("resources", [])
+                for resource_data in records:
+                    self.tracked.upsert(resource_data)
+                logger.info(f"Imported tracked resources from {self.tracking_file}")
+            for resource_data in records:
+                resource = Resource.from_dict(resource_data)
+                self.resources[resource.resource_id] = resource
+            logger.info(f"Loaded {len(self.resources)} tracked resources")
+        except Exception as e:
+            logger.error(f"Failed to load tracking data: {e}")
     
-    def _save_tracking_data(self):
-        """Save tracking data to file."""
+    def _save_resource(self, resource: Resource):
+        """Persist one resource."""
         try:
-            data = {
-                "last_updated": datetime.now().isoformat(),
-                "resources": [r.to_dict() for r in self.resources.values()]
-            }
-            
-            # Write to temp file first
-            temp_file = f"{self.tracking_file}.tmp"
-            with open(temp_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            # Atomic rename
-            os.replace(temp_file, self.tracking_file)
-            
+            self.tracked.upsert(resource.to_dict())
         except Exception as e:
             logger.error(f"Failed to save tracking data: {e}")
     
@@ -182,7 +199,7 @@ class OrphanedResourceDetector:
             )
             
             self.resources[resource_id] = resource
-            self._save_tracking_data()
+            self._save_resource(resource)
             
             logger.debug(f"Registered resource: {resource_id} (type: {resource_type.value})")
             return resource_id
@@ -199,14 +216,17 @@ class OrphanedResourceDetector:
         with self._lock:
             if resource_id in self.resources:
                 self.resources[resource_id].status = ResourceStatus.IDLE
-                self._save_tracking_data()
+                self._save_resource(self.resources[resource_id])
     
     def remove_resource(self, resource_id: str):
         """Remove resource from tracking."""
         with self._lock:
             if resource_id in self.resources:
                 del self.resources[resource_id]
-                self._save_tracking_data()
+                try:
+                    self.tracked.delete(resource_id)
+                except Exception as e:
+                    logger.error(f"Failed to save tracking data: {e}")
     
     def scan_for_orphans(self) -> List[Resource]:
         """Scan for orphaned resources.
@@ -219,12 +239,13 @@ class OrphanedResourceDetector:
         with self._lock:
             for resource in self.resources.values():
                 if resource.is_orphaned(self.idle_threshold_minutes):
-                    resource.status = ResourceStatus.ORPHANED
+                    if resource.status != ResourceStatus.ORPHANED:
+                        # Save updated status
+                        resource.status = ResourceStatus.ORPHANED
+                        self._save_resource(resource)
                     orphaned.append(resource)
             
-            # Save updated statuses
             if orphaned:
-                self._save_tracking_data()
                 logger.info(f"Found {len(orphaned)} orphaned resources")
         
         return orphaned
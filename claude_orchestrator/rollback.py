@@ -18,6 +18,7 @@ import threading
 from contextlib import contextmanager
 
 from .checkpoint_system import CheckpointManager, CheckpointData, CheckpointState
+from .state_store import StateStore, ROLLBACK_HISTORY, DEFAULT_STATE_DB, get_state_store
 
 
 logger = logging.getLogger(__name__)
@@ -94,11 +95,14 @@ class RollbackManager:
     # Version for compatibility checking
     ROLLBACK_VERSION = "1.0.0"
     
+    DEFAULT_STORAGE_DIR = ".taskmaster/rollbacks"
+    
     def __init__(
         self,
         checkpoint_manager: Optional[CheckpointManager] = None,
-        storage_dir: str = ".taskmaster/rollbacks",
-        max_rollback_history: int = 100
+        storage_dir: str = DEFAULT_STORAGE_DIR,
+        max_rollback_history: int = 100,
+        state_store: Optional[StateStore] = None
     ):
         """
         Initialize the RollbackManager
@@ -107,12 +111,20 @@ class RollbackManager:
             checkpoint_manager: CheckpointManager instance
             storage_dir: Directory for rollback records
             max_rollback_history: Maximum number of rollback records to keep
+            state_store: Store for the rollback history (default: the shared
+                orchestrator store, or one inside a custom storage_dir)
         """
         self.checkpoint_manager = checkpoint_manager or CheckpointManager()
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.max_rollback_history = max_rollback_history
         
+        if state_store is None:
+            state_store = get_state_store(
+                DEFAULT_STATE_DB if storage_dir == self.DEFAULT_STORAGE_DIR else self.storage_dir / "state.db"
+            )
+        self.history_table = state_store.table(ROLLBACK_HISTORY)
+        
         # Rollback history
         self.rollback_history: List[RollbackRecord] = []
         self.active_rollbacks: Dict[str, RollbackRecord] = {}
@@ -130,42 +142,44 @@ class RollbackManager:
     
     def _load_rollback_history(self):
         """Load rollback history from storage"""
+        # Pre-state-store location, imported once
         history_file = self.storage_dir / "rollback_history.json"
         
-        if history_file.exists():
-            try:
+        try:
+            records = self.history_table.all(order_by="initiated_at")
+            if not records and history_file.exists():
                 with open(history_file, 'r', encoding='utf-8') as f:
-                    history_data = json.load(f)
-                    
-                for record_data in history_data.get('records', []):
-                    try:
-                        record = RollbackRecord.from_dict(record_data)
-                        self.rollback_history.append(record)
-                    except Exception as e:
-                        logger.error(f"Error loading rollback record: {e}")
-                
-                logger.info(f"Loaded {len(self.rollback_history)} rollback records")
-                
-            except Exception as e:
-                logger.error(f"Error loading rollback history: {e}")
+                    records = json.load(f).get('records', [])
+                for record_data in records:
+                    self.history_table.upsert(record_data)
+                logger.info(f"Imported rollback history from {history_file}")
+            
+            loaded = []
+            for record_data in records:
+                try:
+                    loaded.append(RollbackRecord.from_dict(record_data))
+                except Exception as e:
+                    logger.error(f"Error loading rollback record: {e}")
+            self.rollback_history = loaded
+            
+            logger.info(f"Loaded {len(self.rollback_history)} rollback records")
+            
+        except Exception as e:
+            logger.error(f"Error loading rollback history: {e}")
     
-    def _save_rollback_history(self):
-        """Save rollback history to storage"""
-        history_file = self.storage_dir / "rollback_history.json"
-        
+    def _save_rollback_history(self, record: Optional[RollbackRecord] = None):
+        """Save a new rollback record and trim the stored history"""
         try:
+            if record is not None:
+                self.history_table.upsert(record.to_dict())
+            
             # Keep only the most recent records
             if len(self.rollback_history) > self.max_rollback_history:
                 self.rollback_history = self.rollback_history[-self.max_rollback_history:]
+                self.history_table.prune(self.max_rollback_history, order_by="initiated_at")
             
-            history_data = {
-                "version": self.ROLLBACK_VERSION,
-                "updated_at": datetime.now().isoformat(),
-                "records": [record.to_dict() for record in self.rollback_history]
-            }
-            
-            with open(history_file, 'w', encoding='utf-8') as f:
-                json.dump(history_data, f, indent=2)
+            # Rollbacks are rare; make sure the record is on disk before returning
+            self.history_table.store.flush()
                 
         except Exception as e:
             logger.error(f"Error saving rollback history: {e}")
@@ -381,7 +395,7 @@ class RollbackManager:
             with self._lock:
                 self.rollback_history.append(rollback_record)
                 self.active_rollbacks.pop(rollback_id, None)
-                self._save_rollback_history()
+                self._save_rollback_history(rollback_record)
     
     def _save_pre_rollback_state(self, rollback_id: str, task_id: str):
         """Save current state before performing rollback"""
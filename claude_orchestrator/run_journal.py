@@ -0,0 +1,185 @@
+"""Append-only journal of an orchestrator run, replayed by ``co run --resume``.
+
+Without it, a run that is killed midway leaves only tasks.json behind:
+the next run executes in-progress tasks again from scratch and loses the
+completed tasks still waiting for an Opus review. The journal records,
+one JSON line per event:
+
+- ``run``: a run started (``resumed_from`` names the run it continues)
+- ``assigned``: a worker took a task
+- ``completed``: a task finished, with the worker's output
+- ``failed``: a task failed
+- ``reviewed``: the Opus review of a completed task finished
+- ``finished``: the run ended normally with no reviews outstanding
+
+Each line is flushed as it is written, so a killed process loses at most
+the event it was writing; a torn last line is ignored on replay. Replay
+is a single pass over the file. When a run resumes, the journal is
+rewritten as a snapshot of the restored state, so it stays proportional
+to the run rather than growing across restarts.
+
+Typical usage example:
+    state = RunJournal.replay(RUN_JOURNAL_FILE)
+    journal = RunJournal(RUN_JOURNAL_FILE)
+    journal.start(state if state.resumable else None)
+    journal.task_completed(task)
+    journal.close(finished=True)
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+from .models import TaskStatus, WorkerTask
+
+logger = logging.getLogger(__name__)
+
+RUN_JOURNAL_FILE = ".taskmaster/run_journal.jsonl"
+
+
+@dataclass
+class JournalState:
+    """State of a run as recorded in its journal"""
+    run_id: Optional[str] = None
+    finished: bool = False
+    completed: Dict[str, WorkerTask] = field(default_factory=dict)
+    pending_reviews: Dict[str, WorkerTask] = field(default_factory=dict)
+    failed: Dict[str, Optional[str]] = field(default_factory=dict)  # task_id -> error
+    in_progress: Dict[str, Any] = field(default_factory=dict)  # task_id -> worker_id
+    events: int = 0
+
+    @property
+    def resumable(self) -> bool:
+        """Whether the journal describes a run that did not finish"""
+        return self.run_id is not None and not self.finished
+
+
+class RunJournal:
+    """Writes the event journal of the current run"""
+
+    def __init__(self, path: Union[str, Path] = RUN_JOURNAL_FILE):
+        self.path = Path(path)
+        self.run_id: Optional[str] = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def start(self, state: Optional[JournalState] = None) -> str:
+        """Begin a new journal, seeded with ``state`` when resuming.
+
+        Returns:
+            The new run's ID
+        """
+        self.run_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        events = [{"e": "run", "run_id": self.run_id,
+                   "resumed_from": state.run_id if state else None}]
+        if state is not None:
+            for task_id, task in state.completed.items():
+                events.append({"e": "completed", "task": _task_to_dict(task)})
+                if task_id not in state.pending_reviews:
+                    events.append({"e": "reviewed", "task_id": task_id})
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        with self._lock:
+            self._close_file()
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for event in events:
+                    f.write(_encode(event))
+            os.replace(temp_path, self.path)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        return self.run_id
+
+    def task_assigned(self, task: WorkerTask, worker_id: Any):
+        self._write({"e": "assigned", "task_id": str(task.task_id), "worker": worker_id})
+
+    def task_completed(self, task: WorkerTask):
+        self._write({"e": "completed", "task": _task_to_dict(task)})
+
+    def task_failed(self, task: WorkerTask):
+        self._write({"e": "failed", "task_id": str(task.task_id), "error": task.error})
+
+    def review_done(self, task_id: str):
+        self._write({"e": "reviewed", "task_id": str(task_id)})
+
+    def close(self, finished: bool = False):
+        """Stop journaling; ``finished`` marks the run as not resumable"""
+        if finished:
+            self._write({"e": "finished"})
+        with self._lock:
+            self._close_file()
+
+    def _write(self, event: Dict[str, Any]):
+        event["ts"] = round(time.time(), 3)
+        with self._lock:
+            if self._file is None:
+                return
+            try:
+                self._file.write(_encode(event))
+                self._file.flush()
+            except OSError as e:
+                logger.error(f"Failed to write run journal {self.path}: {e}")
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def replay(path: Union[str, Path] = RUN_JOURNAL_FILE) -> JournalState:
+        """Rebuild the state of the last run from its journal"""
+        state = JournalState()
+        path = Path(path)
+        if not path.exists():
+            return state
+
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write from the crash
+                    logger.debug(f"Skipping unreadable journal line {line_no} in {path}")
+                    continue
+                state.events += 1
+                kind = event.get("e")
+                if kind == "run":
+                    state.run_id = event.get("run_id")
+                elif kind == "assigned":
+                    state.in_progress[event["task_id"]] = event.get("worker")
+                    state.failed.pop(event["task_id"], None)
+                elif kind == "completed":
+                    task = _task_from_dict(event["task"])
+                    state.in_progress.pop(task.task_id, None)
+                    state.completed[task.task_id] = task
+                    state.pending_reviews[task.task_id] = task
+                elif kind == "failed":
+                    state.in_progress.pop(event["task_id"], None)
+                    state.failed[event["task_id"]] = event.get("error")
+                elif kind == "reviewed":
+                    state.pending_reviews.pop(event["task_id"], None)
+                elif kind == "finished":
+                    state.finished = True
+        return state
+
+
+def _encode(event: Dict[str, Any]) -> str:
+    return json.dumps(event, separators=(',', ':'), default=str) + "\n"
+
+
+def _task_to_dict(task: WorkerTask) -> Dict[str, Any]:
+    data = asdict(task)
+    data["task_id"] = str(task.task_id)
+    data["status"] = task.status.value
+    return data
+
+
+def _task_from_dict(data: Dict[str, Any]) -> WorkerTask:
+    data = dict(data)
+    data["status"] = TaskStatus(data.get("status", TaskStatus.COMPLETED.value))
+    return WorkerTask(**data)
@@ -16,13 +16,16 @@ import threading
 import time
 import json
 import hashlib
+import selectors
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 import platform
 from enum import Enum
-import psutil
+
+from .process_monitor import ProcessMonitor, WatchedProcess, get_process_monitor
+from .cgroup_backend import CgroupBackend, rusage_usage
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +46,7 @@ class ResourceLimits:
     max_file_size: int = 50 * 1024 * 1024  # 50MB
     max_processes: int = 10
     max_open_files: int = 100
+    max_cpu_cores: Optional[float] = None  # CPU bandwidth (cgroup backend only)
     network_allowed: bool = False
     allowed_paths: List[str] = field(default_factory=list)
     blocked_paths: List[str] = field(default_factory=list)
@@ -66,79 +70,42 @@ class ExecutionResult:
 class SecurityMonitor:
     """Monitors and enforces security policies during execution."""
     
-    def __init__(self, policy: SandboxPolicy, limits: ResourceLimits):
+    def __init__(self, policy: SandboxPolicy, limits: ResourceLimits,
+                 process_monitor: Optional[ProcessMonitor] = None):
         self.policy = policy
         self.limits = limits
         self.violations: List[str] = []
         self._monitoring = False
-        self._process: Optional[psutil.Process] = None
+        self._process_monitor = process_monitor if process_monitor is not None else get_process_monitor()
+        self._watched: Optional[WatchedProcess] = None
         
-    def start_monitoring(self, process_id: int):
-        """Start monitoring a process."""
-        try:
-            self._process = psutil.Process(process_id)
-            self._monitoring = True
-            
-            # Start monitoring thread
-            monitor_thread = threading.Thread(
-                target=self._monitor_loop,
-                daemon=True
-            )
-            monitor_thread.start()
-            
-        except psutil.NoSuchProcess:
-            logger.error(f"Process {process_id} not found")
+    def start_monitoring(self, process_id: int, enforce_memory: bool = True):
+        """Start monitoring a process on the shared process monitor.
+        
+        Args:
+            process_id: Process to monitor
+            enforce_memory: Poll RSS against max_memory (not needed when
+                a cgroup enforces the limit)
+        """
+        self._watched = self._process_monitor.watch(
+            process_id,
+            max_memory=self.limits.max_memory if enforce_memory else None,
+            max_open_files=self.limits.max_open_files,
+            network_allowed=self.limits.network_allowed,
+            on_violation=self.violations.append
+        )
+        self._monitoring = self._watched is not None
     
     def stop_monitoring(self):
         """Stop monitoring."""
+        if self._watched is not None:
+            self._process_monitor.unwatch(self._watched.pid)
         self._monitoring = False
-        self._process = None
     
-    def _monitor_loop(self):
-        """Main monitoring loop."""
-        while self._monitoring and self._process:
-            try:
-                # Check memory usage
-                if self._process.memory_info().rss > self.limits.max_memory:
-                    self.violations.append(f"Memory limit exceeded: {self._process.memory_info().rss} bytes")
-                    self._terminate_process("Memory limit exceeded")
-                
-                # Check CPU usage
-                cpu_percent = self._process.cpu_percent(interval=0.1)
-                if cpu_percent > 90:  # Sustained high CPU
-                    logger.warning(f"High CPU usage: {cpu_percent}%")
-                
-                # Check file operations (platform-specific)
-                if platform.system() != "Windows":
-                    open_files = self._process.open_files()
-                    if len(open_files) > self.limits.max_open_files:
-                        self.violations.append(f"Too many open files: {len(open_files)}")
-                
-                # Check network connections if not allowed
-                if not self.limits.network_allowed:
-                    connections = self._process.connections()
-                    if connections:
-                        self.violations.append(f"Unauthorized network connection attempted")
-                        self._terminate_process("Network access not allowed")
-                
-                time.sleep(0.5)  # Check every 500ms
-                
-            except psutil.NoSuchProcess:
-                break
-            except Exception as e:
-                logger.debug(f"Monitoring error: {e}")
-    
-    def _terminate_process(self, reason: str):
-        """Terminate the monitored process."""
-        if self._process:
-            try:
-                logger.warning(f"Terminating process {self._process.pid}: {reason}")
-                self._process.terminate()
-                time.sleep(0.5)
-                if self._process.is_running():
-                    self._process.kill()
-            except:
-                pass
+    @property
+    def resources_used(self) -> Dict[str, Any]:
+        """Latest resource readings of the monitored process."""
+        return self._watched.resources_used() if self._watched else {}
     
     def check_command(self, command: str) -> bool:
         """Check if a command is allowed."""
@@ -202,16 +169,60 @@ class SecurityMonitor:
         return True
 
 
+def _communicate(process: subprocess.Popen,
+                 timeout: Optional[float]) -> Tuple[bytes, bytes, Any]:
+    """Like Popen.communicate, but reap the child with wait4 for its rusage.
+    
+    Returns:
+        Tuple of (stdout, stderr, rusage); rusage is None where wait4 is
+        not available
+    """
+    if not hasattr(os, "wait4"):
+        stdout, stderr = process.communicate(timeout=timeout)
+        return stdout, stderr, None
+    
+    deadline = time.monotonic() + timeout if timeout else None
+    output = {process.stdout: [], process.stderr: []}
+    with selectors.DefaultSelector() as selector:
+        for pipe in output:
+            selector.register(pipe, selectors.EVENT_READ)
+        while selector.get_map():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise subprocess.TimeoutExpired(process.args, timeout)
+            for key, _ in selector.select(remaining):
+                data = os.read(key.fd, 65536)
+                if data:
+                    output[key.fileobj].append(data)
+                else:
+                    selector.unregister(key.fileobj)
+    
+    # The pipes are closed; the process is exiting or has exited
+    while True:
+        pid, status, rusage = os.wait4(process.pid, os.WNOHANG)
+        if pid:
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            raise subprocess.TimeoutExpired(process.args, timeout)
+        time.sleep(0.005)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    for pipe in output:
+        pipe.close()
+    return b"".join(output[process.stdout]), b"".join(output[process.stderr]), rusage
+
+
 class SecureSandbox:
     """Secure sandbox for code and command execution."""
     
     def __init__(self, 
                  policy: SandboxPolicy = SandboxPolicy.MODERATE,
                  working_dir: Optional[str] = None,
-                 cleanup: bool = True):
+                 cleanup: bool = True,
+                 cgroup_backend: Optional[CgroupBackend] = None):
         self.policy = policy
         self.working_dir = working_dir
         self.cleanup = cleanup
+        self.cgroup_backend = cgroup_backend
         self.limits = self._get_policy_limits(policy)
         self._sandbox_dir: Optional[str] = None
         self._original_cwd: Optional[str] = None
@@ -224,6 +235,7 @@ class SecureSandbox:
                 max_memory=256 * 1024 * 1024,  # 256MB
                 max_file_size=10 * 1024 * 1024,  # 10MB
                 max_processes=5,
+                max_cpu_cores=1.0,
                 network_allowed=False,
                 blocked_paths=["/", "/etc", "/usr", "/var", "/tmp"],
                 blocked_commands=["sudo", "su", "curl", "wget", "nc", "ssh"]
@@ -234,6 +246,7 @@ class SecureSandbox:
                 max_memory=512 * 1024 * 1024,  # 512MB
                 max_file_size=50 * 1024 * 1024,  # 50MB
                 max_processes=10,
+                max_cpu_cores=2.0,
                 network_allowed=True,
                 blocked_paths=["/etc", "/usr/bin", "/usr/sbin"],
                 blocked_commands=["sudo", "su"]
@@ -329,24 +342,38 @@ class SecureSandbox:
         for var in dangerous_vars:
             sandbox_env.pop(var, None)
         
+        # Kernel-enforced memory, process and CPU bandwidth limits, if available
+        cgroup = None
+        if self.cgroup_backend is not None and platform.system() == "Linux":
+            cgroup = self.cgroup_backend.create(
+                sandbox_id,
+                memory_max=self.limits.max_memory,
+                cpu_cores=self.limits.max_cpu_cores,
+                pids_max=self.limits.max_processes
+            )
+        
         # Set resource limits (Unix only)
         def set_limits():
             if platform.system() != "Windows":
+                if cgroup is not None:
+                    cgroup.attach()
                 # CPU time limit
                 resource.setrlimit(resource.RLIMIT_CPU, 
                                  (self.limits.max_cpu_time, self.limits.max_cpu_time))
-                # Memory limit
-                resource.setrlimit(resource.RLIMIT_AS,
-                                 (self.limits.max_memory, self.limits.max_memory))
                 # File size limit
                 resource.setrlimit(resource.RLIMIT_FSIZE,
                                  (self.limits.max_file_size, self.limits.max_file_size))
-                # Process limit
-                resource.setrlimit(resource.RLIMIT_NPROC,
-                                 (self.limits.max_processes, self.limits.max_processes))
+                if cgroup is None:
+                    # Memory limit
+                    resource.setrlimit(resource.RLIMIT_AS,
+                                     (self.limits.max_memory, self.limits.max_memory))
+                    # Process limit
+                    resource.setrlimit(resource.RLIMIT_NPROC,
+                                     (self.limits.max_processes, self.limits.max_processes))
         
         # Execute command
         start_time = time.time()
+        process = None
         try:
             # Use timeout if specified
             actual_timeout = timeout or self.limits.max_cpu_time
@@ -361,24 +388,24 @@ class SecureSandbox:
             )
             
             # Start monitoring
-            monitor.start_monitoring(process.pid)
+            monitor.start_monitoring(process.pid, enforce_memory=cgroup is None)
             
             # Wait for completion
-            stdout, stderr = process.communicate(timeout=actual_timeout)
+            stdout, stderr, rusage = _communicate(process, actual_timeout)
             
             execution_time = time.time() - start_time
             
-            # Get resource usage
-            resources_used = {}
-            try:
-                proc_info = psutil.Process(process.pid)
-                resources_used = {
-                    "cpu_percent": proc_info.cpu_percent(),
-                    "memory_mb": proc_info.memory_info().rss / 1024 / 1024,
-                    "num_threads": proc_info.num_threads()
-                }
-            except:
-                pass
+            # Sampled readings, overridden by exact accounting where available
+            resources_used = dict(monitor.resources_used)
+            if cgroup is not None:
+                resources_used.update(cgroup.read_usage())
+                events = cgroup.events()
+                if events["oom_kill"]:
+                    monitor.violations.append(f"Memory limit exceeded: {events['oom_kill']} process(es) OOM killed")
+                if events["pids_max"]:
+                    monitor.violations.append(f"Process limit reached: {events['pids_max']} fork(s) refused")
+            elif rusage is not None:
+                resources_used.update(rusage_usage(rusage))
             
             return ExecutionResult(
                 success=process.returncode == 0,
@@ -393,6 +420,7 @@ class SecureSandbox:
             
         except subprocess.TimeoutExpired:
             process.kill()
+            process.wait()
             return ExecutionResult(
                 success=False,
                 output="",
@@ -414,6 +442,8 @@ class SecureSandbox:
             )
         finally:
             monitor.stop_monitoring()
+            if cgroup is not None:
+                cgroup.destroy()
     
     def execute_python(self,
                       code: str,
@@ -540,8 +570,12 @@ except Exception as e:
 class SandboxManager:
     """Manages multiple sandbox instances and policies."""
     
-    def __init__(self, default_policy: SandboxPolicy = SandboxPolicy.MODERATE):
+    def __init__(self, default_policy: SandboxPolicy = SandboxPolicy.MODERATE,
+                 use_cgroups: bool = False,
+                 cgroup_parent: Optional[str] = None):
         self.default_policy = default_policy
+        # Shared by all sandboxes; falls back to rlimits when unavailable
+        self.cgroup_backend = CgroupBackend(cgroup_parent) if use_cgroups else None
         self.active_sandboxes: Dict[str, SecureSandbox] = {}
         self.execution_history: List[ExecutionResult] = []
         self._lock = threading.Lock()
@@ -566,7 +600,8 @@ class SandboxManager:
             
             sandbox = SecureSandbox(
                 policy=policy or self.default_policy,
-                working_dir=working_dir
+                working_dir=working_dir,
+                cgroup_backend=self.cgroup_backend
             )
             
             self.active_sandboxes[sandbox_id] = sandbox
@@ -0,0 +1,406 @@
+"""Pool of persistent worker processes for enhanced task sessions
+
+Workers are started once, import the session machinery up front and then
+serve task assignments over a JSON-lines pipe, streaming progress lines
+and a final result back to the orchestrator. A worker is recycled after
+``max_tasks`` assignments, when its resident memory has grown by more
+than ``max_memory_growth_mb`` since it became ready, or when it times
+out or dies. A worker that cannot be restarted after ``spawn_retries``
+attempts is counted as lost capacity; once none are left, assignments
+fail instead of waiting for a worker that will never come.
+"""
+
+import os
+import sys
+import json
+import signal
+import asyncio
+import logging
+import importlib
+import itertools
+from typing import Dict, List, Any, Optional, Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HANDLER = "claude_orchestrator.enhanced_worker_session:run_session_task"
+
+# Results carry full task output, so allow long protocol lines
+STREAM_LIMIT = 64 * 1024 * 1024
+
+
+@dataclass
+class AssignmentResult:
+    """Outcome of one task assignment"""
+    result: Optional[Dict[str, Any]]
+    worker_pid: Optional[int] = None
+    error: Optional[str] = None
+    timed_out: bool = False
+
+
+def _current_rss_kb() -> int:
+    """Resident set size of this process in KiB"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError, AttributeError):
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, KiB elsewhere
+        return usage // 1024 if sys.platform == "darwin" else usage
+
+
+class SessionWorker:
+    """Handle on one persistent worker process"""
+
+    def __init__(self, handler: str, cwd: Optional[str] = None):
+        self.handler = handler
+        self.cwd = cwd
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.pid: Optional[int] = None
+        self.tasks_run = 0
+        self.broken = False
+        self.baseline_rss_kb = 0
+        self.rss_kb = 0
+
+    async def start(self, startup_timeout: float = 60.0):
+        """Spawn the worker and wait until its imports are loaded"""
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in [package_root, env.get("PYTHONPATH", "")] if p
+        )
+
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "claude_orchestrator.session_worker_pool",
+            "--handler", self.handler,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            cwd=self.cwd,
+            env=env,
+            limit=STREAM_LIMIT,
+            start_new_session=True
+        )
+        self.pid = self.process.pid
+
+        message = await asyncio.wait_for(self._read_message(), timeout=startup_timeout)
+        if not message or message.get("type") != "ready":
+            self.kill()
+            raise RuntimeError(f"Session worker {self.pid} failed to start")
+        self.baseline_rss_kb = self.rss_kb = message.get("rss_kb", 0)
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None and not self.broken
+
+    async def _read_message(self) -> Optional[Dict[str, Any]]:
+        line = await self.process.stdout.readline()
+        if not line:
+            return None
+        return json.loads(line)
+
+    async def _send(self, message: Dict[str, Any]):
+        self.process.stdin.write((json.dumps(message) + "\n").encode())
+        await self.process.stdin.drain()
+
+    async def run(self,
+                  assignment_id: str,
+                  task: Dict[str, Any],
+                  worker_id: str,
+                  on_progress: Optional[Callable[[str], None]] = None) -> AssignmentResult:
+        """Send one assignment and stream messages until its result arrives"""
+        self.tasks_run += 1
+        await self._send({
+            "type": "task",
+            "assignment_id": assignment_id,
+            "worker_id": worker_id,
+            "task": task
+        })
+
+        while True:
+            message = await self._read_message()
+            if message is None:
+                self.broken = True
+                return AssignmentResult(None, self.pid, error="Worker process exited unexpectedly")
+            if message.get("assignment_id") != assignment_id:
+                continue
+            if message.get("type") == "progress":
+                if on_progress:
+                    try:
+                        on_progress(message.get("message", ""))
+                    except Exception as e:
+                        logger.debug(f"Progress callback failed: {e}")
+            elif message.get("type") == "result":
+                self.rss_kb = message.get("rss_kb", self.rss_kb)
+                return AssignmentResult(message.get("result"), self.pid, error=message.get("error"))
+
+    async def stop(self, timeout: float = 5.0):
+        """Ask the worker to exit, killing it if it does not"""
+        if self.process is None:
+            return
+        if not self.alive:
+            self.kill()
+            await self.process.wait()
+            return
+        try:
+            await self._send({"type": "shutdown"})
+            await asyncio.wait_for(self.process.wait(), timeout=timeout)
+        except (asyncio.TimeoutError, ConnectionError, BrokenPipeError):
+            self.kill()
+            await self.process.wait()
+
+    def kill(self):
+        """Kill the worker and anything it spawned"""
+        if self.process is None or self.process.returncode is not None:
+            return
+        self.broken = True
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError, AttributeError):
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+
+
+class SessionWorkerPool:
+    """Fixed-size pool of persistent session workers"""
+
+    def __init__(self,
+                 size: int = 3,
+                 handler: str = DEFAULT_HANDLER,
+                 max_tasks: int = 20,
+                 max_memory_growth_mb: int = 512,
+                 cwd: Optional[str] = None,
+                 spawn_retries: int = 3,
+                 spawn_backoff: float = 1.0):
+        self.size = max(1, size)
+        self.handler = handler
+        self.max_tasks = max_tasks
+        self.max_memory_growth_mb = max_memory_growth_mb
+        self.cwd = cwd
+        self.spawn_retries = spawn_retries
+        self.spawn_backoff = spawn_backoff
+
+        self._idle: Optional[asyncio.Queue] = None
+        self._workers: List[SessionWorker] = []
+        self._replacements: set = set()
+        self._assignment_ids = itertools.count(1)
+        self._started = False
+        self._lost = 0
+        self.stats = {
+            "tasks_run": 0,
+            "workers_started": 0,
+            "workers_recycled": 0,
+            "timeouts": 0,
+            "crashes": 0,
+            "workers_lost": 0
+        }
+
+    async def start(self):
+        """Start all workers concurrently"""
+        if self._started:
+            return
+        self._started = True
+        self._lost = 0
+        self._idle = asyncio.Queue()
+        workers = await asyncio.gather(*(self._spawn_with_retry() for _ in range(self.size)))
+        for worker in workers:
+            if worker is None:
+                self._lose_worker()
+            else:
+                self._idle.put_nowait(worker)
+        logger.info(f"Started {self.capacity} of {self.size} session workers")
+
+    @property
+    def capacity(self) -> int:
+        """Workers running or being replaced, excluding lost ones"""
+        return self.size - self._lost
+
+    async def _spawn(self) -> SessionWorker:
+        worker = SessionWorker(self.handler, self.cwd)
+        try:
+            await worker.start()
+        except BaseException:
+            worker.kill()
+            if worker.process is not None:
+                await worker.process.wait()
+            raise
+        self._workers.append(worker)
+        self.stats["workers_started"] += 1
+        return worker
+
+    async def _spawn_with_retry(self) -> Optional[SessionWorker]:
+        """Spawn a worker, backing off between failed attempts"""
+        delay = self.spawn_backoff
+        for attempt in range(self.spawn_retries + 1):
+            try:
+                return await self._spawn()
+            except Exception as e:
+                logger.warning(f"Failed to start session worker (attempt {attempt + 1}): {e}")
+            if attempt == self.spawn_retries or not self._started:
+                break
+            await asyncio.sleep(delay)
+            delay *= 2
+        return None
+
+    def _lose_worker(self):
+        """Give up on a worker slot and wake one waiting checkout"""
+        self._lost += 1
+        self.stats["workers_lost"] += 1
+        logger.error(f"Session worker lost; {self.capacity} of {self.size} remain")
+        self._idle.put_nowait(None)
+
+    def _needs_recycle(self, worker: SessionWorker) -> bool:
+        if not worker.alive:
+            return True
+        if self.max_tasks and worker.tasks_run >= self.max_tasks:
+            return True
+        growth_mb = (worker.rss_kb - worker.baseline_rss_kb) / 1024
+        return bool(self.max_memory_growth_mb) and growth_mb > self.max_memory_growth_mb
+
+    async def _replace(self, worker: SessionWorker):
+        """Retire a worker and put a fresh one in the idle queue"""
+        self.stats["workers_recycled"] += 1
+        if worker in self._workers:
+            self._workers.remove(worker)
+        await worker.stop()
+        if not self._started:
+            return
+        new_worker = await self._spawn_with_retry()
+        if new_worker is None:
+            if self._started:
+                self._lose_worker()
+            return
+        if self._started:
+            self._idle.put_nowait(new_worker)
+        else:
+            await new_worker.stop()
+
+    def _release(self, worker: SessionWorker):
+        if self._needs_recycle(worker):
+            replacement = asyncio.ensure_future(self._replace(worker))
+            self._replacements.add(replacement)
+            replacement.add_done_callback(self._replacements.discard)
+        else:
+            self._idle.put_nowait(worker)
+
+    async def run_task(self,
+                       task: Dict[str, Any],
+                       worker_id: str,
+                       timeout: Optional[float] = None,
+                       on_progress: Optional[Callable[[str], None]] = None) -> AssignmentResult:
+        """Run a task on the next idle worker
+
+        ``timeout`` covers both waiting for an idle worker and running the
+        task.
+        """
+        await self.start()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        try:
+            worker = await self._checkout(deadline)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            return AssignmentResult(None, error="Timed out waiting for a session worker", timed_out=True)
+        if worker is None:
+            return AssignmentResult(None, error="No session workers available")
+
+        assignment_id = str(next(self._assignment_ids))
+        remaining = None if deadline is None else max(0.0, deadline - loop.time())
+
+        try:
+            outcome = await asyncio.wait_for(
+                worker.run(assignment_id, task, worker_id, on_progress),
+                timeout=remaining
+            )
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            worker.kill()
+            outcome = AssignmentResult(None, worker.pid, error="Task timed out", timed_out=True)
+        except Exception as e:
+            worker.kill()
+            outcome = AssignmentResult(None, worker.pid, error=str(e))
+
+        if worker.broken and not outcome.timed_out:
+            self.stats["crashes"] += 1
+        self.stats["tasks_run"] += 1
+        self._release(worker)
+        return outcome
+
+    async def _checkout(self, deadline: Optional[float]) -> Optional[SessionWorker]:
+        """Wait for an idle worker; None once every worker has been lost"""
+        loop = asyncio.get_running_loop()
+        while self.capacity > 0:
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            worker = await asyncio.wait_for(self._idle.get(), timeout=remaining)
+            if worker is not None:
+                return worker
+        return None
+
+    async def shutdown(self):
+        """Stop all workers"""
+        self._started = False
+        if self._replacements:
+            await asyncio.gather(*self._replacements, return_exceptions=True)
+        workers, self._workers = self._workers, []
+        await asyncio.gather(*(w.stop() for w in workers), return_exceptions=True)
+
+
+def _load_handler(spec: str) -> Callable:
+    module_name, func_name = spec.split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def _serve(handler_spec: str):
+    """Worker main loop: load the handler, then serve assignments from stdin"""
+    # Keep the protocol channel private so task output can't corrupt it
+    proto_fd = os.dup(1)
+    os.dup2(2, 1)
+    proto = os.fdopen(proto_fd, "w", buffering=1)
+
+    def send(message: Dict[str, Any]):
+        proto.write(json.dumps(message) + "\n")
+        proto.flush()
+
+    handler = _load_handler(handler_spec)
+    send({"type": "ready", "pid": os.getpid(), "rss_kb": _current_rss_kb()})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request = json.loads(line)
+        if request.get("type") == "shutdown":
+            break
+        if request.get("type") != "task":
+            continue
+
+        assignment_id = request["assignment_id"]
+
+        def progress(message: str, _assignment_id=assignment_id):
+            send({"type": "progress", "assignment_id": _assignment_id, "message": message})
+
+        reply = {"type": "result", "assignment_id": assignment_id, "result": None, "error": None}
+        try:
+            reply["result"] = handler(request["task"], request["worker_id"], progress)
+        except Exception as e:
+            reply["error"] = f"{type(e).__name__}: {e}"
+        reply["rss_kb"] = _current_rss_kb()
+        send(reply)
+
+
+def main(argv: Optional[List[str]] = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Persistent session worker")
+    parser.add_argument("--handler", default=DEFAULT_HANDLER)
+    args = parser.parse_args(argv)
+
+    _serve(args.handler)
+
+
+if __name__ == "__main__":
+    main()
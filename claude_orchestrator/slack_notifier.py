@@ -3,49 +3,292 @@
 Slack Notification Manager for Claude Orchestrator
 """
 
+import time
+import queue
 import logging
+import threading
 from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field
+
+import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
-# import requests  # Temporarily disabled for task creation
+# Notification kinds that are merged into digests when they arrive in bursts
+TASK_COMPLETE = "task_complete"
+TASK_FAILED = "task_failed"
+COALESCED_KINDS = (TASK_COMPLETE, TASK_FAILED)
+
+# Maximum number of tasks listed individually in a digest
+DIGEST_MAX_ITEMS = 10
+
+
+@dataclass
+class _Notification:
+    """A queued Slack message"""
+    payload: Dict[str, Any]
+    kind: Optional[str] = None
+    task_id: Optional[str] = None
+    title: Optional[str] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class _DigestBucket:
+    """Coalescing state for one notification kind"""
+    window_end: float = 0.0
+    pending: List[_Notification] = field(default_factory=list)
+
+
+class _Control:
+    """Flush/stop marker passed through the dispatch queue"""
+
+    def __init__(self, stop: bool = False):
+        self.stop = stop
+        self.done = threading.Event()
 
 
 class SlackNotificationManager:
-    """Manages Slack notifications for the orchestrator"""
+    """Manages Slack notifications for the orchestrator
+
+    Sending only enqueues the message; a background dispatcher thread
+    delivers it over a pooled HTTP session. Task completion and failure
+    messages arriving within ``coalesce_window`` seconds of the previous
+    one are merged into a single digest message.
+    """
     
-    def __init__(self, webhook_url: Optional[str] = None):
+    def __init__(self,
+                 webhook_url: Optional[str] = None,
+                 coalesce_window: float = 30.0,
+                 queue_size: int = 1000,
+                 timeout: float = 10.0,
+                 max_retries: int = 3,
+                 retry_backoff: float = 1.0,
+                 max_retry_delay: float = 60.0):
         self.webhook_url = webhook_url
+        self.coalesce_window = coalesce_window
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_retry_delay = max_retry_delay
         
-    def send_notification(self, message: str, emoji: str = ":robot_face:", blocks: Optional[List[Dict]] = None) -> bool:
-        """Send a notification to Slack"""
-        if not self.webhook_url:
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._buckets = {kind: _DigestBucket() for kind in COALESCED_KINDS}
+        self._session: Optional[requests.Session] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        self.stats = {
+            "queued": 0,
+            "sent": 0,
+            "failed": 0,
+            "dropped": 0,
+            "retries": 0,
+            "coalesced": 0,
+            "digests": 0
+        }
+    
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._dispatch_loop, name="slack-dispatcher", daemon=True
+                )
+                self._thread.start()
+    
+    def _enqueue(self, notification: _Notification) -> bool:
+        if not self.webhook_url or self._closed:
             return False
-            
+        self._ensure_started()
         try:
-            payload = {
-                "text": message,
-                "icon_emoji": emoji
-            }
-            
-            if blocks:
-                payload["blocks"] = blocks
-                
-            response = requests.post(self.webhook_url, json=payload)
-            return response.status_code == 200
-        except Exception as e:
-            logger.error(f"Failed to send Slack notification: {e}")
+            self._queue.put_nowait(notification)
+        except queue.Full:
+            self.stats["dropped"] += 1
+            logger.warning("Slack notification queue is full, dropping message")
             return False
+        self.stats["queued"] += 1
+        return True
+    
+    def send_notification(self, message: str, emoji: str = ":robot_face:", blocks: Optional[List[Dict]] = None) -> bool:
+        """Queue a notification for Slack
+        
+        Returns True if the message was queued for delivery.
+        """
+        payload = {
+            "text": message,
+            "icon_emoji": emoji
+        }
+        
+        if blocks:
+            payload["blocks"] = blocks
+        
+        return self._enqueue(_Notification(payload))
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Deliver everything queued so far, including pending digests"""
+        return self._control(_Control(), timeout)
+    
+    def close(self, timeout: Optional[float] = 30.0) -> bool:
+        """Flush pending messages and stop the dispatcher"""
+        if self._closed:
+            return True
+        self._closed = True
+        delivered = self._control(_Control(stop=True), timeout)
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._session is not None:
+            self._session.close()
+        return delivered
+    
+    def _control(self, marker: _Control, timeout: Optional[float]) -> bool:
+        if self._thread is None:
+            return True
+        # Control markers must not be dropped, so block on a full queue
+        self._queue.put(marker)
+        return marker.done.wait(timeout)
+    
+    # Dispatcher thread
+    
+    def _dispatch_loop(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self._next_deadline())
+            except queue.Empty:
+                item = None
+            
+            if isinstance(item, _Control):
+                try:
+                    self._flush_digests(force=True)
+                except Exception as e:
+                    logger.error(f"Slack dispatcher error: {e}")
+                item.done.set()
+                if item.stop:
+                    return
+                continue
+            
+            try:
+                if item is not None:
+                    self._handle(item)
+                self._flush_digests()
+            except Exception as e:
+                logger.error(f"Slack dispatcher error: {e}")
+    
+    def _next_deadline(self) -> Optional[float]:
+        deadlines = [b.window_end for b in self._buckets.values() if b.pending]
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.monotonic())
+    
+    def _handle(self, notification: _Notification):
+        bucket = self._buckets.get(notification.kind)
+        if bucket is None:
+            # Keep ordering: task digests go out before summary messages
+            self._flush_digests(force=True)
+            self._deliver(notification.payload)
+            return
+        
+        now = time.monotonic()
+        if now < bucket.window_end:
+            bucket.pending.append(notification)
+        else:
+            self._deliver(notification.payload)
+            bucket.window_end = now + self.coalesce_window
+    
+    def _flush_digests(self, force: bool = False):
+        now = time.monotonic()
+        for kind, bucket in self._buckets.items():
+            if not bucket.pending or (not force and now < bucket.window_end):
+                continue
+            pending, bucket.pending = bucket.pending, []
+            if len(pending) == 1:
+                self._deliver(pending[0].payload)
+            else:
+                self.stats["digests"] += 1
+                self.stats["coalesced"] += len(pending)
+                self._deliver(self._build_digest(kind, pending))
+            bucket.window_end = now + self.coalesce_window
+    
+    def _build_digest(self, kind: str, notifications: List[_Notification]) -> Dict[str, Any]:
+        count = len(notifications)
+        window = f"{self.coalesce_window:g} s"
+        if kind == TASK_COMPLETE:
+            header = f"✅ {count} tasks completed in the last {window}"
+            emoji = ":white_check_mark:"
+        else:
+            header = f"❌ {count} tasks failed in the last {window}"
+            emoji = ":x:"
+        
+        lines = [header]
+        for n in notifications[:DIGEST_MAX_ITEMS]:
+            line = f"• {n.task_id} - {n.title}"
+            if n.error:
+                line += f": {n.error[:100]}"
+            lines.append(line)
+        if count > DIGEST_MAX_ITEMS:
+            lines.append(f"... and {count - DIGEST_MAX_ITEMS} more")
+        
+        return {"text": "\n".join(lines), "icon_emoji": emoji}
+    
+    def _get_session(self) -> requests.Session:
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=2)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+    
+    def _deliver(self, payload: Dict[str, Any]) -> bool:
+        """POST a payload, retrying on rate limits and transient errors"""
+        delay = self.retry_backoff
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self._get_session().post(self.webhook_url, json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                logger.warning(f"Slack notification attempt {attempt + 1} failed: {e}")
+                wait = delay
+            else:
+                if response.status_code == 200:
+                    self.stats["sent"] += 1
+                    return True
+                if response.status_code == 429:
+                    try:
+                        wait = float(response.headers.get("Retry-After", delay))
+                    except ValueError:
+                        wait = delay
+                elif response.status_code >= 500:
+                    wait = delay
+                else:
+                    logger.error(f"Slack rejected notification: HTTP {response.status_code} {response.text[:200]}")
+                    break
+            
+            if attempt < self.max_retries:
+                self.stats["retries"] += 1
+                time.sleep(min(wait, self.max_retry_delay))
+                delay *= 2
+        
+        self.stats["failed"] += 1
+        logger.error("Failed to send Slack notification")
+        return False
     
     def send_task_complete(self, task_id: str, task_title: str) -> bool:
         """Send notification when a task is completed"""
         message = f"✅ Task completed: {task_id} - {task_title}"
-        return self.send_notification(message, ":white_check_mark:")
+        return self._enqueue(_Notification(
+            {"text": message, "icon_emoji": ":white_check_mark:"},
+            kind=TASK_COMPLETE, task_id=str(task_id), title=task_title
+        ))
     
     def send_task_failed(self, task_id: str, task_title: str, error: str) -> bool:
         """Send notification when a task fails"""
         message = f"❌ Task failed: {task_id} - {task_title}\nError: {error}"
-        return self.send_notification(message, ":x:")
+        return self._enqueue(_Notification(
+            {"text": message, "icon_emoji": ":x:"},
+            kind=TASK_FAILED, task_id=str(task_id), title=task_title, error=error
+        ))
     
     def send_all_complete(self, total_tasks: int, completed: int, failed: int, elapsed_time: str) -> bool:
         """Send notification when all tasks are complete"""
@@ -121,4 +364,4 @@ class SlackNotificationManager:
             ]
         })
         
-        return self.send_notification("Opus Review Complete", ":robot_face:", blocks)
\ No newline at end of file
+        return self.send_notification("Opus Review Complete", ":robot_face:", blocks)
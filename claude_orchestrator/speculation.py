@@ -0,0 +1,163 @@
+"""Bookkeeping for speculative execution of tasks.
+
+A dependency counts as done for scheduling once its worker finishes, but
+its Opus review comes later and may ask for changes. In speculative mode
+(``execution.speculative_execution``) a task whose dependencies are still
+awaiting review runs in its worker's git worktree instead of the shared
+working directory. Its result is held until those reviews finish:
+
+- if every review passes, the result is applied to the working directory
+  and the task is completed as usual
+- if a review asks for improvements (or fails), the result is discarded
+  and the task runs again in the working directory
+
+Held tasks are not treated as completed, so tasks depending on them wait
+for the commit; speculation is one level deep.
+
+For each committed task, the time saved is how much earlier it finished
+than it would have if it had waited for the reviews:
+``min(review done - start, run time)``. Savings add up along dependency
+chains; the largest chain total is reported as the critical-path saving.
+
+Typical usage example:
+    tracker = SpeculationTracker()
+    tracker.review_queued("1")
+    tracker.start(task, tracker.unconfirmed(task))
+    tracker.finish(task.task_id, worktree.diff())
+    tracker.review_finished("1", passed=True)
+    to_commit, to_discard = tracker.settle()
+"""
+
+import time
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .models import WorkerTask
+
+
+@dataclass
+class Speculation:
+    """A task running, or held, ahead of its dependencies' reviews"""
+    task: WorkerTask
+    depends_on: Set[str]
+    started_at: float
+    worker_id: Any = None
+    finished_at: Optional[float] = None
+    patch: Optional[str] = None
+
+
+class SpeculationTracker:
+    """Tracks pending reviews and the speculative tasks waiting on them"""
+
+    def __init__(self):
+        self.awaiting_review: Set[str] = set()
+        self.rejected: Set[str] = set()
+        self.review_times: Dict[str, float] = {}
+        self.speculations: Dict[str, Speculation] = {}
+        self.time_saved: Dict[str, float] = {}
+        self._dependencies: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"started": 0, "committed": 0, "discarded": 0, "conflicts": 0}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self.speculations)
+
+    def __contains__(self, task_id: str) -> bool:
+        with self._lock:
+            return task_id in self.speculations
+
+    def task_ids(self) -> Set[str]:
+        """Tasks running or held speculatively"""
+        with self._lock:
+            return set(self.speculations)
+
+    def review_queued(self, task_id: str):
+        with self._lock:
+            self.awaiting_review.add(task_id)
+
+    def review_finished(self, task_id: str, passed: bool):
+        with self._lock:
+            self.awaiting_review.discard(task_id)
+            self.review_times[task_id] = time.time()
+            if not passed:
+                self.rejected.add(task_id)
+
+    def unconfirmed(self, task: WorkerTask) -> Set[str]:
+        """Dependencies of ``task`` whose reviews have not finished"""
+        with self._lock:
+            return {dep for dep in task.dependencies if dep in self.awaiting_review}
+
+    def start(self, task: WorkerTask, depends_on: Set[str], worker_id: Any = None) -> Speculation:
+        speculation = Speculation(task, set(depends_on), time.time(), worker_id)
+        with self._lock:
+            self.speculations[task.task_id] = speculation
+            self.stats["started"] += 1
+        return speculation
+
+    def finish(self, task_id: str, patch: str):
+        """Record the finished task's changes; it is held until settled"""
+        with self._lock:
+            speculation = self.speculations[task_id]
+            speculation.finished_at = time.time()
+            speculation.patch = patch
+
+    def drop(self, task_id: str) -> Optional[Speculation]:
+        """Forget a speculation (its task failed or the run is stopping)"""
+        with self._lock:
+            return self.speculations.pop(task_id, None)
+
+    def settle(self) -> Tuple[List[Speculation], List[Speculation]]:
+        """Take the finished speculations whose dependencies' reviews are done.
+
+        Returns:
+            Tuple of (speculations to commit, speculations to discard)
+        """
+        to_commit, to_discard = [], []
+        with self._lock:
+            for task_id, speculation in list(self.speculations.items()):
+                if speculation.finished_at is None:
+                    continue
+                if speculation.depends_on & self.rejected:
+                    to_discard.append(self.speculations.pop(task_id))
+                    self.stats["discarded"] += 1
+                elif not speculation.depends_on & self.awaiting_review:
+                    to_commit.append(self.speculations.pop(task_id))
+        return to_commit, to_discard
+
+    def committed(self, speculation: Speculation) -> float:
+        """Record a committed speculation; returns the time it saved"""
+        with self._lock:
+            confirmed_at = max(
+                (self.review_times.get(dep, speculation.started_at) for dep in speculation.depends_on),
+                default=speculation.started_at
+            )
+            saved = max(0.0, min(confirmed_at - speculation.started_at,
+                                 speculation.finished_at - speculation.started_at))
+            task_id = speculation.task.task_id
+            self.time_saved[task_id] = saved
+            self._dependencies[task_id] = list(speculation.task.dependencies)
+            self.stats["committed"] += 1
+        return saved
+
+    def conflict(self):
+        with self._lock:
+            self.stats["conflicts"] += 1
+
+    def critical_path_saved(self) -> float:
+        """Largest total saving along one dependency chain"""
+        with self._lock:
+            chain: Dict[str, float] = {}
+
+            def saved(task_id: str, seen: frozenset) -> float:
+                if task_id in chain:
+                    return chain[task_id]
+                upstream = [
+                    saved(dep, seen | {task_id}) for dep in self._dependencies.get(task_id, [])
+                    if dep in self.time_saved and dep not in seen
+                ]
+                chain[task_id] = self.time_saved[task_id] + max(upstream, default=0.0)
+                return chain[task_id]
+
+            return max((saved(task_id, frozenset()) for task_id in self.time_saved), default=0.0)
@@ -0,0 +1,277 @@
+"""Embedded SQLite state store for orchestrator bookkeeping.
+
+The lifecycle manager, the orphaned resource detector and the rollback
+manager used to keep their state in JSON files, which they rewrote in
+full on every change. With many tracked objects, each event cost time
+proportional to the size of the whole state.
+
+StateStore keeps that state in a single SQLite database in WAL mode:
+
+- each subsystem gets its own table, described by a TableSpec; the full
+  record is stored as JSON, with a few columns copied out for filtering
+- changes are row-level: one upsert or delete per changed object
+- all writes go through one writer thread, which commits whatever has
+  queued up in a single transaction (group commit), so callers never
+  wait on the disk
+- reads flush pending writes first, so callers read their own writes
+
+Typical usage example:
+    store = get_state_store(".taskmaster/state.db")
+    states = store.table(LIFECYCLE_STATES)
+    states.upsert({"task_id": "7", "state": "pending", ...})
+    states.all(state="pending")
+"""
+
+import json
+import queue
+import atexit
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_DB = ".taskmaster/state.db"
+
+# Most statements committed in one transaction
+MAX_BATCH = 500
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """A subsystem table: the record key plus columns copied out for queries"""
+    name: str
+    key: str
+    columns: Tuple[str, ...] = ()
+
+
+LIFECYCLE_STATES = TableSpec("lifecycle_states", "task_id", ("state", "updated_at"))
+TRACKED_RESOURCES = TableSpec("tracked_resources", "resource_id", ("resource_type", "status", "owner_id"))
+ROLLBACK_HISTORY = TableSpec("rollback_history", "rollback_id", ("task_id", "initiated_at"))
+
+
+class StateTable:
+    """Typed accessor for one subsystem's records"""
+
+    def __init__(self, store: 'StateStore', spec: TableSpec):
+        self.store = store
+        self.spec = spec
+        columns = (spec.key,) + spec.columns + ("data",)
+        self._upsert_sql = (
+            f"INSERT OR REPLACE INTO {spec.name} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+
+    def upsert(self, record: Dict[str, Any]):
+        """Insert or replace a record (keyed by ``spec.key``)"""
+        params = [str(record[self.spec.key])]
+        params += [_column_value(record.get(column)) for column in self.spec.columns]
+        params.append(json.dumps(record, default=str))
+        self.store.execute(self._upsert_sql, params)
+
+    def delete(self, key: Any):
+        self.store.execute(f"DELETE FROM {self.spec.name} WHERE {self.spec.key} = ?", (str(key),))
+
+    def prune(self, keep: int, order_by: str):
+        """Delete all but the ``keep`` records with the highest ``order_by``"""
+        self.store.execute(
+            f"DELETE FROM {self.spec.name} WHERE {self.spec.key} NOT IN ("
+            f"SELECT {self.spec.key} FROM {self.spec.name} ORDER BY {order_by} DESC LIMIT ?)",
+            (keep,)
+        )
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        rows = self.store.query(
+            f"SELECT data FROM {self.spec.name} WHERE {self.spec.key} = ?", (str(key),)
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def all(self, order_by: Optional[str] = None, **filters) -> List[Dict[str, Any]]:
+        """Records matching ``column=value`` filters, optionally ordered"""
+        for column in list(filters) + ([order_by] if order_by else []):
+            if column not in self.spec.columns and column != self.spec.key:
+                raise ValueError(f"{self.spec.name} has no column {column!r}")
+        sql = f"SELECT data FROM {self.spec.name}"
+        if filters:
+            sql += " WHERE " + " AND ".join(f"{column} = ?" for column in filters)
+        if order_by:
+            sql += f" ORDER BY {order_by}"
+        rows = self.store.query(sql, [_column_value(v) for v in filters.values()])
+        return [json.loads(row[0]) for row in rows]
+
+    def __len__(self) -> int:
+        return self.store.query(f"SELECT COUNT(*) FROM {self.spec.name}")[0][0]
+
+
+class StateStore:
+    """SQLite (WAL) store with a single group-committing writer thread"""
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_STATE_DB):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._tables: Dict[str, StateTable] = {}
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        self.stats = {"writes": 0, "commits": 0, "errors": 0}
+
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.commit()
+
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection with context manager"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def table(self, spec: TableSpec) -> StateTable:
+        """Accessor for a subsystem table, creating the table on first use"""
+        with self._lock:
+            if spec.name not in self._tables:
+                with self._get_connection() as conn:
+                    columns = "".join(f", {column}" for column in spec.columns)
+                    conn.execute(
+                        f"CREATE TABLE IF NOT EXISTS {spec.name} "
+                        f"({spec.key} TEXT PRIMARY KEY{columns}, data TEXT NOT NULL)"
+                    )
+                    for column in spec.columns:
+                        conn.execute(
+                            f"CREATE INDEX IF NOT EXISTS idx_{spec.name}_{column} ON {spec.name}({column})"
+                        )
+                    conn.commit()
+                self._tables[spec.name] = StateTable(self, spec)
+            return self._tables[spec.name]
+
+    def execute(self, sql: str, params=()):
+        """Queue a write; it is committed by the writer thread"""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"State store {self.db_path} is closed")
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="state-store-writer", daemon=True)
+                self._writer.start()
+        self._queue.put((sql, params))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued write is committed"""
+        done = threading.Event()
+        with self._lock:
+            writer = self._writer
+            if writer is None or not writer.is_alive():
+                return True
+            # Queued under the lock, so a marker always lands ahead of close()'s stop
+            queued = not self._closed
+            if queued:
+                self._queue.put(done)
+        if not queued:
+            # Closing: the writer drains the queue up to the stop marker and exits
+            writer.join(timeout)
+            return not writer.is_alive()
+        return done.wait(timeout)
+
+    def query(self, sql: str, params=()) -> List[tuple]:
+        """Run a read after flushing pending writes"""
+        self.flush()
+        with self._get_connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def close(self):
+        """Commit pending writes and stop the writer thread"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            writer = self._writer
+            if writer is not None:
+                self._queue.put(None)
+        if writer is not None:
+            writer.join(timeout=10)
+
+    def _write_loop(self):
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            stop = False
+            while not stop:
+                batch = [self._queue.get()]
+                while len(batch) < MAX_BATCH:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                waiters = []
+                statements = []
+                for item in batch:
+                    if item is None:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        statements.append(item)
+
+                if statements:
+                    self._commit(conn, statements)
+                for waiter in waiters:
+                    waiter.set()
+        finally:
+            conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, statements: List[tuple]):
+        try:
+            with conn:
+                for sql, params in statements:
+                    conn.execute(sql, params)
+            self.stats["writes"] += len(statements)
+            self.stats["commits"] += 1
+        except sqlite3.Error as e:
+            # Retry one by one so a single bad statement does not drop the batch
+            logger.error(f"State store batch failed ({e}); retrying statements individually")
+            for sql, params in statements:
+                try:
+                    with conn:
+                        conn.execute(sql, params)
+                    self.stats["writes"] += 1
+                    self.stats["commits"] += 1
+                except sqlite3.Error as e:
+                    self.stats["errors"] += 1
+                    logger.error(f"State store write failed: {e}")
+
+
+def _column_value(value: Any) -> Any:
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    return str(value)
+
+
+# Global stores, one per database file
+_stores: Dict[Path, StateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_state_store(db_path: Union[str, Path] = DEFAULT_STATE_DB) -> StateStore:
+    """Get or create the shared store for a database file"""
+    path = Path(db_path).resolve()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None or store._closed:
+            store = StateStore(path)
+            _stores[path] = store
+        return store
+
+
+@atexit.register
+def _close_stores():
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        store.close()
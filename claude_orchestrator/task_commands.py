@@ -0,0 +1,177 @@
+"""
+Read-only task commands for the CLI (list, show, next)
+
+These only need the native Task Master, so they are kept apart from
+``main`` and its orchestration, UI and configuration imports.
+"""
+
+from typing import Dict, Any, Optional
+
+from .task_master import TaskManager, Task
+
+
+STATUS_EMOJIS = {
+    'pending': '○',
+    'in-progress': '►',
+    'done': '✓',
+    'review': '👁',
+    'deferred': '⏱',
+    'cancelled': '✗'
+}
+
+PRIORITY_COLORS = {
+    'high': '🔴',
+    'medium': '🟡',
+    'low': '🟢'
+}
+
+
+def _task_to_dict(task: Task, include_subtasks: bool = False) -> Dict[str, Any]:
+    """Convert a task to the dict shape used by TaskMasterInterface"""
+    data = {
+        'id': str(task.id),
+        'title': task.title,
+        'description': task.description,
+        'status': task.status,
+        'priority': task.priority,
+        'dependencies': task.dependencies,
+        'details': task.details
+    }
+    if include_subtasks:
+        data['subtasks'] = [{
+            'id': f"{task.id}.{st.id}",
+            'title': st.title,
+            'status': st.status
+        } for st in task.subtasks]
+    return data
+
+
+def list_command(args, task_manager: Optional[TaskManager] = None) -> int:
+    """List all tasks with optional filtering"""
+    task_manager = task_manager or TaskManager()
+    tasks = [
+        _task_to_dict(t, include_subtasks=args.show_subtasks)
+        for t in task_manager.get_all_tasks()
+        if not args.filter_status or t.status == args.filter_status
+    ]
+
+    if not tasks:
+        print("No tasks found.")
+        return 0
+
+    # Group tasks by status
+    status_groups = {}
+    for task in tasks:
+        status_groups.setdefault(task['status'], []).append(task)
+
+    # Display tasks
+    print("\n📋 Task List")
+    print("=" * 80)
+
+    for status in ['in-progress', 'pending', 'review', 'done', 'deferred', 'cancelled']:
+        if status in status_groups:
+            print(f"\n{STATUS_EMOJIS.get(status, '?')} {status.upper()} ({len(status_groups[status])})")
+            print("-" * 40)
+
+            for task in status_groups[status]:
+                priority_emoji = PRIORITY_COLORS.get(task.get('priority', 'medium'), '⚪')
+                print(f"{priority_emoji} [{task['id']}] {task['title'][:60]}")
+
+                if args.show_subtasks and task.get('subtasks'):
+                    for subtask in task['subtasks']:
+                        subtask_emoji = STATUS_EMOJIS.get(subtask.get('status', 'pending'), '?')
+                        print(f"    {subtask_emoji} {subtask['id']}: {subtask['title'][:50]}")
+
+    # Show summary
+    total = len(tasks)
+    completed = len([t for t in tasks if t['status'] == 'done'])
+    in_progress = len([t for t in tasks if t['status'] == 'in-progress'])
+    pending = len([t for t in tasks if t['status'] == 'pending'])
+
+    print(f"\n📊 Summary: Total: {total} | ✓ Done: {completed} | ► In Progress: {in_progress} | ○ Pending: {pending}")
+    return 0
+
+
+def show_command(args, task_manager: Optional[TaskManager] = None) -> int:
+    """Show detailed information about a specific task"""
+    if not args.arg2:
+        print("Error: Task ID required for show command")
+        print("Usage: co show <task_id>")
+        return 1
+
+    task_manager = task_manager or TaskManager()
+    found = task_manager.get_task(args.arg2)
+    if not isinstance(found, Task):
+        print(f"Error: Task {args.arg2} not found")
+        return 1
+    task = _task_to_dict(found, include_subtasks=True)
+
+    status_emoji = STATUS_EMOJIS.get(task['status'], '?')
+    priority_color = PRIORITY_COLORS.get(task.get('priority', 'medium'), '⚪')
+
+    print("\n📋 Task Details")
+    print("=" * 80)
+    print(f"ID:          {task['id']}")
+    print(f"Title:       {task['title']}")
+    print(f"Status:      {status_emoji} {task['status']}")
+    print(f"Priority:    {priority_color} {task.get('priority', 'medium')}")
+    print("\nDescription:")
+    print(f"  {task.get('description', 'No description')}")
+
+    if task.get('details'):
+        print("\nDetails:")
+        print(f"  {task['details']}")
+
+    if task.get('dependencies'):
+        print(f"\nDependencies: {', '.join(map(str, task['dependencies']))}")
+
+    if task.get('subtasks'):
+        print(f"\nSubtasks ({len(task['subtasks'])}):")
+        for st in task['subtasks']:
+            st_emoji = {
+                'pending': '○',
+                'in-progress': '►',
+                'done': '✓'
+            }.get(st.get('status', 'pending'), '?')
+            print(f"  {st_emoji} {st['id']}: {st['title']}")
+
+    return 0
+
+
+def next_command(args, task_manager: Optional[TaskManager] = None) -> int:
+    """Get the next available task"""
+    task_manager = task_manager or TaskManager()
+    task = task_manager.get_next_task()
+
+    if not task:
+        print("No available tasks. All tasks are either completed or have unmet dependencies.")
+        return 0
+
+    next_task = _task_to_dict(task)
+    print("\n📋 Next Task")
+    print("=" * 80)
+    print(f"ID:       {next_task['id']}")
+    print(f"Title:    {next_task['title']}")
+    print(f"Priority: {next_task.get('priority', 'medium')}")
+    print("\nDescription:")
+    print(f"  {next_task.get('description', 'No description')}")
+
+    if next_task.get('details'):
+        print("\nDetails:")
+        print(f"  {next_task['details']}")
+
+    print("\nTo start working on this task, run:")
+    print(f"  co update {next_task['id']} --status in-progress")
+    return 0
+
+
+TASK_COMMANDS = {
+    'list': list_command,
+    'show': show_command,
+    'next': next_command,
+}
+
+
+def run_task_command(args) -> int:
+    """Run a read-only task command and return its exit code"""
+    return TASK_COMMANDS[args.command](args)
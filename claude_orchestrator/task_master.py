@@ -3,18 +3,26 @@ Task Master - Native Python implementation
 Integrated task management system for Claude Orchestrator
 """
 
+import copy
 import json
 import os
 import re
 import uuid
 import time
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import logging
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -136,6 +144,239 @@ class Task:
         return task
 
 
+class TaskStore:
+    """Process-wide parsed copy of one tasks.json
+    
+    Every TaskManager for the same file shares a single TaskStore, so all
+    interfaces see the same Task objects. Reads re-parse the file only when
+    its (mtime, size) changed; writes go through ``transaction()``, which
+    holds an in-process lock plus an advisory file lock, reloads if another
+    process wrote in the meantime, and saves atomically once at the end.
+    """
+    
+    _registry: Dict[str, 'TaskStore'] = {}
+    _registry_lock = threading.Lock()
+    
+    def __init__(self, tasks_file: Path, project_name: str = "", check_interval: float = 0.5):
+        self.tasks_file = Path(tasks_file)
+        self.lock_file = self.tasks_file.with_name(self.tasks_file.name + ".lock")
+        self.project_name = project_name or self.tasks_file.parent.parent.parent.name
+        self.check_interval = check_interval
+        self.lock = threading.RLock()
+        self.version = 0
+        self._data: Dict = {}
+        self._file_signature = None
+        self._next_check = 0.0
+        self._subscribers: List[Callable[['TaskStore'], None]] = []
+        self._depth = 0
+        self._dirty = False
+        
+        with self.lock:
+            self._reload()
+    
+    @classmethod
+    def for_file(cls, tasks_file: Path, project_name: str = "") -> 'TaskStore':
+        """Get the shared store for a tasks file"""
+        key = os.path.abspath(str(tasks_file))
+        with cls._registry_lock:
+            store = cls._registry.get(key)
+            if store is None:
+                store = cls(Path(key), project_name)
+                cls._registry[key] = store
+            return store
+    
+    @property
+    def data(self) -> Dict:
+        """Current tasks data, reloaded first if the file changed"""
+        self.maybe_reload()
+        return self._data
+    
+    def _stat_signature(self):
+        try:
+            stat = os.stat(self.tasks_file)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
+    def _empty_data(self) -> Dict:
+        return {
+            'meta': {
+                'projectName': self.project_name,
+                'projectVersion': '1.0.0',
+                'createdAt': datetime.now().isoformat(),
+                'updatedAt': datetime.now().isoformat()
+            },
+            'tasks': []
+        }
+    
+    def _reload(self):
+        """Parse the tasks file; caller holds ``self.lock``"""
+        signature = self._stat_signature()
+        data = None
+        if signature is not None:
+            try:
+                with open(self.tasks_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                # Convert task dicts to Task objects
+                if 'tasks' in data:
+                    converted_tasks = []
+                    for i, t in enumerate(data['tasks']):
+                        try:
+                            if isinstance(t, dict):
+                                converted_tasks.append(Task.from_dict(t))
+                            else:
+                                converted_tasks.append(t)
+                        except Exception as task_error:
+                            logger.error(f"Error loading task at index {i}: {task_error}")
+                            logger.debug(f"Problematic task data: {t}")
+                    data['tasks'] = converted_tasks
+            except Exception as e:
+                logger.error(f"Error loading tasks: {e}")
+                data = None
+        
+        self._data = data if data is not None else self._empty_data()
+        self._file_signature = signature
+        self._next_check = time.monotonic() + self.check_interval
+        self.version += 1
+    
+    def maybe_reload(self, force: bool = False) -> bool:
+        """Reload if the file changed on disk
+        
+        Args:
+            force: Check the file now instead of waiting for ``check_interval``
+            
+        Returns:
+            True if the tasks were reloaded
+        """
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return False
+        
+        with self.lock:
+            # Inside a transaction the in-memory copy is authoritative
+            if self._depth:
+                return False
+            self._next_check = now + self.check_interval
+            if self._stat_signature() == self._file_signature:
+                return False
+            self._reload()
+        
+        self._notify()
+        return True
+    
+    def replace(self, data: Dict):
+        """Replace the whole tasks data (caller saves)"""
+        with self.lock:
+            self._data = data
+            self.version += 1
+    
+    @contextmanager
+    def _file_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_file, 'a') as lock_handle:
+            fcntl.flock(lock_handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_handle.fileno(), fcntl.LOCK_UN)
+    
+    @contextmanager
+    def transaction(self):
+        """Lock, refresh from disk, yield the data and save once on exit
+        
+        Transactions nest; only the outermost one touches the file. The
+        file is left alone when the body changed nothing, and the data is
+        reloaded from disk when the body raises.
+        """
+        with self.lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self._data
+                finally:
+                    self._depth -= 1
+                return
+            
+            with self._file_lock():
+                if self._stat_signature() != self._file_signature:
+                    self._reload()
+                self._depth = 1
+                self._dirty = False
+                before = self._serialize()
+                try:
+                    yield self._data
+                except BaseException:
+                    # Drop the body's partial in-memory edits
+                    self._reload()
+                    raise
+                else:
+                    if not self._dirty and self._serialize() == before:
+                        return
+                    self._write()
+                finally:
+                    self._depth = 0
+                    self._dirty = False
+        
+        self._notify()
+    
+    def save(self):
+        """Write the current data (used after in-place edits)"""
+        with self.lock:
+            if self._depth:
+                # The enclosing transaction writes on exit
+                self._dirty = True
+                return
+            with self._file_lock():
+                self._write()
+        self._notify()
+    
+    def _serialize(self) -> Dict:
+        """Current data with Task objects converted to dicts"""
+        data = copy.deepcopy({k: v for k, v in self._data.items() if k != 'tasks'})
+        data['tasks'] = [t.to_dict() if isinstance(t, Task) else copy.deepcopy(t)
+                         for t in self._data.get('tasks', [])]
+        return data
+    
+    def _write(self):
+        """Serialize atomically; caller holds both locks"""
+        self._data.setdefault('meta', {})['updatedAt'] = datetime.now().isoformat()
+        data = self._serialize()
+        
+        tmp_file = self.tasks_file.with_name(f"{self.tasks_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, self.tasks_file)
+        
+        # Our own write must not trigger a reload
+        self._file_signature = self._stat_signature()
+        self.version += 1
+        logger.info(f"Saved {len(data['tasks'])} tasks to {self.tasks_file}")
+    
+    def subscribe(self, callback: Callable[['TaskStore'], None]) -> Callable[[], None]:
+        """Call ``callback(store)`` after every save or reload
+        
+        Returns:
+            Function that removes the subscription
+        """
+        with self.lock:
+            self._subscribers.append(callback)
+        
+        def unsubscribe():
+            with self.lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+    
+    def _notify(self):
+        for callback in list(self._subscribers):
+            try:
+                callback(self)
+            except Exception as e:
+                logger.debug(f"Task store subscriber failed: {e}")
+
+
 class TaskManager:
     """Native Python Task Manager implementation"""
     
@@ -149,62 +390,28 @@ class TaskManager:
         # Ensure directories exist
         self.tasks_dir.mkdir(parents=True, exist_ok=True)
         
-        # Load tasks
-        self.tasks_data = self._load_tasks()
+        # Share one parsed copy per tasks file; pick up external edits now
+        self.store = TaskStore.for_file(self.tasks_file, self.project_root.name)
+        self.store.maybe_reload(force=True)
+    
+    @property
+    def tasks_data(self) -> Dict:
+        """Tasks data from the shared store"""
+        return self.store.data
+    
+    @tasks_data.setter
+    def tasks_data(self, data: Dict):
+        self.store.replace(data)
         
     def _load_tasks(self) -> Dict:
         """Load tasks from file"""
-        if self.tasks_file.exists():
-            try:
-                with open(self.tasks_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Convert task dicts to Task objects
-                    if 'tasks' in data:
-                        converted_tasks = []
-                        for i, t in enumerate(data['tasks']):
-                            try:
-                                if isinstance(t, dict):
-                                    converted_tasks.append(Task.from_dict(t))
-                                else:
-                                    converted_tasks.append(t)
-                            except Exception as task_error:
-                                logger.error(f"Error loading task at index {i}: {task_error}")
-                                logger.debug(f"Problematic task data: {t}")
-                        data['tasks'] = converted_tasks
-                    return data
-            except Exception as e:
-                logger.error(f"Error loading tasks: {e}")
-                return self._create_empty_tasks_data()
-        else:
-            return self._create_empty_tasks_data()
-    
-    def _create_empty_tasks_data(self) -> Dict:
-        """Create empty tasks data structure"""
-        return {
-            'meta': {
-                'projectName': self.project_root.name,
-                'projectVersion': '1.0.0',
-                'createdAt': datetime.now().isoformat(),
-                'updatedAt': datetime.now().isoformat()
-            },
-            'tasks': []
-        }
+        self.store.maybe_reload(force=True)
+        return self.store.data
     
     def _save_tasks(self):
         """Save tasks to file"""
         try:
-            # Update timestamp
-            self.tasks_data['meta']['updatedAt'] = datetime.now().isoformat()
-            
-            # Convert Task objects to dicts
-            data = self.tasks_data.copy()
-            data['tasks'] = [t.to_dict() if isinstance(t, Task) else t for t in self.tasks_data['tasks']]
-            
-            # Save with pretty formatting
-            with open(self.tasks_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                
-            logger.info(f"Saved {len(data['tasks'])} tasks to {self.tasks_file}")
+            self.store.save()
         except Exception as e:
             logger.error(f"Error saving tasks: {e}")
             raise
@@ -213,6 +420,13 @@ class TaskManager:
         """Get all tasks"""
         return self.tasks_data.get('tasks', [])
     
+    def list_tasks(self, filter_func: Optional[Callable[[Task], bool]] = None) -> List[Task]:
+        """List tasks, optionally filtered by a predicate"""
+        tasks = self.get_all_tasks()
+        if filter_func:
+            return [t for t in tasks if filter_func(t)]
+        return list(tasks)
+    
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a specific task by ID"""
         # Handle subtask IDs (e.g., "1.2")
@@ -236,6 +450,10 @@ class TaskManager:
                  details: Optional[str] = None,
                  testStrategy: Optional[str] = None) -> Task:
         """Add a new task"""
+        with self.store.transaction():
+            return self._add_task(title, description, dependencies, priority, details, testStrategy)
+    
+    def _add_task(self, title, description, dependencies, priority, details, testStrategy) -> Task:
         # Find next available ID
         tasks = self.get_all_tasks()
         # Handle both string and int IDs during transition
@@ -261,9 +479,8 @@ class TaskManager:
             updatedAt=datetime.now().isoformat()
         )
         
-        # Add to tasks
+        # Add to tasks; the enclosing transaction saves
         self.tasks_data['tasks'].append(task)
-        self._save_tasks()
         
         logger.info(f"Added task {next_id}: {title}")
         return task
@@ -274,14 +491,14 @@ class TaskManager:
             logger.error(f"Invalid status: {status}")
             return False
             
-        task = self.get_task(task_id)
-        if not task:
-            logger.error(f"Task {task_id} not found")
-            return False
-        
-        task.status = status
-        task.updatedAt = datetime.now().isoformat()
-        self._save_tasks()
+        with self.store.transaction():
+            task = self.get_task(task_id)
+            if not task:
+                logger.error(f"Task {task_id} not found")
+                return False
+            
+            task.status = status
+            task.updatedAt = datetime.now().isoformat()
         
         logger.info(f"Updated task {task_id} status to {status}")
         return True
@@ -289,6 +506,10 @@ class TaskManager:
     def add_subtask(self, parent_id: str, title: str, description: str,
                     dependencies: Optional[List[int]] = None) -> Optional[Subtask]:
         """Add a subtask to a parent task"""
+        with self.store.transaction():
+            return self._add_subtask(parent_id, title, description, dependencies)
+    
+    def _add_subtask(self, parent_id, title, description, dependencies) -> Optional[Subtask]:
         parent_task = self.get_task(parent_id)
         if not parent_task:
             logger.error(f"Parent task {parent_id} not found")
@@ -309,7 +530,6 @@ class TaskManager:
         )
         
         parent_task.subtasks.append(subtask)
-        self._save_tasks()
         
         logger.info(f"Added subtask {parent_id}.{next_id}: {title}")
         return subtask
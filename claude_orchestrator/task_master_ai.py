@@ -7,14 +7,25 @@ import logging
 import os
 import subprocess
 import tempfile
-from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from datetime import datetime
 
 from .task_master import TaskManager, Task, Subtask
+from .research_cache import ResearchCache, make_key, fingerprint
+from .prd_chunking import PRD_CHUNK_CHARS, PrdSection, split_prd, extract_json_array, merge_section_tasks
 
 logger = logging.getLogger(__name__)
 
+# Seconds a single expansion request may take before it is abandoned
+EXPANSION_TIMEOUT = 600
+
+# Concurrent model calls during bulk expansion
+DEFAULT_EXPANSION_CONCURRENCY = 4
+
+RESEARCH_MODEL = "claude-3-5-sonnet-20241022"
+
 
 class TaskMasterAI:
     """AI-powered features for Task Master"""
@@ -23,13 +34,23 @@ class TaskMasterAI:
         self.task_manager = task_manager
         self.claude_command = claude_command
         self.api_key = os.getenv("ANTHROPIC_API_KEY")
+        self._research_cache: Optional[ResearchCache] = None
+    
+    @property
+    def research_cache(self) -> ResearchCache:
+        """Research cache shared by all runs in this project"""
+        if self._research_cache is None:
+            self._research_cache = ResearchCache(self.task_manager.taskmaster_dir / "research_cache.db")
+        return self._research_cache
         
     def _create_ai_prompt(self, template: str, **kwargs) -> str:
         """Create a prompt from template with variables"""
         return template.format(**kwargs)
     
-    def _execute_claude(self, prompt: str, model: str = "claude-3-5-sonnet-20241022") -> Dict[str, Any]:
+    def _execute_claude(self, prompt: str, model: str = "claude-3-5-sonnet-20241022",
+                        timeout: Optional[float] = None) -> Dict[str, Any]:
         """Execute Claude CLI with the given prompt"""
+        prompt_file = None
         try:
             # Save prompt to temporary file
             with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
@@ -48,12 +69,10 @@ class TaskMasterAI:
                 cmd,
                 capture_output=True,
                 text=True,
-                cwd=self.task_manager.project_root
+                cwd=self.task_manager.project_root,
+                timeout=timeout
             )
             
-            # Clean up
-            os.unlink(prompt_file)
-            
             if result.returncode == 0:
                 # Always return text response
                 return {
@@ -66,12 +85,20 @@ class TaskMasterAI:
                     'error': result.stderr or "Command failed"
                 }
                 
+        except subprocess.TimeoutExpired:
+            return {
+                'success': False,
+                'error': f"Claude did not respond within {timeout} seconds"
+            }
         except Exception as e:
             logger.error(f"Error executing Claude: {e}")
             return {
                 'success': False,
                 'error': str(e)
             }
+        finally:
+            if prompt_file:
+                os.unlink(prompt_file)
     
     def expand_task(self, task_id: str, num_subtasks: int = 5, use_research: bool = False) -> List[Subtask]:
         """Expand a task into subtasks using AI"""
@@ -80,6 +107,100 @@ class TaskMasterAI:
             logger.error(f"Task {task_id} not found")
             return []
         
+        subtasks_data, error = self._request_expansion(task, num_subtasks, use_research)
+        if error:
+            logger.error(f"Failed to expand task: {error}")
+            return []
+        
+        with self.task_manager.store.transaction():
+            return self._apply_expansion(str(task.id), subtasks_data)
+    
+    def expand_all(self, task_ids: Optional[List[str]] = None, threshold: int = 5,
+                   num_subtasks: Optional[int] = None, use_research: bool = False,
+                   max_workers: int = DEFAULT_EXPANSION_CONCURRENCY,
+                   timeout: Optional[float] = EXPANSION_TIMEOUT,
+                   on_result: Optional[Callable[[str, Optional[str]], None]] = None) -> Dict[str, Any]:
+        """Expand many tasks concurrently and save all subtasks at once.
+        
+        Tasks that are done, cancelled or already have subtasks are left
+        alone, and tasks scoring below ``threshold`` in
+        _calculate_complexity are skipped without calling the model. The
+        remaining expansions run on a bounded thread pool; their subtasks
+        are applied in a single task store transaction, so tasks.json is
+        written once.
+        
+        Args:
+            task_ids: Tasks to consider (default: all tasks)
+            threshold: Minimum complexity score worth expanding
+            num_subtasks: Subtasks per task (default: derived from the score)
+            use_research: Add research context to each expansion prompt
+            max_workers: Concurrent model calls
+            timeout: Seconds allowed per model call
+            on_result: Called with (task_id, error) as each expansion finishes
+            
+        Returns:
+            Dict with 'expanded' (task_id -> subtasks), 'skipped'
+            (task_id -> complexity score) and 'failed' (task_id -> error)
+        """
+        if task_ids is None:
+            candidates = self.task_manager.get_all_tasks()
+        else:
+            candidates = [t for t in (self.task_manager.get_task(i) for i in task_ids) if t]
+        
+        report = {'expanded': {}, 'skipped': {}, 'failed': {}}
+        pending = []
+        for task in candidates:
+            if task.status in ['done', 'cancelled'] or task.subtasks:
+                continue
+            score = self._calculate_complexity(task)
+            if score < threshold:
+                report['skipped'][str(task.id)] = score
+                continue
+            # analyze_complexity's suggested count, with a floor for low thresholds
+            pending.append((task, num_subtasks or min(max(score, 3), 8)))
+        
+        if not pending:
+            return report
+        
+        logger.info(f"Expanding {len(pending)} tasks with {max_workers} concurrent requests "
+                    f"({len(report['skipped'])} below complexity threshold {threshold})")
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(self._request_expansion, task, count, use_research, timeout): str(task.id)
+                for task, count in pending
+            }
+            for future in as_completed(futures):
+                task_id = futures[future]
+                try:
+                    subtasks_data, error = future.result()
+                except Exception as e:
+                    subtasks_data, error = None, str(e)
+                if error:
+                    report['failed'][task_id] = error
+                else:
+                    results[task_id] = subtasks_data
+                if on_result:
+                    on_result(task_id, error)
+        
+        # One transaction: a single refresh from disk and a single write
+        with self.task_manager.store.transaction():
+            for task_id, subtasks_data in results.items():
+                task = self.task_manager.get_task(task_id)
+                if task is None or task.subtasks:
+                    # Removed or expanded elsewhere while the model was running
+                    continue
+                report['expanded'][task_id] = self._apply_expansion(task_id, subtasks_data)
+        
+        return report
+    
+    def _request_expansion(self, task: Task, num_subtasks: int, use_research: bool = False,
+                           timeout: Optional[float] = EXPANSION_TIMEOUT) -> Tuple[Optional[List[Dict]], Optional[str]]:
+        """Ask the model for a task's subtasks without touching the task store
+        
+        Returns:
+            Tuple of (subtask dicts, None) on success or (None, error)
+        """
         # Create expansion prompt
         prompt = f"""You are an expert project manager. Break down the following task into {num_subtasks} detailed subtasks.
 
@@ -115,43 +236,42 @@ Focus on technical implementation details and ensure each subtask is well-define
                 prompt += f"\n\nResearch Context:\n{research_result['research'][:2000]}"
         
         # Execute AI request
-        result = self._execute_claude(prompt)
+        result = self._execute_claude(prompt, timeout=timeout)
         
         if not result['success']:
-            logger.error(f"Failed to expand task: {result['error']}")
-            return []
+            return None, result['error']
         
         # Parse response
-        subtasks_created = []
         try:
             if isinstance(result['response'], dict) and 'response' in result['response']:
                 subtasks_data = json.loads(result['response']['response'])
             elif isinstance(result['response'], str):
                 # Extract JSON from response
-                import re
-                json_match = re.search(r'\[.*\]', result['response'], re.DOTALL)
-                if json_match:
-                    subtasks_data = json.loads(json_match.group())
-                else:
-                    logger.error("No JSON found in response")
-                    return []
+                subtasks_data = extract_json_array(result['response'])
+                if subtasks_data is None:
+                    return None, "No JSON found in response"
             else:
                 subtasks_data = result['response']
-            
-            # Create subtasks
-            for idx, st_data in enumerate(subtasks_data):
-                subtask = self.task_manager.add_subtask(
-                    parent_id=str(task.id),
-                    title=st_data.get('title', f'Subtask {idx+1}'),
-                    description=st_data.get('description', ''),
-                    dependencies=st_data.get('dependencies', [])
-                )
-                if subtask:
-                    subtasks_created.append(subtask)
-                    
         except Exception as e:
-            logger.error(f"Error parsing subtasks: {e}")
-            
+            return None, f"Error parsing subtasks: {e}"
+        
+        if not isinstance(subtasks_data, list) or not all(isinstance(st, dict) for st in subtasks_data):
+            return None, "Expected a JSON array of subtask objects"
+        
+        return subtasks_data, None
+    
+    def _apply_expansion(self, task_id: str, subtasks_data: List[Dict]) -> List[Subtask]:
+        """Add parsed subtasks to a task; the caller's transaction saves"""
+        subtasks_created = []
+        for idx, st_data in enumerate(subtasks_data):
+            subtask = self.task_manager._add_subtask(
+                task_id,
+                st_data.get('title', f'Subtask {idx+1}'),
+                st_data.get('description', ''),
+                st_data.get('dependencies', [])
+            )
+            if subtask:
+                subtasks_created.append(subtask)
         return subtasks_created
     
     def analyze_complexity(self, threshold: int = 5) -> Dict[str, Any]:
@@ -246,24 +366,33 @@ Focus on technical implementation details and ensure each subtask is well-define
     
     def perform_research(self, query: str, task_ids: Optional[List[str]] = None,
                         file_paths: Optional[List[str]] = None,
-                        additional_context: Optional[str] = None) -> Dict[str, Any]:
-        """Perform AI-powered research with project context"""
+                        additional_context: Optional[str] = None,
+                        use_cache: bool = True) -> Dict[str, Any]:
+        """Perform AI-powered research with project context
+        
+        Results are cached on disk, keyed by the query and the current
+        content of the related tasks and files, so repeated research
+        (e.g. across ``co expand`` runs) skips the model call.
+        """
         
         # Build context
         context_parts = [f"Research Query: {query}"]
         
         # Add task context
+        task_parts = []
         if task_ids:
-            context_parts.append("\nRelated Tasks:")
+            task_parts.append("\nRelated Tasks:")
             for task_id in task_ids:
                 task = self.task_manager.get_task(task_id)
                 if task:
-                    context_parts.append(f"- Task {task.id}: {task.title}")
-                    context_parts.append(f"  Description: {task.description}")
+                    task_parts.append(f"- Task {task.id}: {task.title}")
+                    task_parts.append(f"  Description: {task.description}")
                     if task.details:
-                        context_parts.append(f"  Details: {task.details}")
+                        task_parts.append(f"  Details: {task.details}")
+        context_parts.extend(task_parts)
         
         # Add file context
+        file_fingerprints = []
         if file_paths:
             context_parts.append("\nRelevant Files:")
             for file_path in file_paths:
@@ -271,10 +400,10 @@ Focus on technical implementation details and ensure each subtask is well-define
                 if path.exists():
                     context_parts.append(f"- {file_path}")
                     try:
-                        # Read first 500 lines of file
-                        with open(path, 'r', encoding='utf-8') as f:
-                            lines = f.readlines()[:500]
-                            context_parts.append(f"  Content preview:\n{''.join(lines[:50])}")
+                        content = path.read_bytes()
+                        file_fingerprints.append((str(path.resolve()), fingerprint(content)))
+                        lines = content.decode('utf-8').splitlines(keepends=True)
+                        context_parts.append(f"  Content preview:\n{''.join(lines[:50])}")
                     except Exception as e:
                         context_parts.append(f"  (Could not read file: {e})")
         
@@ -282,6 +411,26 @@ Focus on technical implementation details and ensure each subtask is well-define
         if additional_context:
             context_parts.append(f"\nAdditional Context:\n{additional_context}")
         
+        cache_key = None
+        if use_cache:
+            try:
+                if file_fingerprints:
+                    self.research_cache.invalidate_changed(file_fingerprints)
+                cache_key = make_key(query, "\n".join(task_parts), file_fingerprints,
+                                     additional_context, RESEARCH_MODEL)
+                cached = self.research_cache.get(cache_key)
+            except Exception as e:
+                logger.debug(f"Research cache unavailable: {e}")
+                cache_key, cached = None, None
+            if cached is not None:
+                logger.info(f"Using cached research for: {query[:60]}")
+                return {
+                    'success': True,
+                    'research': cached,
+                    'cached': True,
+                    'timestamp': datetime.now().isoformat()
+                }
+        
         # Create research prompt
         prompt = f"""You are a technical research assistant. Please provide comprehensive research and analysis for the following query.
 
@@ -297,12 +446,19 @@ Provide a detailed response that includes:
 Focus on practical, actionable information that can be used for implementation."""
 
         # Execute research
-        result = self._execute_claude(prompt, model="claude-3-5-sonnet-20241022")
+        result = self._execute_claude(prompt, model=RESEARCH_MODEL)
         
         if result['success']:
+            research = result['response'].get('response', result['response']) if isinstance(result['response'], dict) else result['response']
+            if cache_key and isinstance(research, str):
+                try:
+                    self.research_cache.put(cache_key, query, research, file_fingerprints)
+                except Exception as e:
+                    logger.debug(f"Failed to cache research: {e}")
             return {
                 'success': True,
-                'research': result['response'].get('response', result['response']) if isinstance(result['response'], dict) else result['response'],
+                'research': research,
+                'cached': False,
                 'timestamp': datetime.now().isoformat()
             }
         else:
@@ -311,12 +467,142 @@ Focus on practical, actionable information that can be used for implementation."
                 'error': result['error']
             }
     
-    def parse_prd(self, prd_content: str, auto_add: bool = True) -> List[Task]:
-        """Parse PRD content and create tasks"""
-        prompt = f"""You are an expert project manager. Parse the following PRD (Product Requirements Document) and create a comprehensive task list.
+    def parse_prd(self, prd_content: str, auto_add: bool = True,
+                  max_workers: int = DEFAULT_EXPANSION_CONCURRENCY,
+                  chunk_chars: int = PRD_CHUNK_CHARS,
+                  timeout: Optional[float] = EXPANSION_TIMEOUT) -> List[Task]:
+        """Parse PRD content and create tasks
+        
+        PRDs longer than ``chunk_chars`` are split at their headings and the
+        sections are parsed concurrently. The per-section task lists are
+        then merged: duplicate tasks are folded together and dependencies
+        on tasks from other sections are resolved by title. All tasks are
+        added in a single task store transaction.
+        
+        Args:
+            prd_content: PRD text (markdown headings delimit sections)
+            auto_add: Add the tasks to the task store
+            max_workers: Concurrent model calls for chunked PRDs
+            chunk_chars: Maximum characters per section prompt
+            timeout: Seconds allowed per model call
+        """
+        preamble, sections = split_prd(prd_content, chunk_chars)
+        
+        if len(sections) <= 1:
+            result = self._execute_claude(self._prd_prompt(prd_content), timeout=timeout)
+            if not result['success']:
+                logger.error(f"Failed to parse PRD: {result['error']}")
+                return []
+            tasks_data = extract_json_array(result['response'])
+            if tasks_data is None:
+                logger.error("No JSON array found in response")
+                logger.error(f"Response preview: {str(result['response'])[:1000]}")
+                # Try to create a simple task from the description
+                tasks_data = [{
+                    "title": "Task: " + prd_content[:100],
+                    "description": prd_content,
+                    "priority": "medium",
+                    "dependencies": []
+                }]
+                logger.info("Created a simple task from PRD content")
+            section_tasks = [tasks_data]
+        else:
+            section_tasks = self._parse_prd_sections(preamble, sections, max_workers, timeout)
+            if not any(section_tasks):
+                logger.error("Failed to parse any PRD section")
+                return []
+        
+        tasks_data = merge_section_tasks(section_tasks)
+        logger.info(f"Parsed {len(tasks_data)} tasks from {max(1, len(sections))} PRD section(s)")
+        
+        if not auto_add:
+            # Just return parsed tasks; ids are positions in the parsed list
+            return [Task(
+                id=idx,
+                title=task_data['title'],
+                description=task_data.get('description', ''),
+                dependencies=task_data['dependencies'],
+                priority=task_data.get('priority', 'medium'),
+                details=task_data.get('details'),
+                testStrategy=task_data.get('testStrategy')
+            ) for idx, task_data in enumerate(tasks_data, 1)]
+        
+        tasks_created = []
+        # One transaction: a single refresh from disk and a single write
+        with self.task_manager.store.transaction():
+            for task_data in tasks_data:
+                tasks_created.append(self.task_manager._add_task(
+                    task_data['title'],
+                    task_data.get('description', ''),
+                    [],
+                    task_data.get('priority', 'medium'),
+                    task_data.get('details'),
+                    task_data.get('testStrategy')
+                ))
+            # Dependencies may point forward, so map them once every id is known
+            for task, task_data in zip(tasks_created, tasks_data):
+                task.dependencies = [tasks_created[pos - 1].id for pos in task_data['dependencies']]
+        
+        return tasks_created
+    
+    def _parse_prd_sections(self, preamble: str, sections: List[PrdSection],
+                            max_workers: int, timeout: Optional[float]) -> List[List[Dict]]:
+        """Parse PRD sections concurrently; failed sections yield no tasks"""
+        outline = "\n".join(
+            f"{section.index + 1}. {', '.join(section.headings) or '(untitled)'}" for section in sections
+        )
+        results: List[List[Dict]] = [[] for _ in sections]
+        
+        logger.info(f"Parsing PRD in {len(sections)} sections with {max_workers} concurrent requests")
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(
+                    self._execute_claude,
+                    self._prd_prompt(section.text, preamble, outline, section.index + 1),
+                    timeout=timeout
+                ): section
+                for section in sections
+            }
+            for future in as_completed(futures):
+                section = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {'success': False, 'error': str(e)}
+                if not result['success']:
+                    logger.error(f"Failed to parse PRD section {section.index + 1}: {result['error']}")
+                    continue
+                tasks_data = extract_json_array(result['response'])
+                if tasks_data is None:
+                    logger.error(f"No JSON array found for PRD section {section.index + 1}")
+                    continue
+                results[section.index] = tasks_data
+        
+        return results
+    
+    def _prd_prompt(self, content: str, preamble: str = "", outline: str = "",
+                    section_number: Optional[int] = None) -> str:
+        """Build the task extraction prompt for a whole PRD or one section"""
+        if section_number is None:
+            source = f"PRD Content:\n{content}"
+            dependency_note = "[list of task numbers this depends on]"
+        else:
+            source = f"""This is section {section_number} of a larger PRD. Only create tasks for this section.
 
-PRD Content:
-{prd_content}
+PRD Overview:
+{preamble or '(none)'}
+
+PRD Sections:
+{outline}
+
+Section {section_number} Content:
+{content}"""
+            dependency_note = ("[task numbers from this section, or exact titles of tasks "
+                               "another section is expected to create]")
+        
+        return f"""You are an expert project manager. Parse the following PRD (Product Requirements Document) and create a comprehensive task list.
+
+{source}
 
 Create a structured task list with:
 1. Clear task titles and descriptions
@@ -331,101 +617,10 @@ Return your response as a JSON array with this structure:
     "title": "Task title",
     "description": "Task description",
     "priority": "high|medium|low",
-    "dependencies": [list of task numbers this depends on],
+    "dependencies": {dependency_note},
     "details": "Implementation details",
     "testStrategy": "How to test this task"
   }}
 ]
 
-Ensure tasks are ordered logically with foundational tasks first."""
-
-        result = self._execute_claude(prompt)
-        
-        if not result['success']:
-            logger.error(f"Failed to parse PRD: {result['error']}")
-            return []
-        
-        tasks_created = []
-        try:
-            # Extract JSON from response
-            import re
-            response_text = result['response']
-            
-            # Try to find JSON array in the response (non-greedy to get complete array)
-            json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
-            if json_match:
-                try:
-                    tasks_data = json.loads(json_match.group())
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to parse JSON: {e}")
-                    logger.debug(f"JSON string: {json_match.group()}")
-                    return []
-            else:
-                logger.error("No JSON array found in response")
-                logger.error(f"Response preview: {response_text[:1000]}")
-                # Try to create a simple task from the description
-                tasks_data = [{
-                    "title": "Task: " + prd_content[:100],
-                    "description": prd_content,
-                    "priority": "medium",
-                    "dependencies": []
-                }]
-                logger.info("Created a simple task from PRD content")
-            
-            # Debug logging
-            logger.debug(f"Type of tasks_data: {type(tasks_data)}")
-            logger.debug(f"tasks_data content: {tasks_data}")
-            
-            # Ensure tasks_data is a list
-            if not isinstance(tasks_data, list):
-                logger.error(f"Expected list but got {type(tasks_data)}: {tasks_data}")
-                return []
-            
-            # Create tasks if auto_add is True
-            if auto_add:
-                # Map old indices to new task IDs for dependencies
-                id_mapping = {}
-                
-                for idx, task_data in enumerate(tasks_data):
-                    # Ensure task_data is a dict
-                    if isinstance(task_data, str):
-                        logger.error(f"Task data is string instead of dict: {task_data}")
-                        continue
-                    
-                    # Map dependencies using the mapping
-                    mapped_deps = []
-                    for dep in task_data.get('dependencies', []):
-                        if dep in id_mapping:
-                            mapped_deps.append(id_mapping[dep])
-                    
-                    # Create task
-                    task = self.task_manager.add_task(
-                        title=task_data.get('title', f'Task {idx+1}'),
-                        description=task_data.get('description', ''),
-                        dependencies=mapped_deps,
-                        priority=task_data.get('priority', 'medium'),
-                        details=task_data.get('details'),
-                        testStrategy=task_data.get('testStrategy')
-                    )
-                    
-                    # Store mapping
-                    id_mapping[idx + 1] = task.id
-                    tasks_created.append(task)
-            else:
-                # Just return parsed tasks without adding
-                for task_data in tasks_data:
-                    task = Task(
-                        id=0,  # Temporary ID
-                        title=task_data.get('title', ''),
-                        description=task_data.get('description', ''),
-                        dependencies=task_data.get('dependencies', []),
-                        priority=task_data.get('priority', 'medium'),
-                        details=task_data.get('details'),
-                        testStrategy=task_data.get('testStrategy')
-                    )
-                    tasks_created.append(task)
-                    
-        except Exception as e:
-            logger.error(f"Error parsing tasks from PRD: {e}")
-            
-        return tasks_created
\ No newline at end of file
+Ensure tasks are ordered logically with foundational tasks first."""
\ No newline at end of file
@@ -0,0 +1,417 @@
+"""Import-graph-based test impact analysis for selecting affected tests."""
+
+import os
+import ast
+import json
+import logging
+import threading
+from typing import Dict, List, Any, Optional, Set, Tuple, Iterable
+from dataclasses import dataclass, field
+from collections import defaultdict, deque
+
+logger = logging.getLogger(__name__)
+
+
+# Directories never scanned for project modules
+DEFAULT_EXCLUDED_DIRS = {
+    "__pycache__", "node_modules", "venv", ".venv", "env", "build", "dist",
+    "site-packages", "htmlcov", ".git", ".tox", ".nox", ".mypy_cache",
+    ".pytest_cache", ".ruff_cache", ".taskmaster", ".test_results"
+}
+
+# Files whose change can affect any test regardless of imports
+GLOBAL_IMPACT_FILES = {
+    "conftest.py", "pytest.ini", "setup.cfg", "tox.ini", "pyproject.toml", "setup.py"
+}
+
+# Calls that import modules by name at runtime and defeat static analysis
+DYNAMIC_IMPORT_CALLS = {"__import__", "import_module", "import_from_path", "run_module"}
+
+
+@dataclass
+class ModuleInfo:
+    """Cached import information for a single Python file."""
+    path: str
+    module_name: str
+    mtime_ns: int
+    size: int
+    imports: Set[str] = field(default_factory=set)
+    has_dynamic_imports: bool = False
+    parse_error: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "path": self.path,
+            "module_name": self.module_name,
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "imports": sorted(self.imports),
+            "has_dynamic_imports": self.has_dynamic_imports,
+            "parse_error": self.parse_error
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModuleInfo":
+        """Create from dictionary."""
+        return cls(
+            path=data["path"],
+            module_name=data["module_name"],
+            mtime_ns=data["mtime_ns"],
+            size=data["size"],
+            imports=set(data.get("imports", [])),
+            has_dynamic_imports=data.get("has_dynamic_imports", False),
+            parse_error=data.get("parse_error", False)
+        )
+
+
+class TestImpactAnalyzer:
+    """Builds a module import graph of a project and selects affected tests.
+
+    The graph is cached per file and keyed on ``(mtime_ns, size)``, so a
+    refresh only stats the tree and re-parses the files that actually
+    changed. ``get_affected_tests`` returns ``None`` whenever the graph
+    cannot give a trustworthy answer, signalling callers to fall back to
+    running the full suite.
+    """
+
+    __test__ = False  # Not a pytest test class despite the name
+
+    def __init__(self,
+                 root_dir: str = ".",
+                 test_dir: str = "tests",
+                 cache_file: Optional[str] = None,
+                 excluded_dirs: Optional[Set[str]] = None):
+        self.root_dir = os.path.abspath(root_dir)
+        self.test_dir = os.path.abspath(
+            test_dir if os.path.isabs(test_dir) else os.path.join(self.root_dir, test_dir)
+        )
+        self.cache_file = cache_file
+        self.excluded_dirs = excluded_dirs or DEFAULT_EXCLUDED_DIRS
+
+        # path -> cached module info
+        self._modules: Dict[str, ModuleInfo] = {}
+        # dotted module name -> path
+        self._module_paths: Dict[str, str] = {}
+        # path -> paths of project files importing it
+        self._reverse_deps: Dict[str, Set[str]] = defaultdict(set)
+        self._graph_dirty = True
+        self._lock = threading.RLock()
+
+        self._load_cache()
+
+    # ------------------------------------------------------------------
+    # Cache persistence
+    # ------------------------------------------------------------------
+
+    def _load_cache(self):
+        """Load the per-file import cache from disk."""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                data = json.load(f)
+            if data.get("root_dir") != self.root_dir:
+                return
+            for module_data in data.get("modules", []):
+                info = ModuleInfo.from_dict(module_data)
+                self._modules[info.path] = info
+            self._graph_dirty = True
+            logger.debug(f"Loaded import cache for {len(self._modules)} files")
+        except Exception as e:
+            logger.warning(f"Failed to load import graph cache: {e}")
+
+    def save_cache(self):
+        """Persist the per-file import cache to disk."""
+        if not self.cache_file:
+            return
+        with self._lock:
+            data = {
+                "root_dir": self.root_dir,
+                "modules": [info.to_dict() for info in self._modules.values()]
+            }
+        try:
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            logger.warning(f"Failed to save import graph cache: {e}")
+
+    # ------------------------------------------------------------------
+    # Scanning and parsing
+    # ------------------------------------------------------------------
+
+    def _iter_tracked_files(self) -> Iterable[Tuple[str, os.stat_result]]:
+        """Yield ``(path, stat)`` for every Python or global-impact file under the root."""
+        stack = [self.root_dir]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name.startswith(".") or entry.name in self.excluded_dirs:
+                                    continue
+                                stack.append(entry.path)
+                            elif ((entry.name.endswith(".py") or entry.name in GLOBAL_IMPACT_FILES)
+                                  and entry.is_file()):
+                                yield entry.path, entry.stat()
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.debug(f"Failed to scan {current}: {e}")
+
+    def _module_name_for(self, path: str) -> str:
+        """Get the dotted module name of a file relative to the root."""
+        rel_path = os.path.relpath(path, self.root_dir)
+        parts = rel_path[:-3].split(os.sep)
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        return ".".join(parts)
+
+    def _parse_imports(self, path: str, module_name: str) -> Tuple[Set[str], bool, bool]:
+        """Parse a file and extract the absolute names of everything it imports.
+
+        Returns:
+            Tuple of (imported names, uses dynamic imports, failed to parse)
+        """
+        try:
+            with open(path, 'rb') as f:
+                tree = ast.parse(f.read(), filename=path)
+        except (SyntaxError, ValueError, OSError) as e:
+            logger.debug(f"Failed to parse {path}: {e}")
+            return set(), False, True
+
+        is_package = os.path.basename(path) == "__init__.py"
+        package_parts = module_name.split(".") if module_name else []
+        if not is_package:
+            package_parts = package_parts[:-1]
+
+        imports: Set[str] = set()
+        dynamic = False
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    imports.add(alias.name)
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    # Resolve relative import against the containing package
+                    base_parts = package_parts[:len(package_parts) - (node.level - 1)]
+                    if node.level - 1 > len(package_parts):
+                        continue
+                    base = ".".join(base_parts)
+                    target = f"{base}.{node.module}" if node.module else base
+                else:
+                    target = node.module or ""
+                if not target:
+                    continue
+                imports.add(target)
+                # "from pkg import name" may refer to a submodule
+                for alias in node.names:
+                    if alias.name != "*":
+                        imports.add(f"{target}.{alias.name}")
+            elif isinstance(node, ast.Call):
+                func = node.func
+                name = None
+                if isinstance(func, ast.Name):
+                    name = func.id
+                elif isinstance(func, ast.Attribute):
+                    name = func.attr
+                if name in DYNAMIC_IMPORT_CALLS:
+                    dynamic = True
+
+        return imports, dynamic, False
+
+    def refresh(self) -> Set[str]:
+        """Rescan the tree and re-parse files whose stat signature changed.
+
+        Returns:
+            Set of absolute paths that were added, modified or removed
+        """
+        changed: Set[str] = set()
+        with self._lock:
+            seen: Set[str] = set()
+            for path, stat in self._iter_tracked_files():
+                seen.add(path)
+                cached = self._modules.get(path)
+                if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+                    continue
+
+                if path.endswith(".py"):
+                    module_name = self._module_name_for(path)
+                    imports, dynamic, parse_error = self._parse_imports(path, module_name)
+                else:
+                    # Config files are only tracked for changes, never imported
+                    module_name, imports, dynamic, parse_error = "", set(), False, False
+                self._modules[path] = ModuleInfo(
+                    path=path,
+                    module_name=module_name,
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    imports=imports,
+                    has_dynamic_imports=dynamic,
+                    parse_error=parse_error
+                )
+                changed.add(path)
+
+            for path in set(self._modules) - seen:
+                del self._modules[path]
+                changed.add(path)
+
+            if changed:
+                self._graph_dirty = True
+
+        return changed
+
+    def _rebuild_graph(self):
+        """Rebuild the reverse dependency graph from the per-file cache."""
+        self._module_paths = {
+            info.module_name: path for path, info in self._modules.items() if info.module_name
+        }
+        reverse_deps: Dict[str, Set[str]] = defaultdict(set)
+
+        for path, info in self._modules.items():
+            for imported in info.imports:
+                for target in self._resolve(imported):
+                    if target != path:
+                        reverse_deps[target].add(path)
+
+        self._reverse_deps = reverse_deps
+        self._graph_dirty = False
+
+    def _resolve(self, imported: str) -> List[str]:
+        """Resolve an imported name to project files, including parent packages."""
+        targets = []
+        parts = imported.split(".")
+        # Importing a.b.c executes a/__init__, a/b/__init__ and a/b/c
+        for i in range(1, len(parts) + 1):
+            path = self._module_paths.get(".".join(parts[:i]))
+            if path:
+                targets.append(path)
+        return targets
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def is_test_file(self, path: str) -> bool:
+        """Check whether a path is a test module under the test directory."""
+        name = os.path.basename(path)
+        return (
+            path.startswith(self.test_dir + os.sep)
+            and name.endswith(".py")
+            and (name.startswith("test_") or name.endswith("_test.py"))
+        )
+
+    def get_dependents(self, path: str) -> Set[str]:
+        """Get every project file that transitively imports ``path``."""
+        path = os.path.abspath(path)
+        with self._lock:
+            if self._graph_dirty:
+                self._rebuild_graph()
+
+            visited: Set[str] = set()
+            queue = deque([path])
+            while queue:
+                current = queue.popleft()
+                for dependent in self._reverse_deps.get(current, ()):
+                    if dependent not in visited:
+                        visited.add(dependent)
+                        queue.append(dependent)
+            return visited
+
+    def get_affected_tests(self, changed_files: Iterable[str]) -> Optional[Set[str]]:
+        """Select the test files affected by a set of changed files.
+
+        Args:
+            changed_files: Paths of changed files
+
+        Returns:
+            Absolute paths of affected test files, or None if the graph is
+            uncertain and the full suite should be run instead
+        """
+        with self._lock:
+            if self._graph_dirty:
+                self._rebuild_graph()
+
+            affected: Set[str] = set()
+            dynamic_tests: Optional[Set[str]] = None
+
+            for changed in changed_files:
+                path = os.path.abspath(changed)
+                name = os.path.basename(path)
+
+                if name in GLOBAL_IMPACT_FILES:
+                    logger.debug(f"{name} changed, selecting full suite")
+                    return None
+
+                if not path.endswith(".py"):
+                    continue
+
+                info = self._modules.get(path)
+                if info is None or info.parse_error:
+                    # Deleted, untracked or unparseable: the graph can't tell
+                    return None
+
+                if self.is_test_file(path):
+                    affected.add(path)
+
+                affected.update(d for d in self.get_dependents(path) if self.is_test_file(d))
+
+                if not self.is_test_file(path):
+                    # Dynamic importers may load the changed module at runtime
+                    if dynamic_tests is None:
+                        dynamic_tests = self._get_dynamic_tests()
+                    affected.update(dynamic_tests)
+
+            return affected
+
+    def get_most_imported_modules(self, limit: int = 20) -> List[str]:
+        """Get the project modules imported by the most test files.
+
+        Args:
+            limit: Maximum number of module names to return
+
+        Returns:
+            Dotted module names, most widely imported first
+        """
+        with self._lock:
+            if self._graph_dirty:
+                self._rebuild_graph()
+
+            counts = []
+            for path, info in self._modules.items():
+                if not info.module_name or info.parse_error or self.is_test_file(path):
+                    continue
+                importers = sum(1 for d in self.get_dependents(path) if self.is_test_file(d))
+                if importers:
+                    counts.append((importers, info.module_name))
+            counts.sort(key=lambda count: (-count[0], count[1]))
+            return [name for _, name in counts[:limit]]
+
+    def _get_dynamic_tests(self) -> Set[str]:
+        """Get test files that import, directly or transitively, a dynamic importer."""
+        tests: Set[str] = set()
+        for path, info in self._modules.items():
+            if not info.has_dynamic_imports:
+                continue
+            if self.is_test_file(path):
+                tests.add(path)
+            tests.update(d for d in self.get_dependents(path) if self.is_test_file(d))
+        return tests
+
+    def get_graph_stats(self) -> Dict[str, Any]:
+        """Get statistics about the import graph."""
+        with self._lock:
+            if self._graph_dirty:
+                self._rebuild_graph()
+            return {
+                "files": len(self._modules),
+                "test_files": sum(1 for p in self._modules if self.is_test_file(p)),
+                "edges": sum(len(d) for d in self._reverse_deps.values()),
+                "dynamic_import_files": sum(1 for i in self._modules.values() if i.has_dynamic_imports),
+                "parse_errors": sum(1 for i in self._modules.values() if i.parse_error)
+            }
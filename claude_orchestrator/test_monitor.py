@@ -1,6 +1,7 @@
 """Continuous test monitoring system for tracking test execution and results."""
 
 import os
+import sys
 import json
 import logging
 import subprocess
@@ -13,6 +14,9 @@ from enum import Enum
 from pathlib import Path
 import hashlib
 
+from .test_impact_analyzer import TestImpactAnalyzer
+from .test_result_store import TestHistoryStore, build_junit_command, parse_junit_xml
+
 logger = logging.getLogger(__name__)
 
 
@@ -88,7 +92,8 @@ class TestMonitor:
     def __init__(self,
                  test_dir: str = "tests",
                  result_dir: str = ".test_results",
-                 watch_patterns: Optional[List[str]] = None):
+                 watch_patterns: Optional[List[str]] = None,
+                 use_impact_analysis: bool = True):
         self.test_dir = test_dir
         self.result_dir = result_dir
         self.watch_patterns = watch_patterns or ["*.py"]
@@ -101,6 +106,19 @@ class TestMonitor:
         self.test_results: List[TestResult] = []
         self.file_hashes: Dict[str, str] = {}
         
+        # Indexed result history
+        self.history = TestHistoryStore(os.path.join(result_dir, "test_history.db"))
+        
+        # Import graph used to narrow source changes down to affected tests
+        self.impact_analyzer: Optional[TestImpactAnalyzer] = None
+        if use_impact_analysis:
+            self.impact_analyzer = TestImpactAnalyzer(
+                root_dir=os.path.dirname(os.path.abspath(test_dir)),
+                test_dir=test_dir,
+                cache_file=os.path.join(result_dir, "import_graph.json")
+            )
+        self._graph_primed = False
+        
         # Monitoring state
         self._monitoring = False
         self._monitor_thread: Optional[threading.Thread] = None
@@ -112,49 +130,75 @@ class TestMonitor:
         logger.info(f"Test monitor initialized for {test_dir}")
     
     def _load_results(self):
-        """Load previous test results."""
-        result_file = os.path.join(self.result_dir, "test_history.json")
-        if os.path.exists(result_file):
-            try:
-                with open(result_file, 'r') as f:
-                    data = json.load(f)
-                    
-                # Load test results
-                for result_data in data.get("results", []):
-                    result = TestResult(
-                        test_name=result_data["test_name"],
-                        test_file=result_data["test_file"],
-                        status=TestStatus(result_data["status"]),
-                        duration=result_data["duration"],
-                        timestamp=datetime.fromisoformat(result_data["timestamp"]),
-                        error_message=result_data.get("error_message"),
-                        traceback=result_data.get("traceback")
-                    )
-                    self.test_results.append(result)
-                
-                logger.info(f"Loaded {len(self.test_results)} historical test results")
-                
-            except Exception as e:
-                logger.error(f"Failed to load test history: {e}")
-    
-    def _save_results(self):
-        """Save test results to disk."""
-        result_file = os.path.join(self.result_dir, "test_history.json")
-        
-        # Keep only recent results (last 7 days)
+        """Load recent test results from the history database."""
         cutoff = datetime.now() - timedelta(days=7)
-        recent_results = [r for r in self.test_results if r.timestamp > cutoff]
+        try:
+            if self.history.is_empty():
+                self._import_legacy_history()
+            rows = self.history.get_recent_results(since=cutoff, limit=1000)
+        except Exception as e:
+            logger.error(f"Failed to load test history: {e}")
+            return
         
-        data = {
-            "last_updated": datetime.now().isoformat(),
-            "results": [r.to_dict() for r in recent_results[-1000:]]  # Keep last 1000
-        }
+        for row in rows:
+            self.test_results.append(TestResult(
+                test_name=row["test_name"],
+                test_file=row["test_file"],
+                status=TestStatus(row["status"]),
+                duration=row["duration"],
+                timestamp=datetime.fromisoformat(row["timestamp"]),
+                error_message=row["error_message"],
+                traceback=row["traceback"]
+            ))
+        
+        logger.info(f"Loaded {len(self.test_results)} historical test results")
+    
+    def _import_legacy_history(self):
+        """Import a test_history.json written by older versions, once.
+        
+        The file is renamed to ``test_history.json.imported`` afterwards;
+        recent results are then loaded from the database like any others.
+        """
+        result_file = os.path.join(self.result_dir, "test_history.json")
+        if not os.path.exists(result_file):
+            return
         
         try:
-            with open(result_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(result_file, 'r') as f:
+                data = json.load(f)
+                
+            results = [
+                TestResult(
+                    test_name=result_data["test_name"],
+                    test_file=result_data["test_file"],
+                    status=TestStatus(result_data["status"]),
+                    duration=result_data["duration"],
+                    timestamp=datetime.fromisoformat(result_data["timestamp"]),
+                    error_message=result_data.get("error_message"),
+                    traceback=result_data.get("traceback")
+                )
+                for result_data in data.get("results", [])
+            ]
+            
+            if results:
+                self.history.record_run(results, run_type="import")
+            os.replace(result_file, result_file + ".imported")
+            logger.info(f"Imported {len(results)} historical test results")
+            
         except Exception as e:
-            logger.error(f"Failed to save test history: {e}")
+            logger.error(f"Failed to import test history: {e}")
+    
+    def _save_results(self, results: Optional[List[TestResult]] = None, run_type: str = "file"):
+        """Record new results and trim the in-memory window."""
+        if results:
+            try:
+                self.history.record_run(results, run_type=run_type)
+            except Exception as e:
+                logger.error(f"Failed to save test history: {e}")
+        
+        # Keep only recent results (last 7 days, last 1000) in memory
+        cutoff = datetime.now() - timedelta(days=7)
+        self.test_results = [r for r in self.test_results if r.timestamp > cutoff][-1000:]
     
     def discover_tests(self) -> Dict[str, List[str]]:
         """Discover test files in the test directory.
@@ -207,6 +251,8 @@ class TestMonitor:
         """
         results = []
         
+        run_type = "file" if test_file else "suite"
+        
         # Determine what to run
         if test_file:
             files_to_run = [test_file]
@@ -218,58 +264,42 @@ class TestMonitor:
             for suite in self.test_suites.values():
                 files_to_run.extend(suite.test_files)
         
-        # Run pytest with JSON output
+        # Run pytest with a JUnit XML report per file
         for test_file in files_to_run:
             if not os.path.exists(test_file):
                 continue
             
             # Create temporary result file
-            temp_result = os.path.join(self.result_dir, f"temp_{os.getpid()}.json")
+            temp_result = os.path.join(self.result_dir, f"temp_{os.getpid()}_{threading.get_ident()}.xml")
             
             try:
-                # Run pytest
-                cmd = [
-                    "python", "-m", "pytest",
-                    test_file,
-                    "--json-report",
-                    f"--json-report-file={temp_result}",
-                    "-v"
-                ]
+                cmd = build_junit_command(sys.executable, test_file, temp_result)
                 
                 start_time = time.time()
                 result = subprocess.run(cmd, capture_output=True, text=True)
                 duration = time.time() - start_time
                 
-                # Parse results
+                cases = []
                 if os.path.exists(temp_result):
-                    with open(temp_result, 'r') as f:
-                        pytest_data = json.load(f)
-                    
-                    # Extract test results
-                    for test in pytest_data.get("tests", []):
-                        status = TestStatus.PASSED
-                        if test["outcome"] == "failed":
-                            status = TestStatus.FAILED
-                        elif test["outcome"] == "skipped":
-                            status = TestStatus.SKIPPED
-                        elif test["outcome"] == "error":
-                            status = TestStatus.ERROR
-                        
+                    if os.path.getsize(temp_result) > 0:
+                        cases = parse_junit_xml(temp_result, test_file)
+                    os.remove(temp_result)
+                
+                if cases:
+                    for case in cases:
                         test_result = TestResult(
-                            test_name=test["nodeid"],
+                            test_name=case["node_id"],
                             test_file=test_file,
-                            status=status,
-                            duration=test.get("duration", 0),
-                            error_message=test.get("call", {}).get("longrepr")
+                            status=TestStatus(case["status"]),
+                            duration=case["duration"],
+                            error_message=case["error_message"],
+                            traceback=case["traceback"]
                         )
                         
                         results.append(test_result)
                         self.test_results.append(test_result)
-                    
-                    # Clean up
-                    os.remove(temp_result)
                 else:
-                    # Fallback parsing from output
+                    # No report written, fall back to the exit code
                     if result.returncode == 0:
                         # Tests passed
                         test_result = TestResult(
@@ -312,7 +342,7 @@ class TestMonitor:
                 suite.update_stats(suite_results)
         
         # Save results
-        self._save_results()
+        self._save_results(results, run_type=run_type)
         
         # Notify callbacks
         self._notify_callbacks(results)
@@ -332,6 +362,47 @@ class TestMonitor:
     def _check_file_changes(self) -> Set[str]:
         """Check for changed files.
         
+        Returns:
+            Set of changed file paths
+        """
+        if self.impact_analyzer is None:
+            return self._check_file_changes_by_hash()
+        
+        all_test_files = {
+            f for suite in self.test_suites.values() for f in suite.test_files
+        }
+        
+        # Only stats the tree; files are re-parsed when their mtime/size changes
+        modified = self.impact_analyzer.refresh()
+        
+        if not self._graph_primed:
+            # First scan establishes the baseline, like the initial hash pass
+            self._graph_primed = True
+            self.impact_analyzer.save_cache()
+            return all_test_files
+        
+        if not modified:
+            return set()
+        
+        self.impact_analyzer.save_cache()
+        
+        affected = self.impact_analyzer.get_affected_tests(modified)
+        if affected is None:
+            logger.info("Import graph is uncertain for this change, selecting all tests")
+            return all_test_files
+        
+        changed_files = {
+            f for f in all_test_files if os.path.abspath(f) in affected
+        }
+        logger.debug(
+            f"{len(modified)} files changed, {len(changed_files)} of "
+            f"{len(all_test_files)} test files affected"
+        )
+        return changed_files
+    
+    def _check_file_changes_by_hash(self) -> Set[str]:
+        """Check for changed files by hashing the whole tree.
+        
         Returns:
             Set of changed file paths
         """
@@ -351,10 +422,11 @@ class TestMonitor:
                         changed_files.add(test_file)
         
         # Also check source files that tests might depend on
-        source_dir = os.path.dirname(self.test_dir)
+        source_dir = os.path.dirname(os.path.abspath(self.test_dir))
+        abs_test_dir = os.path.abspath(self.test_dir)
         for root, dirs, files in os.walk(source_dir):
             # Skip test directory
-            if root.startswith(self.test_dir):
+            if root.startswith(abs_test_dir):
                 continue
             
             for file in files:
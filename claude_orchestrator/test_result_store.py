@@ -0,0 +1,329 @@
+"""Structured pytest result ingestion and indexed SQLite test history"""
+
+import sqlite3
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterable
+from pathlib import Path
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+def build_junit_command(python: str, test_path: str, xml_path: str,
+                        extra_args: Optional[List[str]] = None) -> List[str]:
+    """Build a pytest command line that writes a JUnit XML report.
+
+    ``-p no:cacheprovider`` keeps monitor runs from touching the
+    project's ``.pytest_cache``, and ``-q`` avoids paying for verbose
+    terminal output nobody reads.
+    """
+    cmd = [
+        python, "-m", "pytest",
+        test_path,
+        f"--junitxml={xml_path}",
+        "-o", "junit_family=xunit2",
+        "-p", "no:cacheprovider",
+        "--tb=short",
+        "-q"
+    ]
+    if extra_args:
+        cmd.extend(extra_args)
+    return cmd
+
+
+def _node_id(test_file: str, classname: str, name: str) -> str:
+    """Rebuild a pytest node id from a JUnit ``classname`` and test name.
+
+    pytest writes ``classname`` as the dotted module path followed by any
+    test classes, e.g. ``tests.test_x.TestFoo``.
+    """
+    parts = classname.split(".") if classname else []
+    stem = Path(test_file).stem
+    if stem in parts:
+        parts = parts[parts.index(stem) + 1:]
+    return "::".join([test_file] + parts + [name])
+
+
+def parse_junit_xml(xml_path: str, test_file: str) -> List[Dict[str, Any]]:
+    """Parse a pytest JUnit XML report.
+
+    Args:
+        xml_path: Path to the JUnit XML file
+        test_file: Test file or directory the report was produced for
+
+    Returns:
+        List of result dictionaries with ``node_id``, ``test_name``,
+        ``test_file``, ``status``, ``duration``, ``error_message``,
+        ``traceback`` and ``stdout`` keys
+    """
+    tree = ET.parse(xml_path)
+    results = []
+
+    for case in tree.getroot().iter("testcase"):
+        name = case.get("name", "")
+        classname = case.get("classname", "")
+        case_file = case.get("file") or test_file
+
+        status = "passed"
+        error_message = None
+        traceback = None
+
+        for tag in ("failure", "error", "skipped"):
+            element = case.find(tag)
+            if element is not None:
+                status = {"failure": "failed", "error": "error", "skipped": "skipped"}[tag]
+                error_message = element.get("message")
+                traceback = element.text
+                break
+
+        stdout_element = case.find("system-out")
+
+        try:
+            duration = float(case.get("time", 0) or 0)
+        except ValueError:
+            duration = 0.0
+
+        results.append({
+            "node_id": _node_id(case_file, classname, name),
+            "test_name": name,
+            "test_file": case_file,
+            "status": status,
+            "duration": duration,
+            "error_message": error_message,
+            "traceback": traceback,
+            "stdout": stdout_element.text if stdout_element is not None else None
+        })
+
+    return results
+
+
+class TestHistoryStore:
+    """Indexed SQLite history of test runs and per-test results"""
+
+    __test__ = False  # Not a pytest test class despite the name
+
+    def __init__(self, db_path: str = ".test_results/test_history.db"):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._init_database()
+
+    def _init_database(self):
+        """Initialize database schema"""
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS test_runs (
+                    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    suite_name TEXT,
+                    run_type TEXT NOT NULL,
+                    started_at TEXT NOT NULL,
+                    ended_at TEXT,
+                    passed_count INTEGER DEFAULT 0,
+                    failed_count INTEGER DEFAULT 0,
+                    error_count INTEGER DEFAULT 0,
+                    skipped_count INTEGER DEFAULT 0,
+                    duration REAL DEFAULT 0
+                )
+            """)
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS test_results (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    run_id INTEGER REFERENCES test_runs(run_id),
+                    node_id TEXT,
+                    test_name TEXT NOT NULL,
+                    test_file TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    duration REAL DEFAULT 0,
+                    error_message TEXT,
+                    traceback TEXT,
+                    timestamp TEXT NOT NULL
+                )
+            """)
+
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_name_ts ON test_results(test_name, timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_node_ts ON test_results(node_id, timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_run ON test_results(run_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_ts ON test_results(timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_type_started ON test_runs(run_type, started_at)")
+
+            conn.commit()
+
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection with context manager"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _value(status: Any) -> str:
+        """Normalize enum or string statuses"""
+        return getattr(status, "value", status)
+
+    def record_run(self,
+                   results: Iterable[Any],
+                   run_type: str = "file",
+                   suite_name: Optional[str] = None,
+                   started_at: Optional[datetime] = None,
+                   ended_at: Optional[datetime] = None) -> int:
+        """Record a test run and its results in one transaction.
+
+        Args:
+            results: Result objects exposing ``test_name``, ``test_file``,
+                ``status``, ``duration``, ``error_message`` and ``timestamp``
+            run_type: ``"file"`` for single file runs, ``"suite"`` for full runs
+            suite_name: Optional suite name
+            started_at: Run start time
+            ended_at: Run end time
+
+        Returns:
+            The new run id
+        """
+        results = list(results)
+        now = datetime.now()
+        started_at = started_at or now
+        ended_at = ended_at or now
+
+        counts = {"passed": 0, "failed": 0, "error": 0, "skipped": 0}
+        for result in results:
+            status = self._value(result.status)
+            if status in counts:
+                counts[status] += 1
+
+        with self._lock, self._get_connection() as conn:
+            cursor = conn.execute("""
+                INSERT INTO test_runs (
+                    suite_name, run_type, started_at, ended_at,
+                    passed_count, failed_count, error_count, skipped_count, duration
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                suite_name,
+                run_type,
+                started_at.isoformat(),
+                ended_at.isoformat(),
+                counts["passed"],
+                counts["failed"],
+                counts["error"],
+                counts["skipped"],
+                (ended_at - started_at).total_seconds()
+            ))
+            run_id = cursor.lastrowid
+
+            conn.executemany("""
+                INSERT INTO test_results (
+                    run_id, node_id, test_name, test_file, status,
+                    duration, error_message, traceback, timestamp
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    run_id,
+                    getattr(r, "node_id", None),
+                    r.test_name,
+                    r.test_file,
+                    self._value(r.status),
+                    r.duration,
+                    r.error_message,
+                    getattr(r, "traceback", None),
+                    (getattr(r, "timestamp", None) or now).isoformat()
+                )
+                for r in results
+            ])
+            conn.commit()
+
+        return run_id
+
+    def is_empty(self) -> bool:
+        """Whether no run has ever been recorded"""
+        with self._get_connection() as conn:
+            return conn.execute("SELECT 1 FROM test_runs LIMIT 1").fetchone() is None
+
+    def get_history(self, test_name: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get the most recent results for a test name or node id"""
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT * FROM (
+                    SELECT * FROM test_results WHERE test_name = ?
+                    UNION
+                    SELECT * FROM test_results WHERE node_id = ?
+                )
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ?
+            """, (test_name, test_name, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_recent_results(self, since: Optional[datetime] = None, limit: int = 1000) -> List[Dict[str, Any]]:
+        """Get recent results in chronological order"""
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT * FROM (
+                    SELECT * FROM test_results
+                    WHERE timestamp > ?
+                    ORDER BY timestamp DESC, id DESC
+                    LIMIT ?
+                ) ORDER BY timestamp ASC, id ASC
+            """, ((since or datetime.min).isoformat(), limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_statistics(self, run_type: Optional[str] = "suite") -> Dict[str, Any]:
+        """Get aggregate statistics over recorded runs"""
+        where = "WHERE run_type = ?" if run_type else ""
+        params = (run_type,) if run_type else ()
+
+        with self._get_connection() as conn:
+            row = conn.execute(f"""
+                SELECT
+                    COUNT(*) AS total_runs,
+                    COALESCE(SUM(passed_count + failed_count + error_count + skipped_count), 0) AS total_tests_run,
+                    COALESCE(SUM(passed_count), 0) AS total_passed,
+                    COALESCE(SUM(failed_count), 0) AS total_failed,
+                    COALESCE(SUM(error_count), 0) AS total_errors,
+                    MAX(started_at) AS last_run
+                FROM test_runs {where}
+            """, params).fetchone()
+
+        stats = dict(row)
+        stats["average_success_rate"] = (
+            stats["total_passed"] / stats["total_tests_run"] * 100
+            if stats["total_tests_run"] > 0 else 0.0
+        )
+        return stats
+
+    def get_slowest_tests(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get tests with the highest average duration"""
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT COALESCE(node_id, test_name) AS test_id, test_file,
+                       AVG(duration) AS average_duration, COUNT(*) AS runs
+                FROM test_results
+                WHERE status = 'passed'
+                GROUP BY test_id
+                ORDER BY average_duration DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def cleanup(self, older_than: datetime) -> int:
+        """Delete runs and results older than a cutoff
+
+        Returns:
+            Number of deleted results
+        """
+        cutoff = older_than.isoformat()
+        with self._lock, self._get_connection() as conn:
+            cursor = conn.execute("DELETE FROM test_results WHERE timestamp < ?", (cutoff,))
+            conn.execute("""
+                DELETE FROM test_runs
+                WHERE started_at < ?
+                  AND run_id NOT IN (SELECT DISTINCT run_id FROM test_results WHERE run_id IS NOT NULL)
+            """, (cutoff,))
+            conn.commit()
+            return cursor.rowcount
@@ -27,6 +27,7 @@ import time
 from typing import Optional, Dict, Any
 
 from .models import TaskStatus, WorkerTask
+from .claude_stream import run_streaming, StreamProgress
 # TaskMasterInterface will be provided by orchestrator
 
 # Import direct Claude API
@@ -36,6 +37,15 @@ try:
 except ImportError:
     DIRECT_API_AVAILABLE = False
 
+# Prompt prefix used when resuming a session that timed out
+RESUME_PROMPT = (
+    "Your previous attempt at this task was interrupted by a timeout. "
+    "Continue from where you left off and finish the task."
+)
+
+# Minimum seconds between live progress updates pushed to the orchestrator
+PROGRESS_UPDATE_INTERVAL = 0.5
+
 # Import error handler if available
 try:
     from .claude_error_handler import ClaudeErrorHandler
@@ -70,6 +80,10 @@ class SonnetWorker:
         # Statistics
         self.tasks_completed = 0
         self.session_tokens_used = 0
+        # Live state of the task being executed
+        self.current_task: Optional[WorkerTask] = None
+        self.current_task_tokens = 0
+        self._last_progress_update = 0.0
         # Reference to orchestrator (set by orchestrator)
         self.orchestrator = None
         # Task master interface (set by orchestrator)
@@ -113,6 +127,8 @@ class SonnetWorker:
                 and error information based on execution outcome.
         """
         logger.info(f"Worker {self.worker_id}: Starting task {task.task_id} - {task.title}")
+        self.current_task = task
+        self.current_task_tokens = 0
         
         try:
             # Update task status in Task Master
@@ -128,11 +144,14 @@ class SonnetWorker:
             if result['success']:
                 task.status = TaskStatus.COMPLETED
                 task.result = result['output']
+                task.partial_result = None
+                task.resume_session_id = None
                 self.task_master.set_task_status(task.task_id, "done")
                 
                 # Track usage
                 if 'usage' in result:
                     usage = result['usage']
+                    self.current_task_tokens = usage.get('tokens_used', self.current_task_tokens)
                     self.session_tokens_used += usage.get('tokens_used', 0)
                     self.tasks_completed += 1
                     
@@ -150,6 +169,12 @@ class SonnetWorker:
                 task.status = TaskStatus.FAILED
                 task.error = result['error']
                 
+                # Keep what a timed-out run produced so a retry can resume it
+                if result.get('timed_out'):
+                    task.partial_result = result.get('partial_output')
+                    task.resume_session_id = result.get('session_id')
+                    task.transcript_path = result.get('transcript_path')
+                
                 # Check if it's a usage limit error
                 if "USAGE LIMIT" in result['error']:
                     logger.error(f"Worker {self.worker_id}: USAGE LIMIT REACHED - Cannot continue processing")
@@ -166,6 +191,8 @@ class SonnetWorker:
             task.status = TaskStatus.FAILED
             task.error = str(e)
             logger.error(f"Worker {self.worker_id}: Exception processing task {task.task_id} - {e}")
+        finally:
+            self.current_task = None
         
         return task
     
@@ -272,8 +299,23 @@ class SonnetWorker:
                 for tool in self.config.claude_flags["disallowed_tools"]:
                     cmd.extend(["--disallowedTools", tool])
             
-            if self.config.claude_flags.get("output_format") and self.config.claude_flags["output_format"] != "text":
-                cmd.extend(["--output-format", self.config.claude_flags["output_format"]])
+            streaming = getattr(self.config, 'stream_output', False)
+            output_format = self.config.claude_flags.get("output_format")
+            if streaming and output_format in (None, "text"):
+                # stream-json needs --verbose in print mode
+                output_format = "stream-json"
+                if "--verbose" not in cmd:
+                    cmd.append("--verbose")
+            if output_format and output_format != "text":
+                cmd.extend(["--output-format", output_format])
+            
+            task = self.current_task
+            if streaming and task is not None and getattr(task, 'resume_session_id', None):
+                cmd.extend(["--resume", task.resume_session_id])
+                with open(prompt_file, 'w') as f:
+                    f.write(f"{RESUME_PROMPT}\n\n{prompt}")
+                logger.info(f"Worker {self.worker_id}: Resuming session {task.resume_session_id} "
+                           f"for task {task.task_id}")
             
             if self.config.claude_flags.get("input_format") and self.config.claude_flags["input_format"] != "text":
                 cmd.extend(["--input-format", self.config.claude_flags["input_format"]])
@@ -319,6 +361,12 @@ class SonnetWorker:
                 if value is not None:
                     env[key] = str(value)
             
+            if streaming:
+                try:
+                    return self._run_streaming_command(cmd, env)
+                finally:
+                    os.unlink(prompt_file)
+            
             # Execute command with timeout
             result = subprocess.run(
                 cmd,
@@ -363,6 +411,76 @@ class SonnetWorker:
                 'error': f"Exception during execution: {str(e)}"
             }
     
+    def _run_streaming_command(self, cmd, env) -> Dict[str, Any]:
+        """Run the CLI with incremental output parsing and live progress"""
+        task = self.current_task
+        transcript_name = None
+        if task is not None:
+            transcript_name = f"task_{task.task_id}_{int(time.time())}.jsonl"
+        
+        stream = run_streaming(
+            cmd,
+            cwd=self.working_dir,
+            env=env,
+            timeout=self.config.worker_timeout,
+            on_progress=self._on_stream_progress,
+            spool_dir=getattr(self.config, 'transcript_dir', None),
+            transcript_name=transcript_name
+        )
+        
+        if stream.timed_out:
+            return {
+                'success': False,
+                'timed_out': True,
+                'error': f"Task execution timed out after {self.config.worker_timeout} seconds",
+                'partial_output': stream.output,
+                'session_id': stream.session_id,
+                'transcript_path': stream.transcript_path,
+                'usage': stream.usage
+            }
+        
+        if stream.success:
+            usage = self._parse_usage_info(stream.output)
+            usage.update(stream.usage)
+            return {
+                'success': True,
+                'output': stream.output,
+                'usage': usage,
+                'session_id': stream.session_id,
+                'transcript_path': stream.transcript_path
+            }
+        
+        error_msg = stream.stderr or stream.output
+        return {
+            'success': False,
+            'error': error_msg,
+            'return_code': stream.returncode,
+            'request_id': self._extract_request_id(error_msg),
+            'session_id': stream.session_id
+        }
+    
+    def _on_stream_progress(self, progress: StreamProgress):
+        """Publish live turn and token counts for the running task"""
+        self.current_task_tokens = progress.tokens_used
+        task = self.current_task
+        if task is None:
+            return
+        
+        now = time.time()
+        if now - self._last_progress_update < PROGRESS_UPDATE_INTERVAL:
+            return
+        self._last_progress_update = now
+        
+        task.status_message = (f"Turn {progress.turns}, {progress.tool_uses} tool calls, "
+                               f"{progress.tokens_used} tokens")
+        
+        # Turns against the turn budget drive the subtask progress column
+        task_master = getattr(self.orchestrator, 'task_master', None)
+        if task_master and self.config.max_turns:
+            task_master.update_subtask_progress(
+                task.task_id, min(progress.turns, self.config.max_turns), self.config.max_turns
+            )
+    
     def _parse_usage_info(self, output: str) -> Dict[str, Any]:
         """Parse usage information from Claude output"""
         usage = {}
@@ -0,0 +1,192 @@
+"""Adaptive sizing of the orchestrator's worker pool.
+
+The WorkerAutoscaler decides how many worker threads the orchestrator
+should run, based on four signals:
+
+- queue depth: tasks waiting for a worker
+- task latency: a moving window of recent task durations, used to
+  estimate how long the current queue takes to drain
+- error rate: a high failure rate stops further scale-up, since extra
+  parallelism does not fix failing tasks
+- rate-limit signals: usage-limit failures or admission delays shrink
+  the pool instead of growing it
+
+Scaling is bounded by ``min_workers``/``max_workers``. Hysteresis comes
+from requiring the same decision on several consecutive evaluations and
+from separate scale-up and scale-down cooldowns. Step sizes follow the
+same PoolScalingPolicy values as worker_pool_manager.WorkerPool.
+
+Typical usage example:
+    autoscaler = WorkerAutoscaler(AutoscaleConfig(min_workers=1, max_workers=8))
+    autoscaler.record_task(duration=42.0, success=True)
+    target = autoscaler.evaluate(current_workers=3, queue_depth=10, busy_workers=3)
+"""
+
+import time
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from .worker_pool_manager import PoolScalingPolicy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AutoscaleConfig:
+    """Autoscaling bounds and thresholds"""
+    min_workers: int = 1
+    max_workers: int = 3
+    # Scale up when the queue would take longer than this to drain (seconds)
+    target_queue_wait: float = 60.0
+    # Consecutive evaluations that must agree before scaling
+    sustain: int = 2
+    scale_up_cooldown: float = 30.0
+    scale_down_cooldown: float = 120.0
+    # Failure ratio over recent tasks above which the pool does not grow
+    max_error_rate: float = 0.5
+    # How long a rate-limit signal suppresses scale-up (seconds)
+    rate_limit_backoff: float = 120.0
+    latency_window: int = 20
+    policy: PoolScalingPolicy = PoolScalingPolicy.BALANCED
+
+
+class WorkerAutoscaler:
+    """Computes the target worker count from load and health signals"""
+
+    def __init__(self, config: AutoscaleConfig, clock: Callable[[], float] = time.monotonic):
+        self.config = config
+        self._clock = clock
+        self._recent: Deque[Tuple[float, bool]] = deque(maxlen=config.latency_window)
+        self._last_rate_limit: Optional[float] = None
+        self._last_scale_up: Optional[float] = None
+        self._last_scale_down: Optional[float] = None
+        self._pending_direction = 0
+        self._pending_count = 0
+        self.history: List[Dict[str, Any]] = []
+
+    def record_task(self, duration: float, success: bool, rate_limited: bool = False):
+        """Record a finished task.
+
+        Args:
+            duration: Wall-clock seconds the task took
+            success: Whether the task completed
+            rate_limited: Whether it failed on a usage or rate limit
+        """
+        self._recent.append((duration, success))
+        if rate_limited:
+            self.record_rate_limit()
+
+    def record_rate_limit(self):
+        """Note that a model is being throttled."""
+        self._last_rate_limit = self._clock()
+
+    @property
+    def average_latency(self) -> Optional[float]:
+        if not self._recent:
+            return None
+        return sum(d for d, _ in self._recent) / len(self._recent)
+
+    @property
+    def error_rate(self) -> float:
+        if not self._recent:
+            return 0.0
+        return sum(1 for _, ok in self._recent if not ok) / len(self._recent)
+
+    def evaluate(self, current_workers: int, queue_depth: int, busy_workers: int) -> int:
+        """Decide the worker count for the next period.
+
+        Args:
+            current_workers: Live workers in the pool
+            queue_depth: Tasks waiting for a worker
+            busy_workers: Workers currently running a task
+
+        Returns:
+            Target number of workers (equal to current_workers for no change)
+        """
+        cfg = self.config
+        now = self._clock()
+        idle = max(0, current_workers - busy_workers)
+        rate_limited = (self._last_rate_limit is not None and
+                        now - self._last_rate_limit < cfg.rate_limit_backoff)
+
+        # A throttled model does not get replacement workers, even below the minimum
+        if current_workers < cfg.min_workers and not rate_limited:
+            return self._apply(now, current_workers, cfg.min_workers, "below minimum")
+        if current_workers > cfg.max_workers:
+            return self._apply(now, current_workers, cfg.max_workers, "above maximum")
+
+        direction, reason = 0, ""
+        waiting = queue_depth - idle
+        if rate_limited:
+            if current_workers > cfg.min_workers:
+                direction, reason = -1, "rate limited"
+        elif waiting > 0 and current_workers < cfg.max_workers:
+            latency = self.average_latency
+            expected_wait = None if latency is None else queue_depth * latency / max(1, current_workers)
+            if self.error_rate > cfg.max_error_rate:
+                reason = f"error rate {self.error_rate:.0%} blocks scale-up"
+            elif expected_wait is None or expected_wait > cfg.target_queue_wait:
+                direction = 1
+                reason = (f"{queue_depth} queued" if expected_wait is None else
+                          f"{queue_depth} queued, ~{expected_wait:.0f}s expected wait")
+        elif queue_depth == 0 and idle > 0 and current_workers > cfg.min_workers:
+            direction, reason = -1, f"{idle} idle"
+
+        # Hysteresis: the same decision must hold for `sustain` evaluations
+        if direction != self._pending_direction:
+            self._pending_direction = direction
+            self._pending_count = 0
+        if direction == 0:
+            return current_workers
+        self._pending_count += 1
+        if self._pending_count < cfg.sustain:
+            return current_workers
+
+        if direction > 0:
+            if self._last_scale_up is not None and now - self._last_scale_up < cfg.scale_up_cooldown:
+                return current_workers
+            target = current_workers + self._scale_up_step(current_workers, waiting)
+        else:
+            if self._last_scale_down is not None and now - self._last_scale_down < cfg.scale_down_cooldown:
+                return current_workers
+            step = 1 if rate_limited else self._scale_down_step(current_workers, idle)
+            target = current_workers - step
+        return self._apply(now, current_workers, target, reason)
+
+    def _scale_up_step(self, current: int, waiting: int) -> int:
+        room = self.config.max_workers - current
+        if self.config.policy == PoolScalingPolicy.AGGRESSIVE:
+            step = max(1, waiting // 2)
+        elif self.config.policy == PoolScalingPolicy.BALANCED:
+            step = 2
+        else:
+            step = 1
+        # Never add more workers than there are tasks waiting
+        return max(1, min(step, room, waiting))
+
+    def _scale_down_step(self, current: int, idle: int) -> int:
+        room = current - self.config.min_workers
+        step = 2 if self.config.policy == PoolScalingPolicy.AGGRESSIVE else 1
+        return max(1, min(step, room, idle))
+
+    def _apply(self, now: float, current: int, target: int, reason: str) -> int:
+        target = max(self.config.min_workers, min(self.config.max_workers, target))
+        if target == current:
+            return current
+        if target > current:
+            self._last_scale_up = now
+        else:
+            self._last_scale_down = now
+        self._pending_direction = 0
+        self._pending_count = 0
+        self.history.append({
+            "action": "scale_up" if target > current else "scale_down",
+            "from": current,
+            "to": target,
+            "reason": reason,
+            "timestamp": now
+        })
+        logger.info(f"Autoscaling workers {current} -> {target} ({reason})")
+        return target
@@ -1,17 +1,40 @@
 """
 Worker Result Manager - Centralized result storage and retrieval system
+
+Result metadata lives in narrow ``worker_results`` rows. Outputs larger
+than ``inline_threshold`` bytes are compressed (zstd when the
+``zstandard`` package is installed, zlib otherwise) into the
+content-addressed ``result_blobs`` table and only loaded when a
+result's ``output`` is accessed.
 """
 import json
+import zlib
+import queue
+import hashlib
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Callable
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
+# Columns read for results; the legacy inline ``output`` column is only
+# populated for small outputs and rows written before blob storage
+RESULT_COLUMNS = """
+    id, task_id, worker_id, status, output, output_hash, created_files,
+    modified_files, execution_time, tokens_used, timestamp, error_message,
+    validation_passed, metadata
+"""
+
 
 class ResultStatus(Enum):
     PENDING = "pending"
@@ -47,19 +70,42 @@ class WorkerResult:
         return cls(**data)
 
 
+class _LazyWorkerResult(WorkerResult):
+    """WorkerResult whose output is fetched from blob storage on first access"""
+
+    def __init__(self, *args, output_hash: Optional[str] = None,
+                 loader: Optional[Callable[[str], str]] = None, **kwargs):
+        self._output_hash = output_hash
+        self._loader = loader
+        super().__init__(*args, **kwargs)
+
+    @property
+    def output(self) -> str:
+        if self._output is None and self._output_hash:
+            self._output = self._loader(self._output_hash)
+        return self._output
+
+    @output.setter
+    def output(self, value: Optional[str]):
+        self._output = value
+
+
 class WorkerResultManager:
     """Manages worker results with persistent storage and validation"""
     
-    def __init__(self, db_path: Path = None):
+    def __init__(self, db_path: Path = None, inline_threshold: int = 1024, pool_size: int = 4):
         if db_path is None:
             db_path = Path(".taskmaster/results.db")
-        self.db_path = db_path
+        self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.inline_threshold = inline_threshold
+        self._pool: queue.LifoQueue = queue.LifoQueue(maxsize=pool_size)
         self._init_database()
         
     def _init_database(self):
         """Initialize SQLite database for result storage"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS worker_results (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -67,6 +113,7 @@ class WorkerResultManager:
                     worker_id TEXT NOT NULL,
                     status TEXT NOT NULL,
                     output TEXT,
+                    output_hash TEXT,
                     created_files TEXT,
                     modified_files TEXT,
                     execution_time REAL,
@@ -80,6 +127,20 @@ class WorkerResultManager:
                 )
             """)
             
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS result_blobs (
+                    hash TEXT PRIMARY KEY,
+                    codec TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    data BLOB NOT NULL
+                )
+            """)
+            
+            # Databases created before blob storage lack output_hash
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(worker_results)")}
+            if "output_hash" not in columns:
+                conn.execute("ALTER TABLE worker_results ADD COLUMN output_hash TEXT")
+            
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_task_id ON worker_results(task_id)
             """)
@@ -92,20 +153,103 @@ class WorkerResultManager:
                 CREATE INDEX IF NOT EXISTS idx_status ON worker_results(status)
             """)
             
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_created_at ON worker_results(created_at)
+            """)
+            
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_output_hash ON worker_results(output_hash)
+            """)
+    
+    @contextmanager
+    def _get_connection(self):
+        """Borrow a pooled connection; commits on success, rolls back on error"""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        except Exception:
+            conn.close()
+            raise
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+    
+    def close(self):
+        """Close all pooled connections"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+    
+    @staticmethod
+    def _compress(raw: bytes) -> Tuple[str, bytes]:
+        if zstandard is not None:
+            data, codec = zstandard.ZstdCompressor(level=10).compress(raw), "zstd"
+        else:
+            data, codec = zlib.compress(raw, 6), "zlib"
+        if len(data) >= len(raw):
+            return "raw", raw
+        return codec, data
+    
+    @staticmethod
+    def _decompress(codec: str, data: bytes) -> bytes:
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("Result blob is zstd-compressed but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompress(data)
+        if codec == "zlib":
+            return zlib.decompress(data)
+        return data
+    
+    def _store_blob(self, conn: sqlite3.Connection, text: str) -> str:
+        """Store text in the content-addressed blob table and return its hash"""
+        raw = text.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        codec, data = self._compress(raw)
+        conn.execute(
+            "INSERT OR IGNORE INTO result_blobs (hash, codec, size, data) VALUES (?, ?, ?, ?)",
+            (digest, codec, len(raw), data)
+        )
+        return digest
+    
+    def _load_blob(self, digest: str) -> str:
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT codec, data FROM result_blobs WHERE hash = ?", (digest,)
+            ).fetchone()
+        if row is None:
+            logger.warning(f"Result blob {digest} is missing")
+            return ""
+        return self._decompress(row["codec"], row["data"]).decode("utf-8")
+            
     def store_result(self, result: WorkerResult) -> int:
         """Store a worker result and return the result ID"""
-        with sqlite3.connect(self.db_path) as conn:
+        output = result.output or ""
+        with self._get_connection() as conn:
+            if len(output) > self.inline_threshold:
+                inline_output, output_hash = None, self._store_blob(conn, output)
+            else:
+                inline_output, output_hash = output, None
+            
             cursor = conn.execute("""
                 INSERT INTO worker_results (
-                    task_id, worker_id, status, output, created_files,
+                    task_id, worker_id, status, output, output_hash, created_files,
                     modified_files, execution_time, tokens_used, timestamp,
                     error_message, validation_passed, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 result.task_id,
                 result.worker_id,
                 result.status.value,
-                result.output,
+                inline_output,
+                output_hash,
                 json.dumps(result.created_files),
                 json.dumps(result.modified_files),
                 result.execution_time,
@@ -122,12 +266,11 @@ class WorkerResultManager:
             
     def get_latest_result(self, task_id: str) -> Optional[WorkerResult]:
         """Get the most recent result for a task"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM worker_results 
+        with self._get_connection() as conn:
+            cursor = conn.execute(f"""
+                SELECT {RESULT_COLUMNS} FROM worker_results 
                 WHERE task_id = ? 
-                ORDER BY created_at DESC 
+                ORDER BY created_at DESC, id DESC 
                 LIMIT 1
             """, (task_id,))
             
@@ -138,24 +281,22 @@ class WorkerResultManager:
             
     def get_all_results(self, task_id: str) -> List[WorkerResult]:
         """Get all results for a task (history)"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM worker_results 
+        with self._get_connection() as conn:
+            cursor = conn.execute(f"""
+                SELECT {RESULT_COLUMNS} FROM worker_results 
                 WHERE task_id = ? 
-                ORDER BY created_at DESC
+                ORDER BY created_at DESC, id DESC
             """, (task_id,))
             
             return [self._row_to_result(row) for row in cursor]
             
     def get_results_by_status(self, status: ResultStatus) -> List[WorkerResult]:
         """Get all results with a specific status"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT * FROM worker_results 
+        with self._get_connection() as conn:
+            cursor = conn.execute(f"""
+                SELECT {RESULT_COLUMNS} FROM worker_results 
                 WHERE status = ? 
-                ORDER BY created_at DESC
+                ORDER BY created_at DESC, id DESC
             """, (status.value,))
             
             return [self._row_to_result(row) for row in cursor]
@@ -193,18 +334,23 @@ class WorkerResultManager:
         
     def mark_validated(self, task_id: str, validated: bool = True):
         """Mark a result as validated"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             conn.execute("""
                 UPDATE worker_results 
                 SET validation_passed = ? 
-                WHERE task_id = ? 
-                ORDER BY created_at DESC 
-                LIMIT 1
+                WHERE id = (
+                    SELECT id FROM worker_results
+                    WHERE task_id = ?
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT 1
+                )
             """, (validated, task_id))
             
     def _row_to_result(self, row: sqlite3.Row) -> WorkerResult:
-        """Convert database row to WorkerResult"""
-        return WorkerResult(
+        """Convert database row to WorkerResult (output loaded lazily)"""
+        return _LazyWorkerResult(
+            output_hash=row['output_hash'],
+            loader=self._load_blob,
             task_id=row['task_id'],
             worker_id=row['worker_id'],
             status=ResultStatus(row['status']),
@@ -221,7 +367,7 @@ class WorkerResultManager:
         
     def get_worker_stats(self, worker_id: str) -> Dict[str, Any]:
         """Get statistics for a specific worker"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_connection() as conn:
             cursor = conn.execute("""
                 SELECT 
                     COUNT(*) as total_tasks,
@@ -244,10 +390,27 @@ class WorkerResultManager:
                 'validated_tasks': row[5] or 0
             }
             
-    def cleanup_old_results(self, days: int = 30):
-        """Remove results older than specified days"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+    def cleanup_old_results(self, days: int = 30) -> int:
+        """Remove results older than specified days, and blobs no longer referenced
+        
+        Returns:
+            Number of results removed
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute("""
                 DELETE FROM worker_results
                 WHERE created_at < datetime('now', '-' || ? || ' days')
-            """, (days,))
\ No newline at end of file
+            """, (days,))
+            removed = cursor.rowcount
+            
+            if removed:
+                conn.execute("""
+                    DELETE FROM result_blobs
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM worker_results
+                        WHERE worker_results.output_hash = result_blobs.hash
+                    )
+                """)
+            
+            logger.info(f"Removed {removed} results older than {days} days")
+            return removed
@@ -0,0 +1,238 @@
+"""Git worktrees for running tasks in isolation from the working directory.
+
+A worktree is created from a snapshot of the working directory as it is
+right now, including uncommitted and untracked (but not ignored) files,
+so a task running in it sees everything the tasks before it produced.
+The snapshot is an unreferenced commit written through a temporary
+index: the working directory, its index, HEAD and branches are not
+touched.
+
+When the task is done, its changes are taken from the worktree as a
+binary patch against the snapshot and can be applied to the working
+directory; a patch that no longer applies is reported, not forced.
+
+``WorkspacePool`` keeps one worktree per worker for the whole run. Before
+each task the worker's worktree is reset to a new snapshot instead of
+being recreated, which only rewrites the files that changed and keeps
+ignored files (installed dependencies, build output) in place. Snapshots
+and merges of the working directory are serialized, so a snapshot never
+sees half of a merged patch.
+
+Typical usage example:
+    pool = WorkspacePool(repo_dir)
+    worktree = pool.acquire(worker_id)
+    run_task(cwd=worktree.path)
+    error = pool.merge(worktree.diff())
+    pool.close()
+"""
+
+import os
+import shutil
+import logging
+import tempfile
+import threading
+import subprocess
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Task Master state is shared through the main working directory only
+EXCLUDED_PATHS = (".taskmaster",)
+
+# Identity for snapshot commits, which are never put on a branch
+SNAPSHOT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Claude Orchestrator",
+    "GIT_AUTHOR_EMAIL": "orchestrator@localhost",
+    "GIT_COMMITTER_NAME": "Claude Orchestrator",
+    "GIT_COMMITTER_EMAIL": "orchestrator@localhost",
+}
+
+
+class WorktreeError(Exception):
+    """A git operation on a worktree failed"""
+
+
+def _git(cwd: str, *args: str, env: Optional[dict] = None, input: Optional[str] = None) -> str:
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, env=env, input=input,
+            capture_output=True, text=True, timeout=120
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise WorktreeError(f"git {args[0]} failed: {e}") from e
+    if result.returncode != 0:
+        raise WorktreeError(f"git {args[0]} failed: {result.stderr.strip() or result.stdout.strip()}")
+    return result.stdout
+
+
+def is_git_repo(path: str) -> bool:
+    """Whether ``path`` is inside a git work tree with at least one commit"""
+    try:
+        _git(path, "rev-parse", "--verify", "HEAD")
+        return True
+    except WorktreeError:
+        return False
+
+
+def _copy_index(repo_dir: str, dest: str) -> bool:
+    try:
+        index = _git(repo_dir, "rev-parse", "--git-path", "index").strip()
+        shutil.copyfile(os.path.join(repo_dir, index), dest)
+        return True
+    except (WorktreeError, OSError):
+        return False
+
+
+def snapshot_commit(repo_dir: str) -> str:
+    """Commit the working directory as it is, without touching its index or refs"""
+    with tempfile.TemporaryDirectory(prefix="co-index-") as temp_dir:
+        index = os.path.join(temp_dir, "index")
+        env = dict(os.environ, GIT_INDEX_FILE=index, **SNAPSHOT_IDENTITY)
+        # Start from a copy of the real index: its stat data lets git skip
+        # hashing files that have not changed
+        if _copy_index(repo_dir, index):
+            try:
+                _git(repo_dir, "add", "-A", env=env)
+            except WorktreeError as e:
+                logger.debug(f"Snapshot from the index failed, starting from HEAD: {e}")
+                os.remove(index)
+                _git(repo_dir, "read-tree", "HEAD", env=env)
+                _git(repo_dir, "add", "-A", env=env)
+        else:
+            _git(repo_dir, "read-tree", "HEAD", env=env)
+            _git(repo_dir, "add", "-A", env=env)
+        tree = _git(repo_dir, "write-tree", env=env).strip()
+        return _git(repo_dir, "commit-tree", tree, "-p", "HEAD",
+                    "-m", "Working directory snapshot", env=env).strip()
+
+
+class GitWorktree:
+    """A detached worktree checked out at a snapshot of the working directory"""
+
+    def __init__(self, repo_dir: str, path: str, base: str):
+        self.repo_dir = repo_dir
+        self.path = path
+        self.base = base
+
+    @classmethod
+    def create(cls, repo_dir: str, base: Optional[str] = None,
+               prefix: str = "co-worktree-") -> 'GitWorktree':
+        """Create a worktree at ``base`` (default: a snapshot of ``repo_dir``)"""
+        base = base or snapshot_commit(repo_dir)
+        path = tempfile.mkdtemp(prefix=prefix)
+        try:
+            _git(repo_dir, "worktree", "add", "--detach", path, base)
+        except WorktreeError:
+            shutil.rmtree(path, ignore_errors=True)
+            raise
+        return cls(repo_dir, path, base)
+
+    def diff(self) -> str:
+        """Binary patch of everything changed in the worktree since ``base``"""
+        _git(self.path, "add", "-A")
+        excludes = [f":(exclude){p}" for p in EXCLUDED_PATHS]
+        return _git(self.path, "diff", "--cached", "--binary", self.base, "--", ".", *excludes)
+
+    def reset(self, base: Optional[str] = None):
+        """Check out ``base`` (default: a new snapshot), dropping all changes.
+
+        Ignored files are kept, so the next task can reuse them.
+        """
+        base = base or snapshot_commit(self.repo_dir)
+        _git(self.path, "reset", "-q", "--hard", base)
+        _git(self.path, "clean", "-fdq")
+        self.base = base
+
+    def remove(self):
+        """Delete the worktree and its checkout"""
+        try:
+            _git(self.repo_dir, "worktree", "remove", "--force", self.path)
+        except WorktreeError as e:
+            logger.debug(f"Removing worktree {self.path} by hand: {e}")
+            shutil.rmtree(self.path, ignore_errors=True)
+            try:
+                _git(self.repo_dir, "worktree", "prune")
+            except WorktreeError:
+                pass
+
+
+def apply_patch(repo_dir: str, patch: str) -> Optional[str]:
+    """Apply a patch to the working directory.
+
+    Returns:
+        None on success, otherwise why the patch does not apply (nothing
+        is changed in that case)
+    """
+    if not patch.strip():
+        return None
+    try:
+        _git(repo_dir, "apply", "--check", "--whitespace=nowarn", "-", input=patch)
+        _git(repo_dir, "apply", "--whitespace=nowarn", "-", input=patch)
+    except WorktreeError as e:
+        return str(e)
+    return None
+
+
+class WorkspacePool:
+    """One reusable worktree per worker, merged back into the working directory"""
+
+    def __init__(self, repo_dir: str):
+        self.repo_dir = repo_dir
+        self._worktrees: Dict[Any, GitWorktree] = {}
+        self._lock = threading.Lock()
+        # Snapshots and merges of the working directory must not interleave
+        self._merge_lock = threading.Lock()
+        self.stats = {"created": 0, "reused": 0, "merged": 0, "conflicts": 0}
+
+    def acquire(self, worker_id: Any) -> GitWorktree:
+        """The worker's worktree, reset to a snapshot of the working directory"""
+        with self._merge_lock:
+            base = snapshot_commit(self.repo_dir)
+        with self._lock:
+            worktree = self._worktrees.pop(worker_id, None)
+
+        if worktree is not None:
+            try:
+                worktree.reset(base)
+                self._count("reused")
+            except WorktreeError as e:
+                logger.debug(f"Recreating worktree of worker {worker_id}: {e}")
+                worktree.remove()
+                worktree = None
+        if worktree is None:
+            worktree = GitWorktree.create(self.repo_dir, base, prefix=f"co-worker-{worker_id}-")
+            self._count("created")
+
+        with self._lock:
+            self._worktrees[worker_id] = worktree
+        return worktree
+
+    def merge(self, patch: str) -> Optional[str]:
+        """Apply a task's patch to the working directory.
+
+        Returns:
+            None on success, otherwise why the patch conflicts
+        """
+        with self._merge_lock:
+            error = apply_patch(self.repo_dir, patch)
+        self._count("conflicts" if error else "merged")
+        return error
+
+    def discard(self, worker_id: Any):
+        """Remove the worktree of a worker that stopped"""
+        with self._lock:
+            worktree = self._worktrees.pop(worker_id, None)
+        if worktree is not None:
+            worktree.remove()
+
+    def close(self):
+        """Remove every worktree in the pool"""
+        with self._lock:
+            worktrees = list(self._worktrees.values())
+            self._worktrees.clear()
+        for worktree in worktrees:
+            worktree.remove()
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
@@ -0,0 +1,177 @@
+"""Tests for token- and concurrency-aware admission control"""
+
+import queue
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from claude_orchestrator.admission_control import AdmissionController, ModelBudget
+from claude_orchestrator.manager import OpusManager
+from claude_orchestrator.models import WorkerTask
+from claude_orchestrator.orchestrator import ClaudeOrchestrator
+from claude_orchestrator.speculation import SpeculationTracker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_controller(clock=None, **budget):
+    return AdmissionController({"sonnet": ModelBudget(**budget)}, clock=clock or FakeClock())
+
+
+class TestAdmissionController:
+    """Test cases for budget accounting"""
+
+    def test_tokens_per_minute_window(self):
+        clock = FakeClock()
+        controller = make_controller(clock, tokens_per_minute=1000)
+
+        first = controller.try_acquire("sonnet", 600)
+        assert first is not None
+        # The in-flight estimate counts against the budget
+        assert controller.try_acquire("sonnet", 600) is None
+
+        controller.release(first, 700)
+        assert controller.try_acquire("sonnet", 400) is None
+        assert controller.try_acquire("sonnet", 300) is not None
+
+        clock.now += 61
+        assert controller.get_status()["sonnet"]["tokens_in_window"] == 0
+
+    def test_unbudgeted_model_is_always_admitted(self):
+        controller = make_controller(tokens_per_minute=10)
+
+        tickets = [controller.try_acquire("opus", 10 ** 6) for _ in range(5)]
+
+        assert all(tickets)
+
+    def test_oversized_request_waits_for_empty_window(self):
+        clock = FakeClock()
+        controller = make_controller(clock, tokens_per_minute=1000)
+        controller.record_usage("sonnet", 100)
+
+        assert controller.try_acquire("sonnet", 5000) is None
+        clock.now += 60
+        assert controller.try_acquire("sonnet", 5000) is not None
+
+    def test_concurrency_limit_blocks_until_release(self):
+        controller = AdmissionController({"sonnet": ModelBudget(max_concurrent=1)})
+        held = controller.try_acquire("sonnet", 1)
+        admitted = threading.Event()
+
+        def waiter():
+            ticket = controller.acquire("sonnet", 1, timeout=5)
+            if ticket:
+                admitted.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        assert not admitted.wait(0.2)
+
+        controller.release(held, 1)
+        thread.join(5)
+
+        assert admitted.is_set()
+        assert controller.stats["delayed"] == 1
+
+    def test_acquire_times_out(self):
+        controller = AdmissionController({"sonnet": ModelBudget(max_concurrent=1)})
+        controller.try_acquire("sonnet", 1)
+
+        start = time.perf_counter()
+        assert controller.acquire("sonnet", 1, timeout=0.2) is None
+        assert time.perf_counter() - start < 2
+
+    def test_estimate_follows_observed_usage(self):
+        controller = make_controller()
+        assert controller.estimate("sonnet") == controller.default_estimate
+
+        ticket = controller.try_acquire("sonnet", 1, size=100)
+        controller.release(ticket, 4000)
+
+        assert controller.estimate("sonnet") == 4000
+        assert controller.estimate("sonnet", size=200) == 8000
+        assert controller.estimate("sonnet", size=10) == 1000
+
+
+class TestManagerAdmission:
+    """Test cases for budget-aware task dispatch in OpusManager"""
+
+    def make_manager(self, controller):
+        manager = OpusManager(SimpleNamespace(max_workers=2, worker_model="sonnet"))
+        manager.admission = controller
+        return manager
+
+    def test_smaller_task_runs_ahead_of_one_that_does_not_fit(self):
+        controller = make_controller(tokens_per_minute=10000)
+        ticket = controller.try_acquire("sonnet", 1, size=100)
+        controller.release(ticket, 1000)
+        manager = self.make_manager(controller)
+        manager.delegate_task(WorkerTask("big", "Big", "x" * 5000))
+        manager.delegate_task(WorkerTask("small", "Small", "x" * 50))
+        controller.record_usage("sonnet", 7000)
+
+        task, ticket = manager.next_task(timeout=0.1)
+
+        assert task.task_id == "small"
+        assert ticket is not None
+        assert [t.task_id for t in manager.task_queue.queue] == ["big"]
+        assert controller.stats["reordered"] == 1
+
+    def test_task_is_requeued_when_nothing_fits(self):
+        controller = make_controller(time.monotonic, tokens_per_minute=1000)
+        controller.record_usage("sonnet", 1000)
+        manager = self.make_manager(controller)
+        manager.delegate_task(WorkerTask("1", "One", "first"))
+
+        with pytest.raises(queue.Empty):
+            manager.next_task(timeout=0.1)
+
+        assert [t.task_id for t in manager.task_queue.queue] == ["1"]
+
+    def test_without_controller_tasks_pass_through(self):
+        manager = self.make_manager(None)
+        manager.delegate_task(WorkerTask("1", "One", "first"))
+
+        task, ticket = manager.next_task(timeout=0.1)
+
+        assert task.task_id == "1"
+        assert ticket is None
+
+
+class TestWorkerLoopAdmission:
+    """Test cases for returning admission tickets from the worker loop"""
+
+    def test_ticket_is_released_when_task_setup_fails(self):
+        controller = make_controller(max_concurrent=1)
+        manager = OpusManager(SimpleNamespace(max_workers=1, worker_model="sonnet"))
+        manager.admission = controller
+        manager.delegate_task(WorkerTask("1", "One", "first"))
+
+        orchestrator = ClaudeOrchestrator.__new__(ClaudeOrchestrator)
+        orchestrator.manager = manager
+        orchestrator.admission = controller
+        orchestrator.running = True
+        orchestrator.use_progress_display = False
+        orchestrator.progress = None
+        orchestrator.retiring_workers = set()
+        orchestrator.config = SimpleNamespace(snapshot=SimpleNamespace(task_queue_timeout=0.1))
+        orchestrator.speculation = SpeculationTracker()
+
+        def broken_journal(task, worker_id):
+            orchestrator.running = False
+            raise OSError("disk full")
+
+        orchestrator.journal = SimpleNamespace(task_assigned=broken_journal, task_failed=lambda task: None)
+        orchestrator.worker_loop(SimpleNamespace(worker_id=0))
+
+        assert controller.get_status()["sonnet"]["in_flight"] == 0
+        assert not manager.active_tasks
+        assert manager.failed_tasks["1"].error == "Worker error: disk full"
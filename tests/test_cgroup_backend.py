@@ -0,0 +1,126 @@
+"""Tests for cgroup v2 sandbox enforcement and accounting"""
+
+import sys
+
+import pytest
+
+from claude_orchestrator.cgroup_backend import CgroupBackend
+from claude_orchestrator.sandbox_executor import SecureSandbox, SandboxManager, SandboxPolicy
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+
+
+def fake_hierarchy(tmp_path, controllers="cpuset cpu io memory pids"):
+    """A writable directory tree laid out like a cgroup v2 mount"""
+    root = tmp_path / "cgroup"
+    parent = root / "orchestrator"
+    parent.mkdir(parents=True)
+    (root / "cgroup.controllers").write_text(controllers + "\n")
+    (parent / "cgroup.controllers").write_text(controllers + "\n")
+    # Controllers already delegated to children (a plain file cannot emulate "+memory" writes)
+    (parent / "cgroup.subtree_control").write_text(controllers.replace("cpuset ", "") + "\n")
+    return root, parent
+
+
+class TestCgroupBackend:
+    """Test cases for CgroupBackend"""
+
+    def test_unavailable_without_v2_hierarchy(self, tmp_path):
+        backend = CgroupBackend(parent=str(tmp_path), root=tmp_path)
+
+        assert backend.available is False
+        assert "no cgroup v2 hierarchy" in backend.unavailable_reason
+        assert backend.create("x") is None
+
+    def test_missing_controllers_make_backend_unavailable(self, tmp_path):
+        root, parent = fake_hierarchy(tmp_path, controllers="cpu io")
+
+        backend = CgroupBackend(parent=str(parent), root=root)
+
+        assert backend.available is False
+        assert "memory, pids" in backend.unavailable_reason
+
+    def test_create_writes_limits(self, tmp_path):
+        root, parent = fake_hierarchy(tmp_path)
+        backend = CgroupBackend(parent="orchestrator", root=root)
+
+        cgroup = backend.create("job", memory_max=256 << 20, cpu_cores=1.5, pids_max=5)
+
+        assert backend.controllers == {"cpu", "io", "memory", "pids"}
+        assert (cgroup.path / "memory.max").read_text() == str(256 << 20)
+        assert (cgroup.path / "pids.max").read_text() == "5"
+        assert (cgroup.path / "cpu.max").read_text() == "150000 100000"
+        assert (cgroup.path / "memory.swap.max").read_text() == "0"
+
+    def test_usage_and_events_are_read_from_cgroup_files(self, tmp_path):
+        root, parent = fake_hierarchy(tmp_path)
+        cgroup = CgroupBackend(parent=str(parent), root=root).create("job")
+        (cgroup.path / "cpu.stat").write_text("usage_usec 2500000\nuser_usec 2000000\nsystem_usec 500000\n")
+        (cgroup.path / "memory.peak").write_text(str(64 << 20) + "\n")
+        (cgroup.path / "io.stat").write_text("8:0 rbytes=4096 wbytes=8192 rios=1 wios=2\n"
+                                             "8:16 rbytes=100 wbytes=0 rios=1 wios=0\n")
+        (cgroup.path / "memory.events").write_text("low 0\nhigh 0\nmax 3\noom 1\noom_kill 1\n")
+        (cgroup.path / "pids.events").write_text("max 2\n")
+
+        usage = cgroup.read_usage()
+
+        assert usage == {
+            "accounting": "cgroup",
+            "cpu_time": 2.5,
+            "user_time": 2.0,
+            "system_time": 0.5,
+            "peak_memory_mb": 64.0,
+            "io_read_bytes": 4196,
+            "io_write_bytes": 8192
+        }
+        assert cgroup.events() == {"oom_kill": 1, "pids_max": 2}
+
+
+class TestSandboxAccounting:
+    """Test cases for SecureSandbox resource accounting"""
+
+    def test_rusage_accounting_without_cgroups(self):
+        sandbox = SecureSandbox(SandboxPolicy.PERMISSIVE)
+
+        result = sandbox.execute_command(
+            f"{sys.executable} -c \"x = bytearray(40_000_000); sum(range(3_000_000)); print('ok')\""
+        )
+
+        assert result.success and result.output.strip() == "ok"
+        assert result.resources_used["accounting"] == "rusage"
+        assert result.resources_used["peak_memory_mb"] > 35
+        assert result.resources_used["cpu_time"] > 0
+
+    def test_exit_code_and_timeout_are_preserved(self):
+        sandbox = SecureSandbox(SandboxPolicy.PERMISSIVE)
+
+        assert sandbox.execute_command("exit 3").exit_code == 3
+        result = sandbox.execute_command("sleep 5", timeout=1)
+        assert result.error == "Command timed out after 1 seconds"
+
+    def test_command_runs_in_cgroup_and_reports_its_usage(self, tmp_path):
+        root, parent = fake_hierarchy(tmp_path)
+        manager = SandboxManager(use_cgroups=True, cgroup_parent=str(parent))
+        assert manager.cgroup_backend.parent == parent
+        manager.cgroup_backend = CgroupBackend(parent=str(parent), root=root)
+        created = []
+        real_create = manager.cgroup_backend.create
+
+        def create(name, **limits):
+            cgroup = real_create(name, **limits)
+            (cgroup.path / "cgroup.procs").write_text("")
+            (cgroup.path / "cpu.stat").write_text("usage_usec 1000000\n")
+            (cgroup.path / "memory.events").write_text("oom_kill 1\n")
+            created.append((cgroup, limits))
+            return cgroup
+        manager.cgroup_backend.create = create
+
+        result = manager.execute_in_sandbox("echo hi", policy=SandboxPolicy.STRICT)
+
+        cgroup, limits = created[0]
+        assert limits == {"memory_max": 256 * 1024 * 1024, "cpu_cores": 1.0, "pids_max": 5}
+        # The child wrote itself into cgroup.procs before exec
+        assert (cgroup.path / "cgroup.procs").read_text() == "0"
+        assert result.resources_used["accounting"] == "cgroup"
+        assert result.resources_used["cpu_time"] == 1.0
+        assert any("OOM killed" in v for v in result.security_violations)
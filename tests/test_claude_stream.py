@@ -0,0 +1,156 @@
+"""Tests for streaming Claude CLI execution"""
+
+import sys
+import json
+import time
+import textwrap
+from types import SimpleNamespace
+
+import pytest
+
+from claude_orchestrator.claude_stream import run_streaming, StreamCollector
+from claude_orchestrator.models import WorkerTask, TaskStatus
+from claude_orchestrator.worker import SonnetWorker
+
+
+FAKE_CLI = textwrap.dedent("""
+    import sys, json, time
+
+    mode = sys.argv[1]
+    def emit(event):
+        print(json.dumps(event), flush=True)
+
+    emit({"type": "system", "subtype": "init", "session_id": "sess-1"})
+    for turn in range(3):
+        emit({"type": "assistant", "session_id": "sess-1", "message": {
+            "id": f"msg_{turn}",
+            "content": [{"type": "text", "text": f"step {turn}"},
+                        {"type": "tool_use", "name": "Bash", "input": {}}],
+            "usage": {"input_tokens": 10, "output_tokens": 5}}})
+        time.sleep(0.1)
+    if mode == "hang":
+        time.sleep(30)
+    if mode == "big":
+        for i in range(200):
+            emit({"type": "user", "message": {"content": "x" * 100}})
+    emit({"type": "result", "subtype": "success", "is_error": False,
+          "result": "All done", "session_id": "sess-1", "num_turns": 3,
+          "usage": {"input_tokens": 30, "output_tokens": 15,
+                    "cache_read_input_tokens": 7}})
+""")
+
+
+@pytest.fixture
+def fake_cli(tmp_path):
+    script = tmp_path / "fake_claude.py"
+    script.write_text(FAKE_CLI)
+    return lambda mode="ok": [sys.executable, str(script), mode]
+
+
+class TestRunStreaming:
+    """Test cases for incremental output consumption"""
+
+    def test_progress_is_reported_while_running(self, fake_cli):
+        seen = []
+
+        start = time.perf_counter()
+        result = run_streaming(fake_cli(), on_progress=lambda p: seen.append(
+            (time.perf_counter() - start, p.turns, p.tool_uses, p.tokens_used)))
+
+        assert result.success
+        assert result.output == "All done"
+        assert result.session_id == "sess-1"
+        assert result.usage["tokens_used"] == 45
+        assert result.usage["cache_read_input_tokens"] == 7
+        assert [s[1:] for s in seen[:3]] == [(1, 1, 15), (2, 2, 30), (3, 3, 45)]
+        # The first turn arrives before the run finishes
+        assert seen[0][0] < seen[-1][0] - 0.15
+
+    def test_timeout_keeps_partial_output(self, fake_cli, tmp_path):
+        start = time.perf_counter()
+        result = run_streaming(fake_cli("hang"), timeout=1, spool_dir=str(tmp_path / "spool"),
+                               transcript_name="task_1.jsonl")
+
+        assert time.perf_counter() - start < 10
+        assert result.timed_out
+        assert not result.success
+        assert result.output == "step 0\nstep 1\nstep 2"
+        assert result.session_id == "sess-1"
+        lines = open(result.transcript_path).read().splitlines()
+        assert json.loads(lines[0])["subtype"] == "init"
+
+    def test_large_transcript_is_spooled_to_disk(self, fake_cli, tmp_path):
+        result = run_streaming(fake_cli("big"), spool_dir=str(tmp_path), spool_threshold=4096)
+
+        assert result.success
+        assert result.transcript_path.startswith(str(tmp_path))
+        assert len(open(result.transcript_path).read().splitlines()) == 205
+
+    def test_small_transcript_stays_in_memory(self, fake_cli, tmp_path):
+        result = run_streaming(fake_cli(), spool_dir=str(tmp_path))
+
+        assert result.transcript_path is None
+        assert list(tmp_path.iterdir()) == [tmp_path / "fake_claude.py"]
+
+    def test_plain_text_output(self):
+        collector = StreamCollector()
+        for line in ["hello\n", "{not json\n", "world\n"]:
+            assert not collector.feed(line)
+
+        assert collector.output == "hello\n{not json\nworld\n"
+
+
+class TestWorkerStreaming:
+    """Test cases for SonnetWorker's streaming path"""
+
+    @pytest.fixture
+    def recording_cli(self, tmp_path):
+        """Fake CLI that records its argv and hangs on the first call"""
+        script = tmp_path / "claude"
+        script.write_text(textwrap.dedent(f"""
+            import sys, json, time
+            if sys.argv[1:] == ["--version"]:
+                sys.exit(0)
+            calls = {str(tmp_path / 'calls.jsonl')!r}
+            with open(calls, "a") as f:
+                f.write(json.dumps(sys.argv[1:]) + "\\n")
+            print(json.dumps({{"type": "system", "session_id": "sess-9"}}), flush=True)
+            print(json.dumps({{"type": "assistant", "message": {{"id": "m1",
+                "content": [{{"type": "text", "text": "half way"}}]}}}}), flush=True)
+            if "--resume" not in sys.argv:
+                time.sleep(30)
+            print(json.dumps({{"type": "result", "subtype": "success", "result": "finished",
+                "session_id": "sess-9"}}), flush=True)
+        """))
+        return script
+
+    def test_timeout_then_resume(self, tmp_path, recording_cli):
+        config = SimpleNamespace(
+            claude_command=str(recording_cli), worker_model="sonnet", worker_timeout=1,
+            max_turns=10, claude_flags={}, claude_environment={}, stream_output=True,
+            transcript_dir=str(tmp_path / "transcripts"), use_direct_api=False, max_retries=0
+        )
+        recording_cli.chmod(0o755)
+        recording_cli.write_text("#!" + sys.executable + "\n" + recording_cli.read_text())
+        worker = SonnetWorker(worker_id=0, working_dir=str(tmp_path), config=config)
+        worker.task_master = SimpleNamespace(set_task_status=lambda *a, **k: None,
+                                             update_subtask=lambda *a, **k: None)
+        task = WorkerTask(task_id="5", title="Parser", description="Write the parser")
+
+        worker.process_task(task)
+
+        assert task.status == TaskStatus.FAILED
+        assert "timed out" in task.error
+        assert task.partial_result == "half way"
+        assert task.resume_session_id == "sess-9"
+        assert task.transcript_path.startswith(str(tmp_path / "transcripts"))
+
+        worker.process_task(task)
+
+        assert task.status == TaskStatus.COMPLETED
+        assert task.result == "finished"
+        assert task.resume_session_id is None
+        calls = [json.loads(line) for line in open(tmp_path / "calls.jsonl")]
+        assert "--resume" not in calls[0]
+        assert calls[0][calls[0].index("--output-format") + 1] == "stream-json"
+        assert calls[1][calls[1].index("--resume") + 1] == "sess-9"
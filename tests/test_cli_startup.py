@@ -0,0 +1,86 @@
+"""Startup benchmark for read-only CLI commands
+
+Runs ``co list/show/next`` under ``python -X importtime`` and guards both
+which modules get imported and how long the package imports take.
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time budget for claude_orchestrator modules
+STARTUP_BUDGET_US = int(os.environ.get("CO_STARTUP_BUDGET_MS", "150")) * 1000
+
+# Subsystems that read-only commands must never load
+HEAVY_MODULES = {
+    "claude_orchestrator.main",
+    "claude_orchestrator.config_manager",
+    "claude_orchestrator.orchestrator",
+    "claude_orchestrator.enhanced_progress_display",
+    "claude_orchestrator.task_master_ai",
+    "claude_orchestrator.feedback_storage",
+    "claude_orchestrator.rollback_manager",
+    "claude_orchestrator.test_monitor",
+    "claude_orchestrator.specialized_agents",
+}
+
+
+def _import_times(command, cwd):
+    """Run a CLI command with -X importtime and return {module: cumulative_us}"""
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT))
+    code = f"from claude_orchestrator.cli import main; main({command!r})"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=cwd, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = [part.strip() for part in line.replace("import time:", "").split("|")]
+        times[name] = int(cumulative_us)
+    return times
+
+
+@pytest.fixture
+def project(tmp_path):
+    from claude_orchestrator.task_master import TaskManager
+
+    manager = TaskManager(str(tmp_path))
+    manager.add_task("First task", "Something to do")
+    manager.add_subtask("1", "A subtask", "Part of it")
+    return tmp_path
+
+
+@pytest.mark.parametrize("command", [["list"], ["show", "1"], ["next"]])
+def test_read_only_command_startup(project, command):
+    times = _import_times(command, project)
+
+    loaded_heavy = HEAVY_MODULES & set(times)
+    assert not loaded_heavy, f"'co {command[0]}' imported {sorted(loaded_heavy)}"
+
+    package_us = times.get("claude_orchestrator", 0) + sum(
+        us for name, us in times.items()
+        if name.startswith("claude_orchestrator.") and name.count(".") == 1
+    )
+    assert package_us < STARTUP_BUDGET_US, (
+        f"'co {command[0]}' spent {package_us / 1000:.1f}ms importing claude_orchestrator "
+        f"(budget {STARTUP_BUDGET_US / 1000:.0f}ms)"
+    )
+
+
+def test_package_import_is_lazy():
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT))
+    code = "import sys, claude_orchestrator; print('claude_orchestrator.main' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], env=env,
+                            capture_output=True, text=True, timeout=60)
+
+    assert result.stdout.strip() == "False"
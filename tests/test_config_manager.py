@@ -0,0 +1,101 @@
+"""Tests for compiled EnhancedConfig snapshots"""
+
+import os
+import json
+import time
+import pytest
+
+from claude_orchestrator.config_manager import (
+    ConfigurationManager, EnhancedConfig, ConfigSnapshot
+)
+
+
+class TestEnhancedConfigSnapshot:
+    """Test cases for snapshot-based configuration access"""
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        path = tmp_path / "orchestrator_config.json"
+        path.write_text(json.dumps({
+            "execution": {"max_workers": 5, "task_queue_timeout": 0.01},
+            "claude_cli": {"command": "claude", "flags": {"verbose": True}}
+        }))
+        return path
+
+    @pytest.fixture
+    def config(self, config_file):
+        manager = ConfigurationManager([str(config_file)])
+        manager.load_configuration()
+        config = EnhancedConfig(manager)
+        yield config
+        config.disable_hot_reload()
+
+    def test_values_are_prevalidated(self, config):
+        """Validators run at compile time, not on every read"""
+        assert config.max_workers == 5
+        # Clamped by the validator to its minimum
+        assert config.task_queue_timeout == 0.1
+        assert config.snapshot.task_queue_timeout == 0.1
+
+    def test_snapshot_is_immutable_and_slotted(self, config):
+        snapshot = config.snapshot
+
+        assert isinstance(snapshot, ConfigSnapshot)
+        assert not hasattr(snapshot, "__dict__")
+        with pytest.raises(AttributeError):
+            snapshot.max_workers = 10
+
+    def test_snapshot_does_not_alias_raw_config(self, config):
+        config.snapshot.claude_flags["verbose"] = False
+
+        assert config.get_raw_config()["claude_cli"]["flags"]["verbose"] is True
+
+    def test_refresh_swaps_snapshot(self, config, config_file):
+        old_snapshot = config.snapshot
+        config_file.write_text(json.dumps({"execution": {"max_workers": 7}}))
+
+        config.refresh()
+
+        assert config.max_workers == 7
+        assert old_snapshot.max_workers == 5
+        assert config.version == old_snapshot.version + 1
+
+    def test_overrides_survive_refresh(self, config):
+        config.verbose_logging = True
+        config.refresh()
+
+        assert config.verbose_logging is True
+        assert config.snapshot.verbose_logging is True
+
+    def test_set_value_updates_raw_config(self, config):
+        config.set_value("execution.max_workers", 9)
+
+        assert config.max_workers == 9
+        assert config.get_raw_config()["execution"]["max_workers"] == 9
+
+    def test_invalid_value_falls_back_to_default(self, config):
+        config.set_value("execution.max_workers", "many")
+
+        assert config.max_workers == 3
+
+    def test_hot_reload(self, config, config_file):
+        reloaded = []
+        config.add_reload_callback(reloaded.append)
+        config.enable_hot_reload(interval=0.05)
+
+        stat = config_file.stat()
+        config_file.write_text(json.dumps({"execution": {"max_workers": 11}}))
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        deadline = time.time() + 5
+        while not reloaded and time.time() < deadline:
+            time.sleep(0.05)
+
+        assert reloaded and reloaded[-1].max_workers == 11
+        assert config.max_workers == 11
+
+    def test_reload_does_not_accumulate_loaded_files(self, config):
+        config.refresh()
+        config.refresh()
+
+        assert len(config.config_manager.loaded_files) == 1
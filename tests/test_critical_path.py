@@ -0,0 +1,139 @@
+"""Tests for critical-path task ordering"""
+
+import random
+import statistics
+from types import SimpleNamespace
+
+from claude_orchestrator.critical_path import CriticalPathScheduler, simulate_makespan
+from claude_orchestrator.feedback_model import FeedbackMetrics, create_success_feedback
+from claude_orchestrator.manager import OpusManager, RankedTaskQueue
+from claude_orchestrator.models import WorkerTask
+
+
+def task(task_id, *deps, title=""):
+    return WorkerTask(task_id, title, "", dependencies=list(deps))
+
+
+def scheduler_with(durations):
+    scheduler = CriticalPathScheduler()
+    for task_id, seconds in durations.items():
+        scheduler.record_duration(task_id, seconds)
+    return scheduler
+
+
+def chain_behind_leaves():
+    """Ten independent tasks listed before a five-task chain, all 10 minutes"""
+    tasks = [task(f"leaf{i}") for i in range(10)]
+    tasks += [task("c0")] + [task(f"c{i}", f"c{i - 1}") for i in range(1, 5)]
+    return tasks, {t.task_id: 600.0 for t in tasks}
+
+
+def random_dag(seed, size=60, edge_probability=0.06):
+    rng = random.Random(seed)
+    tasks, durations = [], {}
+    for i in range(size):
+        deps = [str(j) for j in range(i) if rng.random() < edge_probability]
+        tasks.append(task(str(i), *deps))
+        durations[str(i)] = rng.choice([5, 15, 45, 120]) * 60.0
+    return tasks, durations
+
+
+class TestCriticalPathScheduler:
+    """Test cases for CriticalPathScheduler"""
+
+    def test_rank_is_longest_remaining_path_with_fan_out(self):
+        tasks = [task("1"), task("2", "1"), task("3", "1"), task("4", "2"), task("5")]
+        scheduler = scheduler_with({"1": 10, "2": 20, "3": 50, "4": 5, "5": 60})
+
+        ranks = scheduler.plan(tasks)
+
+        assert ranks == {"1": (60.0, 2), "2": (25.0, 1), "3": (50.0, 0),
+                         "4": (5.0, 0), "5": (60.0, 0)}
+        # Equal paths: the task unblocking more work goes first
+        assert sorted(tasks, key=scheduler.rank, reverse=True)[0].task_id == "1"
+
+    def test_estimates_are_calibrated_by_measured_durations(self):
+        scheduler = CriticalPathScheduler()
+        done = task("1", title="Fix typo")
+        pending = [task("2", title="Refactor the database integration")]
+        scheduler.plan([done])
+        scheduler.record_duration("1", scheduler.estimate(done) * 2)
+
+        ranks = scheduler.plan(pending)
+
+        assert ranks["2"][0] == scheduler.estimate(pending[0]) * 2
+        assert scheduler.estimate(pending[0]) > scheduler.estimate(done)
+
+    def test_history_is_loaded_from_success_feedback(self):
+        feedback = [
+            create_success_feedback("1", "done", FeedbackMetrics(execution_time=30.0)),
+            create_success_feedback("1", "done", FeedbackMetrics(execution_time=90.0)),
+            create_success_feedback("2", "done"),
+        ]
+        storage = SimpleNamespace(query=lambda **kwargs: feedback)
+        scheduler = CriticalPathScheduler()
+
+        assert scheduler.load_history(storage) == 1
+        assert scheduler.history == {"1": 30.0}
+
+    def test_dependency_cycle_does_not_hang(self):
+        scheduler = scheduler_with({"1": 10, "2": 20, "3": 5})
+        ranks = scheduler.plan([task("1", "2"), task("2", "1"), task("3", "1")])
+        assert ranks["3"] == (5.0, 0)
+        assert ranks["1"] == (10.0, 2)
+
+
+class TestRankedTaskQueue:
+    """Test cases for the manager's ranked task queue"""
+
+    def test_queue_hands_out_highest_rank_first(self):
+        ranks = {"a": 1, "b": 3, "c": 3, "d": 2}
+        task_queue = RankedTaskQueue(lambda t: ranks[t.task_id])
+        for task_id in "abcd":
+            task_queue.put(task(task_id))
+        assert [task_queue.get_nowait().task_id for _ in range(4)] == ["b", "c", "d", "a"]
+
+    def test_manager_orders_queue_by_plan(self):
+        manager = OpusManager(SimpleNamespace(max_workers=2, worker_model="sonnet"))
+        for task_id in ("leaf", "head", "tail"):
+            manager.scheduler.record_duration(task_id, 600)
+        manager.delegate_task(task("leaf"))
+        manager.delegate_task(task("head"))
+
+        manager.scheduler.plan([task("leaf"), task("head"), task("tail", "head")])
+        manager.task_queue.reorder()
+
+        assert manager.task_queue.get_nowait().task_id == "head"
+
+    def test_fifo_ordering(self):
+        manager = OpusManager(SimpleNamespace(max_workers=2, task_ordering="fifo"))
+        assert manager.scheduler is None
+        manager.delegate_task(task("1"))
+        manager.delegate_task(task("2"))
+        assert manager.task_queue.get_nowait().task_id == "1"
+
+
+class TestMakespanSimulation:
+    """Benchmark of critical-path ordering against FIFO on synthetic DAGs"""
+
+    def test_long_chain_starts_before_leaves(self):
+        tasks, durations = chain_behind_leaves()
+        scheduler = scheduler_with(durations)
+        scheduler.plan(tasks)
+
+        assert simulate_makespan(tasks, durations, workers=2) == 6000.0
+        assert simulate_makespan(tasks, durations, workers=2, rank=scheduler.rank) == 4800.0
+
+    def test_random_dags_finish_sooner(self):
+        for workers, expected_gain in ((3, 0.03), (6, 0.08)):
+            ratios = []
+            for seed in range(50):
+                tasks, durations = random_dag(seed)
+                scheduler = scheduler_with(durations)
+                scheduler.plan(tasks)
+                fifo = simulate_makespan(tasks, durations, workers)
+                ranked = simulate_makespan(tasks, durations, workers, rank=scheduler.rank)
+                ratios.append(ranked / fifo)
+
+            assert max(ratios) <= 1.0
+            assert statistics.mean(ratios) < 1.0 - expected_gain
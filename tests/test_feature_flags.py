@@ -0,0 +1,77 @@
+"""Tests for the versioned feature flag table"""
+
+import os
+import json
+import pytest
+
+from claude_orchestrator.feature_flags import FeatureFlagManager, rollout_bucket
+
+
+class TestFeatureFlagManager:
+    """Test cases for FeatureFlagManager"""
+
+    @pytest.fixture
+    def flags_file(self, tmp_path):
+        path = tmp_path / "feature_flags.json"
+        path.write_text(json.dumps({"flags": [
+            {"name": "parallel", "enabled": True},
+            {"name": "canary", "enabled": True, "rollout_percentage": 30}
+        ]}))
+        return path
+
+    @pytest.fixture
+    def manager(self, flags_file):
+        return FeatureFlagManager(str(flags_file), check_interval=0)
+
+    def _touch_external(self, path, flags):
+        stat = path.stat()
+        path.write_text(json.dumps({"flags": flags}))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def test_update_bumps_version_without_mutating_published_flag(self, manager):
+        old_flag = manager.storage.get_flag("parallel")
+        version = manager.version
+
+        manager.update_flag("parallel", enabled=False)
+
+        assert manager.version == version + 1
+        assert old_flag.enabled is True
+        assert manager.is_enabled("parallel") is False
+
+    def test_own_writes_do_not_trigger_reload(self, manager):
+        manager.create_flag("new_flag", enabled=True)
+        version = manager.version
+
+        assert manager.storage.maybe_reload() is False
+        assert manager.version == version
+
+    def test_external_change_is_picked_up(self, manager, flags_file):
+        self._touch_external(flags_file, [{"name": "parallel", "enabled": False}])
+
+        assert manager.is_enabled("parallel") is False
+        assert manager.storage.get_flag("canary") is None
+
+    def test_cached_flag_revalidates_on_version_change(self, manager, flags_file):
+        parallel = manager.cached("parallel")
+        assert parallel
+
+        self._touch_external(flags_file, [{"name": "parallel", "enabled": False}])
+
+        assert not parallel
+
+    def test_percentage_rollout_is_deterministic(self, manager):
+        keys = [f"task-{i}" for i in range(1000)]
+        enabled = [k for k in keys if manager.is_enabled("canary", key=k)]
+
+        assert enabled == [k for k in keys if manager.is_enabled("canary", key=k)]
+        assert all(rollout_bucket("canary", k) < 30 for k in enabled)
+        assert 200 < len(enabled) < 400
+        # Partial rollouts are off when no id is supplied
+        assert manager.is_enabled("canary") is False
+
+    def test_rollout_percentage_round_trips(self, manager, flags_file):
+        manager.update_flag("canary", rollout_percentage=50)
+
+        reloaded = FeatureFlagManager(str(flags_file))
+
+        assert reloaded.storage.get_flag("canary").rollout_percentage == 50
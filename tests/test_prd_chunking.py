@@ -0,0 +1,157 @@
+"""Tests for chunked PRD parsing"""
+
+import json
+import threading
+import time
+
+from claude_orchestrator.prd_chunking import split_prd, extract_json_array, merge_section_tasks
+from claude_orchestrator.task_master import TaskManager
+from claude_orchestrator.task_master_ai import TaskMasterAI
+
+
+def make_prd(sections=4, size=300):
+    parts = ["# Shop\n\nAn online shop.\n\n"]
+    for i in range(sections):
+        parts.append(f"## Feature {i}\n\n" + ("Requirement text. " * (size // 18)) + "\n\n")
+    return "".join(parts)
+
+
+class TestSplitPrd:
+    """Test cases for split_prd"""
+
+    def test_sections_split_at_headings_and_pack_to_limit(self):
+        preamble, sections = split_prd(make_prd(sections=4, size=300), max_chars=650)
+
+        assert preamble == ""
+        assert [s.headings for s in sections] == [["Shop", "Feature 0", "Feature 1"], ["Feature 2", "Feature 3"]]
+        assert all(len(s.text) <= 650 for s in sections)
+
+    def test_preamble_and_code_blocks(self):
+        prd = "Intro text\n\n## A\n```\n## not a heading\n```\n## B\nbody\n"
+        preamble, sections = split_prd(prd, max_chars=10)
+
+        assert preamble == "Intro text"
+        assert [s.headings for s in sections] == [["A"], ["B"]]
+        assert "## not a heading" in sections[0].text
+
+    def test_fenced_comment_does_not_change_split_level(self):
+        prd = ("# Product\n\n## A\n```bash\n# install deps\npip install .\n```\n\n"
+               "## B\nbody\n\n## C\nbody\n")
+        _, sections = split_prd(prd, max_chars=60)
+
+        assert [s.headings for s in sections] == [["Product", "A"], ["B", "C"]]
+        assert "# install deps" in sections[0].text
+
+    def test_oversized_section_is_cut_at_paragraphs(self):
+        prd = "## Big\n\n" + "\n\n".join("p" * 80 for _ in range(5)) + "\n## Small\nx\n"
+        _, sections = split_prd(prd, max_chars=200)
+
+        assert len(sections) > 2
+        assert all(len(s.text) <= 200 for s in sections)
+
+
+class TestMergeSectionTasks:
+    """Test cases for extract_json_array and merge_section_tasks"""
+
+    def test_first_task_array_is_extracted(self):
+        text = 'Here [see below]:\n[{"title": "A"}]\nAlternatives: [{"title": "B"}]'
+
+        assert extract_json_array(text) == [{"title": "A"}]
+        assert extract_json_array("no json") is None
+
+    def test_duplicates_merge_and_cross_section_titles_resolve(self):
+        merged = merge_section_tasks([
+            [{"title": "Set up database", "priority": "medium"},
+             {"title": "User model", "dependencies": [1]}],
+            [{"title": "Set up the database!", "priority": "high", "details": "Postgres"},
+             {"title": "Checkout", "dependencies": ["User model", 1, "Unknown task"]}],
+        ])
+
+        assert [t["title"] for t in merged] == ["Set up database", "User model", "Checkout"]
+        assert merged[0]["priority"] == "high"
+        assert merged[0]["details"] == "Postgres"
+        assert merged[2]["dependencies"] == [2, 1]
+
+    def test_cycles_and_self_references_are_dropped(self):
+        merged = merge_section_tasks([[
+            {"title": "A", "dependencies": [2, 1]},
+            {"title": "B", "dependencies": [1]},
+        ]])
+
+        assert merged[0]["dependencies"] == [2]
+        assert merged[1]["dependencies"] == []
+
+
+class FakeClaude:
+    """Answers each section prompt with two tasks"""
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, prompt, model=None, timeout=None):
+        with self.lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            number = prompt.split("This is section ")[1].split(" ")[0]
+            tasks = [
+                {"title": f"Build feature {number}",
+                 "dependencies": [] if number == "1" else ["Build feature 1"]},
+                {"title": "Set up project", "priority": "high"},
+            ]
+            return {'success': True, 'response': "Tasks:\n" + json.dumps(tasks) + "\nDone [ok]"}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TestParsePrd:
+    """Test cases for TaskMasterAI.parse_prd"""
+
+    def test_large_prd_is_parsed_in_parallel_and_saved_once(self, tmp_path, monkeypatch):
+        manager = TaskManager(str(tmp_path))
+        ai = TaskMasterAI(manager)
+        fake = FakeClaude()
+        monkeypatch.setattr(ai, "_execute_claude", fake)
+        writes = []
+        real_write = manager.store._write
+        monkeypatch.setattr(manager.store, "_write", lambda: writes.append(1) or real_write())
+
+        start = time.perf_counter()
+        tasks = ai.parse_prd(make_prd(sections=4, size=300), max_workers=4, chunk_chars=400)
+        elapsed = time.perf_counter() - start
+
+        assert len(fake.prompts) == 4
+        assert fake.peak == 4
+        assert elapsed < 4 * 0.2
+        assert writes == [1]
+        titles = [t.title for t in tasks]
+        assert titles.count("Set up project") == 1
+        by_title = {t.title: t for t in tasks}
+        first = by_title["Build feature 1"].id
+        assert by_title["Build feature 3"].dependencies == [first]
+        assert len(TaskManager(str(tmp_path)).get_all_tasks()) == 5
+
+    def test_small_prd_uses_single_request(self, tmp_path, monkeypatch):
+        manager = TaskManager(str(tmp_path))
+        ai = TaskMasterAI(manager)
+        calls = []
+
+        def fake(prompt, model=None, timeout=None):
+            calls.append(prompt)
+            return {'success': True, 'response': json.dumps([
+                {"title": "B", "dependencies": [2]}, {"title": "A"}
+            ])}
+        monkeypatch.setattr(ai, "_execute_claude", fake)
+
+        tasks = ai.parse_prd("Build a thing", auto_add=True)
+
+        assert len(calls) == 1
+        # Forward references resolve once every task has an id
+        assert tasks[0].dependencies == [tasks[1].id]
@@ -0,0 +1,107 @@
+"""Tests for the shared sandbox process monitor"""
+
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from claude_orchestrator.process_monitor import ProcessMonitor
+from claude_orchestrator.sandbox_executor import SecureSandbox, SandboxPolicy, SecurityMonitor
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX process monitoring")
+
+
+@pytest.fixture
+def monitor():
+    monitor = ProcessMonitor(min_interval=0.05, max_interval=0.2, expensive_interval=0.5, kill_grace=0.2)
+    yield monitor
+    monitor.stop()
+
+
+def spawn(code):
+    return subprocess.Popen([sys.executable, "-c", code])
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestProcessMonitor:
+    """Test cases for ProcessMonitor"""
+
+    def test_many_processes_share_one_thread(self, monitor):
+        before = threading.active_count()
+        procs = [spawn("import time; time.sleep(0.5)") for _ in range(5)]
+        exited = []
+        for proc in procs:
+            monitor.watch(proc.pid, on_exit=exited.append)
+
+        assert threading.active_count() == before + 1
+        for proc in procs:
+            proc.wait()
+        assert wait_for(lambda: len(exited) == 5)
+        assert len(monitor) == 0
+
+    def test_memory_limit_terminates_process(self, monitor):
+        proc = spawn("import time; x = bytearray(120 * 1024 * 1024); time.sleep(30)")
+        violations = []
+        monitor.watch(proc.pid, max_memory=60 * 1024 * 1024, on_violation=violations.append)
+
+        proc.wait(timeout=10)
+
+        assert violations and violations[0].startswith("Memory limit exceeded")
+        assert proc.returncode != 0
+
+    def test_socket_terminates_process_when_network_not_allowed(self, monitor):
+        proc = spawn("import socket, time; s = socket.socket(); s.bind(('127.0.0.1', 0)); s.listen(); time.sleep(30)")
+        violations = []
+        monitor.watch(proc.pid, network_allowed=False, on_violation=violations.append)
+
+        proc.wait(timeout=10)
+
+        assert "Unauthorized network connection attempted" in violations
+
+    def test_expensive_checks_run_less_often(self, monitor):
+        proc = spawn("import time; time.sleep(1.2)")
+        watched = monitor.watch(proc.pid, max_memory=1 << 30, max_open_files=100, network_allowed=False)
+
+        proc.wait()
+
+        assert watched.samples["cheap"] > watched.samples["expensive"] >= 1
+        assert watched.samples["expensive"] <= 4
+        assert watched.peak_rss > 0
+
+
+class TestSandboxMonitoring:
+    """Test cases for SecureSandbox on the shared monitor"""
+
+    def test_execute_command_reports_resources_without_own_thread(self):
+        sandbox = SecureSandbox(SandboxPolicy.PERMISSIVE)
+        before = threading.active_count()
+
+        result = sandbox.execute_command(f"exec {sys.executable} -c \"x = bytearray(30_000_000); import time; time.sleep(0.4)\"")
+
+        assert result.success
+        assert result.resources_used["peak_memory_mb"] > 20
+        # At most the shared monitor thread was started
+        assert threading.active_count() <= before + 1
+
+    def test_security_monitor_stops_watching(self, monitor):
+        proc = spawn("import time; time.sleep(5)")
+        security = SecurityMonitor(SandboxPolicy.MODERATE, SecureSandbox(SandboxPolicy.MODERATE).limits,
+                                   process_monitor=monitor)
+        security.start_monitoring(proc.pid)
+        assert len(monitor) == 1
+
+        security.stop_monitoring()
+        proc.kill()
+        proc.wait()
+
+        assert len(monitor) == 0
@@ -0,0 +1,122 @@
+"""Tests for diff-based rendering in EnhancedProgressDisplay"""
+
+import io
+import sys
+import time
+import logging
+import threading
+
+from claude_orchestrator.enhanced_progress_display import EnhancedProgressDisplay, WorkerState
+
+
+def make_display(monkeypatch, is_tty=True, **kwargs):
+    out = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", out)
+    display = EnhancedProgressDisplay(total_tasks=10, **kwargs)
+    display.is_tty = is_tty
+    display.terminal_width = 100
+    # Fixed header so the elapsed-time clock can't change between frames
+    display._render_header = lambda: "🤖 Claude Orchestrator"
+    for i in range(3):
+        display.register_worker(str(i))
+    return display, out
+
+
+class TestDiffRendering:
+    """Test cases for incremental frame output"""
+
+    def test_unchanged_frame_writes_nothing(self, monkeypatch):
+        display, out = make_display(monkeypatch)
+        display.render()
+        first = out.getvalue()
+        assert "👷 Workers:" in first
+
+        display.render()
+
+        assert out.getvalue() == first
+
+    def test_only_changed_lines_are_rewritten(self, monkeypatch):
+        display, out = make_display(monkeypatch)
+        display.render()
+        out.seek(0)
+        out.truncate()
+
+        display.update_worker("1", WorkerState.REVIEWING, "7", "Review parser")
+        display.render()
+
+        frame = out.getvalue()
+        assert frame.startswith(f"\033[{len(display._previous_lines)}A")
+        assert frame.count("\033[2K") == 1
+        assert "Review parser" in frame
+
+    def test_shorter_frame_blanks_leftover_rows(self, monkeypatch):
+        display, out = make_display(monkeypatch)
+        display.add_message("hello")
+        display.render()
+        tall = len(display._previous_lines)
+        out.seek(0)
+        out.truncate()
+
+        display.messages.clear()
+        display.render()
+
+        short = len(display._previous_lines)
+        assert short < tall
+        assert out.getvalue().endswith(f"\033[{tall - short}A")
+
+    def test_workers_do_not_wait_for_rendering(self, monkeypatch):
+        display, out = make_display(monkeypatch)
+        display.update_worker("0", WorkerState.WORKING, "1", "Task")
+        release = threading.Event()
+        real_build = display.build_lines
+
+        def slow_build():
+            release.wait(5)
+            return real_build()
+
+        display.build_lines = slow_build
+        renderer = threading.Thread(target=display.render)
+        renderer.start()
+        try:
+            start = time.perf_counter()
+            for i in range(100):
+                display.update_worker("0", WorkerState.WORKING, "1", "Task", (i, 100))
+                display.task_started()
+                display.add_message(f"step {i}")
+            assert time.perf_counter() - start < 1
+        finally:
+            release.set()
+            renderer.join()
+
+        assert display.workers["0"].progress == (99, 100)
+
+    def test_render_thread_draws_frames(self, monkeypatch):
+        display, out = make_display(monkeypatch, fps=50)
+        display.start()
+        try:
+            deadline = time.time() + 5
+            while not out.getvalue() and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            display.stop()
+
+        assert not display.running
+        assert "📊 Overall Progress" in out.getvalue()
+
+
+class TestNonTtyMode:
+    """Test cases for periodic summaries when stdout is not a terminal"""
+
+    def test_logs_summary_instead_of_drawing(self, monkeypatch, caplog):
+        display, out = make_display(monkeypatch, is_tty=False, summary_interval=0)
+        display.update_worker("0", WorkerState.WORKING, "1", "Task")
+        display.task_completed()
+
+        with caplog.at_level(logging.INFO, logger="claude_orchestrator.enhanced_progress_display"):
+            display.render()
+            display.render()
+
+        assert out.getvalue() == ""
+        summaries = [r.message for r in caplog.records]
+        # Unchanged state is not logged twice
+        assert summaries == ["Progress: 1/10 completed, 0 active, 0 failed, 1/3 workers busy"]
@@ -0,0 +1,111 @@
+"""Tests for the warm pytest worker pool"""
+
+import os
+import time
+import pytest
+
+from claude_orchestrator import pytest_worker_pool
+from claude_orchestrator.continuous_test_monitor import ContinuousTestMonitor
+from claude_orchestrator.pytest_worker_pool import PytestWorkerPool
+from claude_orchestrator.test_result_store import parse_junit_xml
+
+
+pytestmark = pytest.mark.skipif(
+    not pytest_worker_pool.is_supported(), reason="warm workers require fork()"
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with a preloadable helper module and a test using it"""
+    (tmp_path / "helper.py").write_text("VALUE = 1\n")
+    (tmp_path / "test_sample.py").write_text(
+        "import helper\n\n"
+        "def test_value():\n    assert helper.VALUE == 1\n"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def pool(project):
+    pool = PytestWorkerPool(
+        size=1,
+        preload_modules=["pytest", "helper"],
+        project_root=str(project),
+        max_runs=3
+    )
+    pool.start(wait=True)
+    yield pool
+    pool.shutdown()
+
+
+def _run(pool, project, name="report.xml"):
+    xml_path = str(project / name)
+    result = pool.run([str(project / "test_sample.py"), f"--junitxml={xml_path}",
+                       "-p", "no:cacheprovider", "-q"], timeout=60)
+    return result, parse_junit_xml(xml_path, "test_sample.py")
+
+
+class TestPytestWorkerPool:
+    """Test cases for PytestWorkerPool"""
+
+    def test_runs_tests_on_warm_worker(self, pool, project):
+        result, cases = _run(pool, project)
+
+        assert result.returncode == 0
+        assert [c["status"] for c in cases] == ["passed"]
+        assert pool.stats["runs"] == 1
+
+    def test_edited_test_file_is_reimported(self, pool, project):
+        """Forked runs never reuse test modules from a previous run"""
+        _run(pool, project)
+        (project / "test_sample.py").write_text("def test_value():\n    assert False\n")
+
+        result, cases = _run(pool, project, "second.xml")
+
+        assert result.returncode == 1
+        assert [c["status"] for c in cases] == ["failed"]
+
+    def test_worker_recycled_when_preloaded_module_changes(self, pool, project):
+        result, _ = _run(pool, project)
+        first_worker = result.worker_id
+
+        helper = project / "helper.py"
+        stat = helper.stat()
+        helper.write_text("VALUE = 2\n")
+        os.utime(helper, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        result, cases = _run(pool, project, "second.xml")
+
+        assert result.worker_id != first_worker
+        assert [c["status"] for c in cases] == ["failed"]
+        assert pool.stats["workers_recycled"] >= 1
+
+    def test_worker_recycled_after_max_runs(self, pool, project):
+        worker_ids = {_run(pool, project, f"r{i}.xml")[0].worker_id for i in range(4)}
+
+        assert len(worker_ids) == 2
+
+    def test_timeout_kills_run(self, project):
+        (project / "test_slow.py").write_text(
+            "import time\n\ndef test_slow():\n    time.sleep(30)\n"
+        )
+        pool = PytestWorkerPool(size=1, project_root=str(project))
+        pool.start(wait=True)
+        try:
+            start = time.time()
+            result = pool.run([str(project / "test_slow.py"), "-q"], timeout=1)
+            assert result.timed_out
+            assert time.time() - start < 10
+        finally:
+            pool.shutdown()
+
+    def test_monitor_preloads_modules_imported_by_tests(self, project):
+        monitor = ContinuousTestMonitor({
+            "test_dir": str(project),
+            "result_dir": str(project / ".results"),
+            "project_root": str(project),
+            "warm_pool_size": 1
+        })
+
+        assert monitor.warm_pool.preload_modules == ["pytest", "helper"]
@@ -0,0 +1,113 @@
+"""Tests for the persistent research cache"""
+
+import time
+
+import pytest
+
+from claude_orchestrator.research_cache import ResearchCache, make_key
+from claude_orchestrator.task_master import TaskManager
+from claude_orchestrator.task_master_ai import TaskMasterAI
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = TaskManager(str(tmp_path))
+    manager.add_task("Add caching", "Cache API responses", details="Use Redis")
+    return manager
+
+
+class FakeClaude:
+    """Stands in for TaskMasterAI._execute_claude"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, prompt, model=None, timeout=None):
+        self.calls += 1
+        return {'success': True, 'response': f"answer {self.calls}"}
+
+
+def make_ai(manager, monkeypatch):
+    ai = TaskMasterAI(manager)
+    fake = FakeClaude()
+    monkeypatch.setattr(ai, "_execute_claude", fake)
+    return ai, fake
+
+
+class TestPerformResearch:
+    """Test cases for cached TaskMasterAI.perform_research"""
+
+    def test_repeat_query_is_served_from_disk(self, manager, monkeypatch):
+        ai, fake = make_ai(manager, monkeypatch)
+        first = ai.perform_research("How to cache?", task_ids=["1"])
+
+        # A fresh instance (new process) reuses the stored answer
+        ai2, fake2 = make_ai(TaskManager(str(manager.project_root)), monkeypatch)
+        second = ai2.perform_research("  how TO cache? ", task_ids=["1"])
+
+        assert first['cached'] is False
+        assert second['cached'] is True
+        assert second['research'] == first['research']
+        assert fake2.calls == 0
+
+    def test_different_task_context_misses(self, manager, monkeypatch):
+        manager.add_task("Add caching", "Cache API responses", details="Use memcached")
+        ai, fake = make_ai(manager, monkeypatch)
+        ai.perform_research("How to cache?", task_ids=["1"])
+
+        result = ai.perform_research("How to cache?", task_ids=["2"])
+
+        assert result['cached'] is False
+        assert fake.calls == 2
+
+    def test_file_change_invalidates_entry(self, manager, monkeypatch, tmp_path):
+        source = tmp_path / "cache.py"
+        source.write_text("CACHE = {}\n")
+        ai, fake = make_ai(manager, monkeypatch)
+        ai.perform_research("Review cache", file_paths=[str(source)])
+        assert ai.perform_research("Review cache", file_paths=[str(source)])['cached'] is True
+
+        source.write_text("CACHE = LRU()\n")
+        result = ai.perform_research("Review cache", file_paths=[str(source)])
+
+        assert result['cached'] is False
+        assert ai.research_cache.stats['invalidated'] == 1
+        assert len(ai.research_cache) == 1
+
+    def test_use_cache_false_bypasses_cache(self, manager, monkeypatch):
+        ai, fake = make_ai(manager, monkeypatch)
+        ai.perform_research("How to cache?")
+        result = ai.perform_research("How to cache?", use_cache=False)
+
+        assert result['cached'] is False
+        assert fake.calls == 2
+
+
+class TestResearchCache:
+    """Test cases for ResearchCache expiry and eviction"""
+
+    def test_expired_entries_miss(self, tmp_path, monkeypatch):
+        cache = ResearchCache(tmp_path / "cache.db", ttl=60)
+        key = make_key("q")
+        cache.put(key, "q", "answer")
+        assert cache.get(key) == "answer"
+
+        real_time = time.time
+        monkeypatch.setattr(time, "time", lambda: real_time() + 61)
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = ResearchCache(tmp_path / "cache.db", max_entries=2)
+        keys = [make_key(f"q{i}") for i in range(3)]
+        cache.put(keys[0], "q0", "a0", [("/a.py", "f1")])
+        time.sleep(0.01)
+        cache.put(keys[1], "q1", "a1")
+        time.sleep(0.01)
+        cache.get(keys[0])
+        time.sleep(0.01)
+        cache.put(keys[2], "q2", "a2")
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == "a0"
+        assert cache.stats['evicted'] == 1
@@ -0,0 +1,124 @@
+"""Tests for the run journal behind co run --resume"""
+
+import queue
+from types import SimpleNamespace
+
+from claude_orchestrator.models import TaskStatus, WorkerTask
+from claude_orchestrator.orchestrator import ClaudeOrchestrator
+from claude_orchestrator.run_journal import RunJournal
+from claude_orchestrator.speculation import SpeculationTracker
+
+
+def completed(task_id, result="done"):
+    return WorkerTask(task_id, f"Task {task_id}", "", status=TaskStatus.COMPLETED, result=result)
+
+
+def interrupted_run(path):
+    """Journal of a run killed while task 3 was running"""
+    journal = RunJournal(path)
+    journal.start()
+    for task_id in ("1", "2", "3", "4"):
+        journal.task_assigned(WorkerTask(task_id, "", ""), 0)
+    journal.task_completed(completed("1"))
+    journal.review_done("1")
+    journal.task_completed(completed("2", result="output of 2"))
+    journal.task_failed(WorkerTask("4", "", "", status=TaskStatus.FAILED, error="boom"))
+    journal.close()
+    return journal
+
+
+class TestRunJournal:
+    """Test cases for RunJournal"""
+
+    def test_replay_restores_run_state(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        journal = interrupted_run(path)
+
+        state = RunJournal.replay(path)
+
+        assert state.run_id == journal.run_id
+        assert state.resumable
+        assert set(state.completed) == {"1", "2"}
+        assert list(state.pending_reviews) == ["2"]
+        assert state.pending_reviews["2"].result == "output of 2"
+        assert state.pending_reviews["2"].status == TaskStatus.COMPLETED
+        assert list(state.in_progress) == ["3"]
+        assert state.failed == {"4": "boom"}
+
+    def test_torn_last_line_is_ignored(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        interrupted_run(path)
+        with open(path, "a") as f:
+            f.write('{"e":"completed","task":{"task_id":"3"')
+
+        state = RunJournal.replay(path)
+        assert set(state.completed) == {"1", "2"}
+        assert "3" in state.in_progress
+
+    def test_finished_run_is_not_resumable(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        journal = RunJournal(path)
+        journal.start()
+        journal.close(finished=True)
+
+        assert not RunJournal.replay(path).resumable
+        assert not RunJournal.replay(tmp_path / "missing.jsonl").resumable
+
+    def test_resumed_journal_is_compacted(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        interrupted_run(path)
+        state = RunJournal.replay(path)
+
+        journal = RunJournal(path)
+        journal.start(state)
+        journal.close()
+        resumed = RunJournal.replay(path)
+
+        assert resumed.run_id == journal.run_id
+        assert set(resumed.completed) == {"1", "2"}
+        assert list(resumed.pending_reviews) == ["2"]
+        assert not resumed.in_progress and not resumed.failed
+        assert resumed.events < state.events
+
+
+class TestOrchestratorResume:
+    """Test cases for restoring an interrupted run in ClaudeOrchestrator"""
+
+    def make_orchestrator(self, path, resume):
+        orchestrator = ClaudeOrchestrator.__new__(ClaudeOrchestrator)
+        orchestrator.resume = resume
+        orchestrator.journal = RunJournal(path)
+        orchestrator.review_queue = queue.Queue()
+        orchestrator.speculation = SpeculationTracker()
+        orchestrator.marked_done = []
+        orchestrator.manager = SimpleNamespace(
+            completed_tasks={},
+            task_master=SimpleNamespace(complete_task=orchestrator.marked_done.append)
+        )
+        return orchestrator
+
+    def test_resume_skips_finished_work_and_restores_reviews(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        interrupted_run(path)
+        orchestrator = self.make_orchestrator(path, resume=True)
+        # Task 2 was journaled as completed but tasks.json still says pending
+        planned = [WorkerTask(task_id, "", "") for task_id in ("2", "3", "4", "5")]
+
+        remaining = orchestrator._start_journal(planned)
+
+        assert [t.task_id for t in remaining] == ["3", "4", "5"]
+        assert set(orchestrator.manager.completed_tasks) == {"1", "2"}
+        assert orchestrator.marked_done == ["2"]
+        assert orchestrator.review_queue.get_nowait().result == "output of 2"
+        assert orchestrator.review_queue.empty()
+
+    def test_run_without_resume_starts_a_new_journal(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        interrupted_run(path)
+        orchestrator = self.make_orchestrator(path, resume=False)
+        planned = [WorkerTask("2", "", "")]
+
+        assert orchestrator._start_journal(planned) == planned
+        orchestrator.journal.close()
+        assert not orchestrator.manager.completed_tasks
+        assert not RunJournal.replay(path).completed
@@ -0,0 +1,183 @@
+"""Tests for the persistent session worker pool"""
+
+import os
+import time
+import asyncio
+
+from claude_orchestrator.session_worker_pool import SessionWorkerPool
+
+
+HANDLERS = "tests.test_session_worker_pool"
+_hoard = []
+
+
+def echo_handler(task, worker_id, progress):
+    # Stray prints must not corrupt the protocol pipe
+    print("noise from the task")
+    for step in range(3):
+        progress(f"step {step}")
+    return {"task_id": task["id"], "worker_id": worker_id, "pid": os.getpid()}
+
+
+def hoarding_handler(task, worker_id, progress):
+    _hoard.append(bytearray(32 * 1024 * 1024))
+    return {"pid": os.getpid()}
+
+
+def sleeping_handler(task, worker_id, progress):
+    time.sleep(task.get("sleep", 0))
+    return {"pid": os.getpid()}
+
+
+def failing_handler(task, worker_id, progress):
+    raise ValueError("boom")
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestSessionWorkerPool:
+    """Test cases for SessionWorkerPool"""
+
+    def test_streams_progress_and_reuses_worker(self):
+        async def scenario():
+            pool = SessionWorkerPool(size=1, handler=f"{HANDLERS}:echo_handler")
+            progress = []
+            try:
+                first = await pool.run_task({"id": "1"}, "worker_a", on_progress=progress.append)
+                second = await pool.run_task({"id": "2"}, "worker_b")
+            finally:
+                await pool.shutdown()
+            return first, second, progress
+
+        first, second, progress = _run(scenario())
+
+        assert first.result["task_id"] == "1"
+        assert progress == ["step 0", "step 1", "step 2"]
+        assert first.result["pid"] == second.result["pid"]
+
+    def test_worker_recycled_after_max_tasks(self):
+        async def scenario():
+            pool = SessionWorkerPool(size=1, handler=f"{HANDLERS}:echo_handler", max_tasks=2)
+            try:
+                outcomes = [await pool.run_task({"id": str(i)}, "w") for i in range(3)]
+            finally:
+                await pool.shutdown()
+            return outcomes, pool.stats
+
+        outcomes, stats = _run(scenario())
+        pids = [o.result["pid"] for o in outcomes]
+
+        assert pids[0] == pids[1] != pids[2]
+        assert stats["workers_recycled"] == 1
+
+    def test_worker_recycled_on_memory_growth(self):
+        async def scenario():
+            pool = SessionWorkerPool(size=1, handler=f"{HANDLERS}:hoarding_handler",
+                                     max_memory_growth_mb=16)
+            try:
+                return [await pool.run_task({"id": str(i)}, "w") for i in range(2)]
+            finally:
+                await pool.shutdown()
+
+        first, second = _run(scenario())
+
+        assert first.result["pid"] != second.result["pid"]
+
+    def test_timeout_kills_and_replaces_worker(self):
+        async def scenario():
+            pool = SessionWorkerPool(size=1, handler=f"{HANDLERS}:sleeping_handler")
+            try:
+                start = time.time()
+                slow = await pool.run_task({"id": "1", "sleep": 30}, "w", timeout=1)
+                elapsed = time.time() - start
+                fast = await pool.run_task({"id": "2"}, "w", timeout=30)
+            finally:
+                await pool.shutdown()
+            return slow, elapsed, fast
+
+        slow, elapsed, fast = _run(scenario())
+
+        assert slow.timed_out and slow.result is None
+        assert elapsed < 10
+        assert fast.result["pid"] != slow.worker_pid
+
+    def test_handler_error_is_reported(self):
+        async def scenario():
+            pool = SessionWorkerPool(size=1, handler=f"{HANDLERS}:failing_handler")
+            try:
+                return await pool.run_task({"id": "1"}, "w")
+            finally:
+                await pool.shutdown()
+
+        outcome = _run(scenario())
+
+        assert outcome.result is None
+        assert "boom" in outcome.error
+
+    def test_failed_replacement_fails_fast(self):
+        async def scenario():
+            pool = SessionWorkerPool(size=1, handler=f"{HANDLERS}:echo_handler",
+                                     max_tasks=1, spawn_retries=1, spawn_backoff=0.01)
+            try:
+                first = await pool.run_task({"id": "1"}, "w")
+
+                async def broken_spawn():
+                    raise RuntimeError("cannot start")
+                pool._spawn = broken_spawn
+
+                second = await asyncio.wait_for(pool.run_task({"id": "2"}, "w"), timeout=10)
+            finally:
+                await pool.shutdown()
+            return first, second, pool.stats
+
+        first, second, stats = _run(scenario())
+
+        assert first.result["task_id"] == "1"
+        assert second.result is None and "No session workers" in second.error
+        assert stats["workers_lost"] == 1
+
+    def test_partial_start_keeps_working_workers(self):
+        async def scenario():
+            pool = SessionWorkerPool(size=2, handler=f"{HANDLERS}:echo_handler",
+                                     spawn_retries=0)
+            real_spawn = pool._spawn
+            attempts = []
+
+            async def flaky_spawn():
+                attempts.append(1)
+                if len(attempts) == 1:
+                    raise RuntimeError("cannot start")
+                return await real_spawn()
+            pool._spawn = flaky_spawn
+
+            try:
+                outcome = await asyncio.wait_for(pool.run_task({"id": "1"}, "w"), timeout=30)
+            finally:
+                await pool.shutdown()
+            return outcome, pool.capacity
+
+        outcome, capacity = _run(scenario())
+
+        assert outcome.result["task_id"] == "1"
+        assert capacity == 1
+
+    def test_checkout_waits_within_timeout(self):
+        async def scenario():
+            pool = SessionWorkerPool(size=1, handler=f"{HANDLERS}:sleeping_handler")
+            try:
+                busy = asyncio.ensure_future(pool.run_task({"id": "1", "sleep": 3}, "w"))
+                await asyncio.sleep(0.5)
+                start = time.time()
+                waiting = await pool.run_task({"id": "2"}, "w", timeout=0.5)
+                elapsed = time.time() - start
+                await busy
+            finally:
+                await pool.shutdown()
+            return waiting, elapsed
+
+        waiting, elapsed = _run(scenario())
+
+        assert waiting.timed_out and waiting.result is None
+        assert elapsed < 2
@@ -0,0 +1,169 @@
+"""Tests for the background Slack notification dispatcher"""
+
+import json
+import time
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from claude_orchestrator.slack_notifier import SlackNotificationManager
+
+
+class StubWebhook:
+    """Local stand-in for a Slack incoming webhook"""
+
+    def __init__(self):
+        self.payloads = []
+        self.responses = []  # queued (status, headers) overrides
+        self.delay = 0.0
+        self.release = threading.Event()
+        self.release.set()
+        self.received = threading.Event()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length))
+                stub.received.set()
+                stub.release.wait(5)
+                time.sleep(stub.delay)
+                status, headers = stub.responses.pop(0) if stub.responses else (200, {})
+                if status == 200:
+                    stub.payloads.append(payload)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/hook"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.release.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+    @property
+    def texts(self):
+        return [p["text"] for p in self.payloads]
+
+
+@pytest.fixture
+def webhook():
+    stub = StubWebhook()
+    yield stub
+    stub.close()
+
+
+@pytest.fixture
+def make_notifier(webhook):
+    notifiers = []
+
+    def factory(**kwargs):
+        kwargs.setdefault("coalesce_window", 0.3)
+        kwargs.setdefault("retry_backoff", 0.01)
+        notifier = SlackNotificationManager(webhook.url, **kwargs)
+        notifiers.append(notifier)
+        return notifier
+
+    yield factory
+    for notifier in notifiers:
+        notifier.close(timeout=5)
+
+
+class TestSlackNotificationManager:
+    """Test cases for queued, coalescing Slack delivery"""
+
+    def test_send_does_not_block_on_slow_webhook(self, webhook, make_notifier):
+        webhook.delay = 0.5
+        notifier = make_notifier()
+
+        start = time.perf_counter()
+        assert notifier.send_task_complete("1", "First task")
+        assert time.perf_counter() - start < 0.1
+
+        assert notifier.flush(timeout=5)
+        assert webhook.texts == ["✅ Task completed: 1 - First task"]
+
+    def test_burst_is_coalesced_into_digest(self, webhook, make_notifier):
+        notifier = make_notifier()
+
+        for i in range(12):
+            notifier.send_task_complete(str(i), f"Task {i}")
+        # The digest is sent by the window timer, without an explicit flush
+        deadline = time.time() + 5
+        while len(webhook.texts) < 2 and time.time() < deadline:
+            time.sleep(0.05)
+
+        texts = webhook.texts
+        assert len(texts) == 2
+        assert texts[0] == "✅ Task completed: 0 - Task 0"
+        assert texts[1].startswith("✅ 11 tasks completed in the last 0.3 s")
+        assert "... and 1 more" in texts[1]
+        assert notifier.stats["digests"] == 1
+        assert notifier.stats["coalesced"] == 11
+
+    def test_summary_message_flushes_pending_digest_first(self, webhook, make_notifier):
+        notifier = make_notifier(coalesce_window=60)
+
+        notifier.send_task_failed("1", "One", "boom")
+        notifier.send_task_failed("2", "Two", "bang")
+        notifier.send_task_failed("3", "Three", "crash")
+        notifier.send_all_complete(3, 0, 3, "1m")
+        assert notifier.flush(timeout=5)
+
+        texts = webhook.texts
+        assert len(texts) == 3
+        assert texts[1].startswith("❌ 2 tasks failed in the last 60 s")
+        assert "• 2 - Two: bang" in texts[1]
+        assert texts[2].startswith("All tasks complete!")
+
+    def test_rate_limit_is_retried(self, webhook, make_notifier):
+        webhook.responses = [(429, {"Retry-After": "0"}), (503, {})]
+        notifier = make_notifier()
+
+        notifier.send_notification("hello")
+        assert notifier.flush(timeout=5)
+
+        assert webhook.texts == ["hello"]
+        assert notifier.stats["retries"] == 2
+        assert notifier.stats["sent"] == 1
+
+    def test_client_error_is_not_retried(self, webhook, make_notifier):
+        webhook.responses = [(400, {})]
+        notifier = make_notifier()
+
+        notifier.send_notification("bad")
+        assert notifier.flush(timeout=5)
+
+        assert notifier.stats["failed"] == 1
+        assert notifier.stats["retries"] == 0
+
+    def test_full_queue_drops_instead_of_blocking(self, webhook, make_notifier):
+        webhook.release.clear()
+        notifier = make_notifier(queue_size=1)
+
+        notifier.send_notification("in flight")
+        assert webhook.received.wait(5)
+        assert notifier.send_notification("queued")
+        assert not notifier.send_notification("dropped")
+        assert notifier.stats["dropped"] == 1
+
+        webhook.release.set()
+        assert notifier.flush(timeout=5)
+        assert webhook.texts == ["in flight", "queued"]
+
+    def test_without_webhook_nothing_is_started(self):
+        notifier = SlackNotificationManager(None)
+
+        assert not notifier.send_task_complete("1", "Task")
+        assert notifier.flush(timeout=1)
+        assert notifier._thread is None
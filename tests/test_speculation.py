@@ -0,0 +1,268 @@
+"""Tests for speculative execution ahead of pending reviews"""
+
+import queue
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from claude_orchestrator.models import TaskStatus, WorkerTask
+from claude_orchestrator.orchestrator import ClaudeOrchestrator
+from claude_orchestrator.speculation import SpeculationTracker
+from claude_orchestrator.worktree import GitWorktree, WorkspacePool, apply_patch, is_git_repo
+
+
+def git(repo, *args):
+    subprocess.run(["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+                   cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q")
+    (repo / "app.py").write_text("one\ntwo\nthree\n")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "initial")
+    return repo
+
+
+class TestSpeculationTracker:
+    """Test cases for SpeculationTracker"""
+
+    def test_held_result_commits_once_reviews_pass(self):
+        tracker = SpeculationTracker()
+        tracker.review_queued("1")
+        tracker.review_queued("2")
+        task = WorkerTask("3", "", "", dependencies=["1", "2"])
+        tracker.start(task, tracker.unconfirmed(task))
+        tracker.finish("3", "patch")
+
+        tracker.review_finished("1", passed=True)
+        assert tracker.settle() == ([], [])
+        tracker.review_finished("2", passed=True)
+        to_commit, to_discard = tracker.settle()
+
+        assert [s.task.task_id for s in to_commit] == ["3"]
+        assert not to_discard and len(tracker) == 0
+
+    def test_rejected_review_discards_result(self):
+        tracker = SpeculationTracker()
+        tracker.review_queued("1")
+        task = WorkerTask("2", "", "", dependencies=["1"])
+        tracker.start(task, tracker.unconfirmed(task))
+        tracker.review_finished("1", passed=False)
+
+        # Still running: nothing to settle yet
+        assert tracker.settle() == ([], [])
+        tracker.finish("2", "patch")
+        to_commit, to_discard = tracker.settle()
+
+        assert not to_commit
+        assert [s.task.task_id for s in to_discard] == ["2"]
+        assert tracker.unconfirmed(task) == set()
+
+    def test_time_saved_adds_up_along_chains(self):
+        tracker = SpeculationTracker()
+        for task_id, deps, started, finished, reviewed in (
+                ("2", ["1"], 100.0, 130.0, 110.0),   # saves 10s
+                ("3", ["2"], 140.0, 150.0, 200.0),   # saves its whole 10s run
+                ("4", ["1"], 100.0, 101.0, 110.0)):  # saves 1s, separate branch
+            speculation = tracker.start(WorkerTask(task_id, "", "", dependencies=deps), set(deps))
+            speculation.started_at, speculation.finished_at = started, finished
+            tracker.review_times[deps[0]] = reviewed
+            tracker.committed(speculation)
+
+        assert tracker.time_saved == {"2": 10.0, "3": 10.0, "4": 1.0}
+        assert tracker.critical_path_saved() == 20.0
+
+
+class TestWorktree:
+    """Test cases for worktree snapshots and patches"""
+
+    def test_worktree_sees_uncommitted_work_and_returns_only_new_changes(self, repo):
+        (repo / "app.py").write_text("one\ntwo\nthree\nfour\n")
+        (repo / "notes.txt").write_text("untracked\n")
+
+        worktree = GitWorktree.create(str(repo))
+        try:
+            assert (repo / "app.py").read_text() == open(f"{worktree.path}/app.py").read()
+            assert open(f"{worktree.path}/notes.txt").read() == "untracked\n"
+            with open(f"{worktree.path}/app.py", "a") as f:
+                f.write("five\n")
+            with open(f"{worktree.path}/new.py", "w") as f:
+                f.write("new\n")
+            patch = worktree.diff()
+        finally:
+            worktree.remove()
+
+        assert "+five" in patch and "+four" not in patch
+        assert apply_patch(str(repo), patch) is None
+        assert (repo / "app.py").read_text().endswith("four\nfive\n")
+        assert (repo / "new.py").read_text() == "new\n"
+        # The working directory's own index and HEAD are untouched
+        status = subprocess.run(["git", "status", "--porcelain"], cwd=repo,
+                                capture_output=True, text=True).stdout
+        assert " M app.py" in status
+
+    def test_conflicting_patch_is_reported_and_not_applied(self, repo):
+        worktree = GitWorktree.create(str(repo))
+        try:
+            with open(f"{worktree.path}/app.py", "w") as f:
+                f.write("one\nTWO\nthree\n")
+            patch = worktree.diff()
+        finally:
+            worktree.remove()
+        (repo / "app.py").write_text("one\nzwei\nthree\n")
+
+        assert apply_patch(str(repo), patch)
+        assert (repo / "app.py").read_text() == "one\nzwei\nthree\n"
+
+    def test_is_git_repo(self, repo, tmp_path):
+        assert is_git_repo(str(repo))
+        assert not is_git_repo(str(tmp_path))
+
+
+class TestWorkspacePool:
+    """Test cases for per-worker worktrees"""
+
+    def test_worktree_is_reused_and_reset_between_tasks(self, repo):
+        pool = WorkspacePool(str(repo))
+        try:
+            worktree = pool.acquire(0)
+            with open(f"{worktree.path}/app.py", "a") as f:
+                f.write("four\n")
+            with open(f"{worktree.path}/scratch.txt", "w") as f:
+                f.write("leftover\n")
+            assert pool.merge(worktree.diff()) is None
+
+            again = pool.acquire(0)
+            assert again.path == worktree.path
+            # Starts from the merged working directory, without the leftovers
+            assert open(f"{again.path}/app.py").read() == "one\ntwo\nthree\nfour\n"
+            assert (repo / "scratch.txt").exists()
+            assert again.diff() == ""
+            assert pool.stats["created"] == 1 and pool.stats["reused"] == 1
+        finally:
+            pool.close()
+
+    def test_concurrent_edits_to_the_same_lines_conflict(self, repo):
+        pool = WorkspacePool(str(repo))
+        try:
+            first, second = pool.acquire(0), pool.acquire(1)
+            with open(f"{first.path}/app.py", "w") as f:
+                f.write("one\nTWO\nthree\n")
+            with open(f"{second.path}/app.py", "w") as f:
+                f.write("one\nzwei\nthree\n")
+
+            assert pool.merge(first.diff()) is None
+            assert pool.merge(second.diff())
+            assert (repo / "app.py").read_text() == "one\nTWO\nthree\n"
+            assert pool.stats["conflicts"] == 1
+        finally:
+            pool.close()
+        assert not subprocess.run(["git", "worktree", "list", "--porcelain"], cwd=repo,
+                                  capture_output=True, text=True).stdout.count("detached")
+
+
+class TestOrchestratorSpeculation:
+    """Test cases for holding and settling speculative results"""
+
+    def make_orchestrator(self, repo):
+        orchestrator = ClaudeOrchestrator.__new__(ClaudeOrchestrator)
+        orchestrator.working_dir = str(repo)
+        orchestrator.speculative = True
+        orchestrator.isolate_workers = False
+        orchestrator.speculation = SpeculationTracker()
+        orchestrator.workspaces = WorkspacePool(str(repo))
+        orchestrator._merge_conflicts = {}
+        orchestrator.use_progress_display = False
+        orchestrator.progress = None
+        orchestrator.review_queue = queue.Queue()
+        orchestrator.config = SimpleNamespace(snapshot=None)
+        orchestrator.statuses = {}
+        orchestrator.main_task_master = SimpleNamespace(
+            set_task_status=lambda task_id, status: orchestrator.statuses.__setitem__(task_id, status))
+        orchestrator.recorded = []
+        orchestrator._record_completed_task = lambda task, *args: orchestrator.recorded.append(task.task_id)
+        orchestrator._check_and_delegate_new_tasks = lambda: None
+        orchestrator.manager = SimpleNamespace(task_queue=queue.Queue())
+        orchestrator.manager.delegate_task = orchestrator.manager.task_queue.put
+        return orchestrator
+
+    def run_speculatively(self, orchestrator, repo):
+        orchestrator._queue_review(WorkerTask("1", "", "", status=TaskStatus.COMPLETED))
+        task = WorkerTask("2", "", "", dependencies=["1"])
+        worker = SimpleNamespace(worker_id=0, working_dir=str(repo))
+
+        workspace, speculation = orchestrator._enter_workspace(task, worker)
+        assert speculation is not None and worker.working_dir == workspace.path
+        with open(f"{worker.working_dir}/app.py", "a") as f:
+            f.write("four\n")
+        worker.working_dir = str(repo)
+        task.status = TaskStatus.COMPLETED
+
+        assert orchestrator._leave_workspace(workspace, speculation, task, SimpleNamespace(max_retries=1))
+        assert orchestrator.statuses["2"] == "in-progress"
+        assert "2" in orchestrator.speculation
+        return task
+
+    def test_result_is_committed_after_review_passes(self, repo):
+        orchestrator = self.make_orchestrator(repo)
+        self.run_speculatively(orchestrator, repo)
+        assert (repo / "app.py").read_text() == "one\ntwo\nthree\n"
+
+        orchestrator._review_finished(WorkerTask("1", "", ""), {"success": True, "follow_up_count": 0})
+
+        assert (repo / "app.py").read_text() == "one\ntwo\nthree\nfour\n"
+        assert orchestrator.recorded == ["2"]
+        assert orchestrator.speculation.stats["committed"] == 1
+        orchestrator.workspaces.close()
+
+    def test_result_is_discarded_and_rerun_when_review_asks_for_changes(self, repo):
+        orchestrator = self.make_orchestrator(repo)
+        task = self.run_speculatively(orchestrator, repo)
+
+        orchestrator._review_finished(WorkerTask("1", "", ""), {"success": True, "follow_up_count": 2})
+
+        assert (repo / "app.py").read_text() == "one\ntwo\nthree\n"
+        assert not orchestrator.recorded
+        assert orchestrator.manager.task_queue.get_nowait() is task
+        assert task.status == TaskStatus.PENDING
+        assert orchestrator.statuses["2"] == "pending"
+        # The rerun does not speculate on the rejected dependency again
+        assert orchestrator.speculation.unconfirmed(task) == set()
+        orchestrator.workspaces.close()
+
+    def test_isolated_task_is_merged_and_conflicts_are_rerun(self, repo):
+        orchestrator = self.make_orchestrator(repo)
+        orchestrator.speculative = False
+        orchestrator.isolate_workers = True
+        cfg = SimpleNamespace(max_retries=1)
+        workers = [SimpleNamespace(worker_id=i, working_dir=str(repo)) for i in (0, 1)]
+        tasks = [WorkerTask(str(i), "", "") for i in (1, 2)]
+
+        entered = [orchestrator._enter_workspace(task, worker) for task, worker in zip(tasks, workers, strict=True)]
+        for (workspace, speculation), line in zip(entered, ("TWO", "zwei"), strict=True):
+            assert speculation is None
+            with open(f"{workspace.path}/app.py", "w") as f:
+                f.write(f"one\n{line}\nthree\n")
+        for task in tasks:
+            task.status = TaskStatus.COMPLETED
+
+        # The first merges and is completed as usual; the second runs again
+        assert not orchestrator._leave_workspace(entered[0][0], None, tasks[0], cfg)
+        assert orchestrator._leave_workspace(entered[1][0], None, tasks[1], cfg)
+        assert (repo / "app.py").read_text() == "one\nTWO\nthree\n"
+        assert orchestrator.manager.task_queue.get_nowait() is tasks[1]
+
+        # Conflicting again past max_retries fails the task
+        workspace, _ = orchestrator._enter_workspace(tasks[1], workers[1])
+        (repo / "app.py").write_text("one\nzwo\nthree\n")
+        with open(f"{workspace.path}/app.py", "w") as f:
+            f.write("one\nzwei\nthree\n")
+        tasks[1].status = TaskStatus.COMPLETED
+        assert not orchestrator._leave_workspace(workspace, None, tasks[1], cfg)
+        assert tasks[1].status == TaskStatus.FAILED
+        orchestrator.workspaces.close()
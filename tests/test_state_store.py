@@ -0,0 +1,138 @@
+"""Tests for the shared SQLite state store"""
+
+import json
+import threading
+
+import pytest
+
+from claude_orchestrator.state_store import StateStore, TableSpec, ROLLBACK_HISTORY
+from claude_orchestrator.resource_manager import OrphanedResourceDetector, ResourceType, ResourceStatus
+from claude_orchestrator.rollback import RollbackManager
+from claude_orchestrator.checkpoint_system import CheckpointManager
+
+ITEMS = TableSpec("items", "item_id", ("status", "rank"))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = StateStore(tmp_path / "state.db")
+    yield store
+    store.close()
+
+
+class TestStateStore:
+    """Test cases for StateStore and StateTable"""
+
+    def test_reads_see_queued_writes(self, store):
+        items = store.table(ITEMS)
+        items.upsert({"item_id": "a", "status": "new", "rank": 1, "extra": [1, 2]})
+        items.upsert({"item_id": "a", "status": "done", "rank": 1, "extra": [1, 2]})
+
+        assert items.get("a") == {"item_id": "a", "status": "done", "rank": 1, "extra": [1, 2]}
+        assert len(items) == 1
+
+    def test_concurrent_writes_are_group_committed(self, store):
+        items = store.table(ITEMS)
+
+        def write(prefix):
+            for i in range(200):
+                items.upsert({"item_id": f"{prefix}-{i}", "status": "new", "rank": i})
+
+        threads = [threading.Thread(target=write, args=(p,)) for p in "abcd"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(items) == 800
+        assert store.stats["writes"] == 800
+        assert store.stats["commits"] < 800
+        assert store.stats["errors"] == 0
+
+    def test_reads_after_close_do_not_hang(self, store):
+        items = store.table(ITEMS)
+        items.upsert({"item_id": "a", "status": "new", "rank": 1})
+        store.close()
+
+        result = []
+        reader = threading.Thread(target=lambda: result.append(len(items)), daemon=True)
+        reader.start()
+        reader.join(timeout=5)
+
+        assert result == [1]
+        assert store.flush(timeout=1)
+
+    def test_filters_order_and_prune(self, store):
+        items = store.table(ITEMS)
+        for i in range(5):
+            items.upsert({"item_id": str(i), "status": "odd" if i % 2 else "even", "rank": i})
+
+        assert sorted(r["item_id"] for r in items.all(status="odd")) == ["1", "3"]
+        assert [r["rank"] for r in items.all(order_by="rank")] == [0, 1, 2, 3, 4]
+        with pytest.raises(ValueError):
+            items.all(colour="red")
+
+        items.prune(2, order_by="rank")
+        items.delete("4")
+        assert [r["rank"] for r in items.all(order_by="rank")] == [3]
+
+    def test_records_persist_across_stores(self, tmp_path):
+        first = StateStore(tmp_path / "state.db")
+        first.table(ITEMS).upsert({"item_id": "a", "status": "new", "rank": 1})
+        first.close()
+
+        second = StateStore(tmp_path / "state.db")
+        assert second.table(ITEMS).get("a")["status"] == "new"
+        second.close()
+        with pytest.raises(RuntimeError):
+            second.execute("DELETE FROM items")
+
+
+class TestStateStoreAdoption:
+    """Test cases for subsystems persisting through the state store"""
+
+    def test_resource_detector_persists_changed_rows(self, tmp_path):
+        tracking_file = str(tmp_path / "tracking.json")
+        detector = OrphanedResourceDetector(tracking_file=tracking_file)
+        resource_id = detector.register_resource(ResourceType.TEMP_FILE, "tmp-1", owner_id="task-1")
+        detector.register_resource(ResourceType.TEMP_FILE, "tmp-2")
+        detector.release_resource(resource_id)
+        detector.remove_resource("tmp-2")
+
+        reloaded = OrphanedResourceDetector(tracking_file=tracking_file)
+        assert list(reloaded.resources) == ["tmp-1"]
+        assert reloaded.resources["tmp-1"].status == ResourceStatus.IDLE
+        assert reloaded.tracked.all(owner_id="task-1")[0]["resource_id"] == "tmp-1"
+
+    def test_resource_detector_imports_legacy_json(self, tmp_path):
+        tracking_file = tmp_path / "tracking.json"
+        detector = OrphanedResourceDetector(tracking_file=str(tmp_path / "other.json"))
+        detector.register_resource(ResourceType.TEMP_FILE, "old-1")
+        tracking_file.write_text(json.dumps({"resources": [detector.resources["old-1"].to_dict()]}))
+
+        imported = OrphanedResourceDetector(tracking_file=str(tracking_file))
+        assert list(imported.resources) == ["old-1"]
+        assert len(imported.tracked) == 1
+
+    def test_rollback_history_is_trimmed_in_store(self, tmp_path):
+        store = StateStore(tmp_path / "state.db")
+        manager = RollbackManager(
+            checkpoint_manager=CheckpointManager(str(tmp_path / "checkpoints")),
+            storage_dir=str(tmp_path / "rollbacks"),
+            max_rollback_history=2,
+            state_store=store
+        )
+        for i in range(3):
+            manager.restore_checkpoint(f"cp{i}-missing")
+
+        assert len(manager.rollback_history) == 2
+        assert len(store.table(ROLLBACK_HISTORY)) == 2
+
+        reloaded = RollbackManager(
+            checkpoint_manager=manager.checkpoint_manager,
+            storage_dir=str(tmp_path / "rollbacks"),
+            state_store=store
+        )
+        assert [r.rollback_id for r in reloaded.rollback_history] == \
+            [r.rollback_id for r in manager.rollback_history]
+        store.close()
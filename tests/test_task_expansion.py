@@ -0,0 +1,151 @@
+"""Tests for concurrent bulk task expansion"""
+
+import json
+import time
+import threading
+
+import pytest
+
+from claude_orchestrator.task_master import TaskManager
+from claude_orchestrator.task_master_ai import TaskMasterAI
+
+
+COMPLEX = dict(
+    description="Design and implement a comprehensive authentication system with multiple providers",
+    details="Build the login flow, token refresh and session storage; integrate with the existing "
+            "user model and add an admin view for revoking sessions across various devices."
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = TaskManager(str(tmp_path))
+    for i in range(6):
+        manager.add_task(f"Build service {i}", **COMPLEX)
+    manager.add_task("Fix typo", "Readme typo")
+    return manager
+
+
+class FakeClaude:
+    """Stands in for TaskMasterAI._execute_claude"""
+
+    def __init__(self, delay=0.2, fail_on=()):
+        self.delay = delay
+        self.fail_on = set(fail_on)
+        self.prompts = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, prompt, model=None, timeout=None):
+        with self.lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            task_id = prompt.split("Task ID: ")[1].split("\n")[0]
+            if task_id in self.fail_on:
+                return {'success': False, 'error': "boom"}
+            subtasks = [{"title": f"Step {n} of {task_id}", "description": "do it"} for n in range(3)]
+            return {'success': True, 'response': "Here you go:\n" + json.dumps(subtasks)}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def count_writes(manager, monkeypatch):
+    writes = []
+    real_write = manager.store._write
+    monkeypatch.setattr(manager.store, "_write", lambda: writes.append(1) or real_write())
+    return writes
+
+
+class TestExpandAll:
+    """Test cases for TaskMasterAI.expand_all"""
+
+    def test_expansions_run_concurrently_and_save_once(self, manager, monkeypatch):
+        ai = TaskMasterAI(manager)
+        fake = FakeClaude(delay=0.3)
+        monkeypatch.setattr(ai, "_execute_claude", fake)
+        writes = count_writes(manager, monkeypatch)
+
+        start = time.perf_counter()
+        report = ai.expand_all(max_workers=3)
+        elapsed = time.perf_counter() - start
+
+        assert sorted(report['expanded']) == [str(i) for i in range(1, 7)]
+        assert fake.peak == 3
+        assert elapsed < 6 * 0.3
+        assert writes == [1]
+
+        reloaded = TaskManager(str(manager.project_root))
+        assert [st.title for st in reloaded.get_task("2").subtasks] == [
+            "Step 0 of 2", "Step 1 of 2", "Step 2 of 2"
+        ]
+
+    def test_simple_tasks_are_skipped_without_model_call(self, manager, monkeypatch):
+        ai = TaskMasterAI(manager)
+        fake = FakeClaude(delay=0)
+        monkeypatch.setattr(ai, "_execute_claude", fake)
+
+        report = ai.expand_all(threshold=5)
+
+        assert "7" in report['skipped']
+        assert report['skipped']["7"] < 5
+        assert not any("Task ID: 7\n" in p for p in fake.prompts)
+        assert manager.get_task("7").subtasks == []
+
+    def test_failures_are_reported_and_others_still_applied(self, manager, monkeypatch):
+        ai = TaskMasterAI(manager)
+        monkeypatch.setattr(ai, "_execute_claude", FakeClaude(delay=0, fail_on={"3"}))
+        results = []
+
+        report = ai.expand_all(on_result=lambda task_id, error: results.append((task_id, error)))
+
+        assert report['failed'] == {"3": "boom"}
+        assert "3" not in report['expanded']
+        assert len(report['expanded']) == 5
+        assert ("3", "boom") in results
+
+    def test_malformed_replies_fail_only_their_task(self, manager, monkeypatch):
+        ai = TaskMasterAI(manager)
+        fake = FakeClaude(delay=0)
+        replies = {
+            "3": {'success': True, 'response': 'Steps: ["step one", "step two"]'},
+            "4": {'success': True, 'response': {'response': '{"title": "one subtask"}'}},
+        }
+
+        def reply(prompt, model=None, timeout=None):
+            task_id = prompt.split("Task ID: ")[1].split("\n")[0]
+            return replies.get(task_id) or fake(prompt, model, timeout)
+
+        monkeypatch.setattr(ai, "_execute_claude", reply)
+
+        report = ai.expand_all()
+
+        assert sorted(report['failed']) == ["3", "4"]
+        assert len(report['expanded']) == 4
+        assert manager.get_task("3").subtasks == []
+        assert ai.expand_task("3") == []
+
+    def test_already_expanded_tasks_are_left_alone(self, manager, monkeypatch):
+        manager.add_subtask("1", "Existing", "Keep me")
+        ai = TaskMasterAI(manager)
+        fake = FakeClaude(delay=0)
+        monkeypatch.setattr(ai, "_execute_claude", fake)
+
+        report = ai.expand_all()
+
+        assert "1" not in report['expanded']
+        assert [st.title for st in manager.get_task("1").subtasks] == ["Existing"]
+
+    def test_single_expansion_uses_one_write(self, manager, monkeypatch):
+        ai = TaskMasterAI(manager)
+        monkeypatch.setattr(ai, "_execute_claude", FakeClaude(delay=0))
+        writes = count_writes(manager, monkeypatch)
+
+        subtasks = ai.expand_task("1")
+
+        assert len(subtasks) == 3
+        assert writes == [1]
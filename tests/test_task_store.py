@@ -0,0 +1,132 @@
+"""Tests for the shared TaskStore behind TaskManager"""
+
+import gc
+import os
+import json
+import threading
+
+from claude_orchestrator.main import TaskMasterInterface
+from claude_orchestrator.task_master import TaskManager, TaskStore
+
+
+def _external_write(tasks_file, tasks):
+    stat = tasks_file.stat()
+    data = json.loads(tasks_file.read_text())
+    data["tasks"] = tasks
+    tasks_file.write_text(json.dumps(data))
+    os.utime(tasks_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestTaskStore:
+    """Test cases for TaskStore"""
+
+    def test_managers_share_one_parsed_copy(self, tmp_path):
+        first = TaskManager(str(tmp_path))
+        second = TaskManager(str(tmp_path))
+
+        task = first.add_task("Shared", "Visible everywhere")
+
+        assert first.store is second.store
+        assert second.get_task(str(task.id)) is task
+
+    def test_external_change_is_reloaded(self, tmp_path):
+        manager = TaskManager(str(tmp_path))
+        manager.add_task("Original", "From this process")
+
+        _external_write(manager.tasks_file, [
+            {"id": 1, "title": "Edited", "description": "From elsewhere"}
+        ])
+        manager.store.maybe_reload(force=True)
+
+        assert manager.get_task("1").title == "Edited"
+
+    def test_transaction_applies_to_fresh_copy(self, tmp_path):
+        manager = TaskManager(str(tmp_path))
+        manager.add_task("One", "First")
+
+        # Another process appended a task after our last read
+        _external_write(manager.tasks_file, [
+            {"id": 1, "title": "One", "description": "First"},
+            {"id": 2, "title": "Two", "description": "Second"}
+        ])
+        manager.add_task("Three", "Third")
+
+        saved = json.loads(manager.tasks_file.read_text())
+        assert [t["id"] for t in saved["tasks"]] == [1, 2, 3]
+
+    def test_own_saves_do_not_reload(self, tmp_path):
+        manager = TaskManager(str(tmp_path))
+        task = manager.add_task("Task", "Kept in memory")
+
+        assert manager.store.maybe_reload(force=True) is False
+        assert manager.get_task(str(task.id)) is task
+
+    def test_subscribers_are_notified(self, tmp_path):
+        manager = TaskManager(str(tmp_path))
+        versions = []
+        unsubscribe = manager.store.subscribe(lambda store: versions.append(store.version))
+
+        task = manager.add_task("Task", "Notify")
+        manager.update_task_status(str(task.id), "done")
+        unsubscribe()
+        manager.update_task_status(str(task.id), "pending")
+
+        assert len(versions) == 2
+        assert versions[0] < versions[1]
+
+    def test_concurrent_adds_get_unique_ids(self, tmp_path):
+        manager = TaskManager(str(tmp_path))
+        threads = [
+            threading.Thread(target=manager.add_task, args=(f"Task {i}", "Concurrent"))
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        fresh = TaskStore(manager.tasks_file)
+        ids = [t.id for t in fresh.data["tasks"]]
+        assert sorted(ids) == list(range(1, 21))
+
+    def test_unchanged_transaction_does_not_write(self, tmp_path):
+        manager = TaskManager(str(tmp_path))
+        manager.add_task("Task", "Unchanged")
+        signature = manager.store._stat_signature()
+
+        assert manager.update_task_status("99", "done") is False
+        with manager.store.transaction():
+            pass
+
+        assert manager.store._stat_signature() == signature
+
+    def test_failed_transaction_rolls_back(self, tmp_path):
+        manager = TaskManager(str(tmp_path))
+        manager.add_task("Task", "Rolled back")
+
+        try:
+            with manager.store.transaction():
+                manager.get_task("1").status = "done"
+                manager._add_task("Partial", "Never saved", None, "medium", None, None)
+                raise RuntimeError("body failed")
+        except RuntimeError:
+            pass
+
+        assert manager.get_task("1").status == "pending"
+        assert [t.id for t in manager.get_all_tasks()] == [1]
+        saved = json.loads(manager.tasks_file.read_text())
+        assert [t["id"] for t in saved["tasks"]] == [1]
+
+    def test_interface_subscription_does_not_keep_it_alive(self, tmp_path):
+        manager = TaskManager(str(tmp_path))
+        interface = TaskMasterInterface(manager)
+        interface._subtask_cache["1"] = "stale"
+
+        manager.add_task("Task", "Clears the cache")
+        assert interface._subtask_cache == {}
+
+        del interface
+        gc.collect()
+        manager.add_task("Task", "Drops the dead subscription")
+
+        assert manager.store._subscribers == []
@@ -0,0 +1,164 @@
+"""Tests for import-graph-based test impact analysis"""
+
+import os
+import pytest
+from pathlib import Path
+
+from claude_orchestrator.test_impact_analyzer import TestImpactAnalyzer
+from claude_orchestrator.test_monitor import TestMonitor as Monitor
+
+
+def _write(path: Path, content: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _touch(path: Path, content: str):
+    """Rewrite a file and make sure its mtime moves forward"""
+    stat = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestTestImpactAnalyzer:
+    """Test cases for TestImpactAnalyzer"""
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Create a small project with a package and tests"""
+        _write(tmp_path / "pkg" / "__init__.py", "")
+        _write(tmp_path / "pkg" / "core.py", "VALUE = 1\n")
+        _write(tmp_path / "pkg" / "helpers.py", "from .core import VALUE\n")
+        _write(tmp_path / "pkg" / "other.py", "import json\n")
+        _write(tmp_path / "tests" / "__init__.py", "")
+        _write(tmp_path / "tests" / "test_helpers.py", "from pkg import helpers\n")
+        _write(tmp_path / "tests" / "test_other.py", "from pkg.other import json\n")
+        _write(tmp_path / "tests" / "test_plain.py", "def test_x():\n    pass\n")
+        return tmp_path
+
+    @pytest.fixture
+    def analyzer(self, project):
+        analyzer = TestImpactAnalyzer(root_dir=str(project), test_dir="tests")
+        analyzer.refresh()
+        return analyzer
+
+    def test_transitive_dependents(self, project, analyzer):
+        """Changing a module selects only tests that transitively import it"""
+        affected = analyzer.get_affected_tests([str(project / "pkg" / "core.py")])
+
+        assert affected == {str(project / "tests" / "test_helpers.py")}
+
+    def test_package_init_affects_all_importers(self, project, analyzer):
+        """Importing pkg.x also executes pkg/__init__.py"""
+        affected = analyzer.get_affected_tests([str(project / "pkg" / "__init__.py")])
+
+        assert affected == {
+            str(project / "tests" / "test_helpers.py"),
+            str(project / "tests" / "test_other.py"),
+        }
+
+    def test_changed_test_file_selects_itself(self, project, analyzer):
+        """A changed test file is always affected"""
+        test_file = str(project / "tests" / "test_plain.py")
+
+        assert analyzer.get_affected_tests([test_file]) == {test_file}
+
+    def test_refresh_is_incremental(self, project, analyzer):
+        """Only files with a new stat signature are reported as changed"""
+        assert analyzer.refresh() == set()
+
+        _touch(project / "pkg" / "other.py", "import os\n")
+
+        assert analyzer.refresh() == {str(project / "pkg" / "other.py")}
+
+    def test_new_import_edge_is_picked_up(self, project, analyzer):
+        """Re-parsing a changed file updates the graph"""
+        _touch(project / "tests" / "test_plain.py", "from pkg.core import VALUE\n")
+        analyzer.refresh()
+
+        affected = analyzer.get_affected_tests([str(project / "pkg" / "core.py")])
+
+        assert str(project / "tests" / "test_plain.py") in affected
+
+    def test_uncertain_changes_fall_back(self, project, analyzer):
+        """Config changes, syntax errors and deleted modules return None"""
+        _write(project / "tests" / "conftest.py", "")
+        analyzer.refresh()
+        assert analyzer.get_affected_tests([str(project / "tests" / "conftest.py")]) is None
+
+        _touch(project / "pkg" / "core.py", "def broken(:\n")
+        analyzer.refresh()
+        assert analyzer.get_affected_tests([str(project / "pkg" / "core.py")]) is None
+
+        (project / "pkg" / "other.py").unlink()
+        changed = analyzer.refresh()
+        assert analyzer.get_affected_tests(changed) is None
+
+    def test_config_change_is_detected_by_refresh(self, project, analyzer):
+        """Non-Python global impact files are scanned too"""
+        _write(project / "pyproject.toml", "[project]\n")
+        changed = analyzer.refresh()
+        assert str(project / "pyproject.toml") in changed
+
+        _touch(project / "pyproject.toml", "[project]\nname = 'pkg'\n")
+        changed = analyzer.refresh()
+
+        assert changed == {str(project / "pyproject.toml")}
+        assert analyzer.get_affected_tests(changed) is None
+
+    def test_most_imported_modules(self, project, analyzer):
+        """Modules reached by more test files rank first; tests are excluded"""
+        _write(project / "tests" / "test_core.py", "import pkg.core\n")
+        analyzer.refresh()
+
+        assert analyzer.get_most_imported_modules() == ["pkg", "pkg.core", "pkg.helpers", "pkg.other"]
+        assert analyzer.get_most_imported_modules(limit=2) == ["pkg", "pkg.core"]
+
+    def test_dynamic_importers_always_selected(self, project, analyzer):
+        """Tests using importlib are selected for any source change"""
+        _touch(
+            project / "tests" / "test_plain.py",
+            "import importlib\nmod = importlib.import_module('pkg.other')\n"
+        )
+        analyzer.refresh()
+
+        affected = analyzer.get_affected_tests([str(project / "pkg" / "core.py")])
+
+        assert str(project / "tests" / "test_plain.py") in affected
+
+    def test_cache_round_trip(self, project, tmp_path):
+        """A persisted cache avoids re-parsing unchanged files"""
+        cache_file = str(tmp_path / "graph.json")
+        analyzer = TestImpactAnalyzer(root_dir=str(project), cache_file=cache_file)
+        analyzer.refresh()
+        analyzer.save_cache()
+
+        reloaded = TestImpactAnalyzer(root_dir=str(project), cache_file=cache_file)
+
+        assert reloaded.refresh() == set()
+        assert reloaded.get_graph_stats()["files"] == analyzer.get_graph_stats()["files"]
+
+
+class TestTestMonitorImpactSelection:
+    """Test that TestMonitor uses the import graph for source changes"""
+
+    def test_source_change_selects_affected_tests(self, tmp_path):
+        _write(tmp_path / "pkg" / "__init__.py", "")
+        _write(tmp_path / "pkg" / "a.py", "")
+        _write(tmp_path / "pkg" / "b.py", "")
+        _write(tmp_path / "tests" / "test_a.py", "from pkg import a\n")
+        _write(tmp_path / "tests" / "test_b.py", "from pkg import b\n")
+
+        monitor = Monitor(
+            test_dir=str(tmp_path / "tests"),
+            result_dir=str(tmp_path / ".test_results")
+        )
+        monitor.discover_tests()
+
+        # Initial scan reports every test file
+        assert len(monitor._check_file_changes()) == 2
+        assert monitor._check_file_changes() == set()
+
+        _touch(tmp_path / "pkg" / "a.py", "X = 1\n")
+
+        assert monitor._check_file_changes() == {str(tmp_path / "tests" / "test_a.py")}
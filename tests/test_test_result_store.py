@@ -0,0 +1,160 @@
+"""Tests for JUnit XML ingestion and the SQLite test history"""
+
+import json
+import pytest
+from datetime import datetime, timedelta
+
+from claude_orchestrator.test_result_store import TestHistoryStore as HistoryStore, parse_junit_xml
+from claude_orchestrator.test_monitor import TestMonitor as Monitor
+from claude_orchestrator.continuous_test_monitor import (
+    ContinuousTestMonitor, TestResult as MonitorResult, TestStatus as MonitorStatus
+)
+
+
+JUNIT_XML = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+  <testsuite name="pytest" errors="1" failures="1" skipped="1" tests="4" time="0.5">
+    <testcase classname="tests.test_sample" name="test_ok" time="0.010" />
+    <testcase classname="tests.test_sample.TestGroup" name="test_bad[1]" time="0.200">
+      <failure message="assert 1 == 2">def test_bad(): assert 1 == 2</failure>
+    </testcase>
+    <testcase classname="tests.test_sample" name="test_skip" time="0.000">
+      <skipped type="pytest.skip" message="not today" />
+    </testcase>
+    <testcase classname="tests.test_sample" name="test_err" time="0.001">
+      <error message="fixture blew up">Traceback...</error>
+    </testcase>
+  </testsuite>
+</testsuites>
+"""
+
+
+class TestJunitParsing:
+    """Test cases for parse_junit_xml"""
+
+    def test_parse_outcomes_and_durations(self, tmp_path):
+        xml_path = tmp_path / "report.xml"
+        xml_path.write_text(JUNIT_XML)
+
+        cases = parse_junit_xml(str(xml_path), "tests/test_sample.py")
+        by_name = {c["test_name"]: c for c in cases}
+
+        assert [c["status"] for c in cases] == ["passed", "failed", "skipped", "error"]
+        assert by_name["test_bad[1]"]["duration"] == pytest.approx(0.2)
+        assert by_name["test_bad[1]"]["error_message"] == "assert 1 == 2"
+        assert by_name["test_bad[1]"]["node_id"] == "tests/test_sample.py::TestGroup::test_bad[1]"
+        assert by_name["test_ok"]["node_id"] == "tests/test_sample.py::test_ok"
+        assert by_name["test_err"]["traceback"] == "Traceback..."
+
+
+class TestTestHistoryStore:
+    """Test cases for the SQLite history"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return HistoryStore(str(tmp_path / "history.db"))
+
+    def _result(self, name, status, minutes_ago=0):
+        return MonitorResult(
+            test_name=name,
+            test_file="tests/test_sample.py",
+            status=status,
+            duration=0.1,
+            timestamp=datetime.now() - timedelta(minutes=minutes_ago),
+            node_id=f"tests/test_sample.py::{name}"
+        )
+
+    def test_history_is_newest_first_and_limited(self, store):
+        for minutes_ago in (30, 20, 10):
+            store.record_run([self._result("test_a", MonitorStatus.PASSED, minutes_ago)])
+        store.record_run([self._result("test_b", MonitorStatus.FAILED)])
+
+        history = store.get_history("test_a", limit=2)
+
+        assert len(history) == 2
+        assert history[0]["timestamp"] > history[1]["timestamp"]
+
+    def test_history_by_node_id(self, store):
+        store.record_run([self._result("test_a", MonitorStatus.PASSED)])
+
+        assert len(store.get_history("tests/test_sample.py::test_a")) == 1
+
+    def test_statistics_only_count_suite_runs(self, store):
+        store.record_run([
+            self._result("test_a", MonitorStatus.PASSED),
+            self._result("test_b", MonitorStatus.FAILED),
+        ], run_type="suite")
+        store.record_run([self._result("test_c", MonitorStatus.ERROR)], run_type="file")
+
+        stats = store.get_statistics()
+
+        assert stats["total_runs"] == 1
+        assert stats["total_tests_run"] == 2
+        assert stats["total_failed"] == 1
+        assert stats["total_errors"] == 0
+        assert stats["average_success_rate"] == pytest.approx(50.0)
+
+    def test_cleanup(self, store):
+        store.record_run([self._result("test_old", MonitorStatus.PASSED, minutes_ago=120)])
+        store.record_run([self._result("test_new", MonitorStatus.PASSED)])
+
+        deleted = store.cleanup(datetime.now() - timedelta(hours=1))
+
+        assert deleted == 1
+        assert store.get_history("test_old") == []
+
+
+class TestContinuousMonitorIngestion:
+    """Run a real pytest subprocess and ingest its JUnit report"""
+
+    def test_run_test_file_records_history(self, tmp_path):
+        test_dir = tmp_path / "suite"
+        test_dir.mkdir()
+        test_file = test_dir / "test_demo.py"
+        test_file.write_text(
+            "def test_pass():\n    assert True\n\n"
+            "def test_fail():\n    assert 1 == 2\n"
+        )
+
+        monitor = ContinuousTestMonitor({
+            "test_dir": str(test_dir),
+            "result_dir": str(tmp_path / "results"),
+            "warm_pool_size": 0
+        })
+        results = monitor.run_test_file(str(test_file))
+
+        statuses = {r.test_name: r.status for r in results}
+        assert statuses == {"test_pass": MonitorStatus.PASSED, "test_fail": MonitorStatus.FAILED}
+        assert all(r.node_id.startswith(str(test_file)) for r in results)
+
+        history = monitor.get_test_history("test_fail")
+        assert len(history) == 1
+        assert history[0].status == MonitorStatus.FAILED
+        assert list((tmp_path / "results").glob("*.xml")) == []
+
+
+class TestLegacyHistoryImport:
+    """Test cases for importing test_history.json into the database"""
+
+    def test_legacy_history_is_imported_once(self, tmp_path):
+        old = (datetime.now() - timedelta(days=30)).isoformat()
+        recent = datetime.now().isoformat()
+        legacy = tmp_path / "test_history.json"
+        legacy.write_text(json.dumps({"results": [
+            {"test_name": "test_old", "test_file": "t.py", "status": "passed",
+             "duration": 0.1, "timestamp": old},
+            {"test_name": "test_new", "test_file": "t.py", "status": "failed",
+             "duration": 0.2, "timestamp": recent},
+        ]}))
+
+        monitor = Monitor(test_dir=str(tmp_path), result_dir=str(tmp_path),
+                              use_impact_analysis=False)
+        assert [r.test_name for r in monitor.test_results] == ["test_new"]
+        assert not legacy.exists()
+        assert (tmp_path / "test_history.json.imported").exists()
+
+        # A history database that already has runs is never imported into again
+        legacy.write_text((tmp_path / "test_history.json.imported").read_text())
+        Monitor(test_dir=str(tmp_path), result_dir=str(tmp_path), use_impact_analysis=False)
+        assert len(monitor.history.get_history("test_old")) == 1
+        assert legacy.exists()
@@ -0,0 +1,158 @@
+"""Tests for adaptive worker pool sizing"""
+
+import queue
+from types import SimpleNamespace
+
+from claude_orchestrator.admission_control import AdmissionController
+from claude_orchestrator.models import WorkerTask
+from claude_orchestrator.orchestrator import ClaudeOrchestrator
+from claude_orchestrator.worker_autoscaler import WorkerAutoscaler, AutoscaleConfig
+from claude_orchestrator.worker_pool_manager import PoolScalingPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_autoscaler(**overrides):
+    clock = FakeClock()
+    config = AutoscaleConfig(**{"min_workers": 1, "max_workers": 6, **overrides})
+    return WorkerAutoscaler(config, clock=clock), clock
+
+
+class TestWorkerAutoscaler:
+    """Test cases for scaling decisions"""
+
+    def test_backlog_scales_up_after_sustained_pressure(self):
+        autoscaler, clock = make_autoscaler()
+
+        assert autoscaler.evaluate(current_workers=2, queue_depth=8, busy_workers=2) == 2
+        clock.now += 5
+        assert autoscaler.evaluate(current_workers=2, queue_depth=8, busy_workers=2) == 4
+        assert autoscaler.history[-1]["action"] == "scale_up"
+
+    def test_scale_up_is_bounded_by_waiting_tasks_and_max(self):
+        autoscaler, clock = make_autoscaler(sustain=1, policy=PoolScalingPolicy.AGGRESSIVE)
+
+        assert autoscaler.evaluate(current_workers=2, queue_depth=1, busy_workers=2) == 3
+        clock.now += 60
+        assert autoscaler.evaluate(current_workers=5, queue_depth=20, busy_workers=5) == 6
+
+    def test_fast_tasks_do_not_trigger_scale_up(self):
+        autoscaler, _ = make_autoscaler(sustain=1, target_queue_wait=60)
+        for _ in range(5):
+            autoscaler.record_task(duration=5.0, success=True)
+
+        # 4 tasks x 5 s over 2 workers drains in ~10 s
+        assert autoscaler.evaluate(current_workers=2, queue_depth=4, busy_workers=2) == 2
+
+    def test_idle_workers_are_released_down_to_minimum(self):
+        autoscaler, clock = make_autoscaler(sustain=2, scale_down_cooldown=100)
+
+        assert autoscaler.evaluate(current_workers=3, queue_depth=0, busy_workers=0) == 3
+        assert autoscaler.evaluate(current_workers=3, queue_depth=0, busy_workers=0) == 2
+        # Cooldown holds the next step
+        assert autoscaler.evaluate(current_workers=2, queue_depth=0, busy_workers=0) == 2
+        assert autoscaler.evaluate(current_workers=2, queue_depth=0, busy_workers=0) == 2
+        clock.now += 101
+        assert autoscaler.evaluate(current_workers=2, queue_depth=0, busy_workers=0) == 1
+        clock.now += 101
+        assert autoscaler.evaluate(current_workers=1, queue_depth=0, busy_workers=0) == 1
+
+    def test_alternating_signals_do_not_flap(self):
+        autoscaler, clock = make_autoscaler(sustain=2)
+
+        for i in range(6):
+            clock.now += 5
+            depth = 10 if i % 2 else 0
+            assert autoscaler.evaluate(current_workers=3, queue_depth=depth, busy_workers=3 if depth else 0) == 3
+        assert autoscaler.history == []
+
+    def test_rate_limit_shrinks_instead_of_growing(self):
+        autoscaler, clock = make_autoscaler(sustain=1)
+        autoscaler.record_task(duration=30.0, success=False, rate_limited=True)
+
+        assert autoscaler.evaluate(current_workers=4, queue_depth=10, busy_workers=4) == 3
+        clock.now += autoscaler.config.rate_limit_backoff + 1
+        for _ in range(3):
+            autoscaler.record_task(duration=120.0, success=True)
+        assert autoscaler.evaluate(current_workers=3, queue_depth=10, busy_workers=3) > 3
+
+    def test_rate_limit_does_not_replace_workers_below_minimum(self):
+        autoscaler, clock = make_autoscaler(min_workers=2)
+        autoscaler.record_task(duration=30.0, success=False, rate_limited=True)
+
+        for _ in range(3):
+            assert autoscaler.evaluate(current_workers=0, queue_depth=5, busy_workers=0) == 0
+            clock.now += 5
+
+    def test_high_error_rate_blocks_scale_up(self):
+        autoscaler, _ = make_autoscaler(sustain=1)
+        for ok in (False, False, True):
+            autoscaler.record_task(duration=120.0, success=ok)
+
+        assert autoscaler.evaluate(current_workers=2, queue_depth=10, busy_workers=2) == 2
+
+
+class FakeWorker:
+    def __init__(self, worker_id, *args):
+        self.worker_id = worker_id
+
+
+class TestOrchestratorAutoscale:
+    """Test cases for applying scaling decisions to live workers"""
+
+    def make_orchestrator(self, worker_count, busy):
+        orchestrator = ClaudeOrchestrator.__new__(ClaudeOrchestrator)
+        orchestrator.SonnetWorker = FakeWorker
+        orchestrator.working_dir = "."
+        orchestrator.config = None
+        orchestrator.main_task_master = None
+        orchestrator.workers = [FakeWorker(i) for i in range(worker_count)]
+        orchestrator.workers_at_limit = set()
+        orchestrator.retiring_workers = set()
+        orchestrator.progress = None
+        orchestrator.admission = AdmissionController()
+        orchestrator._admission_delays = 0
+        orchestrator.submitted = []
+        orchestrator.executor = SimpleNamespace(submit=lambda fn, w: orchestrator.submitted.append(w.worker_id))
+        active = {}
+        for worker_id in busy:
+            task = WorkerTask(f"t{worker_id}", "Task", "")
+            task.assigned_worker = worker_id
+            active[task.task_id] = task
+        orchestrator.manager = SimpleNamespace(task_queue=queue.Queue(), active_tasks=active)
+        orchestrator.autoscaler = WorkerAutoscaler(AutoscaleConfig(min_workers=1, max_workers=4, sustain=1))
+        return orchestrator
+
+    def test_scale_up_starts_new_worker_threads(self):
+        orchestrator = self.make_orchestrator(2, busy=[0, 1])
+        for i in range(5):
+            orchestrator.manager.task_queue.put(WorkerTask(str(i), "Task", ""))
+
+        orchestrator._autoscale()
+
+        assert orchestrator.submitted == [2, 3]
+        assert len(orchestrator._live_workers()) == 4
+
+    def test_scale_down_retires_idle_workers_only(self):
+        orchestrator = self.make_orchestrator(3, busy=[2])
+
+        orchestrator._autoscale()
+
+        assert orchestrator.retiring_workers == {1}
+        assert [w.worker_id for w in orchestrator._live_workers()] == [0, 2]
+
+    def test_no_new_workers_after_usage_limit(self):
+        orchestrator = self.make_orchestrator(2, busy=[])
+        orchestrator.workers_at_limit = {0, 1}
+        orchestrator.manager.task_queue.put(WorkerTask("1", "Task", ""))
+
+        for _ in range(3):
+            orchestrator._autoscale()
+
+        assert orchestrator.submitted == []
@@ -0,0 +1,163 @@
+"""Tests for compressed, out-of-line output storage in WorkerResultManager"""
+
+import sqlite3
+import threading
+from datetime import datetime
+
+import pytest
+
+from claude_orchestrator.worker_result_manager import (
+    WorkerResultManager, WorkerResult, ResultStatus
+)
+
+
+def make_result(task_id="1", output="done", status=ResultStatus.SUCCESS, worker_id="w1", **kwargs):
+    return WorkerResult(
+        task_id=task_id,
+        worker_id=worker_id,
+        status=status,
+        output=output,
+        created_files=kwargs.pop("created_files", ["a.py"]),
+        modified_files=kwargs.pop("modified_files", []),
+        execution_time=kwargs.pop("execution_time", 1.5),
+        tokens_used=kwargs.pop("tokens_used", 100),
+        timestamp=kwargs.pop("timestamp", datetime.now().isoformat()),
+        **kwargs
+    )
+
+
+class TestWorkerResultStorage:
+    """Test cases for blob-backed result storage"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        manager = WorkerResultManager(tmp_path / "results.db", inline_threshold=64)
+        yield manager
+        manager.close()
+
+    def _raw(self, manager, sql, *params):
+        conn = sqlite3.connect(str(manager.db_path))
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def test_large_output_is_compressed_out_of_line(self, manager):
+        transcript = "Implemented the parser and its tests.\n" * 2000
+        manager.store_result(make_result(output=transcript))
+
+        row = self._raw(manager, "SELECT output, output_hash FROM worker_results")[0]
+        assert row[0] is None
+        codec, size, stored = self._raw(
+            manager, "SELECT codec, size, length(data) FROM result_blobs WHERE hash = ?", row[1]
+        )[0]
+        assert codec in ("zstd", "zlib")
+        assert size == len(transcript)
+        assert stored < size / 10
+
+        assert manager.get_latest_result("1").output == transcript
+
+    def test_small_output_stays_inline(self, manager):
+        manager.store_result(make_result(output="short"))
+
+        assert self._raw(manager, "SELECT output, output_hash FROM worker_results") == [("short", None)]
+        assert self._raw(manager, "SELECT COUNT(*) FROM result_blobs") == [(0,)]
+
+    def test_identical_outputs_share_one_blob(self, manager):
+        transcript = "x" * 500
+        manager.store_result(make_result(task_id="1", output=transcript))
+        manager.store_result(make_result(task_id="2", output=transcript))
+
+        assert self._raw(manager, "SELECT COUNT(*) FROM result_blobs") == [(1,)]
+
+    def test_status_queries_do_not_load_outputs(self, manager, monkeypatch):
+        for i in range(3):
+            manager.store_result(make_result(task_id=str(i), output=f"{i}" * 500))
+
+        loads = []
+        real_load = manager._load_blob
+        monkeypatch.setattr(manager, "_load_blob", lambda h: loads.append(h) or real_load(h))
+
+        results = manager.get_results_by_status(ResultStatus.SUCCESS)
+        assert len(results) == 3
+        assert [r.task_id for r in results] == ["2", "1", "0"]
+        assert loads == []
+
+        assert results[0].output == "2" * 500
+        assert len(loads) == 1
+        assert results[0].output == "2" * 500
+        assert len(loads) == 1
+
+    def test_validation_reads_lazy_output(self, manager):
+        manager.store_result(make_result(output="I created parser.py " * 20, created_files=[]))
+
+        valid, reason = manager.validate_result("1")
+
+        assert not valid
+        assert "no files were recorded" in reason
+
+    def test_mark_validated_updates_latest_only(self, manager):
+        manager.store_result(make_result(timestamp="t1"))
+        manager.store_result(make_result(timestamp="t2"))
+
+        manager.mark_validated("1")
+
+        rows = self._raw(manager, "SELECT timestamp, validation_passed FROM worker_results ORDER BY id")
+        assert rows == [("t1", 0), ("t2", 1)]
+        assert manager.get_worker_stats("w1")["validated_tasks"] == 1
+
+    def test_cleanup_removes_orphaned_blobs(self, manager):
+        manager.store_result(make_result(task_id="old", output="o" * 500))
+        manager.store_result(make_result(task_id="new", output="n" * 500))
+        conn = sqlite3.connect(str(manager.db_path))
+        with conn:
+            conn.execute("UPDATE worker_results SET created_at = datetime('now', '-40 days') WHERE task_id = 'old'")
+        conn.close()
+
+        assert manager.cleanup_old_results(days=30) == 1
+
+        assert self._raw(manager, "SELECT task_id FROM worker_results") == [("new",)]
+        assert self._raw(manager, "SELECT COUNT(*) FROM result_blobs") == [(1,)]
+        assert manager.get_latest_result("new").output == "n" * 500
+
+    def test_concurrent_writers_share_pool(self, manager):
+        def write(worker):
+            for i in range(20):
+                manager.store_result(make_result(task_id=f"{worker}-{i}", worker_id=f"w{worker}"))
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sum(manager.get_worker_stats(f"w{n}")["total_tasks"] for n in range(4)) == 80
+        assert manager._pool.qsize() <= 4
+
+    def test_legacy_database_is_migrated(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(str(db_path))
+        with conn:
+            conn.execute("""
+                CREATE TABLE worker_results (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task_id TEXT NOT NULL, worker_id TEXT NOT NULL, status TEXT NOT NULL,
+                    output TEXT, created_files TEXT, modified_files TEXT,
+                    execution_time REAL, tokens_used INTEGER, timestamp TEXT NOT NULL,
+                    error_message TEXT, validation_passed BOOLEAN DEFAULT 0, metadata TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(task_id, timestamp)
+                )
+            """)
+            conn.execute("""
+                INSERT INTO worker_results (task_id, worker_id, status, output, created_files,
+                                            modified_files, execution_time, tokens_used, timestamp)
+                VALUES ('1', 'w1', 'success', ?, '[]', '[]', 1.0, 10, 't0')
+            """, ("legacy " * 100,))
+        conn.close()
+
+        manager = WorkerResultManager(db_path)
+        try:
+            assert manager.get_latest_result("1").output == "legacy " * 100
+        finally:
+            manager.close()